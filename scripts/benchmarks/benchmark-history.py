@@ -0,0 +1,608 @@
+#!/usr/bin/env python3
+"""Append BenchmarkDotNet results to a local history store and query trends."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import math
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+DELTA_RENDERER = Path(__file__).resolve().parent / "render-benchmark-deltas.py"
+DEFAULT_HISTORY = Path("artifacts/benchmark-history/history.jsonl")
+DEFAULT_RUNTIME_ROOT = Path("BenchmarkDotNet.Artifacts")
+DEFAULT_COMPARISON_ROOT = Path("artifacts/benchmarkdotnet/comparison")
+HISTORY_SCHEMA = "novasharp.benchmark-history.v1"
+METRICS = ("meanNs", "p95Ns", "allocatedBytes", "gen0Per1K")
+DEFAULT_METRIC = "meanNs"
+DEFAULT_MIN_CHANGE = 0.05
+DEFAULT_MIN_SCORE = 4.0
+DEFAULT_MIN_SEGMENT = 2
+# Relative noise floor for flat series, so identical values do not make every
+# small shift look infinitely significant.
+NOISE_FLOOR_FRACTION = 0.005
+
+
+@dataclass(frozen=True, order=True)
+class SeriesKey:
+    machine: str
+    runtime: str
+    summary: str
+    method: str
+    parameters: str
+
+
+@dataclass(frozen=True)
+class CommitPoint:
+    commit: str
+    commit_time: str
+    value: float
+    runs: int
+
+
+@dataclass(frozen=True)
+class Changepoint:
+    series: SeriesKey
+    metric: str
+    before: float
+    after: float
+    score: float
+    last_good: CommitPoint
+    first_bad: CommitPoint
+
+    @property
+    def change(self) -> float:
+        return (self.after - self.before) / self.before if self.before else math.inf
+
+    @property
+    def regression(self) -> bool:
+        return self.after > self.before
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=DEFAULT_HISTORY,
+        help="Append-only JSONL history store.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest = subparsers.add_parser(
+        "ingest",
+        help="Append every BenchmarkDotNet report under the given roots to the history.",
+    )
+    ingest.add_argument(
+        "roots",
+        type=Path,
+        nargs="*",
+        default=[DEFAULT_RUNTIME_ROOT, DEFAULT_COMPARISON_ROOT],
+        help="Directories containing *-report-full(-compressed).json artifacts.",
+    )
+    ingest.add_argument("--commit", default=None, help="Commit to record (defaults to HEAD).")
+    ingest.add_argument(
+        "--commit-time",
+        type=utc_time,
+        default=None,
+        help="ISO-8601 commit time to record (defaults to the committer date of --commit).",
+    )
+
+    for name, help_text in (
+        ("trend", "Print per-commit values for matching series."),
+        ("changepoints", "Find level shifts and the commit range where each first appeared."),
+    ):
+        query = subparsers.add_parser(name, help=help_text)
+        query.add_argument(
+            "--scenario",
+            default="",
+            help="Case-insensitive substring matched against summary, method, and parameters.",
+        )
+        query.add_argument("--runtime", default="", help="Only include this runtime.")
+        query.add_argument("--machine", default="", help="Only include this machine fingerprint.")
+        query.add_argument("--metric", choices=METRICS, default=DEFAULT_METRIC)
+        query.add_argument(
+            "--include-dirty",
+            action="store_true",
+            help="Include records ingested from a checkout with uncommitted changes.",
+        )
+        query.add_argument("--output", type=Path, default=None, help="Markdown output path.")
+        if name == "changepoints":
+            query.add_argument(
+                "--min-change",
+                type=float,
+                default=DEFAULT_MIN_CHANGE,
+                help="Minimum fractional level shift reported as a changepoint.",
+            )
+            query.add_argument(
+                "--min-score",
+                type=float,
+                default=DEFAULT_MIN_SCORE,
+                help="Minimum shift in robust noise units (scaled MAD) for a changepoint.",
+            )
+            query.add_argument(
+                "--min-segment",
+                type=int,
+                default=DEFAULT_MIN_SEGMENT,
+                help="Minimum commits on each side of a changepoint.",
+            )
+            query.add_argument(
+                "--regressions-only",
+                action="store_true",
+                help="Only report shifts that make the metric worse.",
+            )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    history = resolve_repo_path(args.history)
+
+    if args.command == "ingest":
+        return ingest(history, [resolve_repo_path(root) for root in args.roots], args)
+
+    records = load_history(history)
+    series = build_series(
+        records, args.metric, args.scenario, args.runtime, args.machine, args.include_dirty
+    )
+    if args.command == "trend":
+        markdown = render_trend(series, args.metric)
+        changepoints: list[Changepoint] = []
+    else:
+        changepoints = [
+            changepoint
+            for key, points in series.items()
+            for changepoint in find_changepoints(
+                key,
+                args.metric,
+                points,
+                args.min_change,
+                args.min_score,
+                args.min_segment,
+            )
+            if changepoint.regression or not args.regressions_only
+        ]
+        markdown = render_changepoints(changepoints)
+
+    if args.output is not None:
+        output = resolve_repo_path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(markdown, encoding="utf-8")
+        print(f"output={repo_relative(output)}")
+    else:
+        print(markdown, end="")
+
+    print(f"history_records={len(records)}", file=sys.stderr)
+    if not args.include_dirty:
+        print(
+            f"dirty_records_excluded={sum(1 for record in records if record.get('dirty'))}",
+            file=sys.stderr,
+        )
+    print(f"series={len(series)}", file=sys.stderr)
+    if args.command == "changepoints":
+        print(f"changepoints={len(changepoints)}", file=sys.stderr)
+        print(
+            f"regression_changepoints={sum(1 for value in changepoints if value.regression)}",
+            file=sys.stderr,
+        )
+    return 0
+
+
+def resolve_repo_path(path: Path) -> Path:
+    return path if path.is_absolute() else ROOT / path
+
+
+def repo_relative(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def load_delta_renderer():
+    spec = importlib.util.spec_from_file_location("render_benchmark_deltas", DELTA_RENDERER)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {DELTA_RENDERER}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def git_output(*args: str) -> str:
+    result = subprocess.run(
+        ["git", *args],
+        cwd=ROOT,
+        text=True,
+        capture_output=True,
+        check=False,
+    )
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+def utc_time(value: str) -> str:
+    """Normalize an ISO-8601 time to UTC so times recorded in different offsets sort in order.
+
+    Times without an offset are taken as UTC.
+    """
+
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def commit_time_of(commit: str) -> str:
+    # %ct is epoch seconds; %cI would keep the committer's own offset.
+    epoch = git_output("show", "-s", "--format=%ct", commit)
+    return datetime.fromtimestamp(int(epoch), timezone.utc).isoformat() if epoch else ""
+
+
+def ingest(history: Path, roots: list[Path], args: argparse.Namespace) -> int:
+    renderer = load_delta_renderer()
+    commit = args.commit or git_output("rev-parse", "HEAD") or "unknown"
+    commit_time = args.commit_time or commit_time_of(commit)
+    dirty = args.commit is None and bool(git_output("status", "--porcelain", "--untracked-files=no"))
+    recorded_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+    known_reports = {
+        (record.get("commit"), record.get("reportDigest")) for record in load_history(history)
+    }
+    new_records: list[dict[str, object]] = []
+    skipped_reports = 0
+    for root in roots:
+        for report in renderer.find_benchmark_reports(root):
+            payload = report.read_bytes()
+            digest = hashlib.sha256(payload).hexdigest()[:16]
+            if (commit, digest) in known_reports:
+                skipped_reports += 1
+                continue
+
+            known_reports.add((commit, digest))
+            data = json.loads(payload)
+            machine, machine_info = machine_fingerprint(renderer, report, data)
+            for benchmark in data.get("Benchmarks", []):
+                record = history_record(renderer, benchmark)
+                if record is None:
+                    continue
+
+                record.update(
+                    {
+                        "commit": commit,
+                        "commitTime": commit_time,
+                        "dirty": dirty,
+                        "machine": machine,
+                        "machineInfo": machine_info,
+                        "recordedAt": recorded_at,
+                        "report": repo_relative(report),
+                        "reportDigest": digest,
+                        "schema": HISTORY_SCHEMA,
+                    }
+                )
+                new_records.append(record)
+
+    history.parent.mkdir(parents=True, exist_ok=True)
+    with history.open("a", encoding="utf-8") as handle:
+        for record in new_records:
+            handle.write(json.dumps(record, sort_keys=True) + "\n")
+
+    print(f"commit={commit}")
+    print(f"ingested_records={len(new_records)}")
+    print(f"skipped_reports={skipped_reports}")
+    print(f"history={repo_relative(history)}")
+    return 0
+
+
+def machine_fingerprint(renderer, report: Path, data: dict) -> tuple[str, dict[str, object]]:
+    """Return the delta renderer's environment fingerprint for a report and its sidecar."""
+
+    environment = renderer.environment_from_report(
+        renderer.distill_report(report, data), renderer.read_environment_sidecar(report)
+    )
+    if environment is None:
+        return "unknown", {}
+
+    return environment.digest, dict(environment.details)
+
+
+def history_record(renderer, benchmark: dict) -> dict[str, object] | None:
+    key = renderer.benchmark_key_from_json(benchmark)
+    if key is None:
+        return None
+
+    metrics = renderer.metrics_from_json(benchmark)
+    if metrics is None:
+        return None
+
+    runtime_method = renderer.split_runtime_method(key.method)
+    runtime, method = runtime_method if runtime_method is not None else (renderer.NOVA_RUNTIME, key.method)
+    return {
+        "allocatedBytes": renderer.finite_or_none(metrics.allocated_bytes),
+        "gen0Per1K": renderer.finite_or_none(metrics.gen0_per_1k),
+        "meanNs": renderer.finite_or_none(metrics.mean_ns),
+        "method": method,
+        "p95Ns": renderer.finite_or_none(metrics.p95_ns),
+        "parameterDisplay": renderer.build_parameter_display_from_json(benchmark),
+        "parameters": key.parameters,
+        "runtime": runtime,
+        "runtimeKind": renderer.runtime_kind_from_json(benchmark),
+        "summary": key.summary,
+    }
+
+
+def load_history(history: Path) -> list[dict]:
+    if not history.exists():
+        return []
+
+    records: list[dict] = []
+    with history.open(encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get("schema") != HISTORY_SCHEMA:
+                raise ValueError(
+                    f"Unsupported history schema at {repo_relative(history)}:{line_number}: "
+                    f"{record.get('schema')!r}"
+                )
+            records.append(record)
+    return records
+
+
+def build_series(
+    records: list[dict],
+    metric: str,
+    scenario: str,
+    runtime: str,
+    machine: str,
+    include_dirty: bool = False,
+) -> dict[SeriesKey, list[CommitPoint]]:
+    """Group records into per-series commit points, using the median of repeated runs.
+
+    Records ingested from a dirty checkout did not measure their commit, so they are
+    skipped unless ``include_dirty`` is set.
+    """
+
+    needle = scenario.lower()
+    values: dict[SeriesKey, dict[str, list[float]]] = {}
+    commit_times: dict[str, str] = {}
+    first_seen: dict[str, int] = {}
+    for index, record in enumerate(records):
+        value = record.get(metric)
+        if value is None or not math.isfinite(float(value)):
+            continue
+        if runtime and record.get("runtime") != runtime:
+            continue
+        if machine and record.get("machine") != machine:
+            continue
+        if record.get("dirty") and not include_dirty:
+            continue
+
+        key = SeriesKey(
+            str(record.get("machine", "")),
+            str(record.get("runtime", "")),
+            str(record.get("summary", "")),
+            str(record.get("method", "")),
+            str(record.get("parameters", "")),
+        )
+        if needle and needle not in f"{key.summary} {key.method} {key.parameters}".lower():
+            continue
+
+        commit = str(record.get("commit", ""))
+        values.setdefault(key, {}).setdefault(commit, []).append(float(value))
+        commit_times.setdefault(commit, record_commit_time(record))
+        first_seen.setdefault(commit, index)
+
+    series: dict[SeriesKey, list[CommitPoint]] = {}
+    for key in sorted(values):
+        commits = sorted(values[key], key=lambda commit: (commit_times[commit], first_seen[commit]))
+        series[key] = [
+            CommitPoint(
+                commit,
+                commit_times[commit],
+                statistics.median(values[key][commit]),
+                len(values[key][commit]),
+            )
+            for commit in commits
+        ]
+    return series
+
+
+def record_commit_time(record: dict) -> str:
+    """Return a record's commit time in UTC, for records written before times were normalized."""
+
+    value = str(record.get("commitTime") or "")
+    try:
+        return utc_time(value) if value else ""
+    except ValueError:
+        return value
+
+
+def find_changepoints(
+    key: SeriesKey,
+    metric: str,
+    points: list[CommitPoint],
+    min_change: float,
+    min_score: float,
+    min_segment: int,
+) -> list[Changepoint]:
+    """Binary segmentation on segment medians with a robust (MAD) noise estimate."""
+
+    values = [point.value for point in points]
+    min_segment = max(1, min_segment)
+    split_indexes: list[int] = []
+    pending = [(0, len(values))]
+    while pending:
+        start, end = pending.pop()
+        best = best_split(values, start, end, min_change, min_score, min_segment)
+        if best is None:
+            continue
+        split_indexes.append(best)
+        pending.append((start, best))
+        pending.append((best, end))
+
+    split_indexes.sort()
+    changepoints: list[Changepoint] = []
+    boundaries = [0, *split_indexes, len(values)]
+    for position, index in enumerate(split_indexes):
+        before = statistics.median(values[boundaries[position] : index])
+        after = statistics.median(values[index : boundaries[position + 2]])
+        changepoints.append(
+            Changepoint(
+                key,
+                metric,
+                before,
+                after,
+                split_score(values, boundaries[position], index, boundaries[position + 2]),
+                points[index - 1],
+                points[index],
+            )
+        )
+    return changepoints
+
+
+def best_split(
+    values: list[float],
+    start: int,
+    end: int,
+    min_change: float,
+    min_score: float,
+    min_segment: int,
+) -> int | None:
+    best_index: int | None = None
+    best_score = 0.0
+    for index in range(start + min_segment, end - min_segment + 1):
+        before = statistics.median(values[start:index])
+        after = statistics.median(values[index:end])
+        if before <= 0 or abs(after - before) / before < min_change:
+            continue
+
+        score = split_score(values, start, index, end)
+        if score >= min_score and score > best_score:
+            best_index = index
+            best_score = score
+    return best_index
+
+
+def split_score(values: list[float], start: int, index: int, end: int) -> float:
+    left = values[start:index]
+    right = values[index:end]
+    left_median = statistics.median(left)
+    right_median = statistics.median(right)
+    residuals = [abs(value - left_median) for value in left] + [
+        abs(value - right_median) for value in right
+    ]
+    noise = 1.4826 * statistics.median(residuals)
+    noise = max(noise, NOISE_FLOOR_FRACTION * abs(left_median))
+    if noise <= 0:
+        return math.inf
+    return abs(right_median - left_median) / noise
+
+
+def series_label(key: SeriesKey) -> str:
+    parameters = f" [{key.parameters}]" if key.parameters else ""
+    return f"{key.summary} / {key.runtime} {key.method}{parameters}"
+
+
+def format_value(metric: str, value: float) -> str:
+    if metric in ("meanNs", "p95Ns"):
+        return f"{value:,.1f} ns"
+    if metric == "allocatedBytes":
+        return f"{value:,.0f} B"
+    return f"{value:,.4f}"
+
+
+def format_change(change: float) -> str:
+    if math.isinf(change):
+        return "+inf%"
+    return f"{change * 100:+.2f}%"
+
+
+def short_commit(commit: str) -> str:
+    return commit[:10]
+
+
+def render_trend(series: dict[SeriesKey, list[CommitPoint]], metric: str) -> str:
+    lines = [f"# Benchmark History Trend ({metric})", ""]
+    if not series:
+        lines.extend(["No history records matched the query.", ""])
+        return "\n".join(lines)
+
+    for key, points in series.items():
+        lines.extend(
+            [
+                f"## {series_label(key)}",
+                "",
+                f"- Machine: `{key.machine}`",
+                "",
+                "| Commit | Commit Time | Runs | Value | Delta vs Previous | Delta vs First |",
+                "| --- | --- | ---: | ---: | ---: | ---: |",
+            ]
+        )
+        first = points[0].value
+        previous: float | None = None
+        for point in points:
+            delta_previous = (
+                format_change((point.value - previous) / previous) if previous else "-"
+            )
+            delta_first = format_change((point.value - first) / first) if first else "-"
+            lines.append(
+                f"| `{short_commit(point.commit)}` | {point.commit_time or '-'} | {point.runs} | "
+                f"{format_value(metric, point.value)} | {delta_previous} | {delta_first} |"
+            )
+            previous = point.value
+        lines.append("")
+    return "\n".join(lines)
+
+
+def render_changepoints(changepoints: list[Changepoint]) -> str:
+    lines = ["# Benchmark History Changepoints", ""]
+    if not changepoints:
+        lines.extend(["No changepoints were detected.", ""])
+        return "\n".join(lines)
+
+    lines.extend(
+        [
+            "Each row is a sustained level shift. The regression first appeared in the commit "
+            "range `last good..first bad`; inspect it with `git log <last good>..<first bad>`.",
+            "",
+            "| Series | Machine | Metric | Direction | Before | After | Change | Score | Last Good | First Bad |",
+            "| --- | --- | --- | --- | ---: | ---: | ---: | ---: | --- | --- |",
+        ]
+    )
+    for changepoint in sorted(
+        changepoints,
+        key=lambda value: (value.first_bad.commit_time, series_label(value.series)),
+    ):
+        lines.append(
+            " | ".join(
+                [
+                    f"| {series_label(changepoint.series)}",
+                    f"`{changepoint.series.machine}`",
+                    changepoint.metric,
+                    "regression" if changepoint.regression else "improvement",
+                    format_value(changepoint.metric, changepoint.before),
+                    format_value(changepoint.metric, changepoint.after),
+                    format_change(changepoint.change),
+                    "inf" if math.isinf(changepoint.score) else f"{changepoint.score:.1f}",
+                    f"`{short_commit(changepoint.last_good.commit)}`",
+                    f"`{short_commit(changepoint.first_bad.commit)}` |",
+                ]
+            )
+        )
+    lines.append("")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,724 @@
+#!/usr/bin/env python3
+"""Find the commit that regressed one comparison benchmark row with ``git bisect run``.
+
+The driver measures the good and bad commits first and refuses to bisect when the bad
+commit does not regress. It then bisects in a private worktree, so the caller's checkout
+is never touched. Each probed commit gets its own build worktree under the cache
+directory. Only the BenchmarkDotNet filter for the row runs, plus the reference ``lua``
+CLI context for ``Execute`` scenarios. The commit's NovaSharp samples are compared with
+the good commit's samples using the delta renderer's statistics. Successful builds and
+measurements are kept per commit, so later bisections over overlapping ranges reuse them.
+Failed builds and measurements are not cached, so the next probe of that commit retries.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+SCRIPT = Path(__file__).resolve()
+DELTA_RENDERER = SCRIPT.parent / "render-benchmark-deltas.py"
+LUA_CLI_CONTEXT = SCRIPT.parent / "run-lua-cli-context.py"
+CAPTURE_ENVIRONMENT = SCRIPT.parent / "capture-environment.py"
+COMPARISON_PROJECT = Path(
+    "src/tooling/WallstopStudios.NovaSharp.Comparison/WallstopStudios.NovaSharp.Comparison.csproj"
+)
+DEFAULT_CACHE = Path("artifacts/benchmark-bisect")
+DEFAULT_OUTPUT = Path("artifacts/benchmark-bisect.md")
+BISECT_STATE_SCHEMA = "novasharp.benchmark-bisect-state.v1"
+BISECT_RESULT_SCHEMA = "novasharp.benchmark-bisect-result.v1"
+METRICS = ("time", "allocated")
+BUILD_COMPLETE_MARKER = ".bisect-build-complete"
+# git bisect run exit codes.
+BISECT_GOOD = 0
+BISECT_BAD = 1
+BISECT_SKIP = 125
+
+
+@dataclass(frozen=True)
+class CommitResult:
+    commit: str
+    status: str
+    mean_ns: float = math.nan
+    p95_ns: float = math.nan
+    allocated_bytes: float = math.nan
+    samples_ns: tuple[float, ...] = ()
+    reference_lua_mean_ns: float = math.nan
+
+    @property
+    def measured(self) -> bool:
+        return self.status == "measured"
+
+
+@dataclass(frozen=True)
+class Verdict:
+    commit: str
+    regressed: bool
+    detail: str
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="Bisect between a good and a bad commit.")
+    run.add_argument("--good", required=True, help="Commit where the row is known good.")
+    run.add_argument("--bad", required=True, help="Commit where the row is known regressed.")
+    key = run.add_mutually_exclusive_group(required=True)
+    key.add_argument(
+        "--key",
+        default=None,
+        help=(
+            "Comparison row as JSON with summary, operation, and parameters, as written in "
+            "the phaseGateFailures of render-benchmark-deltas.py --json-output. An empty "
+            "summary matches any benchmark class."
+        ),
+    )
+    key.add_argument(
+        "--scenario",
+        default=None,
+        help="Shorthand for the Execute row of one comparison scenario, such as NumericLoops.",
+    )
+    run.add_argument(
+        "--runtime",
+        default="NovaSharp",
+        help="Runtime column of the row to judge.",
+    )
+    run.add_argument(
+        "--metric",
+        choices=METRICS,
+        default="time",
+        help="Judge per-operation timing samples or allocated B/op.",
+    )
+    run.add_argument(
+        "--filter",
+        default=None,
+        help="BenchmarkDotNet filter; defaults to *<scenario>* for scenario rows.",
+    )
+    run.add_argument("--configuration", default="Release", help="Build configuration.")
+    run.add_argument(
+        "--lua-cmd",
+        default="lua",
+        help="Reference lua executable for the scenario's CLI context.",
+    )
+    run.add_argument(
+        "--no-lua-cli",
+        action="store_true",
+        help="Skip the reference lua CLI context.",
+    )
+    run.add_argument(
+        "--measure-command",
+        default=None,
+        help=(
+            "Shell command that replaces the dotnet build and BenchmarkDotNet run. It runs "
+            "in the commit's worktree and must write BenchmarkDotNet JSON below "
+            "$BISECT_ARTIFACTS; $BISECT_FILTER and $BISECT_COMMIT are also set. A non-zero "
+            "exit skips the commit."
+        ),
+    )
+    run.add_argument("--tolerance", type=float, default=None, help="Timing noise band.")
+    run.add_argument("--significance", type=float, default=None, help="Mann-Whitney alpha.")
+    run.add_argument(
+        "--min-effect-size",
+        type=float,
+        default=None,
+        help="Minimum rank-biserial effect size for a timing regression.",
+    )
+    run.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE,
+        help="Per-commit build worktrees and results, reused across bisections.",
+    )
+    run.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Markdown report.")
+    run.add_argument("--repo", type=Path, default=ROOT, help=argparse.SUPPRESS)
+
+    probe = subparsers.add_parser(
+        "probe",
+        help="Judge the current bisect commit; invoked by git bisect run.",
+    )
+    probe.add_argument("--state", type=Path, required=True)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    if args.command == "probe":
+        return probe(args.state)
+    return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    renderer = load_delta_renderer()
+    repo = args.repo.resolve()
+    cache = args.cache if args.cache.is_absolute() else repo / args.cache
+    cache = cache.resolve()
+    output = args.output if args.output.is_absolute() else repo / args.output
+    try:
+        key = parse_key(args.key, args.scenario)
+        benchmark_filter = args.filter or default_filter(key)
+    except ValueError as error:
+        print(f"error={error}", file=sys.stderr)
+        return 2
+
+    good = git(repo, "rev-parse", "--verify", f"{args.good}^{{commit}}")
+    bad = git(repo, "rev-parse", "--verify", f"{args.bad}^{{commit}}")
+    state = {
+        "schema": BISECT_STATE_SCHEMA,
+        "repo": str(repo),
+        "cache": str(cache),
+        "key": key,
+        "runtime": args.runtime,
+        "metric": args.metric,
+        "filter": benchmark_filter,
+        "configuration": args.configuration,
+        "luaCmd": None if args.no_lua_cli else args.lua_cmd,
+        "measureCommand": args.measure_command,
+        "tolerance": first_set(args.tolerance, renderer.DEFAULT_TOLERANCE),
+        "significance": first_set(args.significance, renderer.DEFAULT_SIGNIFICANCE),
+        "minEffectSize": first_set(args.min_effect_size, renderer.DEFAULT_MIN_EFFECT_SIZE),
+        "regressionThreshold": renderer.DEFAULT_REGRESSION_THRESHOLD,
+        "good": good,
+    }
+    cache.mkdir(parents=True, exist_ok=True)
+    state_path = cache / f"state-{measurement_digest(state)}.json"
+    state_path.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    log_path = probe_log_path(state_path)
+    log_path.unlink(missing_ok=True)
+
+    good_result = measure_commit(state, good)
+    bad_result = measure_commit(state, bad)
+    for label, result in (("good", good_result), ("bad", bad_result)):
+        if not result.measured:
+            print(
+                f"error={label} commit {result.commit[:12]} was not measured: {result.status}",
+                file=sys.stderr,
+            )
+            return 1
+    endpoint = judge(renderer, state, bad_result, good_result)
+    if not endpoint.regressed:
+        print(
+            f"error=bad commit {bad[:12]} does not regress against {good[:12]}: {endpoint.detail}",
+            file=sys.stderr,
+        )
+        return 1
+
+    worktree = cache / "bisect-worktree"
+    remove_worktree(repo, worktree)
+    git(repo, "worktree", "add", "--detach", "--no-checkout", str(worktree), bad)
+    try:
+        git(worktree, "bisect", "start", "--no-checkout", bad, good)
+        completed = subprocess.run(
+            [
+                "git",
+                "bisect",
+                "run",
+                sys.executable,
+                str(SCRIPT),
+                "probe",
+                "--state",
+                str(state_path),
+            ],
+            cwd=worktree,
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+        first_bad = parse_first_bad_commit(completed.stdout)
+    finally:
+        subprocess.run(["git", "bisect", "reset"], cwd=worktree, capture_output=True, check=False)
+        remove_worktree(repo, worktree)
+
+    probes = load_probe_log(log_path)
+    results = {result.commit: result for result in (good_result, bad_result)}
+    for entry in probes:
+        results[entry["commit"]] = load_result(state, entry["commit"]) or CommitResult(
+            entry["commit"], "unknown"
+        )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        render_report(repo, state, good, bad, first_bad, probes, results),
+        encoding="utf-8",
+    )
+
+    print(f"good={good}")
+    print(f"bad={bad}")
+    print(f"first_bad_commit={first_bad or '-'}")
+    print(f"probed_commits={len(probes)}")
+    print(f"cached_probes={sum(1 for entry in probes if entry['cached'])}")
+    print(f"skipped_commits={sum(1 for entry in probes if entry['verdict'] == 'skip')}")
+    print(f"output={repo_relative(output, repo)}")
+    if first_bad is None:
+        print(f"error=git bisect run did not converge:\n{completed.stdout}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def probe(state_path: Path) -> int:
+    """Exit 0 (good), 1 (bad), or 125 (skip) for the commit git bisect checked out."""
+
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    if state.get("schema") != BISECT_STATE_SCHEMA:
+        print(f"error=unsupported bisect state: {state_path}", file=sys.stderr)
+        return BISECT_SKIP
+
+    renderer = load_delta_renderer()
+    commit = git(Path.cwd(), "rev-parse", "BISECT_HEAD")
+    cached = load_result(state, commit) is not None
+    result = measure_commit(state, commit)
+    if result.measured:
+        baseline = measure_commit(state, state["good"])
+        verdict = judge(renderer, state, result, baseline)
+        label = "bad" if verdict.regressed else "good"
+        exit_code = BISECT_BAD if verdict.regressed else BISECT_GOOD
+        detail = verdict.detail
+    else:
+        label = "skip"
+        exit_code = BISECT_SKIP
+        detail = result.status
+
+    with probe_log_path(state_path).open("a", encoding="utf-8") as log:
+        log.write(
+            json.dumps(
+                {"cached": cached, "commit": commit, "detail": detail, "verdict": label},
+                sort_keys=True,
+            )
+            + "\n"
+        )
+    print(f"{commit[:12]} {label}: {detail}")
+    return exit_code
+
+
+def measure_commit(state: dict, commit: str) -> CommitResult:
+    cached = load_result(state, commit)
+    if cached is not None:
+        return cached
+
+    repo = Path(state["repo"])
+    worktree = Path(state["cache"]) / "builds" / commit
+    artifacts = result_dir(state, commit)
+    if artifacts.exists():
+        shutil.rmtree(artifacts)
+    artifacts.mkdir(parents=True)
+
+    if not (worktree / ".git").exists():
+        remove_worktree(repo, worktree)
+        git(repo, "worktree", "add", "--detach", str(worktree), commit)
+
+    if state.get("measureCommand"):
+        status = run_measure_command(state, worktree, artifacts, commit)
+    else:
+        status = build_commit(state, worktree, artifacts)
+        if status == "built":
+            status = run_benchmarks(state, worktree, artifacts)
+
+    result = CommitResult(commit, status)
+    if status == "measured":
+        result = read_measurement(state, commit, artifacts)
+    # Failures may be transient (a flaky run, a full disk, a missing SDK), so only a
+    # measurement is cached; the next probe of a failed commit measures it again.
+    if result.measured:
+        save_result(state, result)
+    return result
+
+
+def build_commit(state: dict, worktree: Path, artifacts: Path) -> str:
+    if (worktree / BUILD_COMPLETE_MARKER).exists():
+        return "built"
+
+    completed = subprocess.run(
+        ["dotnet", "build", str(COMPARISON_PROJECT), "-c", state["configuration"]],
+        cwd=worktree,
+        text=True,
+        capture_output=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        (artifacts / "build.log").write_text(completed.stdout[-4000:], encoding="utf-8")
+        return "build-failed"
+
+    (worktree / BUILD_COMPLETE_MARKER).write_text(completed.stdout[-4000:], encoding="utf-8")
+    return "built"
+
+
+def run_benchmarks(state: dict, worktree: Path, artifacts: Path) -> str:
+    dotnet_run = [
+        "dotnet",
+        "run",
+        "--project",
+        str(COMPARISON_PROJECT),
+        "-c",
+        state["configuration"],
+        "--no-build",
+        "--",
+    ]
+    completed = subprocess.run(
+        [*dotnet_run, "--filter", state["filter"], "--artifacts", str(artifacts)],
+        cwd=worktree,
+        check=False,
+    )
+    if completed.returncode != 0:
+        return "benchmark-failed"
+    subprocess.run(
+        [sys.executable, str(CAPTURE_ENVIRONMENT), "--output-root", str(artifacts)],
+        cwd=ROOT,
+        capture_output=True,
+        check=False,
+    )
+
+    scenario = scenario_name(state["key"])
+    if state.get("luaCmd") and scenario and state["key"]["operation"] == "Execute":
+        scenario_dir = artifacts / "lua-cli-scenarios"
+        exported = subprocess.run(
+            [*dotnet_run, "--export-scenarios", str(scenario_dir)],
+            cwd=worktree,
+            capture_output=True,
+            check=False,
+        )
+        scenario_file = scenario_dir / f"{scenario}.lua"
+        if exported.returncode == 0 and scenario_file.exists():
+            for path in scenario_dir.iterdir():
+                if path != scenario_file and path.is_file():
+                    path.unlink()
+            # Lua CLI rows are context only; a missing lua binary must not skip the commit.
+            subprocess.run(
+                [
+                    sys.executable,
+                    str(LUA_CLI_CONTEXT),
+                    "--scenario-dir",
+                    str(scenario_dir),
+                    "--output-root",
+                    str(artifacts),
+                    "--lua-cmd",
+                    state["luaCmd"],
+                ],
+                cwd=ROOT,
+                check=False,
+            )
+
+    return "measured"
+
+
+def run_measure_command(state: dict, worktree: Path, artifacts: Path, commit: str) -> str:
+    completed = subprocess.run(
+        state["measureCommand"],
+        shell=True,
+        cwd=worktree,
+        env={
+            **os.environ,
+            "BISECT_ARTIFACTS": str(artifacts),
+            "BISECT_FILTER": state["filter"],
+            "BISECT_COMMIT": commit,
+        },
+        check=False,
+    )
+    return "measured" if completed.returncode == 0 else "measure-failed"
+
+
+def read_measurement(state: dict, commit: str, artifacts: Path) -> CommitResult:
+    renderer = load_delta_renderer()
+    comparison = renderer.load_comparison_metrics(renderer.ReportIndex(None), artifacts)
+    key = state["key"]
+    for comparison_key, runtimes in sorted(comparison.items()):
+        if not key_matches(key, comparison_key):
+            continue
+
+        record = runtimes.get(state["runtime"])
+        if record is None:
+            continue
+
+        lua = runtimes.get("Lua")
+        return CommitResult(
+            commit,
+            "measured",
+            record.metrics.mean_ns,
+            record.metrics.p95_ns,
+            record.metrics.allocated_bytes,
+            record.metrics.samples_ns,
+            lua.metrics.mean_ns if lua is not None else math.nan,
+        )
+
+    return CommitResult(commit, "row-missing")
+
+
+def key_matches(key: dict, comparison_key) -> bool:
+    return (
+        (not key["summary"] or key["summary"] == comparison_key.summary)
+        and key["operation"] == comparison_key.operation
+        and key["parameters"] == comparison_key.parameters
+    )
+
+
+def judge(renderer, state: dict, current: CommitResult, good: CommitResult) -> Verdict:
+    if state["metric"] == "allocated":
+        regressed = renderer.allocation_regressed(current.allocated_bytes, good.allocated_bytes)
+        return Verdict(
+            current.commit,
+            regressed,
+            f"{renderer.format_bytes(current.allocated_bytes)} vs good "
+            f"{renderer.format_bytes(good.allocated_bytes)}",
+        )
+
+    delta = renderer.fraction_delta(current.mean_ns, good.mean_ns)
+    percent = renderer.format_percent(renderer.percentage_delta(current.mean_ns, good.mean_ns))
+    timing = renderer.compare_samples(current.samples_ns, good.samples_ns, state["significance"])
+    if timing is None:
+        # Too few samples for the rank test; fall back to the mean regression threshold.
+        regressed = math.isfinite(delta) and delta > state["regressionThreshold"]
+        detail = (
+            f"mean {renderer.format_time(current.mean_ns)} vs good "
+            f"{renderer.format_time(good.mean_ns)} "
+            f"({percent}, too few samples for a rank test)"
+        )
+        return Verdict(current.commit, regressed, detail)
+
+    regressed = renderer.timing_regressed(
+        timing,
+        state["tolerance"],
+        state["significance"],
+        state["minEffectSize"],
+    )
+    return Verdict(
+        current.commit,
+        regressed,
+        f"mean {renderer.format_time(current.mean_ns)} vs good "
+        f"{renderer.format_time(good.mean_ns)} ({percent}), "
+        f"p={renderer.format_p_value(timing.p_value)}, effect {timing.effect_size:+.2f}, "
+        f"ratio {timing.ratio_low:.3f}-{timing.ratio_high:.3f}x",
+    )
+
+
+def parse_key(key_json: str | None, scenario: str | None) -> dict[str, str]:
+    if scenario is not None:
+        return {"summary": "", "operation": "Execute", "parameters": f"Scenario:{scenario}"}
+
+    try:
+        payload = json.loads(key_json or "")
+    except ValueError as error:
+        raise ValueError(f"--key is not JSON: {error}") from error
+    if not isinstance(payload, dict) or not payload.get("operation"):
+        raise ValueError("--key needs at least an operation")
+    return {
+        "summary": str(payload.get("summary") or ""),
+        "operation": str(payload["operation"]),
+        "parameters": str(payload.get("parameters") or ""),
+    }
+
+
+def scenario_name(key: dict[str, str]) -> str:
+    for part in key["parameters"].split("|"):
+        name, _, value = part.partition(":")
+        if name == "Scenario":
+            return value
+    return ""
+
+
+def default_filter(key: dict[str, str]) -> str:
+    scenario = scenario_name(key)
+    if scenario:
+        return f"*{scenario}*"
+    if key["summary"]:
+        return f"*{key['summary'].rsplit('.', 1)[-1]}*"
+    raise ValueError("--filter is required for rows without a Scenario parameter")
+
+
+def measurement_digest(state: dict) -> str:
+    """Digest of every setting that changes what a commit's measurement means."""
+
+    settings = {
+        name: state[name]
+        for name in ("key", "runtime", "filter", "configuration", "luaCmd", "measureCommand")
+    }
+    encoded = json.dumps(settings, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:12]
+
+
+def result_dir(state: dict, commit: str) -> Path:
+    return Path(state["cache"]) / "results" / commit / measurement_digest(state)
+
+
+def load_result(state: dict, commit: str) -> CommitResult | None:
+    path = result_dir(state, commit) / "result.json"
+    if not path.exists():
+        return None
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    # Caches written before failures stopped being saved may still hold one.
+    if data.get("schema") != BISECT_RESULT_SCHEMA or data.get("status") != "measured":
+        return None
+
+    return CommitResult(
+        commit,
+        "measured",
+        float_or_nan(data.get("meanNs")),
+        float_or_nan(data.get("p95Ns")),
+        float_or_nan(data.get("allocatedBytes")),
+        tuple(float(value) for value in data.get("samplesNs") or ()),
+        float_or_nan(data.get("referenceLuaMeanNs")),
+    )
+
+
+def save_result(state: dict, result: CommitResult) -> None:
+    path = result_dir(state, result.commit) / "result.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "schema": BISECT_RESULT_SCHEMA,
+        "commit": result.commit,
+        "status": result.status,
+        "measuredAt": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "meanNs": finite_or_none(result.mean_ns),
+        "p95Ns": finite_or_none(result.p95_ns),
+        "allocatedBytes": finite_or_none(result.allocated_bytes),
+        "samplesNs": list(result.samples_ns),
+        "referenceLuaMeanNs": finite_or_none(result.reference_lua_mean_ns),
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def probe_log_path(state_path: Path) -> Path:
+    return state_path.with_suffix(".probes.jsonl")
+
+
+def load_probe_log(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+
+def parse_first_bad_commit(output: str) -> str | None:
+    for line in output.splitlines():
+        commit, separator, _ = line.partition(" is the first bad commit")
+        if separator:
+            return commit.strip()
+    return None
+
+
+def render_report(
+    repo: Path,
+    state: dict,
+    good: str,
+    bad: str,
+    first_bad: str | None,
+    probes: list[dict],
+    results: dict[str, CommitResult],
+) -> str:
+    renderer = load_delta_renderer()
+    key = state["key"]
+    lines = [
+        "## Benchmark Bisection",
+        "",
+        f"- Row: {key['summary'] or '*'} / {key['operation']} / {key['parameters'] or '-'}",
+        f"- Runtime and metric: {state['runtime']} {state['metric']}",
+        f"- BenchmarkDotNet filter: `{state['filter']}`",
+        f"- Good: `{good[:12]}`",
+        f"- Bad: `{bad[:12]}`",
+        f"- First bad commit: `{first_bad[:12]}` {commit_subject(repo, first_bad)}"
+        if first_bad
+        else "- First bad commit: not found",
+        f"- Probed commits: {len(probes)} ({sum(1 for entry in probes if entry['cached'])} cached)",
+        "",
+        renderer.render_markdown_row(
+            ["Commit", "Verdict", "Mean", "P95", "B/op", "Reference lua", "Detail"]
+        ),
+        renderer.render_markdown_row(["---", "---", "---:", "---:", "---:", "---:", "---"]),
+    ]
+    rows = [(good, "good (endpoint)", ""), (bad, "bad (endpoint)", "")]
+    rows.extend((entry["commit"], entry["verdict"], entry["detail"]) for entry in probes)
+    for commit, verdict, detail in rows:
+        result = results.get(commit, CommitResult(commit, "unknown"))
+        lines.append(
+            renderer.render_markdown_row(
+                [
+                    f"`{commit[:12]}`",
+                    verdict,
+                    renderer.format_time(result.mean_ns),
+                    renderer.format_time(result.p95_ns),
+                    renderer.format_bytes(result.allocated_bytes),
+                    renderer.format_time(result.reference_lua_mean_ns),
+                    detail or result.status,
+                ]
+            )
+        )
+    return "\n".join(lines) + "\n"
+
+
+def commit_subject(repo: Path, commit: str) -> str:
+    subject = git(repo, "show", "-s", "--format=%s", commit, check=False)
+    return f"({subject})" if subject else ""
+
+
+def remove_worktree(repo: Path, worktree: Path) -> None:
+    subprocess.run(
+        ["git", "worktree", "remove", "--force", str(worktree)],
+        cwd=repo,
+        capture_output=True,
+        check=False,
+    )
+    if worktree.exists():
+        shutil.rmtree(worktree)
+    subprocess.run(["git", "worktree", "prune"], cwd=repo, capture_output=True, check=False)
+
+
+def git(cwd: Path, *args: str, check: bool = True) -> str:
+    completed = subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        text=True,
+        capture_output=True,
+        check=False,
+    )
+    if check and completed.returncode != 0:
+        raise SystemExit(f"git {' '.join(args)} failed: {completed.stderr.strip()}")
+    return completed.stdout.strip()
+
+
+def load_delta_renderer():
+    spec = importlib.util.spec_from_file_location("render_benchmark_deltas", DELTA_RENDERER)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {DELTA_RENDERER}")
+
+    module = sys.modules.get(spec.name)
+    if module is None:
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+def first_set(value: float | None, default: float) -> float:
+    return default if value is None else value
+
+
+def float_or_nan(value: object) -> float:
+    return float(value) if isinstance(value, (int, float)) else math.nan
+
+
+def finite_or_none(value: float) -> float | None:
+    return value if math.isfinite(value) else None
+
+
+def repo_relative(path: Path, repo: Path) -> str:
+    try:
+        return path.resolve().relative_to(repo).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Record the benchmark host details that BenchmarkDotNet does not export.
+
+BenchmarkDotNet reports carry the CPU model, core count, architecture, and .NET runtime
+in ``HostEnvironmentInfo``, but not the kernel release or the CPU frequency governor,
+and a laptop on ``powersave`` can be twice as slow as the same CPU on ``performance``.
+Run this next to each BenchmarkDotNet run; it writes ``environment-fingerprint.json``
+into the artifacts directory, where render-benchmark-deltas.py merges it into the
+fingerprint of every report below that directory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+ENVIRONMENT_SCHEMA = "novasharp.benchmark-environment.v1"
+ENVIRONMENT_FILE_NAME = "environment-fingerprint.json"
+CPU_ROOT = Path("/sys/devices/system/cpu")
+CPUINFO = Path("/proc/cpuinfo")
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output-root",
+        type=Path,
+        required=True,
+        help=f"BenchmarkDotNet artifacts directory to write {ENVIRONMENT_FILE_NAME} into.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    output_root = args.output_root if args.output_root.is_absolute() else ROOT / args.output_root
+    environment = capture_environment()
+    output_root.mkdir(parents=True, exist_ok=True)
+    output = output_root / ENVIRONMENT_FILE_NAME
+    output.write_text(json.dumps(environment, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    print(f"kernel={environment['kernel'] or '-'}")
+    print(f"governor={environment['governor'] or '-'}")
+    print(f"output={repo_relative(output)}")
+    return 0
+
+
+def capture_environment() -> dict[str, object]:
+    return {
+        "schema": ENVIRONMENT_SCHEMA,
+        "capturedAt": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "processor": read_processor_name(),
+        "logicalCores": os.cpu_count() or 0,
+        "architecture": platform.machine(),
+        "os": platform.system(),
+        "kernel": platform.release(),
+        "governor": read_governors(CPU_ROOT),
+    }
+
+
+def read_processor_name() -> str:
+    try:
+        for line in CPUINFO.read_text(encoding="utf-8").splitlines():
+            name, _, value = line.partition(":")
+            if name.strip() == "model name":
+                return " ".join(value.split())
+    except OSError:
+        pass
+
+    return platform.processor()
+
+
+def read_governors(cpu_root: Path) -> str:
+    """Return the distinct scaling governors of all CPUs, or "" when cpufreq is absent."""
+
+    governors = set()
+    for path in cpu_root.glob("cpu[0-9]*/cpufreq/scaling_governor"):
+        try:
+            governors.add(path.read_text(encoding="utf-8").strip())
+        except OSError:
+            continue
+
+    return ",".join(sorted(governor for governor in governors if governor))
+
+
+def repo_relative(path: Path) -> str:
+    try:
+        return path.relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,604 @@
+#!/usr/bin/env python3
+"""Capture, collapse, and diff CPU profiles of comparison benchmark scenarios.
+
+``capture`` re-runs selected scenarios of the comparison suite under EventPipe CPU
+sampling. By default it uses BenchmarkDotNet's ``--profiler EP``; ``--profiler
+dotnet-trace`` runs the suite in-process under ``dotnet-trace`` instead. Each speedscope
+file is collapsed to folded stacks (``frame;frame;frame microseconds``) and summarized as a
+top-N hot-method table. When ``--baseline-root`` points at an earlier capture, matching
+profiles are diffed. ``profile-index.json`` lists the files so render-benchmark-deltas.py
+``--profile-root`` can link them from the delta report.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import shutil
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+COMPARISON_PROJECT = Path(
+    "src/tooling/WallstopStudios.NovaSharp.Comparison/WallstopStudios.NovaSharp.Comparison.csproj"
+)
+COMPARISON_ASSEMBLY = "WallstopStudios.NovaSharp.Comparison.dll"
+COMPARISON_TARGET_FRAMEWORK = "net8.0"
+DEFAULT_OUTPUT_ROOT = Path("artifacts/benchmark-profiles/current")
+PROFILE_INDEX_NAME = "profile-index.json"
+PROFILE_INDEX_SCHEMA = "novasharp.benchmark-profiles.v1"
+PROFILERS = ("ep", "dotnet-trace")
+DEFAULT_FOCUS = r"WallstopStudios\.NovaSharp"
+DEFAULT_TOP = 25
+SPEEDSCOPE_SUFFIX = ".speedscope.json"
+# Speedscope units to microseconds; folded-stack weights are integers.
+UNIT_MICROSECONDS = {
+    "nanoseconds": 0.001,
+    "microseconds": 1.0,
+    "milliseconds": 1000.0,
+    "seconds": 1_000_000.0,
+}
+
+
+@dataclass(frozen=True)
+class HotMethod:
+    name: str
+    self_weight: float
+    total_weight: float
+
+
+@dataclass(frozen=True)
+class MethodDelta:
+    name: str
+    before_share: float
+    after_share: float
+
+    @property
+    def delta(self) -> float:
+        return self.after_share - self.before_share
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    capture = subparsers.add_parser("capture", help="Profile comparison scenarios.")
+    capture.add_argument(
+        "--scenario",
+        action="append",
+        default=[],
+        help="Comparison scenario to profile, such as NumericLoops. May be repeated.",
+    )
+    capture.add_argument(
+        "--from-deltas",
+        type=Path,
+        default=None,
+        help=(
+            "render-benchmark-deltas.py --json-output file; every scenario with a phase "
+            "gate failure is profiled."
+        ),
+    )
+    capture.add_argument("--runtime", default="NovaSharp", help="Runtime methods to profile.")
+    capture.add_argument("--profiler", choices=PROFILERS, default="ep")
+    capture.add_argument(
+        "--trace-profile",
+        default="cpu-sampling",
+        help="dotnet-trace --profile value for --profiler dotnet-trace.",
+    )
+    capture.add_argument("--configuration", default="Release", help="Build configuration.")
+    capture.add_argument(
+        "--no-build",
+        action="store_true",
+        help="Reuse the existing comparison build instead of building first.",
+    )
+    capture.add_argument("--output-root", type=Path, default=DEFAULT_OUTPUT_ROOT)
+    capture.add_argument(
+        "--baseline-root",
+        type=Path,
+        default=None,
+        help="Earlier capture to diff against, for example one taken on the baseline commit.",
+    )
+    add_analysis_arguments(capture)
+
+    collapse = subparsers.add_parser("collapse", help="Collapse a speedscope file.")
+    collapse.add_argument("speedscope", type=Path)
+    collapse.add_argument("--output", type=Path, required=True, help="Folded-stack output.")
+    collapse.add_argument("--hot-methods", type=Path, default=None, help="Markdown table output.")
+    add_analysis_arguments(collapse)
+
+    diff = subparsers.add_parser("diff", help="Diff two folded-stack files.")
+    diff.add_argument("before", type=Path)
+    diff.add_argument("after", type=Path)
+    diff.add_argument("--output", type=Path, required=True, help="Markdown output.")
+    diff.add_argument(
+        "--folded-output",
+        type=Path,
+        default=None,
+        help="Two-column folded output (stack before after) for flamegraph difffolded tools.",
+    )
+    diff.add_argument("--top", type=int, default=DEFAULT_TOP)
+
+    return parser.parse_args(argv)
+
+
+def add_analysis_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--focus",
+        default=DEFAULT_FOCUS,
+        help=(
+            "Regex for frames of interest. Stacks without a matching frame are dropped and "
+            "the frames above the first match are trimmed; pass '' to keep every stack."
+        ),
+    )
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="Hot-method rows.")
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    if args.command == "collapse":
+        stacks = focus_stacks(collapse_speedscope(load_json(args.speedscope)), args.focus)
+        write_folded(resolve_repo_path(args.output), stacks)
+        if args.hot_methods is not None:
+            write_text(
+                resolve_repo_path(args.hot_methods),
+                render_hot_methods(args.speedscope.name, stacks, args.top),
+            )
+        print(f"stacks={len(stacks)}")
+        print(f"output={repo_relative(resolve_repo_path(args.output))}")
+        return 0
+    if args.command == "diff":
+        before = read_folded(resolve_repo_path(args.before))
+        after = read_folded(resolve_repo_path(args.after))
+        write_text(
+            resolve_repo_path(args.output),
+            render_profile_diff(args.before.name, args.after.name, before, after, args.top),
+        )
+        if args.folded_output is not None:
+            write_diff_folded(resolve_repo_path(args.folded_output), before, after)
+        print(f"output={repo_relative(resolve_repo_path(args.output))}")
+        return 0
+    return capture(args)
+
+
+def capture(args: argparse.Namespace) -> int:
+    scenarios = list(dict.fromkeys(args.scenario))
+    if args.from_deltas is not None:
+        scenarios.extend(
+            scenario
+            for scenario in regressed_scenarios(load_json(resolve_repo_path(args.from_deltas)))
+            if scenario not in scenarios
+        )
+    output_root = resolve_repo_path(args.output_root)
+    output_root.mkdir(parents=True, exist_ok=True)
+    if not scenarios:
+        write_index(output_root, args.profiler, [])
+        print("profiled_scenarios=0")
+        print(f"output={repo_relative(output_root / PROFILE_INDEX_NAME)}")
+        return 0
+
+    if not args.no_build:
+        completed = subprocess.run(
+            ["dotnet", "build", str(COMPARISON_PROJECT), "-c", args.configuration],
+            cwd=ROOT,
+            check=False,
+        )
+        if completed.returncode != 0:
+            print("error=comparison build failed", file=sys.stderr)
+            return 1
+
+    baseline = load_index(resolve_repo_path(args.baseline_root)) if args.baseline_root else {}
+    entries = []
+    failed = []
+    for scenario in scenarios:
+        raw_root = output_root / "raw" / scenario
+        if raw_root.exists():
+            shutil.rmtree(raw_root)
+        raw_root.mkdir(parents=True)
+        if not run_profiler(args, scenario, raw_root):
+            failed.append(scenario)
+            continue
+
+        for speedscope in sorted(raw_root.rglob(f"*{SPEEDSCOPE_SUFFIX}")):
+            entries.append(
+                process_speedscope(
+                    speedscope, scenario, output_root, baseline, args.focus, args.top
+                )
+            )
+
+    write_index(output_root, args.profiler, entries)
+    print(f"profiled_scenarios={len(scenarios) - len(failed)}")
+    print(f"profiles={len(entries)}")
+    print(f"profile_diffs={sum(1 for entry in entries if entry.get('diff'))}")
+    print(f"output={repo_relative(output_root / PROFILE_INDEX_NAME)}")
+    if failed:
+        print(f"error=profiling failed for: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_profiler(args: argparse.Namespace, scenario: str, raw_root: Path) -> bool:
+    benchmark_filter = f"*Benchmarks.{args.runtime}*{scenario}*"
+    if args.profiler == "ep":
+        command = [
+            "dotnet",
+            "run",
+            "--project",
+            str(COMPARISON_PROJECT),
+            "-c",
+            args.configuration,
+            "--no-build",
+            "--",
+            "--filter",
+            benchmark_filter,
+            "--profiler",
+            "EP",
+            "--artifacts",
+            str(raw_root),
+        ]
+    else:
+        if shutil.which("dotnet-trace") is None:
+            print(
+                "error=dotnet-trace is not installed; run `dotnet tool install --global "
+                "dotnet-trace` or use --profiler ep",
+                file=sys.stderr,
+            )
+            return False
+        assembly = (
+            COMPARISON_PROJECT.parent
+            / "bin"
+            / args.configuration
+            / COMPARISON_TARGET_FRAMEWORK
+            / COMPARISON_ASSEMBLY
+        )
+        # dotnet-trace follows only the process it starts, so the benchmarks run in-process.
+        command = [
+            "dotnet-trace",
+            "collect",
+            "--format",
+            "Speedscope",
+            "--profile",
+            args.trace_profile,
+            "--output",
+            str(raw_root / f"{scenario}.nettrace"),
+            "--",
+            "dotnet",
+            str(assembly),
+            "--filter",
+            benchmark_filter,
+            "--inProcess",
+            "--artifacts",
+            str(raw_root),
+        ]
+
+    completed = subprocess.run(command, cwd=ROOT, check=False)
+    return completed.returncode == 0 and any(raw_root.rglob(f"*{SPEEDSCOPE_SUFFIX}"))
+
+
+def process_speedscope(
+    speedscope: Path,
+    scenario: str,
+    output_root: Path,
+    baseline: dict[str, dict],
+    focus: str,
+    top: int,
+) -> dict[str, object]:
+    name = profile_name(speedscope)
+    stem = re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("_")
+    stacks = focus_stacks(collapse_speedscope(load_json(speedscope)), focus)
+
+    copied = output_root / f"{stem}{SPEEDSCOPE_SUFFIX}"
+    shutil.copyfile(speedscope, copied)
+    folded = output_root / f"{stem}.folded"
+    write_folded(folded, stacks)
+    hot_methods = output_root / f"{stem}.hot.md"
+    write_text(hot_methods, render_hot_methods(name, stacks, top))
+
+    entry: dict[str, object] = {
+        "scenario": scenario,
+        "name": name,
+        "speedscope": copied.name,
+        "folded": folded.name,
+        "hotMethods": hot_methods.name,
+        "totalMicroseconds": round(sum(stacks.values())),
+        "topMethods": [
+            display_frame(method.name) for method in hot_method_rows(stacks)[: min(top, 5)]
+        ],
+        "diff": None,
+    }
+
+    baseline_entry = baseline.get(name)
+    if baseline_entry is not None:
+        before = read_folded(Path(baseline_entry["root"]) / baseline_entry["folded"])
+        diff = output_root / f"{stem}.diff.md"
+        write_text(diff, render_profile_diff(f"baseline {name}", f"current {name}", before, stacks, top))
+        diff_folded = output_root / f"{stem}.diff.folded"
+        write_diff_folded(diff_folded, before, stacks)
+        deltas = method_deltas(before, stacks)
+        entry["diff"] = {
+            "markdown": diff.name,
+            "folded": diff_folded.name,
+            "largestIncrease": deltas[0].name if deltas and deltas[0].delta > 0 else None,
+        }
+
+    return entry
+
+
+def profile_name(speedscope: Path) -> str:
+    """Return the benchmark name of a profile file without BenchmarkDotNet's timestamp."""
+
+    name = speedscope.name[: -len(SPEEDSCOPE_SUFFIX)]
+    return re.sub(r"-\d{8}-\d{6}$", "", name)
+
+
+def regressed_scenarios(deltas: dict) -> list[str]:
+    """Scenarios of the phase gate failures in a benchmark-deltas.json document."""
+
+    scenarios: list[str] = []
+    for failure in deltas.get("phaseGateFailures") or []:
+        for part in str(failure.get("parameters") or "").split("|"):
+            name, _, value = part.partition(":")
+            if name == "Scenario" and value and value not in scenarios:
+                scenarios.append(value)
+
+    return scenarios
+
+
+def collapse_speedscope(document: dict) -> dict[tuple[str, ...], float]:
+    """Fold every profile of a speedscope document into stack -> microseconds."""
+
+    frames = [
+        str(frame.get("name") or "?")
+        for frame in (document.get("shared") or {}).get("frames") or []
+    ]
+    stacks: dict[tuple[str, ...], float] = defaultdict(float)
+    for profile in document.get("profiles") or []:
+        scale = UNIT_MICROSECONDS.get(str(profile.get("unit") or "").lower(), 1.0)
+        if profile.get("type") == "sampled":
+            weights = profile.get("weights") or []
+            for index, sample in enumerate(profile.get("samples") or []):
+                weight = weights[index] if index < len(weights) else 1
+                if sample:
+                    stacks[tuple(frames[frame] for frame in sample)] += weight * scale
+            continue
+
+        stack: list[int] = []
+        last_at: float | None = None
+        for event in profile.get("events") or []:
+            at = float(event.get("at") or 0)
+            if stack and last_at is not None and at > last_at:
+                stacks[tuple(frames[frame] for frame in stack)] += (at - last_at) * scale
+            last_at = at
+            if event.get("type") == "O":
+                stack.append(int(event["frame"]))
+            elif event.get("type") == "C" and stack:
+                # Speedscope closes frames in LIFO order; tolerate writers that do not.
+                frame = int(event["frame"])
+                if frame in stack:
+                    del stack[len(stack) - 1 - stack[::-1].index(frame) :]
+
+    return dict(stacks)
+
+
+def focus_stacks(
+    stacks: dict[tuple[str, ...], float], focus: str
+) -> dict[tuple[str, ...], float]:
+    if not focus:
+        return dict(stacks)
+
+    pattern = re.compile(focus)
+    focused: dict[tuple[str, ...], float] = defaultdict(float)
+    for stack, weight in stacks.items():
+        for index, frame in enumerate(stack):
+            if pattern.search(frame):
+                focused[stack[index:]] += weight
+                break
+
+    return dict(focused)
+
+
+def hot_method_rows(stacks: dict[tuple[str, ...], float]) -> list[HotMethod]:
+    self_weights: dict[str, float] = defaultdict(float)
+    total_weights: dict[str, float] = defaultdict(float)
+    for stack, weight in stacks.items():
+        self_weights[stack[-1]] += weight
+        for frame in set(stack):
+            total_weights[frame] += weight
+
+    return sorted(
+        (HotMethod(name, self_weights.get(name, 0.0), total) for name, total in total_weights.items()),
+        key=lambda method: (-method.self_weight, -method.total_weight, method.name),
+    )
+
+
+def method_deltas(
+    before: dict[tuple[str, ...], float], after: dict[tuple[str, ...], float]
+) -> list[MethodDelta]:
+    """Self-time share changes, largest first; shares hide run-length differences."""
+
+    before_shares = self_shares(before)
+    after_shares = self_shares(after)
+    deltas = [
+        MethodDelta(name, before_shares.get(name, 0.0), after_shares.get(name, 0.0))
+        for name in set(before_shares) | set(after_shares)
+    ]
+    return sorted(deltas, key=lambda delta: (-abs(delta.delta), delta.name))
+
+
+def self_shares(stacks: dict[tuple[str, ...], float]) -> dict[str, float]:
+    total = sum(stacks.values())
+    if total <= 0:
+        return {}
+    return {method.name: method.self_weight / total for method in hot_method_rows(stacks)}
+
+
+def render_hot_methods(title: str, stacks: dict[tuple[str, ...], float], top: int) -> str:
+    total = sum(stacks.values())
+    lines = [
+        f"## Hot Methods: {title}",
+        "",
+        f"- Sampled time: {format_microseconds(total)}",
+        f"- Distinct stacks: {len(stacks)}",
+        "",
+        render_markdown_row(["Rank", "Method", "Self", "Self %", "Total %"]),
+        render_markdown_row(["---:", "---", "---:", "---:", "---:"]),
+    ]
+    for rank, method in enumerate(hot_method_rows(stacks)[:top], start=1):
+        lines.append(
+            render_markdown_row(
+                [
+                    str(rank),
+                    f"`{display_frame(method.name)}`",
+                    format_microseconds(method.self_weight),
+                    format_share(method.self_weight, total),
+                    format_share(method.total_weight, total),
+                ]
+            )
+        )
+    return "\n".join(lines) + "\n"
+
+
+def render_profile_diff(
+    before_title: str,
+    after_title: str,
+    before: dict[tuple[str, ...], float],
+    after: dict[tuple[str, ...], float],
+    top: int,
+) -> str:
+    lines = [
+        f"## Profile Diff: {after_title} vs {before_title}",
+        "",
+        "Self-time shares are compared instead of absolute time, so a longer capture does "
+        "not look like a regression. Positive deltas mean the method takes a larger share "
+        "of the current profile.",
+        "",
+        f"- Before: {format_microseconds(sum(before.values()))} sampled",
+        f"- After: {format_microseconds(sum(after.values()))} sampled",
+        "",
+        render_markdown_row(["Method", "Before Self %", "After Self %", "Delta"]),
+        render_markdown_row(["---", "---:", "---:", "---:"]),
+    ]
+    for delta in method_deltas(before, after)[:top]:
+        lines.append(
+            render_markdown_row(
+                [
+                    f"`{display_frame(delta.name)}`",
+                    f"{delta.before_share * 100:.2f}%",
+                    f"{delta.after_share * 100:.2f}%",
+                    f"{delta.delta * 100:+.2f} pp",
+                ]
+            )
+        )
+    return "\n".join(lines) + "\n"
+
+
+def write_folded(path: Path, stacks: dict[tuple[str, ...], float]) -> None:
+    lines = [
+        f"{';'.join(folded_frame(frame) for frame in stack)} {round(weight)}"
+        for stack, weight in sorted(stacks.items())
+        if round(weight) > 0
+    ]
+    write_text(path, "\n".join(lines) + ("\n" if lines else ""))
+
+
+def write_diff_folded(
+    path: Path,
+    before: dict[tuple[str, ...], float],
+    after: dict[tuple[str, ...], float],
+) -> None:
+    lines = [
+        f"{';'.join(folded_frame(frame) for frame in stack)} "
+        f"{round(before.get(stack, 0))} {round(after.get(stack, 0))}"
+        for stack in sorted(set(before) | set(after))
+    ]
+    write_text(path, "\n".join(lines) + ("\n" if lines else ""))
+
+
+def read_folded(path: Path) -> dict[tuple[str, ...], float]:
+    stacks: dict[tuple[str, ...], float] = defaultdict(float)
+    for line in path.read_text(encoding="utf-8").splitlines():
+        stack, _, weight = line.rpartition(" ")
+        if stack:
+            stacks[tuple(stack.split(";"))] += float(weight)
+    return dict(stacks)
+
+
+def folded_frame(frame: str) -> str:
+    # Folded stacks use ';' between frames and a space before the weight.
+    return frame.replace(";", ":").replace(" ", "_")
+
+
+def display_frame(frame: str) -> str:
+    """Drop the ``Module!`` prefix that EventPipe puts on managed frames."""
+
+    return frame.split("!", 1)[1] if "!" in frame else frame
+
+
+def write_index(output_root: Path, profiler: str, entries: list[dict[str, object]]) -> None:
+    payload = {"schema": PROFILE_INDEX_SCHEMA, "profiler": profiler, "profiles": entries}
+    write_text(
+        output_root / PROFILE_INDEX_NAME,
+        json.dumps(payload, indent=2, sort_keys=True) + "\n",
+    )
+
+
+def load_index(root: Path) -> dict[str, dict]:
+    path = root / PROFILE_INDEX_NAME
+    if not path.exists():
+        return {}
+
+    data = load_json(path)
+    if data.get("schema") != PROFILE_INDEX_SCHEMA:
+        raise ValueError(f"Unsupported profile index schema in {repo_relative(path)}")
+    return {
+        str(entry["name"]): {**entry, "root": str(root)}
+        for entry in data.get("profiles") or []
+        if entry.get("name") and entry.get("folded")
+    }
+
+
+def load_json(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8-sig"))
+
+
+def write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def format_microseconds(value: float) -> str:
+    if not math.isfinite(value):
+        return "-"
+    if value >= 1_000_000:
+        return f"{value / 1_000_000:.2f} s"
+    if value >= 1_000:
+        return f"{value / 1_000:.1f} ms"
+    return f"{value:.0f} us"
+
+
+def format_share(value: float, total: float) -> str:
+    return f"{value / total * 100:.2f}%" if total > 0 else "-"
+
+
+def render_markdown_row(cells: list[str]) -> str:
+    return "| " + " | ".join(cell.replace("|", "\\|") for cell in cells) + " |"
+
+
+def resolve_repo_path(path: Path) -> Path:
+    return path if path.is_absolute() else ROOT / path
+
+
+def repo_relative(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
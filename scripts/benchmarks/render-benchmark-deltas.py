@@ -4,31 +4,120 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import math
+import os
+import random
 import re
 import sys
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+from audit_cache import write_json_atomic  # noqa: E402
+
 DEFAULT_CURRENT_ROOT = Path("BenchmarkDotNet.Artifacts")
 DEFAULT_COMPARISON_ROOT = Path("BenchmarkDotNet.Artifacts")
 DEFAULT_SELF_BASELINE_ROOT = Path("docs/performance-history/current-baseline")
 DEFAULT_OUTPUT = Path("artifacts/benchmark-deltas.md")
+DEFAULT_REPORT_CACHE = Path("artifacts/benchmark-deltas-cache")
 DEFAULT_PHASE_BASELINE = Path("progress/benchmarks/phase-a0-scoreboard-baseline.json")
+DEFAULT_MEMORY_RETENTION_BASELINE = Path(
+    "progress/benchmarks/phase-a0.5-memory-retention-baseline.json"
+)
 DEFAULT_TOLERANCE = 0.02
 DEFAULT_REGRESSION_THRESHOLD = 0.10
 DEFAULT_NLUA_RATIO_THRESHOLD = 1.00
+DEFAULT_SIGNIFICANCE = 0.01
+DEFAULT_MIN_EFFECT_SIZE = 0.33
+MIN_STATISTICAL_SAMPLES = 5
+BOOTSTRAP_RESAMPLES = 1000
+BOOTSTRAP_SEED = 20240601
 PHASE_ALLOCATION_EXACT_LIMIT_BYTES = 1024.0
 PHASE_ALLOCATION_ABSOLUTE_TOLERANCE_BYTES = 512.0
 PHASE_ALLOCATION_RELATIVE_TOLERANCE = 0.0002
+# Calibrated noise bands replace the global phase thresholds for rows that carry them.
+# A band is the largest deviation from the median seen across repeated runs of one
+# commit; gates allow NOISE_BAND_MULTIPLIER times that, and never less than the floor.
+# Two runs say too little about the spread, so a band needs at least three.
+MIN_NOISE_CALIBRATION_RUNS = 3
+NOISE_BAND_MULTIPLIER = 3.0
+NOISE_BAND_FLOOR = 0.02
 NOVA_RUNTIME = "NovaSharp"
 RUNTIME_PREFIXES = ("NovaSharp", "MoonSharp", "NLua", "LuaCSharp", "KeraLua", "Lua")
 EXPECTED_EXTERNAL_RUNTIMES = ("MoonSharp", "NLua", "LuaCSharp")
 SCOREBOARD_RUNTIMES = ("MoonSharp", "NLua", "LuaCSharp", "Lua")
+# Reference lua rows from scripts/benchmarks/run-lua-cli-context.py carry no memory
+# or GC data and never feed the changed signal. Whole-process wall time also hides
+# percent deltas; in-process os.clock timing is comparable and shows them.
+LUA_CLI_WALL_TIME_KIND = "LuaCliWallTime"
+REFERENCE_LUA_RUNTIME_KINDS = (LUA_CLI_WALL_TIME_KIND, "LuaInProcessCpuTime")
+# Process resource metrics written by run-lua-cli-context.py. They describe whole lua
+# processes, so they are rendered on their own and never diffed against managed B/op.
+PROCESS_METRIC_IDS = (
+    "PeakRss",
+    "UserCpuTime",
+    "SystemCpuTime",
+    "MinorPageFaults",
+    "MajorPageFaults",
+    "VoluntaryContextSwitches",
+    "InvoluntaryContextSwitches",
+)
 PHASE_BASELINE_SCHEMA = "novasharp.phase-benchmark-baseline.v1"
+DELTAS_JSON_SCHEMA = "novasharp.benchmark-deltas.v1"
+ALLOCATION_SITES_SCHEMA = "novasharp.vm-hotpath-allocation-sites.v1"
+SCENARIO_OPCODES_SCHEMA = "novasharp.benchmark-scenario-opcodes.v1"
+# Bump when the distilled report fields change so stale cache entries are ignored.
+REPORT_CACHE_SCHEMA = "novasharp.benchmark-report-cache.v2"
+# Written by scripts/benchmarks/capture-environment.py next to the BenchmarkDotNet results.
+ENVIRONMENT_FILE_NAME = "environment-fingerprint.json"
+PROFILE_INDEX_NAME = "profile-index.json"
+PROFILE_INDEX_SCHEMA = "novasharp.benchmark-profiles.v1"
+ENVIRONMENT_MISMATCH_MODES = ("normalize", "fail", "warn")
+DEFAULT_NORMALIZATION_SCENARIO = "NumericLoops"
+DEFAULT_NORMALIZATION_RUNTIME = "NLua"
+# Fingerprint fields whose differences change what a row measures; no speed factor bridges them.
+STRICT_ENVIRONMENT_FIELDS = ("architecture", "runtime", "job")
+# Fingerprint fields that mostly change how fast the same work runs.
+SPEED_ENVIRONMENT_FIELDS = ("processor", "logicalCores", "governor", "kernel", "os")
+ENVIRONMENT_FIELDS = (
+    "processor",
+    "logicalCores",
+    "architecture",
+    "runtime",
+    "job",
+    "os",
+    "kernel",
+    "governor",
+)
+ARCHITECTURE_ALIASES = {"x86_64": "x64", "amd64": "x64", "aarch64": "arm64"}
+# Operations that run Lua through the VM opcode loop. Compile rows allocate in the
+# parser and compiler, so VM hot-path allocation sites cannot explain their B/op.
+VM_ALLOCATION_OPERATIONS = ("Execute", "LuaToClrInterop", "ClrToLuaInterop")
+CALLBACK_ALLOCATION_OPERATIONS = ("LuaToClrInterop", "ClrToLuaInterop")
+ALLOCATION_HOTSPOT_LIMIT = 20
+MEMORY_RETENTION_BASELINE_SCHEMA = "novasharp.phase-a0.5-memory-retention-baseline.v1"
+MEMORY_RETENTION_TYPE = "MemoryRetentionBenchmarks"
+# MemoryRetentionBenchmarks writes one <Method>.json per benchmark case into this directory
+# when NOVASHARP_MEMORY_RETENTION_DIAGNOSTICS_DIR points at it.
+MEMORY_RETENTION_DIAGNOSTICS_DIRECTORY = "memory-retention-diagnostics"
+MEMORY_RETENTION_DIAGNOSTICS_SCHEMA = "novasharp.memory-retention-diagnostics.v1"
+# LuaEngine.GetMemoryStatistics() fields recorded after a critical trim. The benchmark
+# writes them, camelCase, under diagnosticsAfterCriticalTrim in its sidecar JSON.
+MEMORY_RETENTION_DIAGNOSTICS = (
+    "retainedPoolCount",
+    "estimatedRetainedBytes",
+    "peakRetainedBytes",
+    "trimCount",
+    "droppedCount",
+    "compilationCacheEntryCount",
+    "privateBytes",
+    "workingSetBytes",
+)
 
 
 @dataclass(frozen=True, order=True)
@@ -45,6 +134,19 @@ class ComparisonKey:
     parameters: str
 
 
+@dataclass(frozen=True)
+class ProcessMetrics:
+    """Per-process resource usage reported by reference lua rows."""
+
+    peak_rss_bytes: float
+    user_cpu_ms: float
+    system_cpu_ms: float
+    minor_faults: float
+    major_faults: float
+    voluntary_switches: float
+    involuntary_switches: float
+
+
 @dataclass(frozen=True)
 class Metrics:
     mean_ns: float
@@ -53,6 +155,43 @@ class Metrics:
     gen1_per_1k: float
     gen2_per_1k: float
     allocated_bytes: float
+    samples_ns: tuple[float, ...] = field(default=(), compare=False, repr=False)
+    process: ProcessMetrics | None = field(default=None, compare=False, repr=False)
+
+
+@dataclass(frozen=True)
+class NoiseBand:
+    """Run-to-run spread of one row measured on an unchanged commit."""
+
+    runs: int
+    mean_fraction: float
+    p95_fraction: float
+    allocated_bytes: float
+
+    def timing_threshold(self, metric_name: str) -> float:
+        fraction = self.mean_fraction if metric_name == "mean" else self.p95_fraction
+        return max(NOISE_BAND_FLOOR, NOISE_BAND_MULTIPLIER * fraction)
+
+    def allocation_tolerance(self, baseline: float) -> float:
+        # Identical runs have no spread, so the band may only widen the global tolerance.
+        return max(
+            NOISE_BAND_MULTIPLIER * self.allocated_bytes, phase_allocation_tolerance(baseline)
+        )
+
+
+@dataclass(frozen=True)
+class EnvironmentFingerprint:
+    """Host, runtime, and job identity of the machine that produced a benchmark row."""
+
+    details: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def digest(self) -> str:
+        encoded = json.dumps(self.details, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:12]
+
+    def value(self, name: str) -> str:
+        return self.details.get(name, "")
 
 
 @dataclass(frozen=True)
@@ -63,6 +202,114 @@ class MetricRecord:
     runtime_context: str = ""
     runtime_kind: str = ""
     show_delta_percent: bool = True
+    noise: NoiseBand | None = field(default=None, compare=False)
+    environment: EnvironmentFingerprint | None = field(default=None, compare=False)
+
+
+@dataclass(frozen=True)
+class ReportBenchmark:
+    """The parts of one BenchmarkDotNet benchmark entry the renderer reads."""
+
+    key: BenchmarkKey
+    type_name: str
+    method: str
+    record: MetricRecord
+    metric_values: dict[str, float] = field(default_factory=dict, compare=False)
+
+
+@dataclass(frozen=True)
+class BenchmarkReport:
+    path: Path
+    host: dict[str, object]
+    benchmarks: tuple[ReportBenchmark, ...]
+    jobs: tuple[str, ...] = ()
+    environment: EnvironmentFingerprint | None = None
+
+
+class ReportIndex:
+    """Parses each BenchmarkDotNet report at most once per run.
+
+    The full-compressed reports carry every raw measurement, so the distilled benchmarks
+    are also cached on disk under the SHA-256 of the report bytes. Later runs hash the
+    file instead of decoding it, and roots that share reports share the parse.
+    """
+
+    def __init__(self, cache_dir: Path | None) -> None:
+        self.cache_dir = cache_dir
+        self.parsed = 0
+        self.cached = 0
+        self._roots: dict[Path, list[Path]] = {}
+        self._reports: dict[Path, BenchmarkReport] = {}
+
+    def reports(self, root: Path) -> list[BenchmarkReport]:
+        root = root.resolve()
+        if root not in self._roots:
+            self._roots[root] = [path.resolve() for path in find_benchmark_reports(root)]
+        return [self.report(path) for path in self._roots[root]]
+
+    def report(self, path: Path) -> BenchmarkReport:
+        report = self._reports.get(path)
+        if report is not None:
+            return report
+
+        payload = path.read_bytes()
+        digest = hashlib.sha256(payload).hexdigest()
+        report = self._read_cache(path, digest)
+        if report is None:
+            report = distill_report(path, json.loads(payload))
+            self.parsed += 1
+            self._write_cache(digest, report)
+        else:
+            self.cached += 1
+
+        # The sidecar fingerprint is not part of the report bytes, so it is merged after
+        # the cache lookup instead of being cached with the distilled benchmarks.
+        environment = environment_from_report(report, read_environment_sidecar(path))
+        report = replace(
+            report,
+            benchmarks=tuple(
+                replace(benchmark, record=replace(benchmark.record, environment=environment))
+                for benchmark in report.benchmarks
+            ),
+            environment=environment,
+        )
+        self._reports[path] = report
+        return report
+
+    def _cache_path(self, digest: str) -> Path | None:
+        return self.cache_dir / f"{digest}.json" if self.cache_dir is not None else None
+
+    def _read_cache(self, path: Path, digest: str) -> BenchmarkReport | None:
+        cache_path = self._cache_path(digest)
+        if cache_path is None or not cache_path.exists():
+            return None
+
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("schema") != REPORT_CACHE_SCHEMA:
+            return None
+
+        return BenchmarkReport(
+            path,
+            data.get("host") or {},
+            tuple(report_benchmark_from_cache(entry) for entry in data.get("benchmarks") or []),
+            tuple(data.get("jobs") or ()),
+        )
+
+    def _write_cache(self, digest: str, report: BenchmarkReport) -> None:
+        cache_path = self._cache_path(digest)
+        if cache_path is None:
+            return
+
+        payload = {
+            "schema": REPORT_CACHE_SCHEMA,
+            "host": report.host,
+            "jobs": list(report.jobs),
+            "benchmarks": [asdict(benchmark) for benchmark in report.benchmarks],
+        }
+        write_json_atomic(cache_path, payload)
 
 
 @dataclass(frozen=True)
@@ -106,12 +353,25 @@ class MissingRuntimeCell:
     runtime: str
 
 
+@dataclass(frozen=True)
+class SampleComparison:
+    """Distribution comparison of per-operation times, current versus baseline."""
+
+    current_count: int
+    baseline_count: int
+    p_value: float
+    effect_size: float
+    ratio_low: float
+    ratio_high: float
+
+
 @dataclass(frozen=True)
 class SelfDeltaRow:
     key: BenchmarkKey
     parameter_display: str
     current: Metrics
     baseline: Metrics
+    timing: SampleComparison | None = None
 
 
 @dataclass(frozen=True)
@@ -121,6 +381,134 @@ class PhaseGateFailure:
     message: str
 
 
+@dataclass(frozen=True)
+class EnvironmentSummary:
+    mode: str
+    normalization_scenario: str
+    normalization_runtime: str
+    current: dict[str, EnvironmentFingerprint]
+    baseline: dict[str, EnvironmentFingerprint]
+    factors: dict[tuple[str, str], float]
+    mismatched_rows: int
+    normalized_rows: int
+
+
+@dataclass(frozen=True)
+class ProfileSummary:
+    root: Path
+    profiler: str
+    entries: list[dict[str, object]]
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    rule_id: str
+    path: str
+    line_number: int
+    symbol: str
+    call_path: tuple[str, ...]
+    allowlisted: bool
+    reason: str
+    # Upper-case opcodes whose ProcessingLoop case can reach the site; None for any.
+    opcodes: frozenset[str] | None = None
+
+
+@dataclass(frozen=True)
+class ScenarioAllocation:
+    key: ComparisonKey
+    parameter_display: str
+    current_bytes: float
+    baseline_bytes: float
+
+    @property
+    def scenario_name(self) -> str:
+        display = self.parameter_display or parameter_display_from_signature(self.key.parameters)
+        return next(
+            (value for name, value in split_parameter_display(display) if name == "Scenario"),
+            "",
+        )
+
+    @property
+    def regression_bytes(self) -> float:
+        if not math.isfinite(self.current_bytes) or not math.isfinite(self.baseline_bytes):
+            return 0.0
+        delta = self.current_bytes - self.baseline_bytes
+        return delta if delta > phase_allocation_tolerance(self.baseline_bytes) else 0.0
+
+
+@dataclass(frozen=True)
+class AllocationSiteCandidate:
+    site: AllocationSite
+    regressed_scenarios: tuple[ScenarioAllocation, ...]
+
+    @property
+    def reached_regression_bytes(self) -> float:
+        return sum(scenario.regression_bytes for scenario in self.regressed_scenarios)
+
+
+@dataclass(frozen=True)
+class RetentionMetric:
+    """A memory-retention measurement and how much growth the gate allows."""
+
+    name: str
+    display_name: str
+    unit: str
+    gated: bool
+    relative_tolerance: float = 0.0
+    absolute_tolerance: float = 0.0
+    exact_below: float = 0.0
+
+    def tolerance(self, baseline: float) -> float:
+        if baseline < self.exact_below:
+            return 0.0
+        return max(self.absolute_tolerance, baseline * self.relative_tolerance)
+
+
+# B/op keeps the phase allocation tolerance. Retained bytes are estimates that move with
+# pool bucket rounding, so they get a small band; pool and cache counts must not grow.
+# Private bytes and working set depend on the runner and are report-only.
+RETENTION_METRICS = (
+    RetentionMetric(
+        "allocatedBytesPerOperation",
+        "B/op",
+        "bytes",
+        True,
+        PHASE_ALLOCATION_RELATIVE_TOLERANCE,
+        PHASE_ALLOCATION_ABSOLUTE_TOLERANCE_BYTES,
+        PHASE_ALLOCATION_EXACT_LIMIT_BYTES,
+    ),
+    RetentionMetric("estimatedRetainedBytes", "Retained", "bytes", True, 0.05, 1024.0),
+    RetentionMetric("peakRetainedBytes", "Peak Retained", "bytes", True, 0.05, 1024.0),
+    RetentionMetric("retainedPoolCount", "Pools", "count", True),
+    RetentionMetric("compilationCacheEntryCount", "Cache Entries", "count", True),
+    RetentionMetric("privateBytes", "Private Bytes", "bytes", False),
+    RetentionMetric("workingSetBytes", "Working Set", "bytes", False),
+)
+
+
+@dataclass(frozen=True)
+class MemoryRetentionRow:
+    method: str
+    current: dict[str, float]
+    baseline: dict[str, float]
+
+
+@dataclass(frozen=True)
+class MemoryRetentionGateFailure:
+    method: str
+    metric: str
+    message: str
+
+
+@dataclass(frozen=True)
+class MemoryRetentionReport:
+    root: Path
+    baseline_path: Path
+    metrics: tuple[RetentionMetric, ...]
+    rows: list[MemoryRetentionRow]
+    failures: list[MemoryRetentionGateFailure]
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -163,12 +551,44 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
             "checked-in phase baselines under progress/ after a representative run."
         ),
     )
+    parser.add_argument(
+        "--noise-calibration-root",
+        type=Path,
+        action="append",
+        default=[],
+        help=(
+            "Comparison artifacts from one of several runs of an unchanged commit. With at "
+            "least three roots, --write-phase-baseline records per-row noise bands, and the "
+            "phase gates use them instead of the global thresholds. Requires "
+            "--write-phase-baseline. May be repeated."
+        ),
+    )
     parser.add_argument(
         "--output",
         type=Path,
         default=DEFAULT_OUTPUT,
         help="Markdown output path.",
     )
+    parser.add_argument(
+        "--json-output",
+        type=Path,
+        default=None,
+        help=(
+            "Also write every self-baseline row, runtime matrix row, phase gate failure, and "
+            "missing runtime cell to this JSON path for dashboards and bots."
+        ),
+    )
+    parser.add_argument(
+        "--report-cache",
+        type=Path,
+        default=DEFAULT_REPORT_CACHE,
+        help="Directory for distilled BenchmarkDotNet reports, keyed by report SHA-256.",
+    )
+    parser.add_argument(
+        "--no-report-cache",
+        action="store_true",
+        help="Parse every report without reading or writing --report-cache.",
+    )
     parser.add_argument(
         "--tolerance",
         type=float,
@@ -179,7 +599,28 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         "--regression-threshold",
         type=float,
         default=DEFAULT_REGRESSION_THRESHOLD,
-        help="Fractional worse-than-self-baseline threshold for regressed=true.",
+        help=(
+            "Fractional worse-than-self-baseline threshold for regressed=true. Used for "
+            "rows whose BenchmarkDotNet JSON lacks per-iteration measurements."
+        ),
+    )
+    parser.add_argument(
+        "--significance",
+        type=float,
+        default=DEFAULT_SIGNIFICANCE,
+        help=(
+            "One-sided Mann-Whitney U p-value below which a self-baseline slowdown is "
+            "significant; the bootstrap mean-ratio interval uses the same level."
+        ),
+    )
+    parser.add_argument(
+        "--min-effect-size",
+        type=float,
+        default=DEFAULT_MIN_EFFECT_SIZE,
+        help=(
+            "Minimum Cliff's delta (0..1) for a significant self-baseline slowdown to "
+            "set regressed=true."
+        ),
     )
     parser.add_argument(
         "--nlua-ratio-threshold",
@@ -201,12 +642,119 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
             "the phase allocation tolerance."
         ),
     )
+    parser.add_argument(
+        "--environment-mismatch",
+        choices=ENVIRONMENT_MISMATCH_MODES,
+        default="normalize",
+        help=(
+            "How phase and memory-retention gates treat rows whose environment fingerprint "
+            "differs from the baseline. Architecture, runtime major version, and job "
+            "differences fail unless this is warn; processor, core count, OS, kernel, and "
+            "governor differences are normalized by the reference scenario (normalize), "
+            "fail (fail), or are only reported (warn)."
+        ),
+    )
+    parser.add_argument(
+        "--normalization-scenario",
+        default=DEFAULT_NORMALIZATION_SCENARIO,
+        help="Execute scenario whose reference-runtime mean calibrates fingerprint speed.",
+    )
+    parser.add_argument(
+        "--normalization-runtime",
+        default=DEFAULT_NORMALIZATION_RUNTIME,
+        help="Comparison runtime whose timing serves as the normalization reference.",
+    )
+    parser.add_argument(
+        "--profile-root",
+        type=Path,
+        default=None,
+        help=(
+            "Capture directory from scripts/benchmarks/profile-benchmarks.py. When present, "
+            "the report links the hot-method tables, flame graph inputs, and profile diffs "
+            "listed in its profile-index.json."
+        ),
+    )
+    parser.add_argument(
+        "--allocation-sites",
+        type=Path,
+        default=None,
+        help=(
+            "Allocation-site JSON from scripts/lint/check-vm-hotpath-allocations.py "
+            "--json-output. When present, the report lists NovaSharp B/op regressions with "
+            "the static VM allocation sites whose call path can run in them, ordered by the "
+            "summed regression of the scenarios each site reaches."
+        ),
+    )
+    parser.add_argument(
+        "--scenario-opcodes",
+        type=Path,
+        default=None,
+        help=(
+            "scenario-opcodes.json written next to the scenarios by the comparison project's "
+            "--export-scenarios. With --allocation-sites, a site only reaches the Execute "
+            "scenarios that compile to an opcode whose ProcessingLoop case can reach it."
+        ),
+    )
     parser.add_argument(
         "--expect-lua-cli",
         action="store_true",
         help="Report missing reference lua CLI wall-time rows for Execute scenarios.",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--memory-retention-root",
+        type=Path,
+        default=None,
+        help=(
+            "BenchmarkDotNet artifacts containing a MemoryRetentionBenchmarks run. When "
+            "present, the report compares them with --memory-retention-baseline."
+        ),
+    )
+    parser.add_argument(
+        "--memory-retention-baseline",
+        type=Path,
+        default=DEFAULT_MEMORY_RETENTION_BASELINE,
+        help="Checked-in Phase A0.5 memory-retention baseline JSON.",
+    )
+    parser.add_argument(
+        "--write-memory-retention-baseline",
+        type=Path,
+        default=None,
+        help=(
+            "Write the current memory-retention measurements to this JSON path, keeping the "
+            "notes from --memory-retention-baseline."
+        ),
+    )
+    parser.add_argument(
+        "--memory-retention-tolerance",
+        action="append",
+        default=[],
+        metavar="METRIC=FRACTION",
+        help=(
+            "Override the allowed fractional growth for one memory-retention metric, for "
+            "example estimatedRetainedBytes=0.10. May be repeated."
+        ),
+    )
+    parser.add_argument(
+        "--enforce-memory-retention-gates",
+        action="store_true",
+        help=(
+            "Fail when the memory-retention baseline is missing, when current benchmarks do "
+            "not match its entries, or when B/op, retained bytes, pool counts, or cache "
+            "entries grow beyond their tolerances."
+        ),
+    )
+    args = parser.parse_args(argv)
+    if args.memory_retention_root is None and (
+        args.enforce_memory_retention_gates or args.write_memory_retention_baseline is not None
+    ):
+        parser.error(
+            "--enforce-memory-retention-gates and --write-memory-retention-baseline "
+            "require --memory-retention-root"
+        )
+    # Noise bands are only ever written into a phase baseline.
+    if args.noise_calibration_root and args.write_phase_baseline is None:
+        parser.error("--noise-calibration-root requires --write-phase-baseline")
+    return args
 
 
 def main(argv: list[str]) -> int:
@@ -221,29 +769,72 @@ def main(argv: list[str]) -> int:
         else None
     )
     output = resolve_repo_path(args.output)
+    reports = ReportIndex(None if args.no_report_cache else resolve_repo_path(args.report_cache))
+    allocation_sites_path = (
+        resolve_repo_path(args.allocation_sites) if args.allocation_sites is not None else None
+    )
+    scenario_opcodes_path = (
+        resolve_repo_path(args.scenario_opcodes) if args.scenario_opcodes is not None else None
+    )
+    memory_retention = (
+        build_memory_retention_report(
+            reports,
+            resolve_repo_path(args.memory_retention_root),
+            resolve_repo_path(args.memory_retention_baseline),
+            resolve_retention_metrics(args.memory_retention_tolerance),
+            (
+                resolve_repo_path(args.write_memory_retention_baseline)
+                if args.write_memory_retention_baseline is not None
+                else None
+            ),
+            args.environment_mismatch,
+        )
+        if args.memory_retention_root is not None
+        else None
+    )
 
-    current = load_benchmark_metrics(current_root, include_external=False)
+    current = load_benchmark_metrics(reports, current_root, include_external=False)
     self_baseline = (
-        load_benchmark_metrics(self_baseline_root, include_external=False)
+        load_benchmark_metrics(reports, self_baseline_root, include_external=False)
         if self_baseline_root.exists()
         else {}
     )
-    self_rows = build_self_delta_rows(current, self_baseline)
+    self_rows = build_self_delta_rows(current, self_baseline, args.significance)
     current_without_baseline = sorted(key for key in current if key not in self_baseline)
     baseline_without_current = sorted(key for key in self_baseline if key not in current)
 
-    comparison = load_comparison_metrics(comparison_root)
+    comparison = load_comparison_metrics(reports, comparison_root)
     external_rows = build_external_delta_rows(comparison)
     runtime_matrix_rows = build_runtime_matrix_rows(comparison)
+    noise_calibration_roots = [resolve_repo_path(root) for root in args.noise_calibration_root]
+    noise_bands = build_noise_bands(
+        [load_comparison_metrics(reports, root) for root in noise_calibration_roots]
+    )
     if write_phase_baseline_path is not None:
-        write_phase_baseline(write_phase_baseline_path, comparison, comparison_root)
+        write_phase_baseline(
+            write_phase_baseline_path,
+            comparison,
+            comparison_root,
+            noise_bands,
+            noise_calibration_roots,
+        )
 
     phase_baseline = load_phase_baseline(phase_baseline_path)
+    environment_summary = build_environment_summary(
+        comparison,
+        phase_baseline,
+        args.environment_mismatch,
+        args.normalization_scenario,
+        args.normalization_runtime,
+    )
     phase_gate_failures = (
         build_phase_gate_failures(
             comparison,
             phase_baseline,
             args.nlua_ratio_threshold,
+            args.environment_mismatch,
+            environment_summary.factors,
+            args.normalization_runtime,
         )
         if phase_baseline_path.exists()
         else []
@@ -258,11 +849,35 @@ def main(argv: list[str]) -> int:
     comparison_groups_without_nova = sorted(
         key for key, runtimes in comparison.items() if NOVA_RUNTIME not in runtimes
     )
+    allocation_sites = (
+        load_allocation_sites(allocation_sites_path) if allocation_sites_path is not None else []
+    )
+    scenario_allocations = build_scenario_allocations(runtime_matrix_rows, phase_baseline)
+    scenario_opcodes = (
+        load_scenario_opcodes(scenario_opcodes_path) if scenario_opcodes_path is not None else {}
+    )
+    allocation_candidates = allocation_site_candidates(
+        allocation_sites, scenario_allocations, scenario_opcodes
+    )
+    profiles = (
+        load_profile_summary(resolve_repo_path(args.profile_root))
+        if args.profile_root is not None
+        else None
+    )
 
     changed = any(external_row_changed(row, args.tolerance) for row in external_rows) or any(
         self_row_changed(row, args.tolerance) for row in self_rows
     )
-    regressed = any(self_row_regressed(row, args.regression_threshold) for row in self_rows)
+    regressed = any(
+        self_row_regressed(
+            row,
+            args.regression_threshold,
+            args.tolerance,
+            args.significance,
+            args.min_effect_size,
+        )
+        for row in self_rows
+    )
 
     output.parent.mkdir(parents=True, exist_ok=True)
     output.write_text(
@@ -284,9 +899,48 @@ def main(argv: list[str]) -> int:
             phase_gate_failures,
             current_without_baseline,
             baseline_without_current,
+            args.tolerance,
+            args.significance,
+            args.min_effect_size,
+            allocation_sites_path,
+            scenario_allocations,
+            allocation_candidates,
+            scenario_opcodes_path,
+            memory_retention,
+            environment_summary,
+            profiles,
+            output.parent,
         ),
         encoding="utf-8",
     )
+    json_output = resolve_repo_path(args.json_output) if args.json_output is not None else None
+    if json_output is not None:
+        payload = build_delta_json(
+            args,
+            changed,
+            regressed,
+            external_rows,
+            runtime_matrix_rows,
+            self_rows,
+            current_root,
+            comparison_root,
+            self_baseline_root,
+            comparison_groups_without_nova,
+            missing_expected_runtime_cells,
+            phase_baseline,
+            phase_baseline_path,
+            phase_gate_failures,
+            current_without_baseline,
+            baseline_without_current,
+            memory_retention,
+            environment_summary,
+            profiles,
+        )
+        json_output.parent.mkdir(parents=True, exist_ok=True)
+        json_output.write_text(
+            json.dumps(payload, indent=2, sort_keys=True, allow_nan=False) + "\n",
+            encoding="utf-8",
+        )
 
     print(f"changed={str(changed).lower()}")
     print(f"regressed={str(regressed).lower()}")
@@ -294,10 +948,39 @@ def main(argv: list[str]) -> int:
     print(f"missing_external_runtime_cells={len(missing_expected_runtime_cells)}")
     print(f"missing_lua_cli_rows={len(missing_lua_cli_rows)}")
     print(f"self_rows={len(self_rows)}")
+    print(f"statistical_self_rows={sum(1 for row in self_rows if row.timing is not None)}")
     print(f"phase_baseline_rows={len(phase_baseline)}")
     print(f"phase_gate_failures={len(phase_gate_failures)}")
+    print(f"environment_fingerprints={len(environment_summary.current)}")
+    print(f"environment_mismatched_rows={environment_summary.mismatched_rows}")
+    print(f"environment_normalized_rows={environment_summary.normalized_rows}")
+    if profiles is not None:
+        print(f"profiles={len(profiles.entries)}")
+    if allocation_sites_path is not None:
+        print(f"allocation_sites={len(allocation_sites)}")
+        print(
+            "allocation_regressed_scenarios="
+            f"{sum(1 for scenario in scenario_allocations if scenario.regression_bytes > 0)}"
+        )
+    if scenario_opcodes_path is not None:
+        print(f"scenario_opcode_sets={len(scenario_opcodes)}")
+    if noise_calibration_roots:
+        print(f"noise_calibration_runs={len(noise_calibration_roots)}")
+        print(f"noise_banded_rows={len({key for key, _ in noise_bands})}")
     if write_phase_baseline_path is not None:
         print(f"phase_baseline_output={repo_relative(write_phase_baseline_path)}")
+    if memory_retention is not None:
+        print(f"memory_retention_rows={len(memory_retention.rows)}")
+        print(f"memory_retention_gate_failures={len(memory_retention.failures)}")
+        if args.write_memory_retention_baseline is not None:
+            print(
+                "memory_retention_baseline_output="
+                f"{repo_relative(resolve_repo_path(args.write_memory_retention_baseline))}"
+            )
+    print(f"reports_parsed={reports.parsed}")
+    print(f"reports_cached={reports.cached}")
+    if json_output is not None:
+        print(f"json_output={repo_relative(json_output)}")
     print(f"output={repo_relative(output)}")
     if args.enforce_phase_gates:
         if not phase_baseline_path.exists():
@@ -313,6 +996,20 @@ def main(argv: list[str]) -> int:
                 file=sys.stderr,
             )
             return 1
+    if args.enforce_memory_retention_gates and memory_retention is not None:
+        if not memory_retention.baseline_path.exists():
+            print(
+                "error=memory retention baseline missing: "
+                f"{repo_relative(memory_retention.baseline_path)}",
+                file=sys.stderr,
+            )
+            return 1
+        if memory_retention.failures:
+            print(
+                f"error=memory retention gate failures: {len(memory_retention.failures)}",
+                file=sys.stderr,
+            )
+            return 1
     return 0
 
 
@@ -320,16 +1017,13 @@ def resolve_repo_path(path: Path) -> Path:
     return path if path.is_absolute() else ROOT / path
 
 
-def load_benchmark_metrics(root: Path, include_external: bool) -> dict[BenchmarkKey, MetricRecord]:
+def load_benchmark_metrics(
+    reports: ReportIndex, root: Path, include_external: bool
+) -> dict[BenchmarkKey, MetricRecord]:
     metrics: dict[BenchmarkKey, MetricRecord] = {}
-    for report in find_benchmark_reports(root):
-        data = json.loads(report.read_text(encoding="utf-8"))
-        for benchmark in data.get("Benchmarks", []):
-            key = benchmark_key_from_json(benchmark)
-            if key is None:
-                continue
-
-            runtime_method = split_runtime_method(key.method)
+    for report in reports.reports(root):
+        for benchmark in report.benchmarks:
+            runtime_method = split_runtime_method(benchmark.key.method)
             if (
                 not include_external
                 and runtime_method is not None
@@ -337,54 +1031,194 @@ def load_benchmark_metrics(root: Path, include_external: bool) -> dict[Benchmark
             ):
                 continue
 
-            benchmark_metrics = metrics_from_json(benchmark)
-            if benchmark_metrics is None:
-                continue
-
-            metrics[key] = MetricRecord(
-                metrics=benchmark_metrics,
-                parameter_display=build_parameter_display_from_json(benchmark),
-                runtime_display_name=runtime_display_name_from_json(benchmark),
-                runtime_context=runtime_context_from_json(benchmark),
-                runtime_kind=runtime_kind_from_json(benchmark),
-                show_delta_percent=show_delta_percent_from_json(benchmark),
-            )
+            metrics[benchmark.key] = benchmark.record
 
     return metrics
 
 
-def load_comparison_metrics(root: Path) -> dict[ComparisonKey, dict[str, MetricRecord]]:
+def load_comparison_metrics(
+    reports: ReportIndex, root: Path
+) -> dict[ComparisonKey, dict[str, MetricRecord]]:
     metrics: dict[ComparisonKey, dict[str, MetricRecord]] = {}
-    for report in find_benchmark_reports(root):
-        data = json.loads(report.read_text(encoding="utf-8"))
-        for benchmark in data.get("Benchmarks", []):
-            key = benchmark_key_from_json(benchmark)
-            if key is None:
-                continue
-
+    for report in reports.reports(root):
+        for benchmark in report.benchmarks:
+            key = benchmark.key
             runtime_method = split_runtime_method(key.method)
             if runtime_method is None:
                 continue
 
             runtime, operation = runtime_method
-            benchmark_metrics = metrics_from_json(benchmark)
-            if benchmark_metrics is None:
-                continue
-
             comparison_key = ComparisonKey(key.summary, operation, key.parameters)
-            runtimes = metrics.setdefault(comparison_key, {})
-            runtimes[runtime] = MetricRecord(
-                metrics=benchmark_metrics,
-                parameter_display=build_parameter_display_from_json(benchmark),
-                runtime_display_name=runtime_display_name_from_json(benchmark),
-                runtime_context=runtime_context_from_json(benchmark),
-                runtime_kind=runtime_kind_from_json(benchmark),
-                show_delta_percent=show_delta_percent_from_json(benchmark),
-            )
+            metrics.setdefault(comparison_key, {})[runtime] = benchmark.record
 
     return metrics
 
 
+def distill_report(path: Path, data: dict) -> BenchmarkReport:
+    benchmarks: list[ReportBenchmark] = []
+    jobs: set[str] = set()
+    for benchmark in data.get("Benchmarks") or []:
+        job = job_from_display_info(str(benchmark.get("DisplayInfo") or ""))
+        if job:
+            jobs.add(job)
+
+        key = benchmark_key_from_json(benchmark)
+        if key is None:
+            continue
+
+        benchmark_metrics = metrics_from_json(benchmark)
+        if benchmark_metrics is None:
+            continue
+
+        metric_values = {}
+        for metric in benchmark.get("Metrics") or []:
+            metric_id = (metric.get("Descriptor") or {}).get("Id")
+            if metric_id:
+                metric_values[str(metric_id)] = to_float(metric.get("Value"))
+
+        benchmarks.append(
+            ReportBenchmark(
+                key,
+                normalize_cell(benchmark.get("Type", "")),
+                normalize_method_name(benchmark.get("Method", "")),
+                MetricRecord(
+                    metrics=benchmark_metrics,
+                    parameter_display=build_parameter_display_from_json(benchmark),
+                    runtime_display_name=runtime_display_name_from_json(benchmark),
+                    runtime_context=runtime_context_from_json(benchmark),
+                    runtime_kind=runtime_kind_from_json(benchmark),
+                    show_delta_percent=show_delta_percent_from_json(benchmark),
+                ),
+                metric_values,
+            )
+        )
+
+    return BenchmarkReport(
+        path,
+        data.get("HostEnvironmentInfo") or {},
+        tuple(benchmarks),
+        tuple(sorted(jobs)),
+    )
+
+
+def job_from_display_info(display_info: str) -> str:
+    """Return the job of ``Type.Method: Job(...) [Parameters]`` display text."""
+
+    _, separator, job = display_info.partition(": ")
+    if not separator:
+        return ""
+    return normalize_cell(job.split(" [", 1)[0])
+
+
+def read_environment_sidecar(report_path: Path) -> dict[str, object]:
+    """Return the capture-environment.py output for a report's artifacts directory."""
+
+    for directory in (report_path.parent, report_path.parent.parent):
+        candidate = directory / ENVIRONMENT_FILE_NAME
+        if not candidate.exists():
+            continue
+        try:
+            data = json.loads(candidate.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    return {}
+
+
+def environment_from_report(
+    report: BenchmarkReport, sidecar: dict[str, object]
+) -> EnvironmentFingerprint | None:
+    host = report.host
+    details: dict[str, object] = {
+        "processor": host.get("ProcessorName"),
+        "logicalCores": host.get("LogicalCoreCount"),
+        "architecture": host.get("Architecture"),
+        "runtime": host.get("RuntimeVersion"),
+        "job": "; ".join(report.jobs),
+        "os": host.get("OsVersion"),
+    }
+    # BenchmarkDotNet's host fields win; the sidecar adds kernel and governor.
+    for name in ENVIRONMENT_FIELDS:
+        if not details.get(name) and sidecar.get(name):
+            details[name] = sidecar[name]
+    return environment_from_json(details)
+
+
+def environment_from_json(payload: object) -> EnvironmentFingerprint | None:
+    if not isinstance(payload, dict):
+        return None
+
+    details = {name: normalize_cell(payload.get(name) or "") for name in ENVIRONMENT_FIELDS}
+    details = {name: value for name, value in details.items() if value}
+    return EnvironmentFingerprint(details) if details else None
+
+
+def comparable_environment_value(name: str, value: str) -> str:
+    """Reduce a fingerprint value to the part that changes benchmark results.
+
+    Patch releases of one .NET major version share a JIT, and BenchmarkDotNet job text
+    embeds iteration counts that the job name already implies.
+    """
+
+    if name == "runtime":
+        match = re.search(r"\.NET (?:Core )?(\d+)", value)
+        return f".NET {match.group(1)}" if match else value
+    if name == "job":
+        return "; ".join(
+            sorted({part.split("(", 1)[0].strip() for part in value.split(";") if part.strip()})
+        )
+    if name == "architecture":
+        lowered = value.lower()
+        return ARCHITECTURE_ALIASES.get(lowered, lowered)
+    return value
+
+
+def environment_mismatches(
+    current: EnvironmentFingerprint,
+    baseline: EnvironmentFingerprint,
+    names: tuple[str, ...] = ENVIRONMENT_FIELDS,
+) -> list[tuple[str, str, str]]:
+    mismatches = []
+    for name in names:
+        current_value = current.value(name)
+        baseline_value = baseline.value(name)
+        if not current_value or not baseline_value:
+            continue
+        if comparable_environment_value(name, current_value) != comparable_environment_value(
+            name, baseline_value
+        ):
+            mismatches.append((name, current_value, baseline_value))
+
+    return mismatches
+
+
+def format_environment_mismatches(mismatches: list[tuple[str, str, str]]) -> str:
+    return "; ".join(
+        f"{name} `{current}` vs baseline `{baseline}`" for name, current, baseline in mismatches
+    )
+
+
+def report_benchmark_from_cache(payload: dict) -> ReportBenchmark:
+    record = dict(payload["record"])
+    metrics = dict(record.pop("metrics"))
+    process = metrics.pop("process", None)
+    metrics["samples_ns"] = tuple(metrics.get("samples_ns") or ())
+    return ReportBenchmark(
+        BenchmarkKey(**payload["key"]),
+        payload["type_name"],
+        payload["method"],
+        MetricRecord(
+            metrics=Metrics(
+                **metrics,
+                process=ProcessMetrics(**process) if process is not None else None,
+            ),
+            **record,
+        ),
+        payload.get("metric_values") or {},
+    )
+
+
 def load_phase_baseline(path: Path) -> dict[ComparisonKey, dict[str, MetricRecord]]:
     if not path.exists():
         return {}
@@ -421,6 +1255,8 @@ def load_phase_baseline(path: Path) -> dict[ComparisonKey, dict[str, MetricRecor
                 runtime_context=normalize_cell(runtime_payload.get("runtimeContext", "")),
                 runtime_kind=normalize_cell(runtime_payload.get("runtimeKind", "")),
                 show_delta_percent=bool(runtime_payload.get("showDeltaPercent", True)),
+                noise=noise_band_from_json(runtime_payload.get("noise")),
+                environment=environment_from_json(runtime_payload.get("environment")),
             )
 
         if runtimes:
@@ -433,6 +1269,8 @@ def write_phase_baseline(
     path: Path,
     comparison: dict[ComparisonKey, dict[str, MetricRecord]],
     comparison_root: Path,
+    noise_bands: dict[tuple[ComparisonKey, str], NoiseBand] | None = None,
+    noise_calibration_roots: list[Path] | None = None,
 ) -> None:
     rows = []
     for key in sorted(comparison, key=comparison_matrix_sort_key):
@@ -443,6 +1281,9 @@ def write_phase_baseline(
         runtime_payload = {}
         for runtime in sorted(runtimes, key=runtime_sort_key):
             record = runtimes[runtime]
+            noise = (noise_bands or {}).get((key, runtime))
+            if noise is not None:
+                record = replace(record, noise=noise)
             runtime_payload[runtime] = metrics_to_baseline_json(record)
 
         rows.append(
@@ -463,13 +1304,107 @@ def write_phase_baseline(
         },
         "rows": rows,
     }
+    if noise_calibration_roots:
+        payload["source"]["noiseCalibrationRoots"] = [
+            repo_relative(root) for root in noise_calibration_roots
+        ]
 
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
 
 def metrics_to_baseline_json(record: MetricRecord) -> dict[str, object]:
-    metrics = record.metrics
+    payload = {
+        **metric_values_to_json(record.metrics),
+        "runtimeContext": record.runtime_context,
+        "runtimeDisplayName": record.runtime_display_name,
+        "runtimeKind": record.runtime_kind,
+        "showDeltaPercent": record.show_delta_percent,
+    }
+    if record.noise is not None:
+        payload["noise"] = {
+            "allocatedBytes": record.noise.allocated_bytes,
+            "meanFraction": record.noise.mean_fraction,
+            "p95Fraction": record.noise.p95_fraction,
+            "runs": record.noise.runs,
+        }
+    if record.environment is not None:
+        payload["environment"] = record.environment.details
+    return payload
+
+
+def noise_band_from_json(payload: object) -> NoiseBand | None:
+    if not isinstance(payload, dict):
+        return None
+
+    runs = to_float(payload.get("runs"))
+    band = NoiseBand(
+        int(runs) if math.isfinite(runs) else 0,
+        to_float(payload.get("meanFraction")),
+        to_float(payload.get("p95Fraction")),
+        to_float(payload.get("allocatedBytes")),
+    )
+    if band.runs < MIN_NOISE_CALIBRATION_RUNS or not all(
+        math.isfinite(value)
+        for value in (band.mean_fraction, band.p95_fraction, band.allocated_bytes)
+    ):
+        return None
+    return band
+
+
+def build_noise_bands(
+    runs: list[dict[ComparisonKey, dict[str, MetricRecord]]],
+) -> dict[tuple[ComparisonKey, str], NoiseBand]:
+    """Measure each row's run-to-run spread across repeated runs of one commit."""
+
+    samples: dict[tuple[ComparisonKey, str], list[Metrics]] = {}
+    for run in runs:
+        for key, runtimes in run.items():
+            for runtime, record in runtimes.items():
+                samples.setdefault((key, runtime), []).append(record.metrics)
+
+    bands: dict[tuple[ComparisonKey, str], NoiseBand] = {}
+    for row, metrics in samples.items():
+        if len(metrics) < MIN_NOISE_CALIBRATION_RUNS:
+            continue
+
+        bands[row] = NoiseBand(
+            len(metrics),
+            relative_spread([value.mean_ns for value in metrics]),
+            relative_spread([value.p95_ns for value in metrics]),
+            absolute_spread([value.allocated_bytes for value in metrics]),
+        )
+
+    return bands
+
+
+def absolute_spread(values: list[float]) -> float:
+    finite = [value for value in values if math.isfinite(value)]
+    if not finite:
+        return 0.0
+
+    center = median(finite)
+    return max(abs(value - center) for value in finite)
+
+
+def relative_spread(values: list[float]) -> float:
+    finite = [value for value in values if math.isfinite(value)]
+    center = median(finite) if finite else 0.0
+    if center <= 0:
+        return 0.0
+
+    return absolute_spread(finite) / center
+
+
+def median(values: list[float]) -> float:
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def metric_values_to_json(metrics: Metrics) -> dict[str, float | None]:
     return {
         "allocatedBytes": finite_or_none(metrics.allocated_bytes),
         "gen0Per1K": finite_or_none(metrics.gen0_per_1k),
@@ -477,10 +1412,6 @@ def metrics_to_baseline_json(record: MetricRecord) -> dict[str, object]:
         "gen2Per1K": finite_or_none(metrics.gen2_per_1k),
         "meanNs": finite_or_none(metrics.mean_ns),
         "p95Ns": finite_or_none(metrics.p95_ns),
-        "runtimeContext": record.runtime_context,
-        "runtimeDisplayName": record.runtime_display_name,
-        "runtimeKind": record.runtime_kind,
-        "showDeltaPercent": record.show_delta_percent,
     }
 
 
@@ -547,7 +1478,10 @@ def metrics_from_json(benchmark: dict) -> Metrics | None:
     statistics = benchmark.get("Statistics") or {}
     memory = benchmark.get("Memory") or {}
     percentiles = statistics.get("Percentiles") or {}
-    has_memory_payload = bool(memory) or bool(benchmark.get("Metrics"))
+    has_memory_payload = bool(memory) or any(
+        (metric.get("Descriptor") or {}).get("Id") not in PROCESS_METRIC_IDS
+        for metric in benchmark.get("Metrics") or []
+    )
 
     mean = to_float(statistics.get("Mean"))
     p95 = to_float(percentiles.get("P95", statistics.get("P95", mean)))
@@ -572,7 +1506,52 @@ def metrics_from_json(benchmark: dict) -> Metrics | None:
     if not math.isfinite(mean):
         return None
 
-    return Metrics(mean, p95, gen0, gen1, gen2, allocated)
+    return Metrics(
+        mean,
+        p95,
+        gen0,
+        gen1,
+        gen2,
+        allocated,
+        samples_from_json(benchmark),
+        process_metrics_from_json(benchmark),
+    )
+
+
+def process_metrics_from_json(benchmark: dict) -> ProcessMetrics | None:
+    peak_rss = metric_value(benchmark, "PeakRss", "Peak RSS")
+    if not math.isfinite(peak_rss):
+        return None
+
+    return ProcessMetrics(
+        peak_rss,
+        metric_value(benchmark, "UserCpuTime", "User CPU"),
+        metric_value(benchmark, "SystemCpuTime", "System CPU"),
+        metric_value(benchmark, "MinorPageFaults", "Minor Faults"),
+        metric_value(benchmark, "MajorPageFaults", "Major Faults"),
+        metric_value(benchmark, "VoluntaryContextSwitches", "Voluntary Switches"),
+        metric_value(benchmark, "InvoluntaryContextSwitches", "Involuntary Switches"),
+    )
+
+
+def samples_from_json(benchmark: dict) -> tuple[float, ...]:
+    """Return per-operation nanoseconds for each measured workload iteration."""
+
+    original_values = (benchmark.get("Statistics") or {}).get("OriginalValues") or []
+    samples = [to_float(value) for value in original_values]
+    if not samples:
+        for measurement in benchmark.get("Measurements") or []:
+            if (
+                measurement.get("IterationMode") != "Workload"
+                or measurement.get("IterationStage") != "Result"
+            ):
+                continue
+            operations = to_float(measurement.get("Operations"))
+            nanoseconds = to_float(measurement.get("Nanoseconds"))
+            if math.isfinite(operations) and operations > 0:
+                samples.append(nanoseconds / operations)
+
+    return tuple(sample for sample in samples if math.isfinite(sample))
 
 
 def metric_value(benchmark: dict, metric_id: str, display_name: str) -> float:
@@ -697,6 +1676,7 @@ def runtime_sort_key(runtime: str) -> tuple[int, str]:
 def build_self_delta_rows(
     current: dict[BenchmarkKey, MetricRecord],
     baseline: dict[BenchmarkKey, MetricRecord],
+    significance: float = DEFAULT_SIGNIFICANCE,
 ) -> list[SelfDeltaRow]:
     rows: list[SelfDeltaRow] = []
     for key in sorted(current):
@@ -709,16 +1689,116 @@ def build_self_delta_rows(
                 current[key].parameter_display,
                 current[key].metrics,
                 baseline[key].metrics,
+                compare_samples(
+                    current[key].metrics.samples_ns,
+                    baseline[key].metrics.samples_ns,
+                    significance,
+                ),
             )
         )
 
     return rows
 
 
+def compare_samples(
+    current: tuple[float, ...],
+    baseline: tuple[float, ...],
+    significance: float,
+) -> SampleComparison | None:
+    if len(current) < MIN_STATISTICAL_SAMPLES or len(baseline) < MIN_STATISTICAL_SAMPLES:
+        return None
+
+    u_statistic, p_value = mann_whitney_greater(current, baseline)
+    ratio_low, ratio_high = bootstrap_mean_ratio_interval(current, baseline, significance)
+    return SampleComparison(
+        len(current),
+        len(baseline),
+        p_value,
+        2 * u_statistic / (len(current) * len(baseline)) - 1,
+        ratio_low,
+        ratio_high,
+    )
+
+
+def mann_whitney_greater(
+    current: tuple[float, ...], baseline: tuple[float, ...]
+) -> tuple[float, float]:
+    """Return the current-sample U statistic and its one-sided "current is slower" p-value.
+
+    Uses the tie-corrected normal approximation with continuity correction, which is
+    accurate for the 5-100 iterations BenchmarkDotNet keeps per benchmark.
+    """
+
+    combined = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    total = len(combined)
+    current_rank_sum = 0.0
+    tie_term = 0.0
+    index = 0
+    while index < total:
+        end = index
+        while end + 1 < total and combined[end + 1][0] == combined[index][0]:
+            end += 1
+        tied = end - index + 1
+        average_rank = (index + end) / 2 + 1
+        current_rank_sum += average_rank * sum(
+            1 for position in range(index, end + 1) if combined[position][1] == 0
+        )
+        tie_term += tied**3 - tied
+        index = end + 1
+
+    current_count = len(current)
+    baseline_count = len(baseline)
+    u_statistic = current_rank_sum - current_count * (current_count + 1) / 2
+    expected = current_count * baseline_count / 2
+    variance = (
+        current_count
+        * baseline_count
+        / 12
+        * ((total + 1) - tie_term / (total * (total - 1)))
+    )
+    if variance <= 0:
+        return u_statistic, 1.0
+
+    z_score = (u_statistic - expected - 0.5) / math.sqrt(variance)
+    return u_statistic, 0.5 * math.erfc(z_score / math.sqrt(2))
+
+
+def bootstrap_mean_ratio_interval(
+    current: tuple[float, ...],
+    baseline: tuple[float, ...],
+    significance: float,
+) -> tuple[float, float]:
+    """Return a percentile bootstrap interval for mean(current) / mean(baseline).
+
+    The generator is seeded so the same artifacts always render the same report.
+    """
+
+    generator = random.Random(BOOTSTRAP_SEED)
+    ratios: list[float] = []
+    for _ in range(BOOTSTRAP_RESAMPLES):
+        baseline_mean = math.fsum(generator.choices(baseline, k=len(baseline))) / len(baseline)
+        if baseline_mean <= 0:
+            continue
+        current_mean = math.fsum(generator.choices(current, k=len(current))) / len(current)
+        ratios.append(current_mean / baseline_mean)
+
+    if not ratios:
+        return math.nan, math.nan
+
+    ratios.sort()
+    tail = min(max(significance, 0.0), 1.0) / 2
+    low_index = min(len(ratios) - 1, int(tail * len(ratios)))
+    high_index = max(0, min(len(ratios) - 1, math.ceil((1 - tail) * len(ratios)) - 1))
+    return ratios[low_index], ratios[high_index]
+
+
 def build_phase_gate_failures(
     current: dict[ComparisonKey, dict[str, MetricRecord]],
     baseline: dict[ComparisonKey, dict[str, MetricRecord]],
     nlua_ratio_threshold: float,
+    environment_mode: str = "warn",
+    normalization_factors: dict[tuple[str, str], float] | None = None,
+    normalization_runtime: str = DEFAULT_NORMALIZATION_RUNTIME,
 ) -> list[PhaseGateFailure]:
     failures: list[PhaseGateFailure] = []
     current_keys = {key for key, runtimes in current.items() if NOVA_RUNTIME in runtimes}
@@ -752,9 +1832,23 @@ def build_phase_gate_failures(
         if current_nova is None or baseline_nova is None:
             continue
 
+        environment_failure, factor = environment_adjustment(
+            current_runtimes,
+            baseline_runtimes,
+            environment_mode,
+            normalization_factors or {},
+            normalization_runtime,
+        )
+        if environment_failure:
+            failures.append(PhaseGateFailure(key, "environment", environment_failure))
+            continue
+        # Allocations do not depend on machine speed, so only timings are normalized.
+        factor = factor or 1.0
+
         allocation_failure = allocation_gate_failure(
             current_nova.metrics.allocated_bytes,
             baseline_nova.metrics.allocated_bytes,
+            baseline_nova.noise,
         )
         if allocation_failure:
             failures.append(PhaseGateFailure(key, "NovaSharp B/op", allocation_failure))
@@ -784,9 +1878,9 @@ def build_phase_gate_failures(
             "mean",
             current_nova.metrics.mean_ns,
             current_nlua.metrics.mean_ns,
-            baseline_nova.metrics.mean_ns,
-            baseline_nlua.metrics.mean_ns,
-            nlua_ratio_threshold,
+            baseline_nova.metrics.mean_ns * factor,
+            baseline_nlua.metrics.mean_ns * factor,
+            *phase_timing_thresholds("mean", baseline_nova, baseline_nlua, nlua_ratio_threshold),
         )
         append_ratio_gate_failure(
             failures,
@@ -794,15 +1888,43 @@ def build_phase_gate_failures(
             "P95",
             current_nova.metrics.p95_ns,
             current_nlua.metrics.p95_ns,
-            baseline_nova.metrics.p95_ns,
-            baseline_nlua.metrics.p95_ns,
-            nlua_ratio_threshold,
+            baseline_nova.metrics.p95_ns * factor,
+            baseline_nlua.metrics.p95_ns * factor,
+            *phase_timing_thresholds("P95", baseline_nova, baseline_nlua, nlua_ratio_threshold),
         )
 
     return failures
 
 
-def allocation_gate_failure(current: float, baseline: float) -> str:
+def phase_timing_thresholds(
+    metric_name: str,
+    baseline_nova: MetricRecord,
+    baseline_nlua: MetricRecord,
+    nlua_ratio_threshold: float,
+) -> tuple[float, float]:
+    """Return (ratio threshold, NovaSharp timing threshold) for one timing metric.
+
+    Calibrated rows use their own noise bands; the ratio moves with the noise of both
+    runtimes, so its band is the sum of theirs.
+    """
+
+    if baseline_nova.noise is None:
+        return nlua_ratio_threshold, nlua_ratio_threshold
+
+    nova_threshold = baseline_nova.noise.timing_threshold(metric_name)
+    if baseline_nlua.noise is None:
+        return nlua_ratio_threshold, nova_threshold
+
+    ratio_threshold = max(
+        NOISE_BAND_FLOOR,
+        nova_threshold + baseline_nlua.noise.timing_threshold(metric_name),
+    )
+    return ratio_threshold, nova_threshold
+
+
+def allocation_gate_failure(
+    current: float, baseline: float, noise: NoiseBand | None = None
+) -> str:
     if not math.isfinite(current):
         return "Current NovaSharp allocation measurement is missing."
     if not math.isfinite(baseline):
@@ -811,7 +1933,11 @@ def allocation_gate_failure(current: float, baseline: float) -> str:
         return ""
 
     delta = current - baseline
-    tolerance = phase_allocation_tolerance(baseline)
+    tolerance = (
+        noise.allocation_tolerance(baseline)
+        if noise is not None
+        else phase_allocation_tolerance(baseline)
+    )
     if delta <= tolerance:
         return ""
 
@@ -841,7 +1967,10 @@ def append_ratio_gate_failure(
     baseline_nova: float,
     baseline_nlua: float,
     threshold: float,
+    nova_threshold: float | None = None,
 ) -> None:
+    if nova_threshold is None:
+        nova_threshold = threshold
     current_ratio = ratio_or_nan(current_nova, current_nlua)
     baseline_ratio = ratio_or_nan(baseline_nova, baseline_nlua)
     ratio_delta = fraction_delta(current_ratio, baseline_ratio)
@@ -849,7 +1978,7 @@ def append_ratio_gate_failure(
         return
 
     nova_delta = fraction_delta(current_nova, baseline_nova)
-    if math.isfinite(ratio_delta) and math.isfinite(nova_delta) and nova_delta <= threshold:
+    if math.isfinite(ratio_delta) and math.isfinite(nova_delta) and nova_delta <= nova_threshold:
         return
 
     if not math.isfinite(current_ratio):
@@ -866,11 +1995,605 @@ def append_ratio_gate_failure(
     failures.append(PhaseGateFailure(key, f"NLua {metric_name} ratio", message))
 
 
+def environment_adjustment(
+    current_runtimes: dict[str, MetricRecord],
+    baseline_runtimes: dict[str, MetricRecord],
+    mode: str,
+    factors: dict[tuple[str, str], float],
+    reference_runtime: str,
+) -> tuple[str, float | None]:
+    """Return (failure message, baseline timing factor) for one phase-gate row.
+
+    Architecture, runtime, and job differences always fail outside ``warn`` mode. Speed
+    differences fail in ``fail`` mode and are bridged in ``normalize`` mode by the ratio
+    of reference timings on both fingerprints, or by the row's own reference runtime when
+    the reference scenario did not run on the current fingerprint.
+    """
+
+    current = current_runtimes[NOVA_RUNTIME].environment
+    baseline = baseline_runtimes[NOVA_RUNTIME].environment
+    if mode == "warn" or current is None or baseline is None:
+        return "", None
+
+    strict = environment_mismatches(current, baseline, STRICT_ENVIRONMENT_FIELDS)
+    speed = environment_mismatches(current, baseline, SPEED_ENVIRONMENT_FIELDS)
+    if strict or (speed and mode == "fail"):
+        return (
+            "Current environment differs from the phase baseline "
+            f"({format_environment_mismatches(strict + speed)}).",
+            None,
+        )
+    if not speed:
+        return "", None
+
+    factor = factors.get((current.digest, baseline.digest))
+    if factor is None:
+        factor = row_reference_factor(current_runtimes, baseline_runtimes, reference_runtime)
+    if factor is None:
+        return (
+            "Current environment differs from the phase baseline "
+            f"({format_environment_mismatches(speed)}) and no normalization reference "
+            "ran on both fingerprints.",
+            None,
+        )
+    return "", factor
+
+
+def row_reference_factor(
+    current_runtimes: dict[str, MetricRecord],
+    baseline_runtimes: dict[str, MetricRecord],
+    reference_runtime: str,
+) -> float | None:
+    current = current_runtimes.get(reference_runtime)
+    baseline = baseline_runtimes.get(reference_runtime)
+    if current is None or baseline is None:
+        return None
+    if current.environment != current_runtimes[NOVA_RUNTIME].environment:
+        return None
+    if baseline.environment != baseline_runtimes[NOVA_RUNTIME].environment:
+        return None
+
+    factor = ratio_or_nan(current.metrics.mean_ns, baseline.metrics.mean_ns)
+    return factor if math.isfinite(factor) and factor > 0 else None
+
+
+def build_normalization_factors(
+    current: dict[ComparisonKey, dict[str, MetricRecord]],
+    baseline: dict[ComparisonKey, dict[str, MetricRecord]],
+    scenario: str,
+    runtime: str,
+) -> dict[tuple[str, str], float]:
+    """Map (current digest, baseline digest) to the reference scenario's mean ratio."""
+
+    current_means = normalization_reference_means(current, scenario, runtime)
+    baseline_means = normalization_reference_means(baseline, scenario, runtime)
+    return {
+        (current_digest, baseline_digest): current_mean / baseline_mean
+        for current_digest, current_mean in current_means.items()
+        for baseline_digest, baseline_mean in baseline_means.items()
+    }
+
+
+def normalization_reference_means(
+    rows: dict[ComparisonKey, dict[str, MetricRecord]],
+    scenario: str,
+    runtime: str,
+) -> dict[str, float]:
+    parameters = build_parameter_signature_from_text(f"ScenarioName={scenario}")
+    means: dict[str, float] = {}
+    for key, runtimes in rows.items():
+        if key.operation != "Execute" or key.parameters != parameters:
+            continue
+
+        record = runtimes.get(runtime)
+        if record is None or record.environment is None:
+            continue
+        mean = record.metrics.mean_ns
+        if math.isfinite(mean) and mean > 0:
+            means[record.environment.digest] = mean
+
+    return means
+
+
+def build_environment_summary(
+    current: dict[ComparisonKey, dict[str, MetricRecord]],
+    baseline: dict[ComparisonKey, dict[str, MetricRecord]],
+    mode: str,
+    scenario: str,
+    runtime: str,
+) -> EnvironmentSummary:
+    factors = build_normalization_factors(current, baseline, scenario, runtime)
+    mismatched_rows = 0
+    normalized_rows = 0
+    for key in sorted(set(current) & set(baseline), key=comparison_matrix_sort_key):
+        current_nova = current[key].get(NOVA_RUNTIME)
+        baseline_nova = baseline[key].get(NOVA_RUNTIME)
+        if current_nova is None or baseline_nova is None:
+            continue
+        if current_nova.environment is None or baseline_nova.environment is None:
+            continue
+        if not environment_mismatches(current_nova.environment, baseline_nova.environment):
+            continue
+
+        mismatched_rows += 1
+        message, factor = environment_adjustment(
+            current[key], baseline[key], mode, factors, runtime
+        )
+        if not message and factor is not None:
+            normalized_rows += 1
+
+    return EnvironmentSummary(
+        mode,
+        scenario,
+        runtime,
+        environment_fingerprints(current),
+        environment_fingerprints(baseline),
+        factors,
+        mismatched_rows,
+        normalized_rows,
+    )
+
+
+def environment_fingerprints(
+    rows: dict[ComparisonKey, dict[str, MetricRecord]],
+) -> dict[str, EnvironmentFingerprint]:
+    fingerprints: dict[str, EnvironmentFingerprint] = {}
+    for runtimes in rows.values():
+        for record in runtimes.values():
+            if record.environment is not None:
+                fingerprints.setdefault(record.environment.digest, record.environment)
+
+    return dict(sorted(fingerprints.items()))
+
+
 def ratio_or_nan(numerator: float, denominator: float) -> float:
     if not math.isfinite(numerator) or not math.isfinite(denominator) or denominator == 0:
         return math.nan
 
-    return numerator / denominator
+    return numerator / denominator
+
+
+def load_allocation_sites(path: Path) -> list[AllocationSite]:
+    if not path.exists():
+        raise ValueError(f"Allocation sites file does not exist: {repo_relative(path)}")
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    schema = data.get("schema")
+    if schema != ALLOCATION_SITES_SCHEMA:
+        raise ValueError(
+            f"Unsupported allocation sites schema in {repo_relative(path)}: {schema!r}"
+        )
+
+    sites: list[AllocationSite] = []
+    for payload in data.get("sites") or []:
+        sites.append(
+            AllocationSite(
+                rule_id=normalize_cell(payload.get("ruleId", "")),
+                path=normalize_cell(payload.get("path", "")),
+                line_number=int(payload.get("line") or 0),
+                symbol=normalize_cell(payload.get("symbol", "")),
+                call_path=tuple(normalize_cell(step) for step in payload.get("callPath") or []),
+                allowlisted=bool(payload.get("allowlisted", False)),
+                reason=normalize_cell(payload.get("reason", "")),
+                opcodes=(
+                    frozenset(normalize_cell(opcode).upper() for opcode in payload["opcodes"])
+                    if payload.get("opcodes") is not None
+                    else None
+                ),
+            )
+        )
+    return sites
+
+
+def load_scenario_opcodes(path: Path) -> dict[str, frozenset[str]]:
+    if not path.exists():
+        raise ValueError(f"Scenario opcodes file does not exist: {repo_relative(path)}")
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    schema = data.get("schema")
+    if schema != SCENARIO_OPCODES_SCHEMA:
+        raise ValueError(
+            f"Unsupported scenario opcodes schema in {repo_relative(path)}: {schema!r}"
+        )
+
+    return {
+        normalize_cell(scenario): frozenset(normalize_cell(opcode).upper() for opcode in opcodes)
+        for scenario, opcodes in (data.get("scenarios") or {}).items()
+    }
+
+
+def build_scenario_allocations(
+    rows: list[RuntimeMatrixRow],
+    phase_baseline: dict[ComparisonKey, dict[str, MetricRecord]],
+) -> list[ScenarioAllocation]:
+    allocations: list[ScenarioAllocation] = []
+    for row in rows:
+        if row.key.operation not in VM_ALLOCATION_OPERATIONS:
+            continue
+
+        baseline = phase_baseline_record(phase_baseline, row.key, NOVA_RUNTIME)
+        allocations.append(
+            ScenarioAllocation(
+                row.key,
+                row.parameter_display,
+                row.nova.allocated_bytes,
+                baseline.metrics.allocated_bytes if baseline is not None else math.nan,
+            )
+        )
+    return allocations
+
+
+def allocation_site_reaches(
+    site: AllocationSite,
+    scenario: ScenarioAllocation,
+    scenario_opcodes: dict[str, frozenset[str]],
+) -> bool:
+    """Return whether a static allocation site's call path can run in a scenario.
+
+    Callback-context sites only reach Lua-to-CLR boundaries unless their call path goes
+    through a Lua call. A site tied to specific opcodes only reaches the Execute scenarios
+    that compile to one of them; without opcode data it can reach any scenario.
+    """
+
+    if scenario.key.operation not in VM_ALLOCATION_OPERATIONS:
+        return False
+
+    methods = {step.rsplit(".", 1)[-1] for step in site.call_path}
+    methods.add(site.symbol)
+    is_callback_site = (
+        site.rule_id == "new-script-execution-context"
+        or "Invoke" in methods
+        or site.path.endswith("/CallbackFunction.cs")
+    )
+    if (
+        is_callback_site
+        and scenario.key.operation not in CALLBACK_ALLOCATION_OPERATIONS
+        and not any(method in ("InternalExecCall", "ExecArgs") for method in methods)
+    ):
+        return False
+
+    compiled = (
+        scenario_opcodes.get(scenario.scenario_name) if scenario.key.operation == "Execute" else None
+    )
+    if site.opcodes is None or compiled is None:
+        return True
+    return not site.opcodes.isdisjoint(compiled)
+
+
+def allocation_site_candidates(
+    sites: list[AllocationSite],
+    scenarios: list[ScenarioAllocation],
+    scenario_opcodes: dict[str, frozenset[str]] | None = None,
+) -> list[AllocationSiteCandidate]:
+    """List each site with the regressed scenarios it can reach, most regressed first.
+
+    A site is ordered by the summed B/op regression of the scenarios it reaches. That is
+    how much regressed traffic runs through it, not bytes the site itself allocated.
+    Ties put new sites before allowlisted ones, then source order.
+    """
+
+    regressed = [scenario for scenario in scenarios if scenario.regression_bytes > 0]
+    candidates = [
+        AllocationSiteCandidate(
+            site,
+            tuple(
+                scenario
+                for scenario in regressed
+                if allocation_site_reaches(site, scenario, scenario_opcodes or {})
+            ),
+        )
+        for site in sites
+    ]
+    candidates.sort(
+        key=lambda candidate: (
+            -candidate.reached_regression_bytes,
+            candidate.site.allowlisted,
+            candidate.site.path,
+            candidate.site.line_number,
+        )
+    )
+    return candidates
+
+
+def resolve_retention_metrics(overrides: list[str]) -> tuple[RetentionMetric, ...]:
+    metrics = {metric.name: metric for metric in RETENTION_METRICS}
+    for override in overrides:
+        name, separator, value = override.partition("=")
+        name = name.strip()
+        if not separator or name not in metrics:
+            raise ValueError(
+                f"Invalid --memory-retention-tolerance {override!r}; expected METRIC=FRACTION "
+                f"with METRIC one of: {', '.join(metrics)}"
+            )
+        metrics[name] = replace(metrics[name], relative_tolerance=float(value))
+
+    return tuple(metrics.values())
+
+
+def build_memory_retention_report(
+    reports: ReportIndex,
+    root: Path,
+    baseline_path: Path,
+    metrics: tuple[RetentionMetric, ...],
+    write_baseline_path: Path | None,
+    environment_mode: str = "warn",
+) -> MemoryRetentionReport:
+    current = load_memory_retention_metrics(reports, root)
+    baseline = load_memory_retention_baseline(baseline_path)
+    if write_baseline_path is not None:
+        write_memory_retention_baseline(
+            write_baseline_path,
+            current,
+            root,
+            baseline_path,
+            memory_retention_environment(reports, root),
+        )
+
+    rows = [
+        MemoryRetentionRow(method, current.get(method, {}), baseline.get(method, {}))
+        for method in sorted(set(current) | set(baseline))
+    ]
+    failures = (
+        build_memory_retention_gate_failures(current, baseline, metrics)
+        if baseline_path.exists()
+        else []
+    )
+    environment_failure = memory_retention_environment_failure(
+        memory_retention_fingerprint(reports, root),
+        load_memory_retention_baseline_environment(baseline_path),
+        environment_mode,
+    )
+    if environment_failure is not None:
+        failures.insert(0, environment_failure)
+    return MemoryRetentionReport(root, baseline_path, metrics, rows, failures)
+
+
+def load_memory_retention_metrics(
+    reports: ReportIndex, root: Path
+) -> dict[str, dict[str, float]]:
+    diagnostics = load_memory_retention_diagnostics(root)
+    measurements: dict[str, dict[str, float]] = {}
+    for report in reports.reports(root):
+        for benchmark in report.benchmarks:
+            if benchmark.type_name != MEMORY_RETENTION_TYPE or not benchmark.method:
+                continue
+
+            metrics = benchmark.record.metrics
+            values = {
+                "meanNs": metrics.mean_ns,
+                "p95Ns": metrics.p95_ns,
+                "allocatedBytesPerOperation": metrics.allocated_bytes,
+                "gen0Per1KOperations": metrics.gen0_per_1k,
+                "gen1Per1KOperations": metrics.gen1_per_1k,
+                "gen2Per1KOperations": metrics.gen2_per_1k,
+            }
+            values.update(diagnostics.get(benchmark.method, {}))
+            measurements[benchmark.method] = {
+                name: value for name, value in values.items() if math.isfinite(value)
+            }
+
+    return measurements
+
+
+def load_memory_retention_diagnostics(root: Path) -> dict[str, dict[str, float]]:
+    """Return the trim diagnostics sidecars of a MemoryRetentionBenchmarks run by method."""
+
+    diagnostics: dict[str, dict[str, float]] = {}
+    for path in sorted(root.rglob(f"{MEMORY_RETENTION_DIAGNOSTICS_DIRECTORY}/*.json")):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        schema = data.get("schema")
+        if schema != MEMORY_RETENTION_DIAGNOSTICS_SCHEMA:
+            raise ValueError(
+                f"Unsupported memory retention diagnostics schema in {repo_relative(path)}: "
+                f"{schema!r}"
+            )
+
+        method = normalize_method_name(str(data.get("method") or ""))
+        values = {
+            name: to_float(value)
+            for name, value in (data.get("diagnosticsAfterCriticalTrim") or {}).items()
+            if name in MEMORY_RETENTION_DIAGNOSTICS
+        }
+        diagnostics[method] = {
+            name: value for name, value in values.items() if math.isfinite(value)
+        }
+
+    return diagnostics
+
+
+def load_memory_retention_baseline(path: Path) -> dict[str, dict[str, float]]:
+    if not path.exists():
+        return {}
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    schema = data.get("schema")
+    if schema != MEMORY_RETENTION_BASELINE_SCHEMA:
+        raise ValueError(
+            f"Unsupported memory retention baseline schema in {repo_relative(path)}: {schema!r}"
+        )
+
+    baseline: dict[str, dict[str, float]] = {}
+    for entry in data.get("benchmarks") or []:
+        method = normalize_method_name(entry.get("method", ""))
+        if not method:
+            continue
+
+        payload = dict(entry.get("diagnosticsAfterCriticalTrim") or {})
+        payload.update(entry)
+        values = {
+            name: to_float(value)
+            for name, value in payload.items()
+            if name not in ("method", "diagnosticsAfterCriticalTrim")
+        }
+        baseline[method] = {name: value for name, value in values.items() if math.isfinite(value)}
+
+    return baseline
+
+
+def write_memory_retention_baseline(
+    path: Path,
+    current: dict[str, dict[str, float]],
+    root: Path,
+    previous_path: Path,
+    environment: dict[str, object],
+) -> None:
+    previous = (
+        json.loads(previous_path.read_text(encoding="utf-8")) if previous_path.exists() else {}
+    )
+    benchmarks = []
+    for method in sorted(current):
+        values = current[method]
+        entry: dict[str, object] = {"method": method}
+        for name in (
+            "meanNs",
+            "p95Ns",
+            "allocatedBytesPerOperation",
+            "gen0Per1KOperations",
+            "gen1Per1KOperations",
+            "gen2Per1KOperations",
+        ):
+            if name in values:
+                entry[name] = values[name]
+        diagnostics = {
+            name: int(values[name]) for name in MEMORY_RETENTION_DIAGNOSTICS if name in values
+        }
+        if diagnostics:
+            entry["diagnosticsAfterCriticalTrim"] = diagnostics
+        benchmarks.append(entry)
+
+    payload = {
+        "schema": MEMORY_RETENTION_BASELINE_SCHEMA,
+        "generatedAt": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "sourceArtifact": repo_relative(root),
+        "environment": environment,
+        "notes": previous.get("notes") or [],
+        "benchmarks": benchmarks,
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def memory_retention_environment(reports: ReportIndex, root: Path) -> dict[str, object]:
+    for report in reports.reports(root):
+        host = report.host
+        if not host:
+            continue
+        environment = {
+            "benchmarkDotNetVersion": host.get("BenchmarkDotNetVersion"),
+            "os": host.get("OsVersion"),
+            "processor": host.get("ProcessorName"),
+            "runtime": host.get("RuntimeVersion"),
+            "dotnetSdk": host.get("DotNetCliVersion"),
+        }
+        if report.environment is not None:
+            environment = {**report.environment.details, **environment}
+        return {name: value for name, value in environment.items() if value is not None}
+
+    return {}
+
+
+def memory_retention_fingerprint(
+    reports: ReportIndex, root: Path
+) -> EnvironmentFingerprint | None:
+    for report in reports.reports(root):
+        if any(benchmark.type_name == MEMORY_RETENTION_TYPE for benchmark in report.benchmarks):
+            return report.environment
+
+    return None
+
+
+def load_memory_retention_baseline_environment(path: Path) -> EnvironmentFingerprint | None:
+    if not path.exists():
+        return None
+
+    return environment_from_json(json.loads(path.read_text(encoding="utf-8")).get("environment"))
+
+
+def memory_retention_environment_failure(
+    current: EnvironmentFingerprint | None,
+    baseline: EnvironmentFingerprint | None,
+    mode: str,
+) -> MemoryRetentionGateFailure | None:
+    """Fail retention gates measured under another architecture, runtime, or job.
+
+    Retained bytes and pool counts do not scale with CPU speed, so processor, kernel, and
+    governor differences are not checked here.
+    """
+
+    if mode == "warn" or current is None or baseline is None:
+        return None
+
+    mismatches = environment_mismatches(current, baseline, STRICT_ENVIRONMENT_FIELDS)
+    if not mismatches:
+        return None
+
+    return MemoryRetentionGateFailure(
+        "environment",
+        "Environment",
+        "Current environment differs from the memory-retention baseline "
+        f"({format_environment_mismatches(mismatches)}).",
+    )
+
+
+def build_memory_retention_gate_failures(
+    current: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    metrics: tuple[RetentionMetric, ...],
+) -> list[MemoryRetentionGateFailure]:
+    failures: list[MemoryRetentionGateFailure] = []
+    for method in sorted(set(current) - set(baseline)):
+        failures.append(
+            MemoryRetentionGateFailure(
+                method,
+                "shape",
+                "Current memory-retention benchmark has no checked-in baseline entry.",
+            )
+        )
+    for method in sorted(set(baseline) - set(current)):
+        failures.append(
+            MemoryRetentionGateFailure(
+                method,
+                "shape",
+                "Checked-in memory-retention baseline entry is absent from current artifacts.",
+            )
+        )
+
+    for method in sorted(set(current) & set(baseline)):
+        for metric in metrics:
+            if not metric.gated or metric.name not in baseline[method]:
+                continue
+
+            baseline_value = baseline[method][metric.name]
+            current_value = current[method].get(metric.name)
+            if current_value is None:
+                failures.append(
+                    MemoryRetentionGateFailure(
+                        method,
+                        metric.display_name,
+                        f"Current artifacts do not report `{metric.name}`.",
+                    )
+                )
+                continue
+
+            delta = current_value - baseline_value
+            allowed = metric.tolerance(baseline_value)
+            if delta <= allowed:
+                continue
+
+            failures.append(
+                MemoryRetentionGateFailure(
+                    method,
+                    metric.display_name,
+                    f"{metric.display_name} grew from "
+                    f"{format_retention_value(metric, baseline_value)} to "
+                    f"{format_retention_value(metric, current_value)} "
+                    f"({format_retention_delta(metric, delta)}; allowed "
+                    f"{format_retention_value(metric, allowed)}).",
+                )
+            )
+
+    return failures
 
 
 def external_row_changed(row: ExternalDeltaRow, tolerance: float) -> bool:
@@ -881,7 +2604,7 @@ def external_row_changed(row: ExternalDeltaRow, tolerance: float) -> bool:
 
 
 def record_contributes_to_changed_signal(record: MetricRecord) -> bool:
-    return record.show_delta_percent and record.runtime_kind != "LuaCliWallTime"
+    return record.show_delta_percent and record.runtime_kind not in REFERENCE_LUA_RUNTIME_KINDS
 
 
 def self_row_changed(row: SelfDeltaRow, tolerance: float) -> bool:
@@ -900,8 +2623,47 @@ def external_row_regressed(row: ExternalDeltaRow, threshold: float) -> bool:
     return metrics_regressed(row.nova, row.comparison, threshold)
 
 
-def self_row_regressed(row: SelfDeltaRow, threshold: float) -> bool:
-    return metrics_regressed(row.current, row.baseline, threshold)
+def self_row_regressed(
+    row: SelfDeltaRow,
+    threshold: float,
+    tolerance: float = DEFAULT_TOLERANCE,
+    significance: float = DEFAULT_SIGNIFICANCE,
+    min_effect_size: float = DEFAULT_MIN_EFFECT_SIZE,
+) -> bool:
+    if row.timing is None:
+        return metrics_regressed(row.current, row.baseline, threshold)
+
+    return timing_regressed(row.timing, tolerance, significance, min_effect_size) or (
+        allocation_regressed(row.current.allocated_bytes, row.baseline.allocated_bytes)
+    )
+
+
+def timing_regressed(
+    timing: SampleComparison,
+    tolerance: float,
+    significance: float,
+    min_effect_size: float,
+) -> bool:
+    """Require significance, a meaningful effect, and an interval clear of the noise band."""
+
+    return (
+        timing.p_value < significance
+        and timing.effect_size >= min_effect_size
+        and timing.ratio_low > 1 + tolerance
+    )
+
+
+def timing_improved(timing: SampleComparison, tolerance: float, min_effect_size: float) -> bool:
+    return timing.effect_size <= -min_effect_size and timing.ratio_high < 1 - tolerance
+
+
+def allocation_regressed(current: float, baseline: float) -> bool:
+    """BenchmarkDotNet B/op is deterministic, so any increase past runner noise counts."""
+
+    if not math.isfinite(current) or not math.isfinite(baseline):
+        return False
+
+    return current - baseline > phase_allocation_tolerance(baseline)
 
 
 def metrics_regressed(current: Metrics, baseline: Metrics, threshold: float) -> bool:
@@ -923,6 +2685,215 @@ def metric_fraction_deltas(current: Metrics, baseline: Metrics) -> tuple[float,
     )
 
 
+def build_delta_json(
+    args: argparse.Namespace,
+    changed: bool,
+    regressed: bool,
+    external_rows: list[ExternalDeltaRow],
+    runtime_matrix_rows: list[RuntimeMatrixRow],
+    self_rows: list[SelfDeltaRow],
+    current_root: Path,
+    comparison_root: Path,
+    self_baseline_root: Path,
+    comparison_groups_without_nova: list[ComparisonKey],
+    missing_expected_runtime_cells: list[MissingRuntimeCell],
+    phase_baseline: dict[ComparisonKey, dict[str, MetricRecord]],
+    phase_baseline_path: Path,
+    phase_gate_failures: list[PhaseGateFailure],
+    current_without_baseline: list[BenchmarkKey],
+    baseline_without_current: list[BenchmarkKey],
+    memory_retention: MemoryRetentionReport | None,
+    environment_summary: EnvironmentSummary | None = None,
+    profiles: ProfileSummary | None = None,
+) -> dict[str, object]:
+    """Return the analysis behind the markdown page as a versioned JSON document."""
+
+    payload: dict[str, object] = {
+        "schema": DELTAS_JSON_SCHEMA,
+        "generatedAt": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "source": {
+            "comparisonRoot": repo_relative(comparison_root),
+            "currentRoot": repo_relative(current_root),
+            "phaseBaseline": repo_relative(phase_baseline_path),
+            "selfBaselineRoot": repo_relative(self_baseline_root),
+        },
+        "settings": {
+            "minEffectSize": args.min_effect_size,
+            "nluaRatioThreshold": args.nlua_ratio_threshold,
+            "regressionThreshold": args.regression_threshold,
+            "significance": args.significance,
+            "tolerance": args.tolerance,
+        },
+        "summary": {
+            "changed": changed,
+            "externalRows": len(external_rows),
+            "missingExternalRuntimeCells": len(missing_expected_runtime_cells),
+            "missingLuaCliRows": sum(
+                1 for cell in missing_expected_runtime_cells if cell.runtime == "Lua"
+            ),
+            "phaseBaselineRows": len(phase_baseline),
+            "phaseGateFailures": len(phase_gate_failures),
+            "regressed": regressed,
+            "selfRows": len(self_rows),
+            "statisticalSelfRows": sum(1 for row in self_rows if row.timing is not None),
+        },
+        "selfRows": [
+            {
+                **benchmark_key_to_json(row.key),
+                "baseline": metric_values_to_json(row.baseline),
+                "changed": self_row_changed(row, args.tolerance),
+                "current": metric_values_to_json(row.current),
+                "deltas": metric_deltas_to_json(row.current, row.baseline),
+                "parameterDisplay": row.parameter_display,
+                "regressed": self_row_regressed(
+                    row,
+                    args.regression_threshold,
+                    args.tolerance,
+                    args.significance,
+                    args.min_effect_size,
+                ),
+                "timing": sample_comparison_to_json(row.timing),
+            }
+            for row in self_rows
+        ],
+        "currentWithoutSelfBaseline": [
+            benchmark_key_to_json(key) for key in current_without_baseline
+        ],
+        "selfBaselineWithoutCurrent": [
+            benchmark_key_to_json(key) for key in baseline_without_current
+        ],
+        "runtimeMatrixRows": [
+            runtime_matrix_row_to_json(row, phase_baseline) for row in runtime_matrix_rows
+        ],
+        "comparisonGroupsWithoutNovaSharp": [
+            comparison_key_to_json(key) for key in comparison_groups_without_nova
+        ],
+        "missingRuntimeCells": [
+            {**comparison_key_to_json(cell.key), "runtime": cell.runtime}
+            for cell in missing_expected_runtime_cells
+        ],
+        "phaseGateFailures": [
+            {
+                **comparison_key_to_json(failure.key),
+                "message": failure.message,
+                "metric": failure.metric,
+            }
+            for failure in phase_gate_failures
+        ],
+    }
+    if environment_summary is not None:
+        payload["environment"] = {
+            "baselineFingerprints": {
+                digest: fingerprint.details
+                for digest, fingerprint in environment_summary.baseline.items()
+            },
+            "currentFingerprints": {
+                digest: fingerprint.details
+                for digest, fingerprint in environment_summary.current.items()
+            },
+            "mismatchedRows": environment_summary.mismatched_rows,
+            "mode": environment_summary.mode,
+            "normalizationFactors": [
+                {"baseline": baseline, "current": current, "factor": factor}
+                for (current, baseline), factor in sorted(environment_summary.factors.items())
+            ],
+            "normalizationRuntime": environment_summary.normalization_runtime,
+            "normalizationScenario": environment_summary.normalization_scenario,
+            "normalizedRows": environment_summary.normalized_rows,
+        }
+    if profiles is not None:
+        payload["profiles"] = {
+            "entries": profiles.entries,
+            "profiler": profiles.profiler,
+            "root": repo_relative(profiles.root),
+        }
+    if memory_retention is not None:
+        payload["memoryRetention"] = {
+            "baseline": repo_relative(memory_retention.baseline_path),
+            "failures": [
+                {"message": failure.message, "method": failure.method, "metric": failure.metric}
+                for failure in memory_retention.failures
+            ],
+            "root": repo_relative(memory_retention.root),
+            "rows": [
+                {"baseline": row.baseline, "current": row.current, "method": row.method}
+                for row in memory_retention.rows
+            ],
+        }
+
+    return payload
+
+
+def runtime_matrix_row_to_json(
+    row: RuntimeMatrixRow,
+    phase_baseline: dict[ComparisonKey, dict[str, MetricRecord]],
+) -> dict[str, object]:
+    baseline_runtimes = phase_baseline.get(row.key, {})
+    return {
+        **comparison_key_to_json(row.key),
+        "novaSharp": metric_values_to_json(row.nova),
+        "parameterDisplay": row.parameter_display,
+        "phaseBaseline": {
+            runtime: metric_values_to_json(record.metrics)
+            for runtime, record in sorted(baseline_runtimes.items())
+        },
+        "runtimes": [
+            {
+                "deltas": metric_deltas_to_json(row.nova, comparison.metrics),
+                "displayName": comparison.display_name,
+                "metrics": metric_values_to_json(comparison.metrics),
+                "process": (
+                    {
+                        name: finite_or_none(value)
+                        for name, value in asdict(comparison.metrics.process).items()
+                    }
+                    if comparison.metrics.process is not None
+                    else None
+                ),
+                "runtime": comparison.runtime,
+                "runtimeContext": comparison.runtime_context,
+                "runtimeKind": comparison.runtime_kind,
+                "showDeltaPercent": comparison.show_delta_percent,
+            }
+            for comparison in row.comparisons
+        ],
+    }
+
+
+def benchmark_key_to_json(key: BenchmarkKey) -> dict[str, str]:
+    return {"method": key.method, "parameters": key.parameters, "summary": key.summary}
+
+
+def comparison_key_to_json(key: ComparisonKey) -> dict[str, str]:
+    return {"operation": key.operation, "parameters": key.parameters, "summary": key.summary}
+
+
+def metric_deltas_to_json(current: Metrics, baseline: Metrics) -> dict[str, float | None]:
+    """Fractional deltas of current over baseline; positive means current is higher."""
+
+    return {
+        "allocatedBytes": finite_or_none(
+            fraction_delta(current.allocated_bytes, baseline.allocated_bytes)
+        ),
+        "meanNs": finite_or_none(fraction_delta(current.mean_ns, baseline.mean_ns)),
+        "p95Ns": finite_or_none(fraction_delta(current.p95_ns, baseline.p95_ns)),
+    }
+
+
+def sample_comparison_to_json(timing: SampleComparison | None) -> dict[str, object] | None:
+    if timing is None:
+        return None
+
+    return {
+        "baselineCount": timing.baseline_count,
+        "currentCount": timing.current_count,
+        "effectSize": finite_or_none(timing.effect_size),
+        "meanRatioHigh": finite_or_none(timing.ratio_high),
+        "meanRatioLow": finite_or_none(timing.ratio_low),
+        "pValue": finite_or_none(timing.p_value),
+    }
+
+
 def render_markdown(
     external_rows: list[ExternalDeltaRow],
     runtime_matrix_rows: list[RuntimeMatrixRow],
@@ -941,6 +2912,17 @@ def render_markdown(
     phase_gate_failures: list[PhaseGateFailure],
     current_without_baseline: list[BenchmarkKey],
     baseline_without_current: list[BenchmarkKey],
+    tolerance: float = DEFAULT_TOLERANCE,
+    significance: float = DEFAULT_SIGNIFICANCE,
+    min_effect_size: float = DEFAULT_MIN_EFFECT_SIZE,
+    allocation_sites_path: Path | None = None,
+    scenario_allocations: list[ScenarioAllocation] | None = None,
+    allocation_candidates: list[AllocationSiteCandidate] | None = None,
+    scenario_opcodes_path: Path | None = None,
+    memory_retention: MemoryRetentionReport | None = None,
+    environment_summary: EnvironmentSummary | None = None,
+    profiles: ProfileSummary | None = None,
+    output_dir: Path = ROOT,
 ) -> str:
     lines = [
         "## Benchmark Comparison Deltas",
@@ -985,6 +2967,10 @@ def render_markdown(
         phase_baseline_path,
         phase_gate_failures,
     )
+    if environment_summary is not None:
+        render_environment_section(lines, environment_summary)
+    if profiles is not None:
+        render_profile_section(lines, profiles, output_dir)
     render_external_section(lines, runtime_matrix_rows)
     render_self_section(
         lines,
@@ -993,6 +2979,17 @@ def render_markdown(
         current_without_baseline,
         baseline_without_current,
     )
+    render_self_statistics_section(lines, self_rows, tolerance, significance, min_effect_size)
+    if allocation_sites_path is not None:
+        render_allocation_hotspot_section(
+            lines,
+            allocation_sites_path,
+            scenario_allocations or [],
+            allocation_candidates or [],
+            scenario_opcodes_path,
+        )
+    if memory_retention is not None:
+        render_memory_retention_section(lines, memory_retention)
 
     return "\n".join(lines).rstrip() + "\n"
 
@@ -1004,18 +3001,27 @@ def render_phase_scoreboard_section(
     phase_baseline_path: Path,
     phase_gate_failures: list[PhaseGateFailure],
 ) -> None:
+    calibrated_rows = sum(
+        1
+        for runtimes in phase_baseline.values()
+        if NOVA_RUNTIME in runtimes and runtimes[NOVA_RUNTIME].noise is not None
+    )
     lines.extend(
         [
             "### Phase A0 Scoreboard",
             "",
             "This scoreboard is the compact Phase A0 view: rows are benchmark scenarios/operations, "
             "and columns show NovaSharp current, NovaSharp baseline, MoonSharp, NLua, Lua-CSharp, "
-            "and reference `lua` CLI wall-time context when present.",
+            "and reference `lua` timing context when present.",
             "The phase gate, when enabled, checks NovaSharp/NLua same-run timing ratios against the "
             "checked-in phase baseline only when NovaSharp's own timing metric also regresses, and "
             "checks NovaSharp allocated B/op regressions with a small runner-noise tolerance.",
+            "Rows with calibrated noise bands use "
+            f"{NOISE_BAND_MULTIPLIER:g}x their measured run-to-run spread instead of the global "
+            "thresholds.",
             "",
             f"- Phase baseline JSON: `{repo_relative(phase_baseline_path)}`",
+            f"- Baseline rows with calibrated noise bands: {calibrated_rows} of {len(phase_baseline)}",
             "",
         ]
     )
@@ -1044,6 +3050,146 @@ def render_phase_scoreboard_section(
     render_phase_memory_scoreboard(lines, rows, phase_baseline)
 
 
+def render_profile_section(lines: list[str], profiles: ProfileSummary, output_dir: Path) -> None:
+    lines.extend(
+        [
+            "### Hot-Path Profiles",
+            "",
+            "CPU profiles of the profiled scenarios, captured by "
+            "`scripts/benchmarks/profile-benchmarks.py`. Hot-method tables rank NovaSharp frames "
+            "by self time; `.folded` files feed flamegraph tools and `.speedscope.json` files "
+            "open in speedscope. Diffs compare self-time shares against the baseline capture.",
+            "",
+            f"- Profile capture: `{repo_relative(profiles.root)}`",
+            f"- Profiler: `{profiles.profiler}`",
+            f"- Profiles: {len(profiles.entries)}",
+            "",
+        ]
+    )
+    if not profiles.entries:
+        lines.extend(["No profiles were captured.", ""])
+        return
+
+    def link(label: str, name: object) -> str:
+        target = os.path.relpath(profiles.root / str(name), output_dir)
+        return f"[{label}]({Path(target).as_posix()})"
+
+    lines.extend(
+        [
+            render_markdown_row(
+                ["Scenario", "Benchmark", "Top Self Method", "Hot Methods", "Flame Graph", "Diff"]
+            ),
+            render_markdown_row(["---", "---", "---", "---", "---", "---"]),
+        ]
+    )
+    for entry in profiles.entries:
+        top_methods = entry.get("topMethods") or []
+        diff = entry.get("diff") or {}
+        lines.append(
+            render_markdown_row(
+                [
+                    str(entry.get("scenario") or "-"),
+                    str(entry.get("name") or "-"),
+                    f"`{top_methods[0]}`" if top_methods else "-",
+                    link("table", entry["hotMethods"]) if entry.get("hotMethods") else "-",
+                    (
+                        f"{link('folded', entry['folded'])}, "
+                        f"{link('speedscope', entry['speedscope'])}"
+                        if entry.get("folded") and entry.get("speedscope")
+                        else "-"
+                    ),
+                    link("diff", diff["markdown"]) if diff.get("markdown") else "-",
+                ]
+            )
+        )
+    lines.append("")
+
+
+def load_profile_summary(root: Path) -> ProfileSummary:
+    path = root / PROFILE_INDEX_NAME
+    if not path.exists():
+        return ProfileSummary(root, "-", [])
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("schema") != PROFILE_INDEX_SCHEMA:
+        raise ValueError(f"Unsupported profile index schema in {repo_relative(path)}")
+    return ProfileSummary(root, str(data.get("profiler") or "-"), list(data.get("profiles") or []))
+
+
+def render_environment_section(lines: list[str], summary: EnvironmentSummary) -> None:
+    if not summary.current and not summary.baseline:
+        return
+
+    lines.extend(
+        [
+            "### Benchmark Environments",
+            "",
+            "Each report is fingerprinted by CPU model, core count, architecture, .NET runtime, "
+            "BenchmarkDotNet job, OS, kernel, and CPU governor. Phase gates compare a row only "
+            "against a baseline from a compatible fingerprint: architecture, runtime major "
+            "version, and job must match, and speed-only differences are "
+            + {
+                "normalize": "scaled by the reference factor below.",
+                "fail": "gate failures.",
+                "warn": "reported without gating.",
+            }[summary.mode],
+            "",
+            f"- Mismatch mode: `{summary.mode}`",
+            f"- Normalization reference: {summary.normalization_runtime} Execute "
+            f"`{summary.normalization_scenario}` mean",
+            f"- Rows with mismatched environments: {summary.mismatched_rows}",
+            f"- Rows normalized across environments: {summary.normalized_rows}",
+            "",
+            render_markdown_row(
+                [
+                    "Fingerprint",
+                    "Source",
+                    "Processor",
+                    "Cores",
+                    "Architecture",
+                    "Runtime",
+                    "Job",
+                    "Kernel",
+                    "Governor",
+                ]
+            ),
+            render_markdown_row(["---", "---", "---", "---:", "---", "---", "---", "---", "---"]),
+        ]
+    )
+    for source, fingerprints in (("current", summary.current), ("baseline", summary.baseline)):
+        for digest, fingerprint in fingerprints.items():
+            lines.append(
+                render_markdown_row(
+                    [
+                        f"`{digest}`",
+                        source,
+                        fingerprint.value("processor") or "-",
+                        fingerprint.value("logicalCores") or "-",
+                        fingerprint.value("architecture") or "-",
+                        fingerprint.value("runtime") or "-",
+                        fingerprint.value("job") or "-",
+                        fingerprint.value("kernel") or "-",
+                        fingerprint.value("governor") or "-",
+                    ]
+                )
+            )
+    lines.append("")
+
+    factors = {
+        pair: factor for pair, factor in summary.factors.items() if pair[0] != pair[1]
+    }
+    if factors:
+        lines.extend(
+            [
+                render_markdown_row(["Current", "Baseline", "Speed Factor"]),
+                render_markdown_row(["---", "---", "---:"]),
+            ]
+        )
+        for (current, baseline), factor in sorted(factors.items()):
+            lines.append(render_markdown_row([f"`{current}`", f"`{baseline}`", f"{factor:.3f}x"]))
+        lines.append("")
+
+
 def render_phase_time_scoreboard(
     lines: list[str],
     rows: list[RuntimeMatrixRow],
@@ -1095,7 +3241,7 @@ def render_phase_memory_scoreboard(
         [
             "#### Scoreboard Memory and GC",
             "",
-            "GC columns are collections per 1,000 operations. Reference `lua` CLI rows are process wall-time context, so their memory cells are `-`.",
+            "GC columns are collections per 1,000 operations. Reference `lua` CLI cells show per-process resource usage instead (see the memory matrix note), or `-` when none was captured.",
             "",
             render_markdown_row(headers),
             render_markdown_row(alignments),
@@ -1148,8 +3294,10 @@ def format_scoreboard_time_cell(record: MetricRecord | None) -> str:
 
 
 def format_scoreboard_memory_cell(record: MetricRecord | None) -> str:
-    if record is None or record.runtime_kind == "LuaCliWallTime":
+    if record is None:
         return "-"
+    if record.runtime_kind in REFERENCE_LUA_RUNTIME_KINDS:
+        return format_process_metrics(record.metrics.process)
 
     return format_memory_gc_pair(record.metrics)
 
@@ -1186,9 +3334,13 @@ def render_external_section(lines: list[str], rows: list[RuntimeMatrixRow]) -> N
             "NovaSharp values are raw results; external columns show raw results plus the NovaSharp delta against that runtime.",
             "NovaSharp comparison rows intentionally use the prepared-handle public API "
             "(`PrepareString`/`CompiledScript.Execute`) so the matrix reports the preferred execution surface.",
-            "Reference `lua` CLI rows, when present, are synthetic out-of-process wall-time context "
-            "that includes process startup, parse, compile, and execution. Memory and GC cells are shown as `-` "
-            "because the CLI context does not report managed allocations.",
+            "Reference `lua` CLI rows, when present, come from `scripts/benchmarks/run-lua-cli-context.py`. "
+            "`Lua in-process os.clock` rows time repeated calls of the loaded chunk inside one lua process, "
+            "so process startup is excluded (the runtime context lists it); `Lua CLI wall-time` rows are "
+            "out-of-process wall time that includes process startup, parse, compile, and execution. "
+            "Their memory cells hold per-process OS resource usage (`RSS / CPU user+sys / faults / "
+            "csw voluntary+involuntary`), not managed B/op, so they carry no NovaSharp delta; they are "
+            "`-` where the platform cannot report it.",
             "",
         ]
     )
@@ -1313,6 +3465,10 @@ def render_runtime_memory_matrix(
             "",
             "GC columns are collections per 1,000 operations.",
             "A `-` cell means that runtime did not report memory or GC diagnostics for that row.",
+            "Reference `lua` CLI cells show whole-process resource usage instead of managed "
+            "allocations: peak RSS, user+system CPU, page faults, and voluntary+involuntary "
+            "context switches per measured lua process. They have no NovaSharp delta because "
+            "the units differ.",
             "",
             render_markdown_row(headers),
             render_markdown_row(alignments),
@@ -1330,6 +3486,9 @@ def render_runtime_memory_matrix(
             if comparison is None:
                 cells.extend(["-", "-"])
                 continue
+            if comparison.metrics.process is not None:
+                cells.extend([format_process_metrics(comparison.metrics.process), "-"])
+                continue
 
             cells.extend(
                 [
@@ -1439,6 +3598,18 @@ def format_memory_gc_pair(metrics: Metrics) -> str:
     return f"{format_bytes(metrics.allocated_bytes)} / {format_gc_triplet(metrics)}"
 
 
+def format_process_metrics(process: ProcessMetrics | None) -> str:
+    if process is None:
+        return "-"
+
+    return (
+        f"RSS {format_bytes(process.peak_rss_bytes)} / "
+        f"CPU {format_count(process.user_cpu_ms)}+{format_count(process.system_cpu_ms)} ms / "
+        f"{format_count(process.minor_faults + process.major_faults)} faults / "
+        f"{format_count(process.voluntary_switches)}+{format_count(process.involuntary_switches)} csw"
+    )
+
+
 def format_memory_gc_delta(
     current: Metrics,
     baseline: Metrics,
@@ -1534,6 +3705,267 @@ def render_self_section(
     lines.append("")
 
 
+def render_self_statistics_section(
+    lines: list[str],
+    rows: list[SelfDeltaRow],
+    tolerance: float,
+    significance: float,
+    min_effect_size: float,
+) -> None:
+    statistical_rows = [row for row in rows if row.timing is not None]
+    if not statistical_rows:
+        return
+
+    lines.extend(
+        [
+            "#### Self Baseline Significance",
+            "",
+            "Timing verdicts compare the raw BenchmarkDotNet iteration times with a one-sided "
+            f"Mann-Whitney U test (p < {significance:g}), Cliff's delta effect size "
+            f"(at least {min_effect_size:g}), and a {100 * (1 - significance):g}% bootstrap interval "
+            f"for the mean ratio that must clear the {100 * tolerance:g}% "
+            "change tolerance. Allocation verdicts use the phase-baseline B/op tolerance. "
+            "Rows without raw measurements fall back to `--regression-threshold`.",
+            "",
+            render_markdown_row(
+                [
+                    "Summary",
+                    "Method",
+                    "Parameters",
+                    "Samples",
+                    "Mean Ratio CI",
+                    "p-value",
+                    "Cliff's Delta",
+                    "Timing",
+                    "Alloc",
+                ]
+            ),
+            render_markdown_row(["---", "---", "---", "---:", "---:", "---:", "---:", "---", "---"]),
+        ]
+    )
+
+    for row in statistical_rows:
+        timing = row.timing
+        assert timing is not None
+        if timing_regressed(timing, tolerance, significance, min_effect_size):
+            timing_verdict = "slower"
+        elif timing_improved(timing, tolerance, min_effect_size):
+            timing_verdict = "faster"
+        else:
+            timing_verdict = "no significant change"
+        lines.append(
+            render_markdown_row(
+                [
+                    row.key.summary,
+                    row.key.method,
+                    row.parameter_display or "-",
+                    f"{timing.current_count}/{timing.baseline_count}",
+                    f"{timing.ratio_low:.3f}x-{timing.ratio_high:.3f}x",
+                    format_p_value(timing.p_value),
+                    f"{timing.effect_size:+.2f}",
+                    timing_verdict,
+                    "regressed"
+                    if allocation_regressed(row.current.allocated_bytes, row.baseline.allocated_bytes)
+                    else "ok",
+                ]
+            )
+        )
+
+    lines.append("")
+
+
+def format_p_value(value: float) -> str:
+    if not math.isfinite(value):
+        return "-"
+    if value < 0.0001:
+        return "<0.0001"
+    return f"{value:.4f}"
+
+
+def render_allocation_hotspot_section(
+    lines: list[str],
+    allocation_sites_path: Path,
+    scenarios: list[ScenarioAllocation],
+    candidates: list[AllocationSiteCandidate],
+    scenario_opcodes_path: Path | None = None,
+) -> None:
+    lines.extend(
+        [
+            "### Allocation Hotspots",
+            "",
+            "NovaSharp B/op regressions next to the static VM hot-path allocation sites that "
+            "can run in them (Execute and interop rows only). With scenario opcodes, a site "
+            "only reaches the Execute scenarios that compile to an opcode whose ProcessingLoop "
+            "case can reach it. Candidates are ordered by the summed B/op regression of the "
+            "scenarios they reach, then new before allowlisted. That sum is the regressed "
+            "traffic through a site, not bytes the site allocated, so confirm a candidate "
+            "with an allocation profiler.",
+            "",
+            f"- Allocation sites JSON: `{repo_relative(allocation_sites_path)}`",
+            "- Scenario opcodes JSON: "
+            + (
+                f"`{repo_relative(scenario_opcodes_path)}`"
+                if scenario_opcodes_path is not None
+                else "not provided; every VM site reaches every Execute scenario"
+            ),
+            "",
+        ]
+    )
+
+    regressed = [scenario for scenario in scenarios if scenario.regression_bytes > 0]
+    if regressed:
+        lines.extend(
+            [
+                "#### Scenarios with B/op Regressions",
+                "",
+                render_markdown_row(["Scenario", "Operation", "Baseline Alloc", "Current Alloc", "Delta"]),
+                render_markdown_row(["---", "---", "---:", "---:", "---:"]),
+            ]
+        )
+        for scenario in sorted(regressed, key=lambda value: -value.regression_bytes):
+            lines.append(
+                render_markdown_row(
+                    [
+                        scenario_display_from_key(scenario.key, scenario.parameter_display),
+                        scenario.key.operation,
+                        format_bytes(scenario.baseline_bytes),
+                        format_bytes(scenario.current_bytes),
+                        format_bytes_delta(scenario.regression_bytes),
+                    ]
+                )
+            )
+        lines.append("")
+
+    if not candidates:
+        lines.extend(["No allocation sites were found in the allocation sites JSON.", ""])
+        return
+
+    lines.extend(
+        [
+            "#### Candidate Allocation Sites",
+            "",
+            render_markdown_row(
+                ["Site", "Rule", "Status", "Reached Regression", "Regressed Scenarios Reached"]
+            ),
+            render_markdown_row(["---", "---", "---", "---:", "---"]),
+        ]
+    )
+    for candidate in candidates[:ALLOCATION_HOTSPOT_LIMIT]:
+        site = candidate.site
+        related = ", ".join(
+            sorted(
+                {
+                    scenario_display_from_key(scenario.key, scenario.parameter_display)
+                    for scenario in candidate.regressed_scenarios
+                }
+            )
+        )
+        lines.append(
+            render_markdown_row(
+                [
+                    f"`{site.path.rsplit('/', 1)[-1]}:{site.line_number}` {site.symbol}",
+                    site.rule_id,
+                    "allowlisted" if site.allowlisted else "new",
+                    (
+                        format_bytes_delta(candidate.reached_regression_bytes)
+                        if candidate.regressed_scenarios
+                        else "-"
+                    ),
+                    related or "-",
+                ]
+            )
+        )
+    if len(candidates) > ALLOCATION_HOTSPOT_LIMIT:
+        lines.append("")
+        lines.append(f"- ... {len(candidates) - ALLOCATION_HOTSPOT_LIMIT} more")
+    lines.append("")
+
+
+def render_memory_retention_section(lines: list[str], report: MemoryRetentionReport) -> None:
+    lines.extend(
+        [
+            "### Phase A0.5 Memory Retention",
+            "",
+            "MemoryRetentionBenchmarks measurements after a critical trim, compared with the "
+            "checked-in Phase A0.5 baseline. The gate, when enabled, fails when B/op, estimated "
+            "or peak retained bytes, retained pool count, or compilation cache entries grow "
+            "beyond their tolerance. Private bytes and working set are process diagnostics and "
+            "stay report-only.",
+            "",
+            f"- Memory retention artifacts: `{repo_relative(report.root)}`",
+            f"- Memory retention baseline JSON: `{repo_relative(report.baseline_path)}`",
+            f"- Memory retention gate failures: {len(report.failures)}",
+            "",
+        ]
+    )
+
+    if not report.baseline_path.exists():
+        lines.extend(
+            [
+                "No checked-in memory-retention baseline was found. Pass "
+                "`--write-memory-retention-baseline` after a representative run to create one.",
+                "",
+            ]
+        )
+
+    if report.failures:
+        lines.extend(
+            [
+                "#### Memory Retention Gate Failures",
+                "",
+                render_markdown_row(["Benchmark", "Metric", "Failure"]),
+                render_markdown_row(["---", "---", "---"]),
+            ]
+        )
+        for failure in report.failures:
+            lines.append(render_markdown_row([failure.method, failure.metric, failure.message]))
+        lines.append("")
+
+    if not report.rows:
+        lines.extend(["No MemoryRetentionBenchmarks rows were found.", ""])
+        return
+
+    lines.extend(
+        [
+            render_markdown_row(
+                ["Benchmark", *(metric.display_name for metric in report.metrics)]
+            ),
+            render_markdown_row(["---", *("---:" for _ in report.metrics)]),
+        ]
+    )
+    for row in report.rows:
+        lines.append(
+            render_markdown_row(
+                [
+                    row.method,
+                    *(format_retention_cell(metric, row) for metric in report.metrics),
+                ]
+            )
+        )
+    lines.append("")
+
+
+def format_retention_cell(metric: RetentionMetric, row: MemoryRetentionRow) -> str:
+    current = row.current.get(metric.name)
+    baseline = row.baseline.get(metric.name)
+    if current is None:
+        return "-"
+    if baseline is None:
+        return format_retention_value(metric, current)
+    return (
+        f"{format_retention_value(metric, current)} "
+        f"({format_retention_delta(metric, current - baseline)})"
+    )
+
+
+def format_retention_value(metric: RetentionMetric, value: float) -> str:
+    return format_bytes(value) if metric.unit == "bytes" else format_count(value)
+
+
+def format_retention_delta(metric: RetentionMetric, value: float) -> str:
+    return format_bytes_delta(value) if metric.unit == "bytes" else format_count_delta(value)
+
+
 def append_benchmark_key_preview(lines: list[str], title: str, keys: list[BenchmarkKey]) -> None:
     if not keys:
         return
@@ -1689,7 +4121,7 @@ def runtime_kind_from_json(benchmark: dict) -> str:
 
 
 def show_delta_percent_from_json(benchmark: dict) -> bool:
-    if runtime_kind_from_json(benchmark) == "LuaCliWallTime":
+    if runtime_kind_from_json(benchmark) == LUA_CLI_WALL_TIME_KIND:
         return False
 
     value = benchmark.get("ShowDeltaPercent")
@@ -3,7 +3,10 @@ param(
     [string]$Configuration = "Release",
     [string]$RuntimeBenchmarkProject = "src/tooling/WallstopStudios.NovaSharp.Benchmarks/WallstopStudios.NovaSharp.Benchmarks.csproj",
     [string]$ComparisonBenchmarkProject = "src/tooling/WallstopStudios.NovaSharp.Comparison/WallstopStudios.NovaSharp.Comparison.csproj",
-    [switch]$SkipComparison
+    [switch]$SkipComparison,
+    [switch]$ProfileRegressions,
+    [string[]]$ProfileScenario = @(),
+    [string]$ProfileBaseline = ""
 )
 
 $ErrorActionPreference = "Stop"
@@ -47,6 +50,18 @@ function Resolve-PythonCommand {
     throw "Python 3 is required to render the benchmark delta report. Set PYTHON to override."
 }
 
+function Write-EnvironmentFingerprint {
+    param(
+        [string]$OutputRoot
+    )
+
+    $pythonCommand = Resolve-PythonCommand
+    & $pythonCommand "scripts/benchmarks/capture-environment.py" "--output-root" $OutputRoot
+    if ($LASTEXITCODE -ne 0) {
+        throw "scripts/benchmarks/capture-environment.py failed. See output above."
+    }
+}
+
 if ([string]::IsNullOrWhiteSpace($env:DOTNET_ROLL_FORWARD)) {
     $env:DOTNET_ROLL_FORWARD = "Major"
     Write-Host "DOTNET_ROLL_FORWARD not set; defaulting to 'Major' so .NET 9 hosts can execute the .NET 8 benchmarks."
@@ -81,6 +96,7 @@ function Invoke-Benchmark {
 }
 
 Invoke-Benchmark -Project $RuntimeBenchmarkProject -Configuration $Configuration -Description "NovaSharp runtime"
+Write-EnvironmentFingerprint -OutputRoot "BenchmarkDotNet.Artifacts"
 
 $comparisonArtifacts = "artifacts/benchmarkdotnet/comparison"
 $luaCliScenarios = "artifacts/benchmarkdotnet/lua-cli-scenarios"
@@ -106,6 +122,7 @@ if (-not $SkipComparison) {
     if ($LASTEXITCODE -ne 0) {
         throw "dotnet run --project $ComparisonBenchmarkProject -c $Configuration failed. See output above."
     }
+    Write-EnvironmentFingerprint -OutputRoot $comparisonArtifacts
     Write-Host "comparison benchmarks complete."
 
     Write-Host ""
@@ -138,15 +155,72 @@ else {
 Write-Host ""
 Write-Host "Rendering benchmark comparison delta report..."
 $pythonCommand = Resolve-PythonCommand
-& $pythonCommand "scripts/benchmarks/render-benchmark-deltas.py" `
-    "--current-root" "BenchmarkDotNet.Artifacts" `
-    "--comparison-root" $comparisonArtifacts `
-    "--self-baseline-root" "docs/performance-history/current-baseline" `
-    "--output" "artifacts/benchmark-deltas.md"
+$rendererArgs = @(
+    "--current-root", "BenchmarkDotNet.Artifacts",
+    "--comparison-root", $comparisonArtifacts,
+    "--self-baseline-root", "docs/performance-history/current-baseline",
+    "--output", "artifacts/benchmark-deltas.md",
+    "--json-output", "artifacts/benchmark-deltas.json"
+)
+& $pythonCommand "scripts/benchmarks/render-benchmark-deltas.py" @rendererArgs
 if ($LASTEXITCODE -ne 0) {
     throw "scripts/benchmarks/render-benchmark-deltas.py failed. See output above."
 }
 
+$profileArtifacts = "artifacts/benchmark-profiles/current"
+$profilePrevious = "artifacts/benchmark-profiles/previous"
+if ($ProfileRegressions -or $ProfileScenario.Count -gt 0) {
+    # Without -ProfileBaseline, the previous run's capture becomes the diff baseline.
+    if ([string]::IsNullOrWhiteSpace($ProfileBaseline) -and (Test-Path (Join-Path $profileArtifacts "profile-index.json"))) {
+        if (Test-Path $profilePrevious) {
+            Remove-Item -Recurse -Force $profilePrevious
+        }
+        Move-Item $profileArtifacts $profilePrevious
+        $ProfileBaseline = $profilePrevious
+    }
+    # Profiles the scenarios that failed a phase gate plus any named with -ProfileScenario.
+    $profileArgs = @(
+        "capture",
+        "--no-build",
+        "--configuration", $Configuration,
+        "--from-deltas", "artifacts/benchmark-deltas.json",
+        "--output-root", $profileArtifacts
+    )
+    foreach ($scenario in $ProfileScenario) {
+        $profileArgs += @("--scenario", $scenario)
+    }
+    if (-not [string]::IsNullOrWhiteSpace($ProfileBaseline)) {
+        $profileArgs += @("--baseline-root", $ProfileBaseline)
+    }
+
+    Write-Host ""
+    Write-Host "Profiling regressed comparison scenarios..."
+    & $pythonCommand "scripts/benchmarks/profile-benchmarks.py" @profileArgs
+    # Profiles are diagnostics; a failed capture must not abort the run or skip the history.
+    if ($LASTEXITCODE -ne 0) {
+        Write-Warning "Profile capture failed; see output above."
+    }
+
+    if (Test-Path (Join-Path $profileArtifacts "profile-index.json")) {
+        Write-Host ""
+        Write-Host "Re-rendering benchmark comparison delta report with profile links..."
+        & $pythonCommand "scripts/benchmarks/render-benchmark-deltas.py" @rendererArgs "--profile-root" $profileArtifacts
+        if ($LASTEXITCODE -ne 0) {
+            throw "scripts/benchmarks/render-benchmark-deltas.py failed. See output above."
+        }
+    }
+}
+
+Write-Host ""
+Write-Host "Recording results in the local benchmark history..."
+& $pythonCommand "scripts/benchmarks/benchmark-history.py" `
+    "ingest" `
+    "BenchmarkDotNet.Artifacts" `
+    $comparisonArtifacts
+if ($LASTEXITCODE -ne 0) {
+    throw "scripts/benchmarks/benchmark-history.py failed. See output above."
+}
+
 $artifactsPath = Join-Path $repoRoot "BenchmarkDotNet.Artifacts"
 $comparisonArtifactsPath = Join-Path $repoRoot $comparisonArtifacts
 Write-Host ""
@@ -156,5 +230,12 @@ Write-Host "Comparison BenchmarkDotNet artifacts are available under:"
 Write-Host "  $comparisonArtifactsPath"
 Write-Host "Benchmark comparison delta report:"
 Write-Host "  artifacts/benchmark-deltas.md"
+Write-Host "  artifacts/benchmark-deltas.json"
+if ($ProfileRegressions -or $ProfileScenario.Count -gt 0) {
+    Write-Host "Hot-path profiles (folded stacks, speedscope files, hot-method tables):"
+    Write-Host "  $profileArtifacts"
+}
+Write-Host "Benchmark history (query with scripts/benchmarks/benchmark-history.py trend|changepoints):"
+Write-Host "  artifacts/benchmark-history/history.jsonl"
 Write-Host ""
 Write-Host "Review the updated sections in docs/Performance.md and attach relevant artifacts when opening a PR."
@@ -2,11 +2,15 @@
 # scripts/benchmarks/run-benchmarks.sh
 # Runs NovaSharp benchmarks with optional comparison suite.
 # Usage: ./run-benchmarks.sh [--skip-comparison] [--configuration <Release|Debug>]
+#        [--profile-regressions] [--profile-scenario <Scenario>] [--profile-baseline <capture-dir>]
 
 set -euo pipefail
 
 CONFIGURATION="Release"
 SKIP_COMPARISON=false
+PROFILE=false
+PROFILE_SCENARIOS=()
+PROFILE_BASELINE=""
 
 while [[ $# -gt 0 ]]; do
     case $1 in
@@ -22,6 +26,19 @@ while [[ $# -gt 0 ]]; do
             CONFIGURATION="$2"
             shift 2
             ;;
+        --profile-regressions)
+            PROFILE=true
+            shift
+            ;;
+        --profile-scenario)
+            PROFILE=true
+            PROFILE_SCENARIOS+=("$2")
+            shift 2
+            ;;
+        --profile-baseline)
+            PROFILE_BASELINE="$2"
+            shift 2
+            ;;
         *)
             echo "Unknown option: $1"
             exit 1
@@ -77,6 +94,7 @@ run_benchmark() {
 }
 
 run_benchmark "src/tooling/WallstopStudios.NovaSharp.Benchmarks/WallstopStudios.NovaSharp.Benchmarks.csproj" "NovaSharp runtime"
+run_python scripts/benchmarks/capture-environment.py --output-root BenchmarkDotNet.Artifacts
 
 COMPARISON_ARTIFACTS="artifacts/benchmarkdotnet/comparison"
 LUA_CLI_SCENARIOS="artifacts/benchmarkdotnet/lua-cli-scenarios"
@@ -95,6 +113,7 @@ if [[ "$SKIP_COMPARISON" == "false" ]]; then
         -- \
         --filter "*" \
         --artifacts "$COMPARISON_ARTIFACTS"
+    run_python scripts/benchmarks/capture-environment.py --output-root "$COMPARISON_ARTIFACTS"
     echo "comparison benchmarks complete."
 
     echo ""
@@ -118,11 +137,58 @@ fi
 
 echo ""
 echo "Rendering benchmark comparison delta report..."
-run_python scripts/benchmarks/render-benchmark-deltas.py \
-    --current-root BenchmarkDotNet.Artifacts \
-    --comparison-root artifacts/benchmarkdotnet/comparison \
-    --self-baseline-root docs/performance-history/current-baseline \
+renderer_args=(
+    --current-root BenchmarkDotNet.Artifacts
+    --comparison-root artifacts/benchmarkdotnet/comparison
+    --self-baseline-root docs/performance-history/current-baseline
     --output artifacts/benchmark-deltas.md
+    --json-output artifacts/benchmark-deltas.json
+)
+run_python scripts/benchmarks/render-benchmark-deltas.py "${renderer_args[@]}"
+
+PROFILE_ARTIFACTS="artifacts/benchmark-profiles/current"
+PROFILE_PREVIOUS="artifacts/benchmark-profiles/previous"
+if [[ "$PROFILE" == "true" ]]; then
+    # Without --profile-baseline, the previous run's capture becomes the diff baseline.
+    if [[ -z "$PROFILE_BASELINE" && -f "$PROFILE_ARTIFACTS/profile-index.json" ]]; then
+        rm -rf "$PROFILE_PREVIOUS"
+        mv "$PROFILE_ARTIFACTS" "$PROFILE_PREVIOUS"
+        PROFILE_BASELINE="$PROFILE_PREVIOUS"
+    fi
+    # Profiles the scenarios that failed a phase gate plus any named with --profile-scenario.
+    profile_args=(
+        capture
+        --no-build
+        --configuration "$CONFIGURATION"
+        --from-deltas artifacts/benchmark-deltas.json
+        --output-root "$PROFILE_ARTIFACTS"
+    )
+    for scenario in ${PROFILE_SCENARIOS[@]+"${PROFILE_SCENARIOS[@]}"}; do
+        profile_args+=(--scenario "$scenario")
+    done
+    if [[ -n "$PROFILE_BASELINE" ]]; then
+        profile_args+=(--baseline-root "$PROFILE_BASELINE")
+    fi
+
+    echo ""
+    echo "Profiling regressed comparison scenarios..."
+    # Profiles are diagnostics; a failed capture must not abort the run or skip the history.
+    run_python scripts/benchmarks/profile-benchmarks.py "${profile_args[@]}" ||
+        echo "Warning: profile capture failed; see output above." >&2
+
+    if [[ -f "$PROFILE_ARTIFACTS/profile-index.json" ]]; then
+        echo ""
+        echo "Re-rendering benchmark comparison delta report with profile links..."
+        run_python scripts/benchmarks/render-benchmark-deltas.py "${renderer_args[@]}" \
+            --profile-root "$PROFILE_ARTIFACTS"
+    fi
+fi
+
+echo ""
+echo "Recording results in the local benchmark history..."
+run_python scripts/benchmarks/benchmark-history.py ingest \
+    BenchmarkDotNet.Artifacts \
+    "$COMPARISON_ARTIFACTS"
 
 ARTIFACTS_PATH="$REPO_ROOT/BenchmarkDotNet.Artifacts"
 COMPARISON_ARTIFACTS_PATH="$REPO_ROOT/artifacts/benchmarkdotnet/comparison"
@@ -133,5 +199,12 @@ echo "Comparison BenchmarkDotNet artifacts are available under:"
 echo "  $COMPARISON_ARTIFACTS_PATH"
 echo "Benchmark comparison delta report:"
 echo "  artifacts/benchmark-deltas.md"
+echo "  artifacts/benchmark-deltas.json"
+if [[ "$PROFILE" == "true" ]]; then
+    echo "Hot-path profiles (folded stacks, speedscope files, hot-method tables):"
+    echo "  $PROFILE_ARTIFACTS"
+fi
+echo "Benchmark history (query with scripts/benchmarks/benchmark-history.py trend|changepoints):"
+echo "  artifacts/benchmark-history/history.jsonl"
 echo ""
 echo "Review the updated sections in docs/Performance.md and attach relevant artifacts when opening a PR."
@@ -1,15 +1,38 @@
 #!/usr/bin/env python3
-"""Measure reference lua CLI wall-time for exported comparison scenarios."""
+"""Measure reference lua timings for exported comparison scenarios.
+
+The default in-process mode runs each scenario inside one lua process through a small
+driver that times repeated chunk calls with ``os.clock``, so process spawn and dynamic
+linking are excluded and the column is comparable to BenchmarkDotNet Execute rows.
+The ``process`` mode keeps the original whole-process wall-time measurement. Both
+modes measure the empty-script startup cost separately and report it as context.
+
+Scenarios are measured in interleaved rounds, so slow machine drift lands on every
+scenario instead of the last few. Each scenario stops once the confidence interval
+of its mean is tight enough. ``--jobs`` spreads scenarios across worker threads that
+can pin themselves, and the lua processes they spawn, to separate CPUs.
+
+Where ``os.wait4`` exists, every measured lua process is reaped with its resource usage
+(peak RSS, user/system CPU, page faults, context switches). Rows report it through
+BenchmarkDotNet-style ``Metrics`` entries so the memory matrix has a reference column.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
+import math
 import os
 import shutil
+import signal
+import statistics
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -18,12 +41,124 @@ DEFAULT_SCENARIO_DIR = Path("artifacts/benchmarkdotnet/lua-cli-scenarios")
 DEFAULT_OUTPUT_ROOT = Path("artifacts/benchmarkdotnet/comparison")
 DEFAULT_WARMUP_COUNT = 2
 DEFAULT_ITERATION_COUNT = 10
+DEFAULT_MAX_ITERATION_COUNT = 40
+DEFAULT_BATCH_SIZE = 5
+DEFAULT_TARGET_RELATIVE_CI = 0.02
+DEFAULT_JOBS = 1
+# Two-sided 95% normal quantile for the confidence interval of the mean.
+CONFIDENCE_Z = 1.96
+# (Id, display name, unit, legend) for the process resource metrics on each row.
+RESOURCE_METRIC_DESCRIPTORS = (
+    ("PeakRss", "Peak RSS", "B", "Largest resident set size of any measured lua process"),
+    ("UserCpuTime", "User CPU", "ms", "User CPU time per measured lua process"),
+    ("SystemCpuTime", "System CPU", "ms", "System CPU time per measured lua process"),
+    ("MinorPageFaults", "Minor Faults", "Count", "Minor page faults per measured lua process"),
+    ("MajorPageFaults", "Major Faults", "Count", "Major page faults per measured lua process"),
+    (
+        "VoluntaryContextSwitches",
+        "Voluntary Switches",
+        "Count",
+        "Voluntary context switches per measured lua process",
+    ),
+    (
+        "InvoluntaryContextSwitches",
+        "Involuntary Switches",
+        "Count",
+        "Involuntary context switches per measured lua process",
+    ),
+)
 DEFAULT_TIMEOUT_SECONDS = 30.0
+DEFAULT_MIN_ITERATION_SECONDS = 0.02
+MODES = ("in-process", "process")
+DEFAULT_MODE = "in-process"
+IN_PROCESS_RUNTIME_KIND = "LuaInProcessCpuTime"
+PROCESS_RUNTIME_KIND = "LuaCliWallTime"
+# Driver protocol: one "operations <n>" line, then "overhead <seconds>" and
+# "iteration <seconds>" lines, each covering <n> calls of the loaded chunk.
+LUA_DRIVER = """\
+local path = arg[1]
+local warmup = tonumber(arg[2])
+local iterations = tonumber(arg[3])
+local min_time = tonumber(arg[4])
+local fixed_operations = tonumber(arg[5])
+local clock = os.clock
+local chunk = assert(loadfile(path))
+local function noop() end
+
+for _ = 1, warmup do
+  chunk()
+end
+
+local operations = fixed_operations or 1
+while not fixed_operations do
+  local start = clock()
+  for _ = 1, operations do
+    chunk()
+  end
+  if clock() - start >= min_time or operations >= 1073741824 then
+    break
+  end
+  operations = operations * 2
+end
+io.write("operations ", string.format("%d", operations), "\\n")
+
+for _ = 1, iterations do
+  local start = clock()
+  for _ = 1, operations do
+    noop()
+  end
+  io.write("overhead ", string.format("%.17g", clock() - start), "\\n")
+end
+
+for _ = 1, iterations do
+  local start = clock()
+  for _ = 1, operations do
+    chunk()
+  end
+  io.write("iteration ", string.format("%.17g", clock() - start), "\\n")
+end
+"""
 REPORT_NAME = (
     "WallstopStudios.NovaSharp.Comparison.ReferenceLuaCli-report-full-compressed.json"
 )
 
 
+@dataclass(frozen=True)
+class ResourceUsage:
+    peak_rss_bytes: float
+    user_cpu_ms: float
+    system_cpu_ms: float
+    minor_faults: int
+    major_faults: int
+    voluntary_switches: int
+    involuntary_switches: int
+
+    @classmethod
+    def from_rusage(cls, usage) -> ResourceUsage:
+        # ru_maxrss is kilobytes on Linux and bytes on macOS.
+        rss_scale = 1 if sys.platform == "darwin" else 1024
+        return cls(
+            usage.ru_maxrss * rss_scale,
+            usage.ru_utime * 1000,
+            usage.ru_stime * 1000,
+            usage.ru_minflt,
+            usage.ru_majflt,
+            usage.ru_nvcsw,
+            usage.ru_nivcsw,
+        )
+
+
+@dataclass
+class ScenarioRun:
+    """Samples collected so far for one scenario across interleaved rounds."""
+
+    scenario: Path
+    samples: list[float] = field(default_factory=list)
+    usages: list[ResourceUsage] = field(default_factory=list)
+    operations: int | None = None
+    rounds: int = 0
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -47,19 +182,72 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         "--warmup-count",
         type=int,
         default=DEFAULT_WARMUP_COUNT,
-        help="Unmeasured process executions per scenario.",
+        help="Unmeasured executions per scenario before each measured batch.",
     )
     parser.add_argument(
         "--iteration-count",
         type=int,
         default=DEFAULT_ITERATION_COUNT,
-        help="Measured process executions per scenario.",
+        help="Minimum measured iterations per scenario.",
+    )
+    parser.add_argument(
+        "--max-iteration-count",
+        type=int,
+        default=DEFAULT_MAX_ITERATION_COUNT,
+        help="Stop measuring a scenario after this many iterations even if its interval is wide.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Measured iterations per scenario in each interleaved round.",
+    )
+    parser.add_argument(
+        "--target-relative-ci",
+        type=float,
+        default=DEFAULT_TARGET_RELATIVE_CI,
+        help=(
+            "Stop measuring a scenario once the 95%% confidence half-width of its mean "
+            "is at most this fraction of the mean."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="Scenarios measured concurrently. Use with --pin-cpus to keep workers apart.",
+    )
+    parser.add_argument(
+        "--pin-cpus",
+        default="",
+        help=(
+            "Comma-separated CPU ids (or 'auto' for every CPU this process may use). Each "
+            "worker and the lua processes it spawns are pinned to one of them. Linux only."
+        ),
     )
     parser.add_argument(
         "--timeout-seconds",
         type=float,
         default=DEFAULT_TIMEOUT_SECONDS,
-        help="Timeout for one lua CLI process execution.",
+        help=(
+            "Timeout for one lua CLI process execution. In-process mode scales it by the "
+            "warmup plus batch size because one process runs a whole batch."
+        ),
+    )
+    parser.add_argument(
+        "--mode",
+        choices=MODES,
+        default=DEFAULT_MODE,
+        help=(
+            "in-process times repeated chunk calls inside one lua process with os.clock; "
+            "process times whole lua CLI executions including startup."
+        ),
+    )
+    parser.add_argument(
+        "--min-iteration-seconds",
+        type=float,
+        default=DEFAULT_MIN_ITERATION_SECONDS,
+        help="In-process mode doubles calls per iteration until one iteration takes this long.",
     )
     return parser.parse_args(argv)
 
@@ -88,19 +276,48 @@ def main(argv: list[str]) -> int:
         raise ValueError("--warmup-count must be non-negative.")
     if args.iteration_count <= 0:
         raise ValueError("--iteration-count must be positive.")
+    if args.max_iteration_count < args.iteration_count:
+        raise ValueError("--max-iteration-count must be at least --iteration-count.")
+    if args.batch_size <= 0:
+        raise ValueError("--batch-size must be positive.")
+    if args.target_relative_ci < 0:
+        raise ValueError("--target-relative-ci must be non-negative.")
+    if args.jobs <= 0:
+        raise ValueError("--jobs must be positive.")
     if args.timeout_seconds <= 0:
         raise ValueError("--timeout-seconds must be positive.")
+    if args.min_iteration_seconds <= 0:
+        raise ValueError("--min-iteration-seconds must be positive.")
+
+    cpus = resolve_pin_cpus(args.pin_cpus)
+    started = time.perf_counter()
+    if cpus:
+        pin_current_thread(cpus[0])
+    startup_timings = measure_startup(
+        lua_cmd,
+        args.warmup_count,
+        args.iteration_count,
+        args.timeout_seconds,
+    )
+    startup_ns = sum(startup_timings) / len(startup_timings)
 
-    benchmarks = []
-    for scenario in scenarios:
-        timings = measure_scenario(
+    with tempfile.TemporaryDirectory(prefix="novasharp-lua-driver-") as driver_dir:
+        driver = Path(driver_dir) / "driver.lua"
+        driver.write_text(LUA_DRIVER, encoding="utf-8")
+        runs = measure_scenarios(lua_cmd, driver, scenarios, cpus, args)
+
+    benchmarks = [
+        benchmark_record(
+            run.scenario.stem,
+            run.samples,
             lua_cmd,
-            scenario,
-            args.warmup_count,
-            args.iteration_count,
-            args.timeout_seconds,
+            lua_version,
+            args.mode,
+            startup_ns,
+            run.usages,
         )
-        benchmarks.append(benchmark_record(scenario.stem, timings, lua_cmd, lua_version))
+        for run in runs
+    ]
 
     output_path = output_root / "results" / REPORT_NAME
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -119,6 +336,16 @@ def main(argv: list[str]) -> int:
     print(f"lua_cli_rows={len(benchmarks)}")
     print(f"lua_cli_command={lua_cmd}")
     print(f"lua_cli_version={lua_version}")
+    print(f"lua_cli_mode={args.mode}")
+    print(f"lua_cli_startup_mean_ns={startup_ns:.0f}")
+    print(f"lua_cli_jobs={args.jobs}")
+    print(f"lua_cli_pinned_cpus={','.join(str(cpu) for cpu in cpus) or 'none'}")
+    print(f"lua_cli_samples={sum(len(run.samples) for run in runs)}")
+    print(
+        "lua_cli_unconverged_rows="
+        f"{sum(1 for run in runs if relative_ci(run.samples) > args.target_relative_ci)}"
+    )
+    print(f"lua_cli_elapsed_seconds={time.perf_counter() - started:.2f}")
     print(f"lua_cli_output={repo_relative(output_path)}")
     return 0
 
@@ -172,6 +399,7 @@ def measure_scenario(
     warmup_count: int,
     iteration_count: int,
     timeout_seconds: float,
+    usages: list[ResourceUsage] | None = None,
 ) -> list[int]:
     for _ in range(warmup_count):
         run_lua(lua_cmd, scenario, timeout_seconds)
@@ -179,27 +407,258 @@ def measure_scenario(
     timings = []
     for _ in range(iteration_count):
         start = time.perf_counter_ns()
-        run_lua(lua_cmd, scenario, timeout_seconds)
+        run_lua(lua_cmd, scenario, timeout_seconds, usages)
         timings.append(time.perf_counter_ns() - start)
 
     return timings
 
 
-def run_lua(lua_cmd: str, scenario: Path, timeout_seconds: float) -> None:
-    result = subprocess.run(
-        [lua_cmd, str(scenario)],
-        cwd=ROOT,
-        env=sanitized_lua_environment(),
-        text=True,
-        capture_output=True,
-        timeout=timeout_seconds,
-        check=False,
+def resolve_pin_cpus(value: str) -> list[int]:
+    if not value:
+        return []
+    if not hasattr(os, "sched_setaffinity"):
+        print("lua_cli_pinning=unsupported", file=sys.stderr)
+        return []
+    if value == "auto":
+        return sorted(os.sched_getaffinity(0))
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def pin_current_thread(cpu: int) -> None:
+    """Pin the calling thread; on Linux, processes it spawns inherit the mask."""
+
+    os.sched_setaffinity(0, {cpu})
+
+
+def measure_scenarios(
+    lua_cmd: str,
+    driver: Path,
+    scenarios: list[Path],
+    cpus: list[int],
+    args: argparse.Namespace,
+) -> list[ScenarioRun]:
+    runs = [ScenarioRun(scenario) for scenario in scenarios]
+    jobs = min(args.jobs, len(runs))
+    assignments = [runs[index::jobs] for index in range(jobs)]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                measure_assignment,
+                lua_cmd,
+                driver,
+                assignment,
+                cpus[index % len(cpus)] if cpus else None,
+                args,
+            )
+            for index, assignment in enumerate(assignments)
+        ]
+        for future in futures:
+            future.result()
+
+    return runs
+
+
+def measure_assignment(
+    lua_cmd: str,
+    driver: Path,
+    runs: list[ScenarioRun],
+    cpu: int | None,
+    args: argparse.Namespace,
+) -> None:
+    """Measure scenarios in interleaved rounds until each one converges or hits the cap."""
+
+    if cpu is not None:
+        pin_current_thread(cpu)
+
+    pending = list(runs)
+    round_index = 0
+    while pending:
+        offset = round_index % len(pending)
+        for run in pending[offset:] + pending[:offset]:
+            batch = min(args.batch_size, args.max_iteration_count - len(run.samples))
+            if args.mode == "in-process":
+                run.operations, samples = measure_scenario_in_process(
+                    lua_cmd,
+                    driver,
+                    run.scenario,
+                    args.warmup_count,
+                    batch,
+                    args.min_iteration_seconds,
+                    args.timeout_seconds * (args.warmup_count + batch + 1),
+                    run.operations,
+                    run.usages,
+                )
+            else:
+                samples = [
+                    float(value)
+                    for value in measure_scenario(
+                        lua_cmd,
+                        run.scenario,
+                        args.warmup_count if run.rounds == 0 else 0,
+                        batch,
+                        args.timeout_seconds,
+                        run.usages,
+                    )
+                ]
+            run.samples.extend(samples)
+            run.rounds += 1
+
+        pending = [
+            run
+            for run in pending
+            if not run_converged(
+                run,
+                args.iteration_count,
+                args.max_iteration_count,
+                args.target_relative_ci,
+            )
+        ]
+        round_index += 1
+
+
+def run_converged(
+    run: ScenarioRun,
+    min_iterations: int,
+    max_iterations: int,
+    target_relative_ci: float,
+) -> bool:
+    if len(run.samples) >= max_iterations:
+        return True
+    return len(run.samples) >= min_iterations and relative_ci(run.samples) <= target_relative_ci
+
+
+def relative_ci(samples: list[float]) -> float:
+    """Return the 95% confidence half-width of the mean as a fraction of the mean."""
+
+    if len(samples) < 2:
+        return math.inf
+    mean = statistics.fmean(samples)
+    if mean <= 0:
+        return 0.0 if max(samples) == 0 else math.inf
+    return CONFIDENCE_Z * statistics.stdev(samples) / math.sqrt(len(samples)) / mean
+
+
+def measure_startup(
+    lua_cmd: str,
+    warmup_count: int,
+    iteration_count: int,
+    timeout_seconds: float,
+) -> list[int]:
+    """Time empty-script lua executions: spawn, dynamic linking, and interpreter setup."""
+
+    for _ in range(warmup_count):
+        run_lua_arguments(lua_cmd, ["-e", ""], "empty script", timeout_seconds)
+
+    timings = []
+    for _ in range(iteration_count):
+        start = time.perf_counter_ns()
+        run_lua_arguments(lua_cmd, ["-e", ""], "empty script", timeout_seconds)
+        timings.append(time.perf_counter_ns() - start)
+
+    return timings
+
+
+def measure_scenario_in_process(
+    lua_cmd: str,
+    driver: Path,
+    scenario: Path,
+    warmup_count: int,
+    iteration_count: int,
+    min_iteration_seconds: float,
+    timeout_seconds: float,
+    operations: int | None = None,
+    usages: list[ResourceUsage] | None = None,
+) -> tuple[int, list[float]]:
+    """Run one driver batch; pass the first batch's ``operations`` to skip re-piloting."""
+
+    arguments = [
+        str(driver),
+        str(scenario),
+        str(warmup_count),
+        str(iteration_count),
+        repr(min_iteration_seconds),
+    ]
+    if operations is not None:
+        arguments.append(str(operations))
+    stdout = run_lua_arguments(
+        lua_cmd,
+        arguments,
+        repo_relative(scenario),
+        timeout_seconds,
+        usages,
+    )
+    return parse_driver_output(stdout)
+
+
+def parse_driver_output(stdout: str) -> tuple[int, list[float]]:
+    """Convert driver output into calls per iteration and per-call nanoseconds.
+
+    The median empty-loop overhead is subtracted from every iteration.
+    """
+
+    operations = 0
+    overheads: list[float] = []
+    iterations: list[float] = []
+    for line in stdout.splitlines():
+        name, _, value = line.strip().partition(" ")
+        if name == "operations":
+            operations = int(value)
+        elif name == "overhead":
+            overheads.append(float(value))
+        elif name == "iteration":
+            iterations.append(float(value))
+
+    if operations <= 0 or not iterations:
+        raise RuntimeError(f"lua driver produced no timings:\n{stdout.rstrip()}")
+
+    overhead = statistics.median(overheads) if overheads else 0.0
+    return operations, [
+        max(0.0, elapsed - overhead) * 1e9 / operations for elapsed in iterations
+    ]
+
+
+def run_lua(
+    lua_cmd: str,
+    scenario: Path,
+    timeout_seconds: float,
+    usages: list[ResourceUsage] | None = None,
+) -> None:
+    run_lua_arguments(
+        lua_cmd,
+        [str(scenario)],
+        repo_relative(scenario),
+        timeout_seconds,
+        usages,
     )
+
+
+def run_lua_arguments(
+    lua_cmd: str,
+    arguments: list[str],
+    description: str,
+    timeout_seconds: float,
+    usages: list[ResourceUsage] | None = None,
+) -> str:
+    """Run lua and return stdout, appending the process resource usage when collected."""
+
+    if usages is not None and hasattr(os, "wait4") and hasattr(os, "waitid"):
+        result, usage = run_with_resource_usage([lua_cmd, *arguments], timeout_seconds)
+        usages.append(usage)
+    else:
+        result = subprocess.run(
+            [lua_cmd, *arguments],
+            cwd=ROOT,
+            env=sanitized_lua_environment(),
+            text=True,
+            capture_output=True,
+            timeout=timeout_seconds,
+            check=False,
+        )
     if result.returncode == 0:
-        return
+        return result.stdout
 
     message = [
-        f"lua CLI failed for {repo_relative(scenario)} with exit code {result.returncode}.",
+        f"lua CLI failed for {description} with exit code {result.returncode}.",
     ]
     if result.stdout:
         message.append("stdout:")
@@ -210,6 +669,64 @@ def run_lua(lua_cmd: str, scenario: Path, timeout_seconds: float) -> None:
     raise RuntimeError("\n".join(message))
 
 
+def run_with_resource_usage(
+    command: list[str],
+    timeout_seconds: float,
+) -> tuple[subprocess.CompletedProcess[str], ResourceUsage]:
+    """Run a process and reap it with ``os.wait4`` to read its own resource usage.
+
+    ``resource.getrusage(RUSAGE_CHILDREN)`` would mix in every other child, including
+    the processes concurrent ``--jobs`` workers spawn, so each child is reaped directly.
+    Output goes to temporary files because nothing drains pipes while ``wait4`` blocks.
+    """
+
+    with tempfile.TemporaryFile() as stdout_file, tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            command,
+            cwd=ROOT,
+            env=sanitized_lua_environment(),
+            stdout=stdout_file,
+            stderr=stderr_file,
+        )
+        lock = threading.Lock()
+        reaped = False
+        killed = False
+
+        def kill_on_timeout() -> None:
+            nonlocal killed
+            # Once the child is reaped its PID may belong to another process. Popen.kill
+            # is avoided too, because its poll() would reap the child behind wait4's back.
+            with lock:
+                if not reaped:
+                    os.kill(process.pid, signal.SIGKILL)
+                    killed = True
+
+        timer = threading.Timer(timeout_seconds, kill_on_timeout)
+        timer.start()
+        try:
+            # Wait without reaping, so the PID stays reserved until the timer is disarmed.
+            os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)
+            with lock:
+                reaped = True
+        finally:
+            timer.cancel()
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        # A kill that only reached the exited (zombie) child does not change its status.
+        if killed and process.returncode == -signal.SIGKILL:
+            raise subprocess.TimeoutExpired(command, timeout_seconds)
+
+        stdout_file.seek(0)
+        stderr_file.seek(0)
+        stdout = stdout_file.read().decode("utf-8", errors="replace")
+        stderr = stderr_file.read().decode("utf-8", errors="replace")
+
+    return (
+        subprocess.CompletedProcess(command, process.returncode, stdout, stderr),
+        ResourceUsage.from_rusage(usage),
+    )
+
+
 def sanitized_lua_environment() -> dict[str, str]:
     env = os.environ.copy()
     for key in (
@@ -226,24 +743,58 @@ def sanitized_lua_environment() -> dict[str, str]:
 
 def benchmark_record(
     scenario_name: str,
-    timings: list[int],
+    timings: list[int] | list[float],
     lua_cmd: str,
     lua_version: str,
+    mode: str = "process",
+    startup_ns: float | None = None,
+    usages: list[ResourceUsage] | None = None,
 ) -> dict:
     mean = sum(timings) / len(timings)
     p95 = percentile(timings, 95)
+    context = f"{lua_cmd}: {lua_version}"
+    if mode == "in-process":
+        if startup_ns is not None:
+            context += f"; process startup {format_milliseconds(startup_ns)} excluded"
+        return {
+            **resource_metrics_payload(usages or []),
+            "Namespace": "WallstopStudios.NovaSharp.Comparison",
+            "Type": "LuaPerformanceBenchmarks",
+            "Method": "LuaExecute",
+            "MethodTitle": "'Lua Execute'",
+            "Parameters": f"ScenarioName={scenario_name}",
+            "RuntimeDisplayName": "Lua in-process os.clock",
+            "RuntimeContext": context,
+            "RuntimeKind": IN_PROCESS_RUNTIME_KIND,
+            "ShowDeltaPercent": True,
+            "StartupNanoseconds": startup_ns,
+            "Statistics": {
+                "Mean": mean,
+                "N": len(timings),
+                "OriginalValues": list(timings),
+                "Percentiles": {
+                    "P95": p95,
+                },
+            },
+        }
+
+    if startup_ns is not None:
+        context += f"; includes process startup {format_milliseconds(startup_ns)}"
     return {
+        **resource_metrics_payload(usages or []),
         "Namespace": "WallstopStudios.NovaSharp.Comparison",
         "Type": "LuaPerformanceBenchmarks",
         "Method": "LuaExecute",
         "MethodTitle": "'Lua Execute'",
         "Parameters": f"ScenarioName={scenario_name}",
         "RuntimeDisplayName": "Lua CLI wall-time",
-        "RuntimeContext": f"{lua_cmd}: {lua_version}",
-        "RuntimeKind": "LuaCliWallTime",
+        "RuntimeContext": context,
+        "RuntimeKind": PROCESS_RUNTIME_KIND,
         "ShowDeltaPercent": False,
+        "StartupNanoseconds": startup_ns,
         "Statistics": {
             "Mean": mean,
+            "N": len(timings),
             "Percentiles": {
                 "P95": p95,
             },
@@ -251,6 +802,42 @@ def benchmark_record(
     }
 
 
+def resource_metrics_payload(usages: list[ResourceUsage]) -> dict:
+    """Summarize per-process usage as BenchmarkDotNet-style ``Metrics`` entries."""
+
+    if not usages:
+        return {}
+
+    count = len(usages)
+    values = (
+        max(usage.peak_rss_bytes for usage in usages),
+        sum(usage.user_cpu_ms for usage in usages) / count,
+        sum(usage.system_cpu_ms for usage in usages) / count,
+        sum(usage.minor_faults for usage in usages) / count,
+        sum(usage.major_faults for usage in usages) / count,
+        sum(usage.voluntary_switches for usage in usages) / count,
+        sum(usage.involuntary_switches for usage in usages) / count,
+    )
+    return {
+        "Metrics": [
+            {
+                "Value": value,
+                "Descriptor": {
+                    "Id": metric_id,
+                    "DisplayName": display_name,
+                    "Legend": legend,
+                    "Unit": unit,
+                    "TheGreaterTheBetter": False,
+                },
+            }
+            for value, (metric_id, display_name, unit, legend) in zip(
+                values, RESOURCE_METRIC_DESCRIPTORS
+            )
+        ],
+        "ProcessCount": count,
+    }
+
+
 def percentile(values: list[int], percentile_value: float) -> float:
     ordered = sorted(values)
     if len(ordered) == 1:
@@ -265,6 +852,10 @@ def percentile(values: list[int], percentile_value: float) -> float:
     return lower + (upper - lower) * fraction
 
 
+def format_milliseconds(ns: float) -> str:
+    return f"{ns / 1_000_000:.2f} ms"
+
+
 def repo_relative(path: Path) -> str:
     try:
         return path.relative_to(ROOT).as_posix()
@@ -5,11 +5,20 @@ param(
     [string]$PhaseBaseline = "progress/benchmarks/phase-a0-scoreboard-baseline.json",
     [string]$WritePhaseBaseline = "",
     [switch]$EnforcePhaseGates,
-    [switch]$SkipLuaCli
+    [switch]$SkipLuaCli,
+    [int]$CalibrationRuns = 1
 )
 
 $ErrorActionPreference = "Stop"
 
+# A noise band needs at least three runs, so two would repeat the suite for nothing.
+if ($CalibrationRuns -lt 1 -or $CalibrationRuns -eq 2) {
+    throw "-CalibrationRuns must be 1 (no calibration) or at least 3; got $CalibrationRuns."
+}
+if ($CalibrationRuns -gt 1 -and [string]::IsNullOrWhiteSpace($WritePhaseBaseline)) {
+    throw "-CalibrationRuns requires -WritePhaseBaseline; the noise bands are only recorded in the baseline it writes."
+}
+
 function Resolve-RepoRoot {
     param([string]$StartPath)
 
@@ -45,6 +54,18 @@ function Resolve-PythonCommand {
     throw "Python 3 is required to render the Phase A0 scoreboard. Set PYTHON to override."
 }
 
+function Write-EnvironmentFingerprint {
+    param(
+        [string]$OutputRoot
+    )
+
+    $pythonCommand = Resolve-PythonCommand
+    & $pythonCommand "scripts/benchmarks/capture-environment.py" "--output-root" $OutputRoot
+    if ($LASTEXITCODE -ne 0) {
+        throw "scripts/benchmarks/capture-environment.py failed. See output above."
+    }
+}
+
 $scriptRoot = $PSScriptRoot
 $repoRoot = Resolve-RepoRoot -StartPath $scriptRoot
 Set-Location $repoRoot
@@ -56,6 +77,7 @@ if ([string]::IsNullOrWhiteSpace($env:DOTNET_ROLL_FORWARD)) {
 
 $comparisonProject = "src/tooling/WallstopStudios.NovaSharp.Comparison/WallstopStudios.NovaSharp.Comparison.csproj"
 $comparisonArtifacts = "artifacts/benchmarkdotnet/phase-a0-comparison"
+$calibrationArtifacts = "artifacts/benchmarkdotnet/phase-a0-calibration"
 $luaCliScenarios = "artifacts/benchmarkdotnet/phase-a0-lua-cli-scenarios"
 
 if (Test-Path $comparisonArtifacts) {
@@ -90,6 +112,27 @@ dotnet run `
 if ($LASTEXITCODE -ne 0) {
     throw "dotnet run --project $comparisonProject -c $Configuration failed. See output above."
 }
+Write-EnvironmentFingerprint -OutputRoot $comparisonArtifacts
+
+# Extra runs of the same build give the renderer the run-to-run spread of every row.
+if (Test-Path $calibrationArtifacts) {
+    Remove-Item -LiteralPath $calibrationArtifacts -Recurse -Force
+}
+for ($run = 2; $run -le $CalibrationRuns; $run++) {
+    Write-Host ""
+    Write-Host "Running Phase A0 noise calibration run $run/$CalibrationRuns..."
+    dotnet run `
+        --project $comparisonProject `
+        -c $Configuration `
+        --no-build `
+        -- `
+        --filter "*" `
+        --artifacts "$calibrationArtifacts/run-$run"
+    if ($LASTEXITCODE -ne 0) {
+        throw "dotnet run --project $comparisonProject -c $Configuration failed during noise calibration. See output above."
+    }
+    Write-EnvironmentFingerprint -OutputRoot "$calibrationArtifacts/run-$run"
+}
 
 if (-not $SkipLuaCli) {
     Write-Host ""
@@ -131,6 +174,12 @@ if (-not [string]::IsNullOrWhiteSpace($WritePhaseBaseline)) {
 if ($EnforcePhaseGates) {
     $rendererArgs += "--enforce-phase-gates"
 }
+if ($CalibrationRuns -gt 1) {
+    $rendererArgs += @("--noise-calibration-root", $comparisonArtifacts)
+    for ($run = 2; $run -le $CalibrationRuns; $run++) {
+        $rendererArgs += @("--noise-calibration-root", "$calibrationArtifacts/run-$run")
+    }
+}
 
 Write-Host ""
 Write-Host "Rendering Phase A0 scoreboard..."
@@ -1,6 +1,7 @@
 #!/usr/bin/env bash
 # Runs the Phase A0 comparison scoreboard without the broader runtime benchmark suite.
-# Usage: ./scripts/benchmarks/run-phase-a0-scoreboard.sh [--configuration Release] [--output artifacts/phase-a0-scoreboard.md]
+# Usage: ./scripts/benchmarks/run-phase-a0-scoreboard.sh [--configuration Release] [--output artifacts/phase-a0-scoreboard.md] [--write-phase-baseline <path> --calibration-runs <n, at least 3>]
+# --calibration-runs only records noise bands into the baseline that --write-phase-baseline writes, so it requires that option.
 
 set -euo pipefail
 
@@ -10,6 +11,7 @@ PHASE_BASELINE="progress/benchmarks/phase-a0-scoreboard-baseline.json"
 WRITE_PHASE_BASELINE=""
 ENFORCE_PHASE_GATES=false
 EXPECT_LUA_CLI=true
+CALIBRATION_RUNS=1
 
 while [[ $# -gt 0 ]]; do
     case "$1" in
@@ -37,6 +39,10 @@ while [[ $# -gt 0 ]]; do
             EXPECT_LUA_CLI=false
             shift
             ;;
+        --calibration-runs)
+            CALIBRATION_RUNS="$2"
+            shift 2
+            ;;
         *)
             echo "Unknown option: $1" >&2
             exit 1
@@ -44,6 +50,16 @@ while [[ $# -gt 0 ]]; do
     esac
 done
 
+# A noise band needs at least three runs, so two would repeat the suite for nothing.
+if ! [[ "$CALIBRATION_RUNS" =~ ^[0-9]+$ ]] || ((CALIBRATION_RUNS < 1 || CALIBRATION_RUNS == 2)); then
+    echo "--calibration-runs must be 1 (no calibration) or at least 3; got '$CALIBRATION_RUNS'." >&2
+    exit 1
+fi
+if ((CALIBRATION_RUNS > 1)) && [[ -z "$WRITE_PHASE_BASELINE" ]]; then
+    echo "--calibration-runs requires --write-phase-baseline; the noise bands are only recorded in the baseline it writes." >&2
+    exit 1
+fi
+
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 REPO_ROOT="$(cd "$SCRIPT_DIR/../.." && pwd)"
 cd "$REPO_ROOT"
@@ -75,7 +91,8 @@ fi
 
 COMPARISON_ARTIFACTS="artifacts/benchmarkdotnet/phase-a0-comparison"
 LUA_CLI_SCENARIOS="artifacts/benchmarkdotnet/phase-a0-lua-cli-scenarios"
-rm -rf "$COMPARISON_ARTIFACTS" "$LUA_CLI_SCENARIOS"
+CALIBRATION_ARTIFACTS="artifacts/benchmarkdotnet/phase-a0-calibration"
+rm -rf "$COMPARISON_ARTIFACTS" "$LUA_CLI_SCENARIOS" "$CALIBRATION_ARTIFACTS"
 mkdir -p "$COMPARISON_ARTIFACTS"
 
 echo "Restoring local tools..."
@@ -93,6 +110,21 @@ dotnet run \
     -- \
     --filter "*" \
     --artifacts "$COMPARISON_ARTIFACTS"
+run_python scripts/benchmarks/capture-environment.py --output-root "$COMPARISON_ARTIFACTS"
+
+# Extra runs of the same build give the renderer the run-to-run spread of every row.
+for ((run = 2; run <= CALIBRATION_RUNS; run++)); do
+    echo ""
+    echo "Running Phase A0 noise calibration run ${run}/${CALIBRATION_RUNS}..."
+    dotnet run \
+        --project "src/tooling/WallstopStudios.NovaSharp.Comparison/WallstopStudios.NovaSharp.Comparison.csproj" \
+        -c "$CONFIGURATION" \
+        --no-build \
+        -- \
+        --filter "*" \
+        --artifacts "$CALIBRATION_ARTIFACTS/run-$run"
+    run_python scripts/benchmarks/capture-environment.py --output-root "$CALIBRATION_ARTIFACTS/run-$run"
+done
 
 if [[ "$EXPECT_LUA_CLI" == "true" ]]; then
     echo ""
@@ -126,6 +158,13 @@ if [[ -n "$WRITE_PHASE_BASELINE" ]]; then
     renderer_args+=(--write-phase-baseline "$WRITE_PHASE_BASELINE")
 fi
 
+if ((CALIBRATION_RUNS > 1)); then
+    renderer_args+=(--noise-calibration-root "$COMPARISON_ARTIFACTS")
+    for ((run = 2; run <= CALIBRATION_RUNS; run++)); do
+        renderer_args+=(--noise-calibration-root "$CALIBRATION_ARTIFACTS/run-$run")
+    done
+fi
+
 if [[ "$ENFORCE_PHASE_GATES" == "true" ]]; then
     renderer_args+=(--enforce-phase-gates)
 fi
@@ -60,6 +60,7 @@ if ! git rev-parse --verify "$base_ref" >/dev/null 2>&1; then
 fi
 
 "$PYTHON_BIN" scripts/ci/test_format_markdown.py
+"$PYTHON_BIN" scripts/ci/test_check_markdown_links.py
 "$PYTHON_BIN" scripts/ci/test_check_jekyll_liquid.py
 
 # Repository-wide, not diff-scoped: GitHub Pages renders every Markdown file in
@@ -56,8 +56,15 @@ Also out of scope: an ``.html`` page carrying real YAML front matter is
 Liquid-rendered but is not scanned — there are none here, and one written
 deliberately would be using Liquid on purpose.
 
+Results are cached per file in ``artifacts/jekyll-liquid-cache.json`` through
+``tools/audit_cache.py``, keyed by the file's size and modification time, then by
+its content hash, and invalidated as a
+whole when this script, the ``exclude`` list, or ``markdown_ext`` changes. Files
+that do need scanning are scanned on ``--jobs`` worker processes, so a run over
+the whole site after an ordinary commit only tokenises the files it touched.
+
 Usage:
-    python3 scripts/ci/check_jekyll_liquid.py [--files FILE ...]
+    python3 scripts/ci/check_jekyll_liquid.py [--files FILE ...] [--jobs N] [--no-cache]
 
 Exit codes:
     0  No fatal Liquid syntax found
@@ -70,14 +77,21 @@ import argparse
 import re
 import subprocess
 import sys
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Iterable, Sequence
 
 import yaml
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+import audit_cache  # noqa: E402
+from process_pool import default_jobs, map_files  # noqa: E402
+
 JEKYLL_CONFIG = REPO_ROOT / "_config.yml"
+DEFAULT_CACHE = Path("artifacts/jekyll-liquid-cache.json")
+CACHE_SCHEMA = "novasharp.jekyll-liquid-cache.v2"
 
 # ``jekyll-optional-front-matter`` promotes every extension in Jekyll's
 # ``markdown_ext`` to a page, and Jekyll's default is five of them — not just
@@ -183,6 +197,23 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         nargs="+",
         help="Specific files to check. Defaults to every rendered Markdown file.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="Worker processes for scanning (defaults to the CPU count).",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE,
+        help="Per-file findings cache, relative to the repository root.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Scan every file without reading or writing --cache.",
+    )
     return parser.parse_args(argv)
 
 
@@ -486,25 +517,78 @@ def _find_endraw(text: str, start: int) -> int:
         index = close + 2
 
 
-def check_files(paths: Iterable[Path], repo_root: Path) -> list[Finding]:
-    findings: list[Finding] = []
+def cache_key(excludes: tuple[str, ...], suffixes: frozenset[str]) -> str:
+    """Identify the scanner and the rendered-file rules that produced cached results."""
+    return audit_cache.cache_key(
+        [Path(__file__)], {"excludes": list(excludes), "suffixes": sorted(suffixes)}
+    )
+
+
+def _findings_to_json(findings: list[Finding]) -> list[dict]:
+    return [
+        {name: value for name, value in asdict(finding).items() if name != "path"}
+        for finding in findings
+    ]
+
+
+def _findings_from_json(path: str, entries: list[dict]) -> list[Finding]:
+    return [Finding(path=path, **entry) for entry in entries]
+
+
+def _scan_entry(entry: tuple[str, str]) -> list[Finding]:
+    return scan_text(*entry)
+
+
+def check_files(
+    paths: Iterable[Path],
+    repo_root: Path,
+    jobs: int = 1,
+    cache_path: Path | None = None,
+    key: str = "",
+) -> list[Finding]:
+    """Scan ``paths`` (relative to ``repo_root``) and return findings in path order.
+
+    Per-file findings are reused through :class:`audit_cache.AuditCache` when
+    ``cache_path`` is set. Everything else is scanned on up to ``jobs`` worker
+    processes.
+    """
+    cache = audit_cache.AuditCache(cache_path, CACHE_SCHEMA, key, root=repo_root)
+    results: dict[str, list[dict]] = {}
+    to_scan: list[tuple[str, str]] = []
+    order: list[str] = []
     for relative in paths:
-        absolute = repo_root / relative
+        name = relative.as_posix()
+        cached = cache.lookup(name)
+        if cached is not None:
+            results[name] = cached
+            order.append(name)
+            continue
         try:
-            text = absolute.read_text(encoding="utf-8")
+            text = (repo_root / relative).read_text(encoding="utf-8")
         except (OSError, UnicodeDecodeError) as error:  # pragma: no cover - I/O guard
             print(f"{relative}: could not read file: {error}", file=sys.stderr)
             continue
-        findings.extend(scan_text(text, relative.as_posix()))
+        order.append(name)
+        to_scan.append((text, name))
+
+    scanned = map_files(_scan_entry, to_scan, jobs)
+    for (_, name), findings in zip(to_scan, scanned):
+        results[name] = _findings_to_json(findings)
+        cache.store(name, results[name])
+    cache.save()
+
+    findings: list[Finding] = []
+    for name in order:
+        findings.extend(_findings_from_json(name, results[name]))
     return findings
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv)
+    excludes = load_excludes()
+    suffixes = load_rendered_suffixes()
 
     if args.files:
-        excludes = load_excludes()
-        suffixes = load_rendered_suffixes()
         candidates = []
         for raw in args.files:
             path = Path(raw)
@@ -518,7 +602,16 @@ def main(argv: Sequence[str] | None = None) -> int:
     else:
         candidates = discover_files(REPO_ROOT)
 
-    findings = check_files(candidates, REPO_ROOT)
+    cache_path = None
+    if not args.no_cache:
+        cache_path = args.cache if args.cache.is_absolute() else REPO_ROOT / args.cache
+    findings = check_files(
+        candidates,
+        REPO_ROOT,
+        jobs=max(1, args.jobs),
+        cache_path=cache_path,
+        key=cache_key(excludes, suffixes),
+    )
 
     if findings:
         print(
@@ -6,12 +6,19 @@ from __future__ import annotations
 import argparse
 import json
 import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Sequence
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+from urllib.parse import urlsplit
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ModuleNotFoundError as exc:  # pragma: no cover
     raise SystemExit(
         "requests is not installed. Run `python -m pip install -r requirements.tooling.txt`."
@@ -26,10 +33,19 @@ except ModuleNotFoundError as exc:  # pragma: no cover
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+from audit_cache import write_json_atomic  # noqa: E402
+
 CONFIG_PATH = REPO_ROOT / ".markdown-link-check.json"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_ALIVE_CODES = {200, 201, 202, 203, 204, 206, 301, 302, 307, 308, 429}
 DEFAULT_IGNORE_PATTERNS = [re.compile(r"NovaSharp\.org", re.IGNORECASE)]
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_CONCURRENCY_PER_HOST = 4
+DEFAULT_CACHE_TTL = 24 * 60 * 60.0
+DEFAULT_CACHE = Path("artifacts/markdown-link-cache.json")
+CACHE_SCHEMA = "novasharp.markdown-link-cache.v1"
 SKIP_FILES = {
     "AGENTS.md",
     "CLAUDE.md",
@@ -54,7 +70,7 @@ def parse_duration(value) -> float:
         return float(value)
 
     if isinstance(value, str):
-        match = re.fullmatch(r"(\d+)(ms|s|m)", value.strip(), flags=re.IGNORECASE)
+        match = re.fullmatch(r"(\d+)(ms|s|m|h)", value.strip(), flags=re.IGNORECASE)
         if match:
             amount = float(match.group(1))
             unit = match.group(2).lower()
@@ -64,6 +80,8 @@ def parse_duration(value) -> float:
                 return amount
             if unit == "m":
                 return amount * 60.0
+            if unit == "h":
+                return amount * 3600.0
 
     return DEFAULT_TIMEOUT
 
@@ -76,6 +94,9 @@ def load_config():
             "retry_on_429": True,
             "alive_codes": DEFAULT_ALIVE_CODES,
             "ignore_patterns": DEFAULT_IGNORE_PATTERNS,
+            "max_concurrency": DEFAULT_MAX_CONCURRENCY,
+            "max_concurrency_per_host": DEFAULT_MAX_CONCURRENCY_PER_HOST,
+            "cache_ttl": DEFAULT_CACHE_TTL,
         }
 
     data = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
@@ -98,6 +119,13 @@ def load_config():
         "retry_on_429": retry_on_429,
         "alive_codes": alive_codes,
         "ignore_patterns": patterns,
+        "max_concurrency": int(data.get("maxConcurrency", DEFAULT_MAX_CONCURRENCY)),
+        "max_concurrency_per_host": int(
+            data.get("maxConcurrencyPerHost", DEFAULT_MAX_CONCURRENCY_PER_HOST)
+        ),
+        "cache_ttl": (
+            parse_duration(data["cacheTtl"]) if "cacheTtl" in data else DEFAULT_CACHE_TTL
+        ),
     }
 
 
@@ -114,6 +142,20 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Also check files normally skipped (AGENTS.md, CLAUDE.md).",
     )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE,
+        help=(
+            "JSON file of external URLs that answered with a live status, reused until "
+            "their age exceeds cacheTtl from .markdown-link-check.json."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Check every external URL without reading or writing --cache.",
+    )
     return parser.parse_args()
 
 
@@ -159,47 +201,189 @@ def check_relative_link(link: str, source_file: Path) -> bool:
     return candidate.exists()
 
 
-def request_with_retry(
+def request_status(
+    session,
     url: str,
     timeout: float,
     alive_codes: set[int],
     retry_count: int,
     retry_on_429: bool,
-) -> bool:
+    backoff: float = 1.0,
+) -> int:
+    """Return the final status code for ``url``, or 0 when every attempt failed to connect."""
+
     attempts = 0
     while True:
         attempts += 1
         try:
-            response = requests.head(url, allow_redirects=True, timeout=timeout)
+            response = session.head(url, allow_redirects=True, timeout=timeout)
             status_code = response.status_code
             if status_code in {405, 501}:
-                response = requests.get(url, allow_redirects=True, timeout=timeout)
+                response = session.get(url, allow_redirects=True, timeout=timeout)
                 status_code = response.status_code
         except requests.RequestException:
             status_code = 0
 
         if status_code in alive_codes:
-            return True
+            return status_code
 
         should_retry = attempts <= retry_count
         if retry_on_429:
             should_retry = should_retry and status_code == 429
 
         if not should_retry:
-            return False
-
-        time.sleep(min(2 ** attempts, 5))
+            return status_code
+
+        time.sleep(backoff * min(2 ** attempts, 5))
+
+
+@dataclass(frozen=True)
+class LinkResult:
+    ok: bool
+    status: int
+    cached: bool = False
+
+
+class LinkChecker:
+    """Checks external URLs concurrently, at most once per URL per run.
+
+    Requests run on a thread pool. Each thread keeps its own pooled ``requests.Session``,
+    so repeated URLs on one host reuse connections, and a semaphore per host caps how many
+    requests any single site sees at once. URLs that answered with a live status are
+    recorded in an optional JSON cache and are not requested again until the entry is
+    older than ``cache_ttl``. Failures are never cached, so a fixed link passes on the
+    next run.
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+        alive_codes: set[int],
+        retry_count: int,
+        retry_on_429: bool,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_concurrency_per_host: int = DEFAULT_MAX_CONCURRENCY_PER_HOST,
+        cache_path: Path | None = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        backoff: float = 1.0,
+    ) -> None:
+        self.timeout = timeout
+        self.alive_codes = alive_codes
+        self.retry_count = retry_count
+        self.retry_on_429 = retry_on_429
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_concurrency_per_host = max(1, max_concurrency_per_host)
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
+        self.backoff = backoff
+        self.requested = 0
+        self.cached = 0
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+
+    def check(self, urls: Iterable[str]) -> Dict[str, LinkResult]:
+        cache = self._load_cache()
+        now = time.time()
+        results: Dict[str, LinkResult] = {}
+        pending: List[str] = []
+        for url in dict.fromkeys(urls):
+            entry = cache.get(url)
+            if entry is not None and now - entry["checkedAt"] < self.cache_ttl:
+                results[url] = LinkResult(True, int(entry["status"]), cached=True)
+                self.cached += 1
+            else:
+                pending.append(url)
+
+        if pending:
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_concurrency, len(pending))
+                ) as executor:
+                    for url, result in zip(pending, executor.map(self._check_url, pending)):
+                        results[url] = result
+                        # 429 counts as alive so rate limits do not fail CI, but it proves
+                        # nothing about the page, so it is checked again next run.
+                        if result.ok and result.status != 429:
+                            cache[url] = {"checkedAt": now, "status": result.status}
+                        else:
+                            cache.pop(url, None)
+            finally:
+                for session in self._sessions:
+                    session.close()
+                self._sessions.clear()
+            self.requested += len(pending)
+            self._save_cache(cache, now)
+
+        return results
+
+    def _check_url(self, url: str) -> LinkResult:
+        with self._host_slot(urlsplit(url).netloc.lower()):
+            status = request_status(
+                self._session(),
+                url,
+                self.timeout,
+                self.alive_codes,
+                self.retry_count,
+                self.retry_on_429,
+                self.backoff,
+            )
+        return LinkResult(status in self.alive_codes, status)
+
+    @contextmanager
+    def _host_slot(self, host: str) -> Iterator[None]:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_concurrency_per_host)
+                self._host_slots[host] = slot
+        with slot:
+            yield
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.max_concurrency,
+                pool_maxsize=self.max_concurrency_per_host,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def _load_cache(self) -> Dict[str, dict]:
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
 
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if data.get("schema") != CACHE_SCHEMA:
+            return {}
+        return dict(data.get("urls") or {})
+
+    def _save_cache(self, cache: Dict[str, dict], now: float) -> None:
+        if self.cache_path is None:
+            return
+
+        live = {
+            url: entry
+            for url, entry in sorted(cache.items())
+            if now - entry["checkedAt"] < self.cache_ttl
+        }
+        write_json_atomic(self.cache_path, {"schema": CACHE_SCHEMA, "urls": live}, indent=2)
 
-def check_links(files: Sequence[Path], include_skipped: bool) -> int:
-    config = load_config()
-    timeout = config["timeout"]
-    retries = config["retry_count"]
-    retry_on_429 = config["retry_on_429"]
-    alive_codes = config["alive_codes"]
-    ignore_patterns = config["ignore_patterns"]
 
-    failed = 0
+def collect_links(
+    files: Sequence[Path], include_skipped: bool, ignore_patterns: Sequence[re.Pattern[str]]
+) -> List[Tuple[Path, str]]:
+    occurrences: List[Tuple[Path, str]] = []
     for file_path in files:
         if should_skip(file_path, include_skipped):
             continue
@@ -210,17 +394,47 @@ def check_links(files: Sequence[Path], include_skipped: bool) -> int:
                 continue
             if link.startswith("#") or link.lower().startswith("mailto:") or link.lower().startswith("tel:"):
                 continue
+            occurrences.append((file_path, link))
+    return occurrences
 
-            if link.startswith(("http://", "https://")):
-                ok = request_with_retry(link, timeout, alive_codes, retries, retry_on_429)
-            else:
-                ok = check_relative_link(link, file_path)
 
-            if not ok:
-                failed += 1
-                rel = file_path.relative_to(REPO_ROOT)
-                print(f"[link-check] {rel}: {link} is unreachable.")
+def check_links(
+    files: Sequence[Path], include_skipped: bool, cache_path: Path | None = None
+) -> int:
+    config = load_config()
+    occurrences = collect_links(files, include_skipped, config["ignore_patterns"])
+
+    checker = LinkChecker(
+        config["timeout"],
+        config["alive_codes"],
+        config["retry_count"],
+        config["retry_on_429"],
+        config["max_concurrency"],
+        config["max_concurrency_per_host"],
+        cache_path,
+        config["cache_ttl"],
+    )
+    external = checker.check(
+        link for _, link in occurrences if link.startswith(("http://", "https://"))
+    )
 
+    failed = 0
+    for file_path, link in occurrences:
+        if link.startswith(("http://", "https://")):
+            ok = external[link].ok
+        else:
+            ok = check_relative_link(link, file_path)
+
+        if not ok:
+            failed += 1
+            rel = file_path.relative_to(REPO_ROOT)
+            print(f"[link-check] {rel}: {link} is unreachable.")
+
+    if external:
+        print(
+            f"[link-check] Checked {len(external)} unique external URL(s): "
+            f"{checker.requested} requested, {checker.cached} cached."
+        )
     if failed:
         print(f"[link-check] Found {failed} broken link(s).")
     else:
@@ -238,7 +452,10 @@ def main() -> int:
             path = REPO_ROOT / path
         files.append(path.resolve())
 
-    failures = check_links(files, include_skipped=args.include_skipped)
+    cache_path = None
+    if not args.no_cache:
+        cache_path = args.cache if args.cache.is_absolute() else REPO_ROOT / args.cache
+    failures = check_links(files, include_skipped=args.include_skipped, cache_path=cache_path)
     return 1 if failures else 0
 
 
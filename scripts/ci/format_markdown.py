@@ -4,10 +4,14 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import re
 import sys
+from functools import partial
+from importlib.metadata import entry_points
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 try:
     import mdformat
@@ -18,6 +22,11 @@ except ModuleNotFoundError as exc:  # pragma: no cover - guidance for missing de
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+from audit_cache import write_json_atomic  # noqa: E402
+from process_pool import default_jobs, map_files  # noqa: E402
+
 EXCLUDE_DIRS = (
     "artifacts",
     "docs/coverage",
@@ -38,6 +47,8 @@ SKIP_FILES = {
 }
 MD_EXTENSIONS = {"gfm"}
 YAML_FRONT_MATTER = re.compile(r"\A(---\r?\n.*?\r?\n---\r?\n)", re.DOTALL)
+DEFAULT_CACHE = Path("artifacts/format-markdown-cache.json")
+CACHE_SCHEMA = "novasharp.format-markdown-cache.v1"
 
 
 def parse_args() -> argparse.Namespace:
@@ -62,6 +73,26 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Also process files normally excluded (AGENTS.md, CLAUDE.md, PLAN.md, README.md).",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="Worker processes for formatting (defaults to the CPU count).",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE,
+        help=(
+            "JSON file recording the content hash of every file already known to be "
+            "formatted. Files whose hash still matches are skipped without parsing."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Format every file without reading or writing --cache.",
+    )
     return parser.parse_args()
 
 
@@ -119,29 +150,114 @@ def iter_markdown_files(targets: Sequence[str] | None, include_skipped: bool) ->
     return unique_paths
 
 
-def format_file(path: Path, write_back: bool) -> bool:
-    original = path.read_text(encoding="utf-8")
+def format_text(original: str) -> str:
     front_matter_match = YAML_FRONT_MATTER.match(original)
     if front_matter_match:
         front_matter = front_matter_match.group(1).replace("\r\n", "\n")
         body = original[front_matter_match.end() :]
-        formatted = front_matter + mdformat.text(body, extensions=MD_EXTENSIONS)
-    else:
-        formatted = mdformat.text(original, extensions=MD_EXTENSIONS)
+        return front_matter + mdformat.text(body, extensions=MD_EXTENSIONS)
+    return mdformat.text(original, extensions=MD_EXTENSIONS)
+
+
+def format_file(path: Path, write_back: bool) -> bool:
+    return format_file_with_digest(path, write_back)[0]
+
+
+def format_file_with_digest(path: Path, write_back: bool) -> Tuple[bool, str]:
+    """Format one file and return whether it changed plus the digest of its formatted text.
+
+    The digest is of the on-disk content that is known to be formatted: the original when
+    nothing changed or when checking, the rewritten text when fixing, and "" when a check
+    found differences, because that file is not formatted yet.
+    """
+
+    original = path.read_text(encoding="utf-8")
+    formatted = format_text(original)
     if original == formatted:
-        return False
+        return False, content_digest(original)
 
     if write_back:
         path.write_text(formatted, encoding="utf-8", newline="\n")
+        return True, content_digest(formatted)
+
+    return True, ""
+
 
-    return True
+def content_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
-def run(files: Iterable[Path], fix: bool) -> List[Path]:
+def cache_key() -> str:
+    """Identify the formatter configuration; a different key invalidates the whole cache."""
+
+    versions = {"mdformat": mdformat.__version__}
+    for entry_point in entry_points(group="mdformat.parser_extension"):
+        if entry_point.name in MD_EXTENSIONS and entry_point.dist is not None:
+            versions[entry_point.dist.name] = entry_point.dist.version
+    return json.dumps(
+        {"extensions": sorted(MD_EXTENSIONS), "versions": versions}, sort_keys=True
+    )
+
+
+def load_cache(path: Path | None) -> Dict[str, str]:
+    if path is None or not path.exists():
+        return {}
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("schema") != CACHE_SCHEMA or data.get("key") != cache_key():
+        return {}
+    return dict(data.get("formatted") or {})
+
+
+def save_cache(path: Path | None, formatted: Dict[str, str]) -> None:
+    if path is None:
+        return
+
+    payload = {"schema": CACHE_SCHEMA, "key": cache_key(), "formatted": formatted}
+    write_json_atomic(path, payload, indent=2, sort_keys=True)
+
+
+def cache_name(path: Path) -> str:
+    try:
+        return path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def run(
+    files: Iterable[Path], fix: bool, jobs: int = 1, cache_path: Path | None = None
+) -> List[Path]:
+    """Format ``files`` and return the ones that changed (or would change under --check).
+
+    With ``cache_path``, files whose content hash matches the last formatted hash recorded
+    for their path are skipped before mdformat parses them. The rest are formatted on
+    ``jobs`` worker processes.
+    """
+
+    files = list(files)
+    cache = load_cache(cache_path)
+    pending = [
+        path
+        for path in files
+        if cache.get(cache_name(path)) != content_digest(path.read_text(encoding="utf-8"))
+    ]
+
+    results = map_files(partial(format_file_with_digest, write_back=fix), pending, jobs)
+
     changed: List[Path] = []
-    for file_path in files:
-        if format_file(file_path, write_back=fix):
-            changed.append(file_path)
+    for path, (file_changed, digest) in zip(pending, results):
+        if file_changed:
+            changed.append(path)
+        if digest:
+            cache[cache_name(path)] = digest
+        else:
+            cache.pop(cache_name(path), None)
+
+    if pending:
+        save_cache(cache_path, cache)
     return changed
 
 
@@ -154,7 +270,10 @@ def main() -> int:
         print("No Markdown files to process.")
         return 0
 
-    changed = run(files, fix=args.fix)
+    cache_path = None
+    if not args.no_cache:
+        cache_path = args.cache if args.cache.is_absolute() else REPO_ROOT / args.cache
+    changed = run(files, fix=args.fix, jobs=max(1, args.jobs), cache_path=cache_path)
 
     if args.check and changed:
         rel_list = ", ".join(str(path.relative_to(REPO_ROOT)) for path in changed)
@@ -8,6 +8,7 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import check_jekyll_liquid
+import process_pool
 
 
 # (label, markdown, expected number of findings)
@@ -306,6 +307,61 @@ class IsRenderedTests(unittest.TestCase):
         )
 
 
+class CacheTests(unittest.TestCase):
+    def test_cached_findings_are_reused_until_the_content_changes(self) -> None:
+        with TemporaryDirectory() as temporary:
+            root = Path(temporary)
+            cache = root / "cache.json"
+            paths = []
+            for index in range(process_pool.MIN_PARALLEL_FILES):
+                path = Path(f"page-{index}.md")
+                body = "local t = {{n=2}, {n=1}}\n" if index % 4 == 0 else "{{ page.title }}\n"
+                (root / path).write_text(body, encoding="utf-8")
+                paths.append(path)
+
+            serial = check_jekyll_liquid.check_files(paths, root)
+            parallel = check_jekyll_liquid.check_files(
+                paths, root, jobs=4, cache_path=cache, key="v1"
+            )
+            self.assertEqual(serial, parallel)
+            self.assertEqual(len(paths) // 4, len(serial))
+
+            original_scan_text = check_jekyll_liquid.scan_text
+            scanned = []
+
+            def recording_scan_text(text: str, path: str):
+                scanned.append(path)
+                return original_scan_text(text, path)
+
+            check_jekyll_liquid.scan_text = recording_scan_text
+            try:
+                cached = check_jekyll_liquid.check_files(
+                    paths, root, cache_path=cache, key="v1"
+                )
+                self.assertEqual(serial, cached)
+                self.assertEqual([], scanned)
+
+                (root / paths[0]).write_text("fixed\n", encoding="utf-8")
+                edited = check_jekyll_liquid.check_files(
+                    paths, root, cache_path=cache, key="v1"
+                )
+                self.assertEqual(["page-0.md"], scanned)
+                self.assertEqual(serial[1:], edited)
+
+                check_jekyll_liquid.check_files(paths, root, cache_path=cache, key="v2")
+                self.assertEqual(1 + len(paths), len(scanned))
+            finally:
+                check_jekyll_liquid.scan_text = original_scan_text
+
+    def test_cache_key_follows_excludes_and_suffixes(self) -> None:
+        key = check_jekyll_liquid.cache_key(("docs",), frozenset({".md"}))
+        self.assertEqual(key, check_jekyll_liquid.cache_key(("docs",), frozenset({".md"})))
+        self.assertNotEqual(key, check_jekyll_liquid.cache_key((), frozenset({".md"})))
+        self.assertNotEqual(
+            key, check_jekyll_liquid.cache_key(("docs",), frozenset({".md", ".mkd"}))
+        )
+
+
 class RepositoryTests(unittest.TestCase):
     def test_repository_markdown_is_free_of_fatal_liquid(self) -> None:
         """The published site must build; this is the guard's real contract."""
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Tests for the Markdown link checker, run against a local HTTP server."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import check_markdown_links
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers by path: /ok, /missing, /no-head (405 on HEAD), and /slow."""
+
+    def do_HEAD(self) -> None:
+        self.server.record(self)
+        if self.path.startswith("/no-head"):
+            self.respond(405)
+        else:
+            self.respond_for_path()
+
+    def do_GET(self) -> None:
+        self.server.record(self)
+        self.respond_for_path()
+
+    def respond_for_path(self) -> None:
+        if self.path.startswith("/slow"):
+            time.sleep(0.1)
+        self.respond(404 if self.path.startswith("/missing") else 200)
+
+    def respond(self, status: int) -> None:
+        self.server.leave()
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.lock = threading.Lock()
+        self.requests: list[tuple[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def record(self, handler: BaseHTTPRequestHandler) -> None:
+        with self.lock:
+            self.requests.append((handler.command, handler.path))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def leave(self) -> None:
+        with self.lock:
+            self.in_flight -= 1
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class CheckMarkdownLinksTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = StandInServer()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.temporary_directory.name)
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.temporary_directory.cleanup()
+
+    def checker(self, **kwargs) -> check_markdown_links.LinkChecker:
+        return check_markdown_links.LinkChecker(
+            timeout=5,
+            alive_codes=check_markdown_links.DEFAULT_ALIVE_CODES,
+            retry_count=0,
+            retry_on_429=True,
+            backoff=0,
+            **kwargs,
+        )
+
+    def test_deduplicates_urls_and_falls_back_to_get(self) -> None:
+        base = self.server.url
+        results = self.checker().check(
+            [f"{base}/ok", f"{base}/missing", f"{base}/ok", f"{base}/no-head", f"{base}/ok"]
+        )
+
+        self.assertEqual({f"{base}/ok", f"{base}/missing", f"{base}/no-head"}, set(results))
+        self.assertTrue(results[f"{base}/ok"].ok)
+        self.assertEqual(404, results[f"{base}/missing"].status)
+        self.assertFalse(results[f"{base}/missing"].ok)
+        self.assertTrue(results[f"{base}/no-head"].ok)
+        self.assertEqual(1, self.server.requests.count(("HEAD", "/ok")))
+        self.assertIn(("GET", "/no-head"), self.server.requests)
+
+    def test_limits_concurrent_requests_per_host(self) -> None:
+        base = self.server.url
+        checker = self.checker(max_concurrency=8, max_concurrency_per_host=2)
+
+        results = checker.check(f"{base}/slow/{index}" for index in range(8))
+
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertEqual(8, checker.requested)
+        self.assertLessEqual(self.server.max_in_flight, 2)
+        self.assertEqual(2, self.server.max_in_flight)
+
+    def test_caches_live_urls_until_ttl_expires(self) -> None:
+        base = self.server.url
+        cache_path = self.root / "cache.json"
+        urls = [f"{base}/ok", f"{base}/missing"]
+
+        self.checker(cache_path=cache_path).check(urls)
+        warm = self.checker(cache_path=cache_path)
+        results = warm.check(urls)
+
+        self.assertTrue(results[f"{base}/ok"].cached)
+        self.assertFalse(results[f"{base}/missing"].cached)
+        self.assertEqual((1, 1), (warm.cached, warm.requested))
+        self.assertEqual(1, self.server.requests.count(("HEAD", "/ok")))
+        self.assertEqual(2, self.server.requests.count(("HEAD", "/missing")))
+
+        expired = self.checker(cache_path=cache_path, cache_ttl=0)
+        expired.check(urls)
+        self.assertEqual((0, 2), (expired.cached, expired.requested))
+
+    def test_check_links_reports_every_occurrence_of_a_broken_url(self) -> None:
+        base = self.server.url
+        original_root = check_markdown_links.REPO_ROOT
+        original_load_config = check_markdown_links.load_config
+        config = original_load_config()
+        config["ignore_patterns"] = []
+        check_markdown_links.REPO_ROOT = self.root
+        check_markdown_links.load_config = lambda: config
+        try:
+            (self.root / "target.md").write_text("# Target\n", encoding="utf-8")
+            for name in ("a.md", "b.md"):
+                (self.root / name).write_text(
+                    f"[ok]({base}/ok) [gone]({base}/missing) [local](target.md) "
+                    "[absent](absent.md)\n",
+                    encoding="utf-8",
+                )
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                failures = check_markdown_links.check_links(
+                    [self.root / "a.md", self.root / "b.md"], include_skipped=False
+                )
+        finally:
+            check_markdown_links.REPO_ROOT = original_root
+            check_markdown_links.load_config = original_load_config
+
+        self.assertEqual(4, failures)
+        self.assertIn(f"[link-check] a.md: {base}/missing is unreachable.", output.getvalue())
+        self.assertIn("[link-check] b.md: absent.md is unreachable.", output.getvalue())
+        self.assertIn("2 unique external URL(s): 2 requested, 0 cached", output.getvalue())
+        self.assertEqual(1, self.server.requests.count(("HEAD", "/missing")))
+
+
+if __name__ == "__main__":
+    unittest.main()
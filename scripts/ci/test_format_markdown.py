@@ -8,6 +8,7 @@ import unittest
 from pathlib import Path
 
 import format_markdown
+import process_pool
 
 
 class FormatMarkdownTests(unittest.TestCase):
@@ -35,6 +36,45 @@ Text
             self.assertTrue(formatted.startswith(expected_front_matter))
             self.assertFalse(format_markdown.format_file(path, write_back=False))
 
+    def test_parallel_run_matches_serial_and_caches_formatted_files(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory)
+            cache = root / "cache.json"
+            files = []
+            for index in range(process_pool.MIN_PARALLEL_FILES + 2):
+                path = root / f"doc-{index}.md"
+                text = "# Title\n\n* item\n" if index % 2 else "# Title\n\n- item\n"
+                path.write_text(text, encoding="utf-8")
+                files.append(path)
+
+            serial = format_markdown.run(files, fix=False)
+            parallel = format_markdown.run(files, fix=False, jobs=4, cache_path=cache)
+
+            self.assertEqual(files[1::2], serial)
+            self.assertEqual(serial, parallel)
+
+            original_format_text = format_markdown.format_text
+            calls = []
+
+            def counting_format_text(text: str) -> str:
+                calls.append(text)
+                return original_format_text(text)
+
+            format_markdown.format_text = counting_format_text
+            try:
+                self.assertEqual(files[1::2], format_markdown.run(files, fix=True, cache_path=cache))
+                self.assertEqual(len(files[1::2]), len(calls))
+
+                calls.clear()
+                self.assertEqual([], format_markdown.run(files, fix=False, cache_path=cache))
+                self.assertEqual([], calls)
+
+                files[0].write_text("# Changed\n\n* item\n", encoding="utf-8")
+                self.assertEqual([files[0]], format_markdown.run(files, fix=False, cache_path=cache))
+                self.assertEqual(1, len(calls))
+            finally:
+                format_markdown.format_text = original_format_text
+
 
 if __name__ == "__main__":
     unittest.main()
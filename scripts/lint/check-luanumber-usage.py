@@ -9,8 +9,16 @@ are used instead of LuaNumber for Lua math operations. This can cause:
 2. Type coercion errors: Integer vs float subtype distinction lost (critical for Lua 5.3+)
 3. Overflow/underflow bugs: Silent wrapping or unexpected behavior
 
+Each file is tokenized once with the shared C# tokenizer in
+tools/csharp_tokens.py, and the patterns below only see the code on lines that
+read a `.Number` member: comments are dropped and string or char literals are
+reduced to empty placeholders by construction. Files are
+analyzed on --jobs worker processes, and per-file results are cached under
+`artifacts/` (see tools/audit_cache.py), so `--scope all` can also cover the
+test and tooling projects.
+
 Usage:
-    python3 scripts/lint/check-luanumber-usage.py [--detailed] [--fail-on-issues]
+    python3 scripts/lint/check-luanumber-usage.py [--detailed] [--fail-on-issues] [--scope all]
 
 Returns:
     Exit code 0: No issues found
@@ -18,12 +26,23 @@ Returns:
 """
 
 import argparse
+import bisect
 import os
 import re
 import sys
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass
+from functools import partial
 from pathlib import Path
-from typing import Optional
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+from audit_cache import AuditCache, cache_key  # noqa: E402
+from csharp_tokens import tokenize  # noqa: E402
+from process_pool import default_jobs, map_files  # noqa: E402
+
+DEFAULT_CACHE = ROOT / "artifacts" / "luanumber-usage-cache.json"
+CACHE_SCHEMA = "novasharp.luanumber-usage-cache.v1"
 
 
 def is_ci() -> bool:
@@ -48,7 +67,8 @@ class Issue:
     description: str
 
 
-# Known-safe patterns that should be excluded from warnings
+# Known-safe patterns that should be excluded from warnings. Like the problematic
+# patterns, they are matched against code only, never comments or string contents.
 SAFE_PATTERNS = [
     # Argument count retrieval (always small values)
     r"_valueStack.*\.Number.*argCount",
@@ -61,9 +81,6 @@ SAFE_PATTERNS = [
     # LuaNumber member access
     r"LuaNumber\.Number",
     r"\.LuaNumber\.",
-    # Comments
-    r"^\s*//",
-    r"^\s*\*",
     # Test files often need raw access for verification
     r"\.Number\s*\)\s*\.Is",  # Assert.That(x.Number).Is...
     r"result\.Number",  # Comparing test results
@@ -140,6 +157,26 @@ PROBLEMATIC_PATTERNS = [
     ),
 ]
 
+SAFE_PATTERN = re.compile("|".join(f"(?:{pattern})" for pattern in SAFE_PATTERNS), re.IGNORECASE)
+
+# Files that have been audited and use intentional patterns
+FILE_SAFE_PATTERNS = [
+    r"Utf8Module\.cs",  # Bounds validated before casting
+    r"LuaBase\.cs",     # Low-level LuaPort interop
+    r"LuaPort",         # Low-level interop
+    r"StringRange\.cs", # Documented Lua 5.1/5.2 truncation behavior
+    r"TableIteratorsModule\.cs",  # ipairs uses sequential integer indices
+    r"StandardEnumUserDataDescriptor\.cs",  # Enum values are bounded
+    r"StringModule\.cs",  # String operations audited - Rep uses count for iteration
+]
+
+FILE_SAFE_PATTERN = re.compile("|".join(f"(?:{pattern})" for pattern in FILE_SAFE_PATTERNS), re.IGNORECASE)
+
+COMPILED_PROBLEMATIC_PATTERNS = [
+    (re.compile(pattern), pattern, severity, description)
+    for pattern, severity, description in PROBLEMATIC_PATTERNS
+]
+
 # Files/directories to skip
 SKIP_PATHS = [
     "obj/",
@@ -153,29 +190,23 @@ TARGET_DIRS = [
     "src/runtime/WallstopStudios.NovaSharp.Interpreter/",
 ]
 
+# --scope choices; "all" is an audit view over the test and tooling projects too.
+SCOPES = {
+    "runtime": TARGET_DIRS,
+    "all": [
+        "src/runtime/",
+        "src/tests/",
+        "src/tooling/",
+    ],
+}
 
-def is_safe_pattern(line: str, file_path: str = "") -> bool:
-    """Check if the line matches a known-safe pattern."""
-    # Check line patterns
-    for pattern in SAFE_PATTERNS:
-        if re.search(pattern, line, re.IGNORECASE):
-            return True
+NEWLINE_PATTERN = re.compile(r"\n")
+WORD_KINDS = ("ident", "number")
 
-    # Check file path patterns - files that have been audited and use intentional patterns
-    file_safe_patterns = [
-        r"Utf8Module\.cs",  # Bounds validated before casting
-        r"LuaBase\.cs",     # Low-level LuaPort interop
-        r"LuaPort",         # Low-level interop
-        r"StringRange\.cs", # Documented Lua 5.1/5.2 truncation behavior
-        r"TableIteratorsModule\.cs",  # ipairs uses sequential integer indices
-        r"StandardEnumUserDataDescriptor\.cs",  # Enum values are bounded
-        r"StringModule\.cs",  # String operations audited - Rep uses count for iteration
-    ]
-    for pattern in file_safe_patterns:
-        if re.search(pattern, file_path, re.IGNORECASE):
-            return True
 
-    return False
+def is_safe_pattern(line: str, file_path: str = "") -> bool:
+    """Check if the line matches a known-safe pattern."""
+    return bool(SAFE_PATTERN.search(line) or FILE_SAFE_PATTERN.search(file_path))
 
 
 def should_skip_path(file_path: str) -> bool:
@@ -186,42 +217,84 @@ def should_skip_path(file_path: str) -> bool:
     return False
 
 
-def is_in_target_dir(file_path: str, repo_root: Path) -> bool:
+def is_in_target_dir(file_path: str, repo_root: Path, target_dirs: list[str] = TARGET_DIRS) -> bool:
     """Check if the file is in a target directory."""
     rel_path = str(file_path).replace(str(repo_root) + "/", "")
-    for target in TARGET_DIRS:
+    for target in target_dirs:
         if rel_path.startswith(target):
             return True
     return False
 
 
-def analyze_file(file_path: Path, repo_root: Path) -> list[Issue]:
-    """Analyze a single C# file for LuaNumber usage issues."""
-    issues = []
-
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except Exception as e:
-        print(f"Warning: Could not read {file_path}: {e}", file=sys.stderr)
-        return issues
-
-    lines = content.split("\n")
+def number_access_lines(content: str) -> dict[int, str]:
+    """Return the code of every line that reads a `.Number` member, by 1-based line number.
+
+    The file is tokenized once. Comments and preprocessor lines never appear in the
+    result, string and char literals become empty placeholders, and tokens are joined
+    without whitespace except between two words, so `(int) x . Number` reads as
+    `(int)x.Number`. A multiline literal belongs to the line it starts on.
+    """
+    texts, kinds, leads, _ = tokenize(content)
+    accesses = [i for i in range(1, len(texts)) if texts[i] == "Number" and texts[i - 1] == "."]
+    if not accesses:
+        return {}
+
+    starts = []
+    offset = 0
+    for lead, text in zip(leads, texts):
+        offset += len(lead)
+        starts.append(offset)
+        offset += len(text)
+    line_starts = [0] + [match.end() for match in NEWLINE_PATTERN.finditer(content)]
+
+    code: dict[int, str] = {}
+    for access in accesses:
+        line = bisect.bisect_right(line_starts, starts[access]) - 1
+        if line + 1 in code:
+            continue
+        first = bisect.bisect_left(starts, line_starts[line])
+        last = (
+            bisect.bisect_left(starts, line_starts[line + 1], first)
+            if line + 1 < len(line_starts)
+            else len(texts)
+        )
+        pieces = []
+        for i in range(first, last):
+            if i > first and leads[i] and kinds[i] in WORD_KINDS and kinds[i - 1] in WORD_KINDS:
+                pieces.append(" ")
+            if kinds[i] == "string":
+                pieces.append('""')
+            elif kinds[i] == "char":
+                pieces.append("''")
+            else:
+                pieces.append(texts[i])
+        code[line + 1] = "".join(pieces)
+    return code
+
+
+def analyze_content(content: str, rel_path: str) -> list[Issue]:
+    """Report the problematic `.Number` usages in one file's source."""
+    # Every problematic pattern reads a `.Number` member, so most files end here.
+    if "Number" not in content or FILE_SAFE_PATTERN.search(rel_path):
+        return []
 
-    for line_num, line in enumerate(lines, start=1):
+    issues = []
+    lines = None
+    for line_num, code in number_access_lines(content).items():
         # Skip safe patterns
-        if is_safe_pattern(line, str(file_path)):
+        if SAFE_PATTERN.search(code):
             continue
 
         # Check for problematic patterns
-        for pattern, severity, description in PROBLEMATIC_PATTERNS:
-            if re.search(pattern, line):
-                # Double-check it's not a false positive
-                rel_path = str(file_path).replace(str(repo_root) + "/", "")
+        for compiled, pattern, severity, description in COMPILED_PROBLEMATIC_PATTERNS:
+            if compiled.search(code):
+                if lines is None:
+                    lines = content.split("\n")
                 issues.append(
                     Issue(
                         file_path=rel_path,
                         line_number=line_num,
-                        line_content=line.strip(),
+                        line_content=lines[line_num - 1].strip(),
                         pattern=pattern,
                         severity=severity,
                         description=description,
@@ -232,10 +305,49 @@ def analyze_file(file_path: Path, repo_root: Path) -> list[Issue]:
     return issues
 
 
-def find_cs_files(repo_root: Path) -> list[Path]:
+def analyze_file(file_path: Path, repo_root: Path) -> list[Issue]:
+    """Analyze a single C# file for LuaNumber usage issues."""
+    try:
+        content = file_path.read_text(encoding="utf-8")
+    except Exception as e:
+        print(f"Warning: Could not read {file_path}: {e}", file=sys.stderr)
+        return []
+
+    rel_path = str(file_path).replace(str(repo_root) + "/", "")
+    return analyze_content(content, rel_path)
+
+
+def analyze_files(
+    paths: list[Path], repo_root: Path, jobs: int = 1, cache: AuditCache | None = None
+) -> list[Issue]:
+    """Analyze ``paths`` on up to ``jobs`` worker processes, keeping their order.
+
+    Files with cached results in ``cache`` are not read again.
+    """
+    results: dict[Path, list[Issue]] = {}
+    to_scan = []
+    for path in paths:
+        cached = cache.lookup(path.relative_to(repo_root).as_posix()) if cache else None
+        if cached is not None:
+            results[path] = [Issue(**issue) for issue in cached]
+        else:
+            to_scan.append(path)
+
+    scanned = map_files(partial(analyze_file, repo_root=repo_root), to_scan, jobs)
+    for path, issues in zip(to_scan, scanned):
+        results[path] = issues
+        if cache:
+            cache.store(path.relative_to(repo_root).as_posix(), [asdict(issue) for issue in issues])
+    if cache:
+        cache.save()
+
+    return [issue for path in paths for issue in results[path]]
+
+
+def find_cs_files(repo_root: Path, target_dirs: list[str] = TARGET_DIRS) -> list[Path]:
     """Find all C# files in target directories."""
     files = []
-    for target_dir in TARGET_DIRS:
+    for target_dir in target_dirs:
         target_path = repo_root / target_dir
         if target_path.exists():
             for cs_file in target_path.rglob("*.cs"):
@@ -305,19 +417,43 @@ def main():
         action="store_true",
         help="Exit with code 1 if any issues found",
     )
+    parser.add_argument(
+        "--scope",
+        choices=sorted(SCOPES),
+        default="runtime",
+        help="runtime: interpreter sources (default); all: runtime, test, and tooling projects",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="Worker processes used to analyze files (default: CPU count)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE,
+        metavar="PATH",
+        help="Per-file results cache (default: artifacts/luanumber-usage-cache.json)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Analyze every file without reading or writing --cache",
+    )
     args = parser.parse_args()
 
-    # Find the repository root
-    script_dir = Path(__file__).resolve().parent
-    repo_root = script_dir.parent.parent
+    repo_root = ROOT
+    cache = AuditCache(
+        None if args.no_cache else args.cache.resolve(),
+        CACHE_SCHEMA,
+        cache_key([Path(__file__), ROOT / "tools" / "csharp_tokens.py"], {}),
+        root=repo_root,
+    )
 
     # Find and analyze all C# files
-    cs_files = find_cs_files(repo_root)
-    all_issues = []
-
-    for file_path in cs_files:
-        issues = analyze_file(file_path, repo_root)
-        all_issues.extend(issues)
+    cs_files = find_cs_files(repo_root, SCOPES[args.scope])
+    all_issues = analyze_files(cs_files, repo_root, jobs=args.jobs, cache=cache)
 
     # Print report
     print_report(all_issues, detailed=args.detailed)
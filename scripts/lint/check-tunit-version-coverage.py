@@ -15,6 +15,7 @@ Returns:
 """
 
 import argparse
+import bisect
 import json
 import os
 import re
@@ -23,6 +24,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools"))
+
+from process_pool import default_jobs, map_files  # noqa: E402
+
 
 def is_ci() -> bool:
     return os.environ.get("GITHUB_ACTIONS") == "true" or os.environ.get("CI") == "true"
@@ -79,22 +84,30 @@ class TestFile:
 # Lua versions that NovaSharp supports
 LUA_VERSIONS = ["Lua51", "Lua52", "Lua53", "Lua54", "Lua55", "Latest"]
 
-# Patterns to identify test methods and version arguments
-TEST_ATTRIBUTE_PATTERN = re.compile(r"^\s*\[(?:global::TUnit\.Core\.)?Test\]", re.MULTILINE)
+# Patterns to identify test methods and version arguments. A [Test] attribute only
+# counts when it is the first thing on its line.
+TEST_ATTRIBUTE_PATTERN = re.compile(r"\[(?:global::TUnit\.Core\.)?Test\]")
+LEADING_WHITESPACE_PATTERN = re.compile(r"[^\S\n]*")
 # Use re.DOTALL to match across newlines for multi-line Arguments attributes
 ARGUMENTS_PATTERN = re.compile(
     r"\[(?:global::TUnit\.Core\.)?Arguments\(.*?(?:Compatibility\.)?LuaCompatibilityVersion\.(Lua\d+|Latest).*?\)\]",
     re.DOTALL
 )
-METHODDATASOURCE_PATTERN = re.compile(r"\[(?:global::TUnit\.Core\.)?MethodDataSource")
-COMBINEDDATASOURCES_PATTERN = re.compile(r"\[(?:global::TUnit\.Core\.)?CombinedDataSources")
-# New helper attribute patterns for data-driven testing
-ALL_LUA_VERSIONS_PATTERN = re.compile(r"\[AllLuaVersions\]")
-LUA_VERSIONS_FROM_PATTERN = re.compile(r"\[LuaVersionsFrom\(")
-LUA_VERSIONS_UNTIL_PATTERN = re.compile(r"\[LuaVersionsUntil\(")
-LUA_VERSION_RANGE_PATTERN = re.compile(r"\[LuaVersionRange\(")
-LUA_TEST_MATRIX_PATTERN = re.compile(r"\[LuaTestMatrix\(")
-METHOD_PATTERN = re.compile(r"public\s+async\s+Task\s+(\w+)\s*\(")
+# Every attribute that can give a test version coverage, located in one pass per file
+# and classified by ATTRIBUTE_MARKER_KINDS. The data-driving helper attributes are
+# only recognised without the TUnit namespace prefix.
+ATTRIBUTE_MARKER_PATTERN = re.compile(
+    r"\[(global::TUnit\.Core\.)?"
+    r"(Arguments\(|MethodDataSource|CombinedDataSources"
+    r"|AllLuaVersions\]|LuaVersionsFrom\(|LuaVersionsUntil\(|LuaVersionRange\(|LuaTestMatrix\()"
+)
+ATTRIBUTE_MARKER_KINDS = {
+    "Arguments(": "arguments",
+    "MethodDataSource": "methoddatasource",
+    "CombinedDataSources": "combineddatasources",
+}
+# The method signature is matched per line, so its whitespace never spans a newline.
+METHOD_PATTERN = re.compile(r"public[^\S\n]+async[^\S\n]+Task[^\S\n]+(\w+)[^\S\n]*\(")
 CLASS_PATTERN = re.compile(r"(?:public\s+)?(?:sealed\s+)?class\s+(\w+)")
 
 # Directories containing infrastructure/fixture code that don't need version tests
@@ -115,16 +128,22 @@ EXCLUDED_PATTERNS = [
 ]
 
 # Patterns that indicate a test executes Lua code and needs version coverage
-LUA_EXECUTION_PATTERNS = [
-    re.compile(r'\.DoString\s*\('),
-    re.compile(r'\.DoFile\s*\('),
-    re.compile(r'\.RunString\s*\('),
-    re.compile(r'\.DoChunk\s*\('),
-    re.compile(r'new\s+Script\s*\('),
-    re.compile(r'CreateScript\s*\('),
-    re.compile(r'script\.Globals'),
-    re.compile(r'script\.Call\s*\('),
-]
+LUA_EXECUTION_PATTERN = re.compile(
+    r"\.DoString\s*\("
+    r"|\.DoFile\s*\("
+    r"|\.RunString\s*\("
+    r"|\.DoChunk\s*\("
+    r"|new\s+Script\s*\("
+    r"|CreateScript\s*\("
+    r"|script\.Globals"
+    r"|script\.Call\s*\("
+)
+
+# How far analyze_test_file looks: attributes up to 20 lines above [Test], a method
+# signature within the 29 lines below it, and a method body of at most 200 lines.
+PRECEDING_CONTEXT_LINES = 20
+SIGNATURE_SEARCH_LINES = 30
+METHOD_BODY_LINES = 200
 
 
 def should_exclude_file(file_path: Path) -> bool:
@@ -149,36 +168,23 @@ def extract_class_name(content: str) -> Optional[str]:
     return match.group(1) if match else None
 
 
-def extract_method_body(lines: list[str], method_start_line: int) -> str:
-    """Extract the method body from the lines, starting at method_start_line (0-indexed)."""
-    # Find the opening brace
+def method_body_span(
+    opens: list[int], closes: list[int], method_start_line: int
+) -> Optional[tuple[int, int]]:
+    """Return the first and last line (0-indexed) of the method body starting at
+    method_start_line, from per-line brace counts, or None if no brace opens."""
     brace_count = 0
-    body_lines = []
-    started = False
-
-    for i in range(method_start_line, min(len(lines), method_start_line + 200)):
-        line = lines[i]
-        for char in line:
-            if char == '{':
-                brace_count += 1
-                started = True
-            elif char == '}':
-                brace_count -= 1
-
-        if started:
-            body_lines.append(line)
+    first = None
+    last = None
+    for i in range(method_start_line, min(len(opens), method_start_line + METHOD_BODY_LINES)):
+        brace_count += opens[i] - closes[i]
+        if first is None and opens[i]:
+            first = i
+        if first is not None:
+            last = i
             if brace_count == 0:
                 break
-
-    return "\n".join(body_lines)
-
-
-def test_executes_lua(method_body: str) -> bool:
-    """Check if a test method body appears to execute Lua code."""
-    for pattern in LUA_EXECUTION_PATTERNS:
-        if pattern.search(method_body):
-            return True
-    return False
+    return None if first is None else (first, last)
 
 
 def analyze_test_file(file_path: Path) -> Optional[TestFile]:
@@ -188,76 +194,112 @@ def analyze_test_file(file_path: Path) -> Optional[TestFile]:
     except Exception as e:
         print(f"Warning: Could not read {file_path}: {e}", file=sys.stderr)
         return None
+    return analyze_content(content, str(file_path), file_path.stem)
+
 
-    class_name = extract_class_name(content) or file_path.stem
+def analyze_content(content: str, path: str, stem: str) -> Optional[TestFile]:
+    """Classify every [Test] method in ``content`` in a single pass over the file.
 
-    # Find all test methods
-    test_file = TestFile(path=str(file_path), class_name=class_name)
+    Lines, brace counts, attribute markers, and method signatures are each located
+    once; every test then only looks up the ones inside its own context window.
+    """
+    class_name = extract_class_name(content) or stem
+    test_file = TestFile(path=path, class_name=class_name)
 
-    # Split content into lines for line number tracking
     lines = content.split("\n")
+    line_starts = [0]
+    for line in lines[:-1]:
+        line_starts.append(line_starts[-1] + len(line) + 1)
+    opens = [line.count("{") for line in lines]
+    closes = [line.count("}") for line in lines]
+
+    def line_of(offset: int) -> int:
+        return bisect.bisect_right(line_starts, offset) - 1
+
+    test_lines: list[int] = []
+    for match in TEST_ATTRIBUTE_PATTERN.finditer(content):
+        line = line_of(match.start())
+        if LEADING_WHITESPACE_PATTERN.fullmatch(content, line_starts[line], match.start()):
+            test_lines.append(line)
+    if not test_lines:
+        return None
 
-    # Track context for each test method
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Check if this is a test attribute
-        if TEST_ATTRIBUTE_PATTERN.match(line):
-            # Look forward for the method signature
-            method_name = None
-            method_line = i + 1
-            method_signature_idx = None
-            for j in range(i + 1, min(i + 30, len(lines))):
-                method_match = METHOD_PATTERN.search(lines[j])
-                if method_match:
-                    method_name = method_match.group(1)
-                    method_line = j + 1  # 1-indexed line number
-                    method_signature_idx = j
-                    break
-
-            if method_name and method_signature_idx is not None:
-                # Extract method body and check for Lua execution
-                method_body = extract_method_body(lines, method_signature_idx)
-                executes_lua = test_executes_lua(method_body)
-
-                # Check for version arguments in the context between [Test] and method signature
-                # Arguments can come before [Test] (preceding) or after [Test] (between [Test] and method)
-                preceding_context_start = max(0, i - 20)
-                preceding_context = "\n".join(lines[preceding_context_start:i])
-                following_context = "\n".join(lines[i:method_signature_idx])
-                full_context = preceding_context + "\n" + following_context
-
-                version_args = ARGUMENTS_PATTERN.findall(full_context)
-                has_methoddatasource = bool(METHODDATASOURCE_PATTERN.search(full_context))
-                has_combineddatasources = bool(COMBINEDDATASOURCES_PATTERN.search(full_context))
-                # Check for new data-driving helper attributes
-                has_lua_version_helper = (
-                    bool(ALL_LUA_VERSIONS_PATTERN.search(full_context)) or
-                    bool(LUA_VERSIONS_FROM_PATTERN.search(full_context)) or
-                    bool(LUA_VERSIONS_UNTIL_PATTERN.search(full_context)) or
-                    bool(LUA_VERSION_RANGE_PATTERN.search(full_context)) or
-                    bool(LUA_TEST_MATRIX_PATTERN.search(full_context))
-                )
+    # First method signature on each line, keyed by line index.
+    signatures: dict[int, str] = {}
+    for match in METHOD_PATTERN.finditer(content):
+        signatures.setdefault(line_of(match.start()), match.group(1))
+    signature_lines = sorted(signatures)
+
+    markers: dict[str, list[int]] = {
+        "arguments": [],
+        "methoddatasource": [],
+        "combineddatasources": [],
+        "helper": [],
+    }
+    for match in ATTRIBUTE_MARKER_PATTERN.finditer(content):
+        prefixed, name = match.groups()
+        kind = ATTRIBUTE_MARKER_KINDS.get(name)
+        if kind is None and prefixed:
+            continue
+        markers[kind or "helper"].append(match.start())
+
+    def has_marker(kind: str, start: int, end: int) -> bool:
+        offsets = markers[kind]
+        index = bisect.bisect_left(offsets, start)
+        return index < len(offsets) and offsets[index] < end
+
+    for i in test_lines:
+        # Look forward for the method signature
+        index = bisect.bisect_right(signature_lines, i)
+        if index == len(signature_lines):
+            continue
+        method_signature_idx = signature_lines[index]
+        if method_signature_idx >= min(i + SIGNATURE_SEARCH_LINES, len(lines)):
+            continue
+        method_name = signatures[method_signature_idx]
+
+        # Extract method body and check for Lua execution
+        span = method_body_span(opens, closes, method_signature_idx)
+        if span is None:
+            method_body = ""
+        else:
+            first, last = span
+            method_body = content[line_starts[first] : line_starts[last] + len(lines[last])]
+        executes_lua = bool(LUA_EXECUTION_PATTERN.search(method_body))
+
+        # Arguments can come before [Test] (preceding) or after [Test] (between [Test]
+        # and method): the context runs from 20 lines above [Test] to the end of the
+        # line before the method signature.
+        context_start = line_starts[max(0, i - PRECEDING_CONTEXT_LINES)]
+        context_end = line_starts[method_signature_idx] - 1
+
+        version_args = (
+            ARGUMENTS_PATTERN.findall(content, context_start, context_end)
+            if has_marker("arguments", context_start, context_end)
+            else []
+        )
+        test_method = TestMethod(
+            name=method_name,
+            file_path=path,
+            line_number=method_signature_idx + 1,  # 1-indexed line number
+            class_name=class_name,
+            has_version_argument=len(version_args) > 0,
+            version_arguments=version_args,
+            has_methoddatasource=has_marker("methoddatasource", context_start, context_end),
+            has_combineddatasources=has_marker("combineddatasources", context_start, context_end),
+            has_lua_version_helper=has_marker("helper", context_start, context_end),
+            executes_lua=executes_lua,
+            method_body=method_body,
+        )
+        test_file.methods.append(test_method)
 
-                test_method = TestMethod(
-                    name=method_name,
-                    file_path=str(file_path),
-                    line_number=method_line,
-                    class_name=class_name,
-                    has_version_argument=len(version_args) > 0,
-                    version_arguments=version_args,
-                    has_methoddatasource=has_methoddatasource,
-                    has_combineddatasources=has_combineddatasources,
-                    has_lua_version_helper=has_lua_version_helper,
-                    executes_lua=executes_lua,
-                    method_body=method_body,
-                )
-                test_file.methods.append(test_method)
+    return test_file if test_file.methods else None
 
-        i += 1
 
-    return test_file if test_file.methods else None
+def analyze_test_files(paths: list[Path], jobs: int = 1) -> list[TestFile]:
+    """Analyze ``paths`` on up to ``jobs`` worker processes, keeping their order."""
+    results = map_files(analyze_test_file, paths, jobs)
+    return [result for result in results if result]
 
 
 def find_test_files(test_dir: Path) -> list[Path]:
@@ -438,6 +480,12 @@ def main():
         action="store_true",
         help="Only report on Lua execution tests (ignore infrastructure tests)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="Worker processes used to analyze test files (default: CPU count)",
+    )
     args = parser.parse_args()
 
     # Find the repository root
@@ -457,12 +505,7 @@ def main():
 
     # Find and analyze all test files
     test_files = find_test_files(test_dir)
-    analyzed_files = []
-
-    for file_path in test_files:
-        result = analyze_test_file(file_path)
-        if result:
-            analyzed_files.append(result)
+    analyzed_files = analyze_test_files(test_files, jobs=args.jobs)
 
     # Generate report
     report = generate_report(analyzed_files, detailed=args.detailed or args.json)
@@ -4,14 +4,17 @@
 from __future__ import annotations
 
 import argparse
+import json
 import os
 import re
 import sys
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
+ALLOCATION_SITES_SCHEMA = "novasharp.vm-hotpath-allocation-sites.v1"
 
 
 @dataclass(frozen=True)
@@ -37,6 +40,44 @@ class Finding:
     symbol: str
     rule: Rule
     line: str
+    call_path: tuple[str, ...] = ()
+    # Opcodes whose ProcessingLoop case can reach this site; None when it runs for any.
+    opcodes: tuple[str, ...] | None = None
+
+
+@dataclass(frozen=True)
+class MethodSymbol:
+    path: str
+    type_name: str
+    name: str
+    start_line: int
+    end_line: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.type_name}.{self.name}"
+
+
+@dataclass(frozen=True)
+class CallSite:
+    receiver: str | None
+    name: str
+    receiver_is_member: bool = False
+
+
+@dataclass
+class CallGraph:
+    methods: list[MethodSymbol]
+    edges: dict[str, set[str]]
+
+
+@dataclass(frozen=True)
+class OpcodeDispatch:
+    """Which opcodes of the ProcessingLoop switch can reach each method."""
+
+    case_lines: dict[int, tuple[str, ...]]
+    method_opcodes: dict[str, frozenset[str]]
+    generic_methods: frozenset[str]
 
 
 TARGET_TYPED_RETURN_NEW_PATTERN = re.compile(r"(?:\breturn|=>)\s+new\s*\(")
@@ -57,6 +98,7 @@ TARGET_TYPED_NEW_EXPRESSION_PATTERN = re.compile(
     r"^\s*(?:(?:context|executionContext)\s*:\s*)?new\s*\("
 )
 RAW_STRING_PREFIX_PATTERN = re.compile(r"\$*\"{3,}")
+STRIP_SPECIAL_CHAR_PATTERN = re.compile(r"[/\"'@$]")
 CONTEXT_BEFORE_LINES = 5
 CONTEXT_AFTER_LINES = 7
 
@@ -112,12 +154,51 @@ RULES = [
 
 RULES_BY_ID = {rule.rule_id: rule for rule in RULES}
 
+
+def rule_group_name(rule_id: str) -> str:
+    return rule_id.replace("-", "_")
+
+
+# One anchored match evaluates every rule: each rule sits in an optional lookahead
+# that scans the whole line, so a named group is set exactly when that rule's
+# pattern would have matched on its own.
+COMBINED_RULE_PATTERN = re.compile(
+    "".join(
+        f"(?:(?=.*?(?P<{rule_group_name(rule.rule_id)}>{rule.pattern.pattern}))|)"
+        for rule in RULES
+    )
+)
+RULE_GROUPS = [(rule_group_name(rule.rule_id), rule) for rule in RULES]
+
+# Every rule and heuristic needs `new` or `DynValue` on the line, and callback
+# argument tracking only starts at an `Invoke(` call, so lines without any of
+# these literals skip the regex engine entirely.
+RULE_PREFILTER_LITERALS = ("new", "DynValue")
+CALLBACK_PREFILTER_LITERAL = "Invoke"
+
 TARGET_FILE_GLOBS = [
     "src/runtime/WallstopStudios.NovaSharp.Interpreter/DataTypes/CallbackFunction.cs",
     "src/runtime/WallstopStudios.NovaSharp.Interpreter/Execution/ScriptExecutionContext.cs",
     "src/runtime/WallstopStudios.NovaSharp.Interpreter/Execution/VM/**/*.cs",
 ]
 
+INTERPRETER_FILE_GLOBS = [
+    "src/runtime/WallstopStudios.NovaSharp.Interpreter/**/*.cs",
+]
+
+# Methods the VM enters per opcode or per CLR callback. `--scope reachable` follows
+# calls out of these roots across the interpreter and reports allocations in any
+# method they can reach, wherever that method lives.
+CALL_GRAPH_ROOTS = [
+    ("Processor", re.compile(r"ProcessingLoop|InternalExecCall|Exec(?!\w*ForTests$)\w+")),
+    ("CallbackFunction", re.compile(r"Invoke")),
+]
+# The opcode switch. Each site records the opcodes whose case can reach it, so the
+# benchmark renderer can match sites to the opcodes a scenario compiles to.
+OPCODE_DISPATCH_METHOD = "Processor.ProcessingLoop"
+OPCODE_CASE_PATTERN = re.compile(r"\bcase\s+OpCode\.(?P<name>\w+)\s*:")
+SWITCH_DEFAULT_PATTERN = re.compile(r"\bdefault\s*:")
+
 ALLOWLIST = [
     AllowedMatch(
         "new-dynvalue-array",
@@ -302,6 +383,18 @@ for symbol, context in INTEGER_FACTORY_ALLOWLIST_CONTEXTS.items():
         )
     )
 
+
+def index_allowlist(
+    allowlist: list[AllowedMatch],
+) -> dict[tuple[str, str], list[tuple[int, AllowedMatch]]]:
+    index: dict[tuple[str, str], list[tuple[int, AllowedMatch]]] = {}
+    for position, allowed in enumerate(allowlist):
+        index.setdefault((allowed.path, allowed.symbol), []).append((position, allowed))
+    return index
+
+
+ALLOWLIST_BY_LOCATION = index_allowlist(ALLOWLIST)
+
 METHOD_PATTERN = re.compile(
     r"^\s*(?:(?:public|private|internal|protected)\s+)+"
     r"(?:(?:static|readonly|unsafe|sealed|override|virtual|async|extern|partial|new)\s+)*"
@@ -310,6 +403,43 @@ METHOD_PATTERN = re.compile(
 )
 
 
+TYPE_DECLARATION_PATTERN = re.compile(
+    r"\b(?:class|struct|interface|record(?:\s+(?:class|struct))?)\s+(?P<name>\w+)"
+)
+CALL_SITE_PATTERN = re.compile(
+    r"(?:(?<!\w)(?P<receiver>\w+)\s*\??\.\s*|(?<![\w.]))"
+    r"(?P<name>[A-Za-z_]\w*)\s*(?:<[\w\s,.?\[\]<>]*>)?\s*\("
+)
+CALL_SITE_EXCLUDED_NAMES = frozenset(
+    {
+        "catch",
+        "checked",
+        "default",
+        "fixed",
+        "for",
+        "foreach",
+        "if",
+        "lock",
+        "nameof",
+        "new",
+        "return",
+        "sizeof",
+        "stackalloc",
+        "switch",
+        "throw",
+        "typeof",
+        "unchecked",
+        "using",
+        "when",
+        "while",
+    }
+)
+SELF_RECEIVERS = frozenset({"this", "base"})
+BUILTIN_TYPE_RECEIVERS = frozenset(
+    {"bool", "byte", "char", "decimal", "double", "float", "int", "long", "object", "string"}
+)
+
+
 def is_ci() -> bool:
     return os.environ.get("GITHUB_ACTIONS") == "true" or os.environ.get("CI") == "true"
 
@@ -350,6 +480,14 @@ def strip_comments_and_strings(
             inside_block_comment = False
             continue
 
+        special_match = STRIP_SPECIAL_CHAR_PATTERN.search(line, index)
+        if special_match is None:
+            output.append(line[index:])
+            break
+        if special_match.start() > index:
+            output.append(line[index : special_match.start()])
+            index = special_match.start()
+
         char = line[index]
         next_char = line[index + 1] if index + 1 < len(line) else ""
         verbatim_string_prefix_length = get_verbatim_string_prefix_length(line, index)
@@ -458,7 +596,15 @@ def matching_rules(
     inside_callback_invoke: bool = False,
     pending_implicit_array_initializer: bool = False,
 ) -> list[Rule]:
-    rules_by_id = {rule.rule_id: rule for rule in RULES if rule.pattern.search(code)}
+    if not any(literal in code for literal in RULE_PREFILTER_LITERALS):
+        return []
+
+    combined_match = COMBINED_RULE_PATTERN.match(code)
+    rules_by_id = {
+        rule.rule_id: rule
+        for group_name, rule in RULE_GROUPS
+        if combined_match.group(group_name) is not None
+    }
 
     if TARGET_TYPED_RETURN_NEW_PATTERN.search(code) and current_return_type is not None:
         if type_matches(current_return_type, "DynValue"):
@@ -497,6 +643,9 @@ def update_callback_invoke_depth(current_depth: int, code: str) -> int:
     if current_depth > 0:
         return max(0, current_depth + code.count("(") - code.count(")"))
 
+    if CALLBACK_PREFILTER_LITERAL not in code:
+        return 0
+
     invoke_match = CALLBACK_INVOKE_OPEN_PATTERN.search(code)
     if invoke_match is None:
         return 0
@@ -509,7 +658,7 @@ def update_pending_implicit_array_initializer(current_pending: bool, code: str)
     if current_pending:
         return ";" not in code
 
-    if not IMPLICIT_ARRAY_NEW_PATTERN.search(code):
+    if "new" not in code or not IMPLICIT_ARRAY_NEW_PATTERN.search(code):
         return False
 
     return DYNVALUE_MEMBER_PATTERN.search(code) is None and ";" not in code
@@ -626,6 +775,20 @@ def run_self_tests() -> None:
                 f"expected {sorted(expected_rule_ids)}, got {sorted(actual_rule_ids)}"
             )
 
+        combined_match = COMBINED_RULE_PATTERN.match(code)
+        combined_rule_ids = {
+            rule.rule_id
+            for group_name, rule in RULE_GROUPS
+            if combined_match.group(group_name) is not None
+        }
+        separate_rule_ids = {rule.rule_id for rule in RULES if rule.pattern.search(code)}
+        if combined_rule_ids != separate_rule_ids:
+            raise AssertionError(
+                f"lint self-test failed for {code!r}: combined rule pattern matched "
+                f"{sorted(combined_rule_ids)}, separate rule patterns matched "
+                f"{sorted(separate_rule_ids)}"
+            )
+
     multiline_cases = [
         (
             "multiline_implicit_dynvalue_array",
@@ -726,55 +889,152 @@ def run_self_tests() -> None:
                 f"expected {expected_rule_ids}, got {actual_rule_ids}"
             )
 
+    call_graph_sources = {
+        "__selftest__/Processor.cs": [
+            "internal sealed partial class Processor",
+            "{",
+            "    private int ExecAdd(Instruction i, int instructionPtr)",
+            "    {",
+            "        return Widen(i);",
+            "    }",
+            "",
+            "    private int Widen(Instruction i)",
+            "    {",
+            "        _stack.Push(Helpers.Wrap(Math.Max(i.Value, 0)));",
+            "        return 0;",
+            "    }",
+            "}",
+        ],
+        "__selftest__/Helpers.cs": [
+            "internal static class Helpers",
+            "{",
+            "    internal static DynValue Wrap(double value) => DynValue.NewNumber(value);",
+            "",
+            "    internal static DynValue Max(double value)",
+            "    {",
+            "        return DynValue.NewNumber(value);",
+            "    }",
+            "}",
+        ],
+    }
+    findings, _ = analyze_reachable_sources(
+        {
+            path: (lines, strip_source_lines(lines))
+            for path, lines in call_graph_sources.items()
+        },
+        set(),
+    )
+    actual_call_paths = [(finding.symbol, finding.call_path) for finding in findings]
+    expected_call_paths = [
+        ("Wrap", ("Processor.ExecAdd", "Processor.Widen", "Helpers.Wrap")),
+    ]
+    if actual_call_paths != expected_call_paths:
+        raise AssertionError(
+            "lint self-test failed for reachable call paths: "
+            f"expected {expected_call_paths}, got {actual_call_paths}"
+        )
+
+    dispatch_sources = {
+        "__selftest__/ProcessorInstructionLoop.cs": [
+            "internal sealed partial class Processor",
+            "{",
+            "    private int ProcessingLoop(int instructionPtr)",
+            "    {",
+            "        Trace();",
+            "        switch (i.OpCode)",
+            "        {",
+            "            case OpCode.Add:",
+            "                instructionPtr = ExecAdd(i, instructionPtr);",
+            "                break;",
+            "            case OpCode.Concat:",
+            "            case OpCode.Len:",
+            "                _valueStack.Push(DynValue.NewNumber(0));",
+            "                break;",
+            "            default:",
+            "                break;",
+            "        }",
+            "        return instructionPtr;",
+            "    }",
+            "",
+            "    private int ExecAdd(Instruction i, int instructionPtr)",
+            "    {",
+            "        return Helpers.Wrap(i.Value);",
+            "    }",
+            "",
+            "    private void Trace()",
+            "    {",
+            "        _log.Push(DynValue.NewNumber(1));",
+            "    }",
+            "}",
+        ],
+        "__selftest__/Helpers.cs": call_graph_sources["__selftest__/Helpers.cs"],
+    }
+    findings, _ = analyze_reachable_sources(
+        {
+            path: (lines, strip_source_lines(lines))
+            for path, lines in dispatch_sources.items()
+        },
+        set(),
+    )
+    actual_opcodes = sorted((finding.symbol, finding.opcodes) for finding in findings)
+    expected_opcodes = [
+        ("ProcessingLoop", ("Concat", "Len")),
+        ("Trace", None),
+        ("Wrap", ("Add",)),
+    ]
+    if actual_opcodes != expected_opcodes:
+        raise AssertionError(
+            "lint self-test failed for opcode dispatch: "
+            f"expected {expected_opcodes}, got {actual_opcodes}"
+        )
+
 
 def is_allowed(
     path: str,
     symbol: str,
     rule: Rule,
-    context: str,
+    stripped_lines: list[str],
+    line_index: int,
     consumed_allowlist: set[int],
 ) -> tuple[int, AllowedMatch] | None:
-    for index, allowed in enumerate(ALLOWLIST):
-        if index in consumed_allowlist:
-            continue
+    candidates = [
+        (index, allowed)
+        for index, allowed in ALLOWLIST_BY_LOCATION.get((path, symbol), ())
+        if index not in consumed_allowlist and allowed.rule_id == rule.rule_id
+    ]
+    if not candidates:
+        return None
 
-        if (
-            allowed.rule_id == rule.rule_id
-            and allowed.path == path
-            and allowed.symbol == symbol
-            and allowed.pattern.search(context)
-        ):
+    context = normalize_context(stripped_lines, line_index)
+    for index, allowed in candidates:
+        if allowed.pattern.search(context):
             return index, allowed
 
     return None
 
 
+def read_source_lines(path: Path) -> list[str] | None:
+    try:
+        return path.read_text(encoding="utf-8").splitlines()
+    except OSError as ex:
+        relative_path = path.relative_to(REPO_ROOT).as_posix()
+        print(f"warning: could not read {relative_path}: {ex}", file=sys.stderr)
+        return None
+
+
 def analyze_file(
     path: Path,
     consumed_allowlist: set[int],
 ) -> tuple[list[Finding], list[tuple[Finding, AllowedMatch]]]:
     relative_path = path.relative_to(REPO_ROOT).as_posix()
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except OSError as ex:
-        print(f"warning: could not read {relative_path}: {ex}", file=sys.stderr)
+    lines = read_source_lines(path)
+    if lines is None:
         return [], []
 
     return analyze_lines(relative_path, lines, consumed_allowlist)
 
 
-def analyze_lines(
-    relative_path: str,
-    lines: list[str],
-    consumed_allowlist: set[int],
-) -> tuple[list[Finding], list[tuple[Finding, AllowedMatch]]]:
-    findings: list[Finding] = []
-    allowed_findings: list[tuple[Finding, AllowedMatch]] = []
-    current_symbol = "<module>"
-    current_return_type: str | None = None
-    pending_callback_invoke_context = False
-    callback_invoke_depth = 0
-    pending_implicit_array_initializer = False
+def strip_source_lines(lines: list[str]) -> list[str]:
     stripped_lines: list[str] = []
     inside_block_comment = False
     raw_string_quote_count = 0
@@ -794,6 +1054,25 @@ def analyze_lines(
         )
         stripped_lines.append(stripped_line)
 
+    return stripped_lines
+
+
+def analyze_lines(
+    relative_path: str,
+    lines: list[str],
+    consumed_allowlist: set[int],
+    stripped_lines: list[str] | None = None,
+) -> tuple[list[Finding], list[tuple[Finding, AllowedMatch]]]:
+    findings: list[Finding] = []
+    allowed_findings: list[tuple[Finding, AllowedMatch]] = []
+    current_symbol = "<module>"
+    current_return_type: str | None = None
+    pending_callback_invoke_context = False
+    callback_invoke_depth = 0
+    pending_implicit_array_initializer = False
+    if stripped_lines is None:
+        stripped_lines = strip_source_lines(lines)
+
     for line_index, line in enumerate(lines):
         line_number = line_index + 1
         code = stripped_lines[line_index]
@@ -805,7 +1084,6 @@ def analyze_lines(
         if not code.strip():
             continue
 
-        context = normalize_context(stripped_lines, line_index)
         for rule in matching_rules(
             code,
             current_return_type,
@@ -818,7 +1096,8 @@ def analyze_lines(
                 relative_path,
                 current_symbol,
                 rule,
-                context,
+                stripped_lines,
+                line_index,
                 consumed_allowlist,
             )
             if allowed_match is not None:
@@ -829,7 +1108,10 @@ def analyze_lines(
                 findings.append(finding)
             break
 
-        pending_callback_invoke_context = CALLBACK_INVOKE_START_PATTERN.search(code) is not None
+        pending_callback_invoke_context = (
+            CALLBACK_PREFILTER_LITERAL in code
+            and CALLBACK_INVOKE_START_PATTERN.search(code) is not None
+        )
         callback_invoke_depth = update_callback_invoke_depth(callback_invoke_depth, code)
         pending_implicit_array_initializer = update_pending_implicit_array_initializer(
             pending_implicit_array_initializer,
@@ -839,9 +1121,341 @@ def analyze_lines(
     return findings, allowed_findings
 
 
-def find_target_files() -> list[Path]:
+def extract_method_symbols(
+    relative_path: str,
+    stripped_lines: list[str],
+) -> list[tuple[MethodSymbol, list[CallSite]]]:
+    """Find method bodies and their call sites by brace depth over comment-free code.
+
+    This is deliberately not a C# parser: constructors, local functions, and
+    members without an explicit access modifier are not split out, and overloads
+    share one `Type.Method` node.
+    """
+
+    methods: list[tuple[MethodSymbol, list[CallSite]]] = []
+    type_stack: list[tuple[str, int]] = []
+    pending_type: str | None = None
+    depth = 0
+    current: tuple[str, str, int, int, list[CallSite]] | None = None
+    current_opened = False
+
+    for line_index, code in enumerate(stripped_lines):
+        line_number = line_index + 1
+        depth_before = depth
+        scan_start = 0
+
+        if current is None:
+            type_match = TYPE_DECLARATION_PATTERN.search(code)
+            method_match = METHOD_PATTERN.match(code)
+            if type_match is not None and method_match is None:
+                pending_type = type_match.group("name")
+            elif method_match is not None and type_stack:
+                current = (
+                    type_stack[-1][0],
+                    method_match.group("name"),
+                    line_number,
+                    depth_before,
+                    [],
+                )
+                current_opened = False
+                scan_start = method_match.end() - 1
+
+        if current is not None:
+            current[4].extend(find_call_sites(code, scan_start))
+
+        for char in code:
+            if char == "{":
+                if pending_type is not None:
+                    type_stack.append((pending_type, depth))
+                    pending_type = None
+                depth += 1
+                if current is not None:
+                    current_opened = True
+            elif char == "}":
+                depth -= 1
+                if type_stack and depth == type_stack[-1][1]:
+                    type_stack.pop()
+
+        if current is None:
+            continue
+
+        type_name, name, start_line, method_depth, calls = current
+        body_finished = (
+            depth <= method_depth if current_opened else ";" in code and depth == method_depth
+        )
+        if body_finished:
+            methods.append(
+                (MethodSymbol(relative_path, type_name, name, start_line, line_number), calls)
+            )
+            current = None
+
+    return methods
+
+
+def find_call_sites(code: str, start: int = 0) -> list[CallSite]:
+    call_sites: list[CallSite] = []
+    for call_match in CALL_SITE_PATTERN.finditer(code, start):
+        name = call_match.group("name")
+        if name in CALL_SITE_EXCLUDED_NAMES:
+            continue
+        receiver = call_match.group("receiver")
+        receiver_is_member = (
+            receiver is not None and code[: call_match.start("receiver")].rstrip().endswith(".")
+        )
+        call_sites.append(CallSite(receiver, name, receiver_is_member))
+    return call_sites
+
+
+def resolve_call_site(
+    call_site: CallSite,
+    caller_type: str,
+    methods_by_type: dict[str, set[str]],
+    types_by_method: dict[str, set[str]],
+) -> str | None:
+    receiver = call_site.receiver
+    name = call_site.name
+    if receiver is None or receiver in SELF_RECEIVERS:
+        if name in methods_by_type.get(caller_type, ()):
+            return f"{caller_type}.{name}"
+    elif name in methods_by_type.get(receiver, ()):
+        return f"{receiver}.{name}"
+    elif not call_site.receiver_is_member and (
+        receiver[0].isupper() or receiver in BUILTIN_TYPE_RECEIVERS
+    ):
+        # An unknown capitalised receiver that starts the expression is almost
+        # always a BCL type such as `Math` or `Array`, not an interpreter member.
+        return None
+
+    # Without type inference an instance call is only resolved when exactly one
+    # interpreter type declares a method with that name.
+    candidate_types = types_by_method.get(name, set())
+    if len(candidate_types) == 1:
+        return f"{next(iter(candidate_types))}.{name}"
+    return None
+
+
+def index_methods(
+    methods: list[MethodSymbol],
+) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
+    methods_by_type: dict[str, set[str]] = {}
+    types_by_method: dict[str, set[str]] = {}
+    for method in methods:
+        methods_by_type.setdefault(method.type_name, set()).add(method.name)
+        types_by_method.setdefault(method.name, set()).add(method.type_name)
+    return methods_by_type, types_by_method
+
+
+def build_call_graph(stripped_sources: dict[str, list[str]]) -> CallGraph:
+    extracted: list[tuple[MethodSymbol, list[CallSite]]] = []
+    for relative_path, stripped_lines in stripped_sources.items():
+        extracted.extend(extract_method_symbols(relative_path, stripped_lines))
+
+    methods_by_type, types_by_method = index_methods([method for method, _ in extracted])
+    edges: dict[str, set[str]] = {}
+    for method, calls in extracted:
+        callees = edges.setdefault(method.key, set())
+        for call_site in calls:
+            callee = resolve_call_site(call_site, method.type_name, methods_by_type, types_by_method)
+            if callee is not None and callee != method.key:
+                callees.add(callee)
+
+    return CallGraph([method for method, _ in extracted], edges)
+
+
+def find_call_graph_roots(graph: CallGraph) -> list[str]:
+    roots = {
+        method.key
+        for method in graph.methods
+        for type_name, name_pattern in CALL_GRAPH_ROOTS
+        if method.type_name == type_name and name_pattern.fullmatch(method.name)
+    }
+    return sorted(roots)
+
+
+def compute_reachable_methods(graph: CallGraph, roots: list[str]) -> dict[str, tuple[str, ...]]:
+    """Map every method reachable from `roots` to its shortest call path."""
+
+    paths: dict[str, tuple[str, ...]] = {root: (root,) for root in roots}
+    queue = deque(roots)
+    while queue:
+        caller = queue.popleft()
+        for callee in sorted(graph.edges.get(caller, ())):
+            if callee not in paths:
+                paths[callee] = paths[caller] + (callee,)
+                queue.append(callee)
+    return paths
+
+
+def collect_reachable(graph: CallGraph, entries: set[str]) -> set[str]:
+    """Return the methods reachable from `entries` without re-entering the opcode loop.
+
+    Re-entering ProcessingLoop dispatches whatever opcodes the callee runs, which the
+    scenario's own opcode set already covers.
+    """
+
+    reached = set(entries) - {OPCODE_DISPATCH_METHOD}
+    queue = deque(sorted(reached))
+    while queue:
+        caller = queue.popleft()
+        for callee in graph.edges.get(caller, ()):
+            if callee not in reached and callee != OPCODE_DISPATCH_METHOD:
+                reached.add(callee)
+                queue.append(callee)
+    return reached
+
+
+def find_opcode_dispatch(
+    graph: CallGraph,
+    stripped_sources: dict[str, list[str]],
+) -> OpcodeDispatch:
+    """Map ProcessingLoop's `case OpCode.X:` bodies to the methods they can reach.
+
+    Calls from loop code outside any case (sandbox checks, debugger hooks, unwinding)
+    mark their callees as generic: they can run whatever the scenario compiles to.
+    """
+
+    loop = next((method for method in graph.methods if method.key == OPCODE_DISPATCH_METHOD), None)
+    if loop is None or loop.path not in stripped_sources:
+        return OpcodeDispatch({}, {}, frozenset())
+
+    methods_by_type, types_by_method = index_methods(graph.methods)
+    lines = stripped_sources[loop.path]
+    case_lines: dict[int, tuple[str, ...]] = {}
+    entries_by_opcode: dict[str, set[str]] = {}
+    generic_entries: set[str] = set()
+    labels: list[str] = []
+    labels_closed = False
+    case_depth: int | None = None
+    depth = 0
+    for line_number in range(loop.start_line + 1, loop.end_line + 1):
+        code = lines[line_number - 1]
+        if case_depth is not None and depth < case_depth:
+            labels, case_depth = [], None
+
+        body_start = 0
+        case_matches = list(OPCODE_CASE_PATTERN.finditer(code))
+        if case_matches:
+            if labels_closed or case_depth != depth:
+                labels = []
+            labels.extend(match.group("name") for match in case_matches)
+            labels_closed = False
+            case_depth = depth
+            body_start = case_matches[-1].end()
+        elif case_depth == depth and SWITCH_DEFAULT_PATTERN.search(code):
+            labels, case_depth = [], None
+
+        body = code[body_start:]
+        if labels and body.strip():
+            labels_closed = True
+        if labels:
+            case_lines[line_number] = tuple(labels)
+        for call_site in find_call_sites(body):
+            callee = resolve_call_site(call_site, loop.type_name, methods_by_type, types_by_method)
+            if callee is None or callee == loop.key:
+                continue
+            if labels:
+                for opcode in labels:
+                    entries_by_opcode.setdefault(opcode, set()).add(callee)
+            else:
+                generic_entries.add(callee)
+
+        depth += code.count("{") - code.count("}")
+
+    method_opcodes: dict[str, set[str]] = {}
+    for opcode, entries in entries_by_opcode.items():
+        for method in collect_reachable(graph, entries):
+            method_opcodes.setdefault(method, set()).add(opcode)
+
+    return OpcodeDispatch(
+        case_lines,
+        {method: frozenset(opcodes) for method, opcodes in method_opcodes.items()},
+        frozenset(collect_reachable(graph, generic_entries)),
+    )
+
+
+def finding_opcodes(
+    dispatch: OpcodeDispatch,
+    method: MethodSymbol,
+    line_number: int,
+) -> tuple[str, ...] | None:
+    if method.key == OPCODE_DISPATCH_METHOD:
+        return dispatch.case_lines.get(line_number)
+    if method.key in dispatch.generic_methods:
+        return None
+
+    opcodes = dispatch.method_opcodes.get(method.key)
+    return tuple(sorted(opcodes)) if opcodes else None
+
+
+def find_enclosing_method(methods: list[MethodSymbol], line_number: int) -> MethodSymbol | None:
+    enclosing: MethodSymbol | None = None
+    for method in methods:
+        if method.start_line <= line_number <= method.end_line:
+            enclosing = method
+    return enclosing
+
+
+def analyze_reachable_files(
+    paths: list[Path],
+    consumed_allowlist: set[int],
+) -> tuple[list[Finding], list[tuple[Finding, AllowedMatch]]]:
+    sources: dict[str, tuple[list[str], list[str]]] = {}
+    for path in paths:
+        lines = read_source_lines(path)
+        if lines is not None:
+            sources[path.relative_to(REPO_ROOT).as_posix()] = (lines, strip_source_lines(lines))
+
+    return analyze_reachable_sources(sources, consumed_allowlist)
+
+
+def analyze_reachable_sources(
+    sources: dict[str, tuple[list[str], list[str]]],
+    consumed_allowlist: set[int],
+) -> tuple[list[Finding], list[tuple[Finding, AllowedMatch]]]:
+    stripped_sources = {relative_path: stripped for relative_path, (_, stripped) in sources.items()}
+    graph = build_call_graph(stripped_sources)
+    reachable = compute_reachable_methods(graph, find_call_graph_roots(graph))
+    dispatch = find_opcode_dispatch(graph, stripped_sources)
+    methods_by_path: dict[str, list[MethodSymbol]] = {}
+    for method in graph.methods:
+        methods_by_path.setdefault(method.path, []).append(method)
+
+    findings: list[Finding] = []
+    allowed_findings: list[tuple[Finding, AllowedMatch]] = []
+    for relative_path, (lines, stripped_lines) in sources.items():
+        file_findings, file_allowed = analyze_lines(
+            relative_path,
+            lines,
+            consumed_allowlist,
+            stripped_lines,
+        )
+        file_methods = methods_by_path.get(relative_path, [])
+        for finding, allowed in file_allowed:
+            method = find_enclosing_method(file_methods, finding.line_number)
+            if method is not None and method.key in reachable:
+                finding = replace(
+                    finding,
+                    call_path=reachable[method.key],
+                    opcodes=finding_opcodes(dispatch, method, finding.line_number),
+                )
+            allowed_findings.append((finding, allowed))
+        for finding in file_findings:
+            method = find_enclosing_method(file_methods, finding.line_number)
+            if method is not None and method.key in reachable:
+                findings.append(
+                    replace(
+                        finding,
+                        call_path=reachable[method.key],
+                        opcodes=finding_opcodes(dispatch, method, finding.line_number),
+                    )
+                )
+
+    return findings, allowed_findings
+
+
+def find_target_files(target_globs: list[str] | None = None) -> list[Path]:
     files: set[Path] = set()
-    for target in TARGET_FILE_GLOBS:
+    for target in target_globs if target_globs is not None else TARGET_FILE_GLOBS:
         matches = list(REPO_ROOT.glob(target))
         if matches:
             for match in matches:
@@ -882,6 +1496,8 @@ def print_report(
             )
             print(f"  symbol: {finding.symbol}")
             print(f"  code: {finding.line}")
+            if finding.call_path:
+                print(f"  call path: {' -> '.join(finding.call_path)}")
             emit_ci_annotation(finding)
 
     if detailed and allowed_findings:
@@ -916,6 +1532,38 @@ def print_report(
         )
 
 
+def finding_to_json(finding: Finding, allowed: AllowedMatch | None) -> dict[str, object]:
+    return {
+        "allowlisted": allowed is not None,
+        "callPath": list(finding.call_path),
+        "code": finding.line,
+        "line": finding.line_number,
+        "opcodes": list(finding.opcodes) if finding.opcodes is not None else None,
+        "path": finding.path,
+        "reason": allowed.reason if allowed is not None else "",
+        "ruleId": finding.rule.rule_id,
+        "symbol": finding.symbol,
+    }
+
+
+def write_allocation_sites(
+    path: Path,
+    scope: str,
+    findings: list[Finding],
+    allowed_findings: list[tuple[Finding, AllowedMatch]],
+) -> None:
+    sites = [finding_to_json(finding, None) for finding in findings]
+    sites.extend(finding_to_json(finding, allowed) for finding, allowed in allowed_findings)
+    sites.sort(key=lambda site: (site["path"], site["line"], site["ruleId"]))
+    payload = {
+        "schema": ALLOCATION_SITES_SCHEMA,
+        "scope": scope,
+        "sites": sites,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Reject new allocation patterns in VM opcode and Lua-call hot paths."
@@ -925,6 +1573,26 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print allowlisted current allocations and their reasons.",
     )
+    parser.add_argument(
+        "--scope",
+        choices=("vm", "interpreter", "reachable"),
+        default="vm",
+        help=(
+            "Files to scan: 'vm' gates the opcode loop and callback entry points (default); "
+            "'interpreter' audits every interpreter source file; 'reachable' audits interpreter "
+            "methods reachable from Processor opcode handlers and CallbackFunction.Invoke and "
+            "reports each finding with its call path."
+        ),
+    )
+    parser.add_argument(
+        "--json-output",
+        type=Path,
+        default=None,
+        help=(
+            "Also write every finding and allowlisted allocation site to this JSON path, "
+            "for render-benchmark-deltas.py --allocation-sites."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -935,15 +1603,25 @@ def main() -> int:
     allowed_findings: list[tuple[Finding, AllowedMatch]] = []
     consumed_allowlist: set[int] = set()
 
-    for path in find_target_files():
-        file_findings, file_allowed = analyze_file(path, consumed_allowlist)
-        findings.extend(file_findings)
-        allowed_findings.extend(file_allowed)
+    if args.scope == "reachable":
+        findings, allowed_findings = analyze_reachable_files(
+            find_target_files(INTERPRETER_FILE_GLOBS),
+            consumed_allowlist,
+        )
+    else:
+        target_globs = INTERPRETER_FILE_GLOBS if args.scope == "interpreter" else TARGET_FILE_GLOBS
+        for path in find_target_files(target_globs):
+            file_findings, file_allowed = analyze_file(path, consumed_allowlist)
+            findings.extend(file_findings)
+            allowed_findings.extend(file_allowed)
 
     unused_allowlist = [
         allowed for index, allowed in enumerate(ALLOWLIST) if index not in consumed_allowlist
     ]
     print_report(findings, allowed_findings, unused_allowlist, args.detailed)
+    if args.json_output is not None:
+        json_output = args.json_output if args.json_output.is_absolute() else REPO_ROOT / args.json_output
+        write_allocation_sites(json_output, args.scope, findings, allowed_findings)
     return 1 if findings or unused_allowlist else 0
 
 
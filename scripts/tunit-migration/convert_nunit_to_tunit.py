@@ -5,10 +5,16 @@ Convert NUnit assertions to TUnit assertions in C# test files.
 This script handles the migration from NUnit patterns to TUnit patterns:
 - Assert.That(x, Is.EqualTo(y)) -> await Assert.That(x).IsEqualTo(y).ConfigureAwait(false)
 - Assert.That(x, Is.Not.Null) -> await Assert.That(x).IsNotNull().ConfigureAwait(false)
+- Assert.That(d, Is.EqualTo(y).Within(tol)) -> await Assert.That(d).IsEqualTo(y).Within(tol).ConfigureAwait(false)
 - Assert.Throws<T>(() => ...) -> await Assert.That(() => ...).ThrowsException().OfType<T>().ConfigureAwait(false)
-- Assert.Multiple(() => { ... }) -> Individual assertions
+- Assert.Multiple(() => { ... }) -> using (Assert.Multiple()) { ... }
+- Assert.That(x, constraint, message) -> ....Because(message)
 - etc.
 
+Every conversion is a rule for the token-stream engine in
+tools/csharp_rewrite.py, so each file is tokenized once and all rules apply in a
+single pass; --all spreads the files across --jobs worker processes.
+
 Usage:
     python3 scripts/tunit-migration/convert_nunit_to_tunit.py <file_path>
     python3 scripts/tunit-migration/convert_nunit_to_tunit.py --all  # Process all TUnit test files
@@ -19,319 +25,116 @@ import argparse
 import re
 import sys
 from pathlib import Path
-
-
-def convert_assert_throws(line: str, indent: str) -> str:
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools"))
+
+from csharp_rewrite import Match, Rewriter, Rule, default_jobs, rewrite_file, rewrite_files  # noqa: E402
+
+AWAIT_PATTERN = re.compile(r'\bawait\b')
+USING_DIRECTIVE_PATTERN = re.compile(r'^\s*using\s+(?:static\s+)?[\w.]+(?:\s*=\s*[\w.]+)?\s*;')
+
+# NUnit constraint -> TUnit assertion method, for Assert.That(actual, <constraint>)
+ASSERT_THAT_CONSTRAINTS = [
+    ("equal-to", "Is.EqualTo($expected)", "IsEqualTo($expected)"),
+    ("not-null", "Is.Not.Null", "IsNotNull()"),
+    ("null", "Is.Null", "IsNull()"),
+    ("true", "Is.True", "IsTrue()"),
+    ("false", "Is.False", "IsFalse()"),
+    ("instance-of", "Is.InstanceOf<$type>()", "IsTypeOf<$type>()"),
+    ("empty", "Is.Empty", "IsEmpty()"),
+    ("not-empty", "Is.Not.Empty", "IsNotEmpty()"),
+    ("greater-than", "Is.GreaterThan($expected)", "IsGreaterThan($expected)"),
+    ("less-than", "Is.LessThan($expected)", "IsLessThan($expected)"),
+    ("greater-than-or-equal", "Is.GreaterThanOrEqualTo($expected)", "IsGreaterThanOrEqualTo($expected)"),
+    ("less-than-or-equal", "Is.LessThanOrEqualTo($expected)", "IsLessThanOrEqualTo($expected)"),
+    ("same-as", "Is.SameAs($expected)", "IsSameReferenceAs($expected)"),
+    ("not-same-as", "Is.Not.SameAs($expected)", "IsNotSameReferenceAs($expected)"),
+    ("count", "Has.Count.EqualTo($expected)", "HasCount().EqualTo($expected)"),
+    ("contains-item", "Contains.Item($expected)", "Contains($expected)"),
+    ("does-contain", "Does.Contain($expected)", "Contains($expected)"),
+    ("does-not-contain", "Does.Not.Contain($expected)", "DoesNotContain($expected)"),
+]
+
+
+def assert_that_rules(constraints: list[tuple[str, str, str]]) -> list[Rule]:
     """
-    Convert Assert.Throws<ExceptionType>(() => expression) patterns.
-    
-    Patterns:
-    - ExceptionType var = Assert.Throws<ExceptionType>(() => expr);
-    - Assert.Throws<ExceptionType>(() => expr);
-    - _ = Assert.Throws<ExceptionType>(() => expr);
+    Build Assert.That rules for each (name, NUnit constraint, TUnit method) entry.
+
+    Trailing constraint modifiers such as .Within($tolerance) carry over to the
+    TUnit assertion, and a trailing assertion message becomes a TUnit
+    .Because($message) clause.
     """
-    # Pattern 1: Type exception = Assert.Throws<Type>(() => ...);
-    match = re.match(
-        r'^(\s*)(\w+)\s+(\w+)\s*=\s*Assert\.Throws<(\w+)>\(\s*\(\)\s*=>\s*$',
-        line
-    )
-    if match:
-        var_type = match.group(2)
-        var_name = match.group(3)
-        exc_type = match.group(4)
-        return f"{indent}{var_type} {var_name} = await Assert.That(() =>\n"
-    
-    # Pattern 2: Type exception = Assert.Throws<Type>(() => { ... }); on single line
-    match = re.match(
-        r'^(\s*)(\w+)\s+(\w+)\s*=\s*Assert\.Throws<(\w+)>\(\s*\(\)\s*=>\s*(.+)\s*\);\s*$',
-        line
-    )
-    if match:
-        var_type = match.group(2)
-        var_name = match.group(3)
-        exc_type = match.group(4)
-        expr = match.group(5).strip()
-        return f"{indent}{var_type} {var_name} = await Assert.That(() => {expr}).ThrowsException().OfType<{exc_type}>().ConfigureAwait(false);\n"
-    
-    # Pattern 3: Assert.Throws<Type>(() => expr); standalone
-    match = re.match(
-        r'^(\s*)Assert\.Throws<(\w+)>\(\s*\(\)\s*=>\s*(.+)\s*\);\s*$',
-        line
-    )
-    if match:
-        exc_type = match.group(2)
-        expr = match.group(3).strip()
-        return f"{indent}await Assert.That(() => {expr}).ThrowsException().OfType<{exc_type}>().ConfigureAwait(false);\n"
-    
-    # Pattern 4: _ = Assert.Throws<Type>(() => ...);
-    match = re.match(
-        r'^(\s*)_\s*=\s*Assert\.Throws<(\w+)>\(\s*\(\)\s*=>\s*(.+)\s*\);\s*$',
-        line
-    )
-    if match:
-        exc_type = match.group(2)
-        expr = match.group(3).strip()
-        return f"{indent}await Assert.That(() => {expr}).ThrowsException().OfType<{exc_type}>().ConfigureAwait(false);\n"
-    
-    return None
+    rules = []
+    for name, constraint, method in constraints:
+        rules.append(
+            Rule(
+                f"assert-that-{name}",
+                f"Assert.That($actual, {constraint}$modifiers:chain);",
+                f"await Assert.That($actual).{method}$modifiers.ConfigureAwait(false);",
+            )
+        )
+        rules.append(
+            Rule(
+                f"assert-that-{name}-message",
+                f"Assert.That($actual, {constraint}$modifiers:chain, $message);",
+                f"await Assert.That($actual).{method}$modifiers.Because($message).ConfigureAwait(false);",
+            )
+        )
+    return rules
 
 
-def convert_assert_that_simple(line: str) -> str:
-    """
-    Convert simple Assert.That(x, Is.Y) patterns to TUnit style.
-    """
-    indent_match = re.match(r'^(\s*)', line)
-    indent = indent_match.group(1) if indent_match else ""
-    
-    # Is.EqualTo patterns
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.EqualTo\((.+)\)\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        expected = match.group(3).strip()
-        return f"{indent}await Assert.That({actual}).IsEqualTo({expected}).ConfigureAwait(false);\n"
-    
-    # Is.EqualTo with message
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.EqualTo\((.+)\),\s*(.+)\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        expected = match.group(3).strip()
-        # TUnit doesn't have .WithMessage() - just use comment or drop
-        return f"{indent}await Assert.That({actual}).IsEqualTo({expected}).ConfigureAwait(false);\n"
-    
-    # Is.Not.Null
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.Not\.Null\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        return f"{indent}await Assert.That({actual}).IsNotNull().ConfigureAwait(false);\n"
-    
-    # Is.Null
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.Null\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        return f"{indent}await Assert.That({actual}).IsNull().ConfigureAwait(false);\n"
-    
-    # Is.True
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.True\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        return f"{indent}await Assert.That({actual}).IsTrue().ConfigureAwait(false);\n"
-    
-    # Is.False
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.False(,\s*.+)?\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        return f"{indent}await Assert.That({actual}).IsFalse().ConfigureAwait(false);\n"
-    
-    # Is.InstanceOf<T>()
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.InstanceOf<(.+)>\(\)\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        expected_type = match.group(3).strip()
-        return f"{indent}await Assert.That({actual}).IsTypeOf<{expected_type}>().ConfigureAwait(false);\n"
-    
-    # Is.Empty
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.Empty\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        return f"{indent}await Assert.That({actual}).IsEmpty().ConfigureAwait(false);\n"
-    
-    # Is.Not.Empty
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.Not\.Empty\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        return f"{indent}await Assert.That({actual}).IsNotEmpty().ConfigureAwait(false);\n"
-    
-    # Is.GreaterThan
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.GreaterThan\((.+)\)\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        expected = match.group(3).strip()
-        return f"{indent}await Assert.That({actual}).IsGreaterThan({expected}).ConfigureAwait(false);\n"
-    
-    # Is.LessThan
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.LessThan\((.+)\)\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        expected = match.group(3).strip()
-        return f"{indent}await Assert.That({actual}).IsLessThan({expected}).ConfigureAwait(false);\n"
-    
-    # Is.GreaterThanOrEqualTo
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.GreaterThanOrEqualTo\((.+)\)\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        expected = match.group(3).strip()
-        return f"{indent}await Assert.That({actual}).IsGreaterThanOrEqualTo({expected}).ConfigureAwait(false);\n"
-    
-    # Is.LessThanOrEqualTo
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.LessThanOrEqualTo\((.+)\)\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        expected = match.group(3).strip()
-        return f"{indent}await Assert.That({actual}).IsLessThanOrEqualTo({expected}).ConfigureAwait(false);\n"
-    
-    # Is.SameAs
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.SameAs\((.+)\)\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        expected = match.group(3).strip()
-        return f"{indent}await Assert.That({actual}).IsSameReferenceAs({expected}).ConfigureAwait(false);\n"
-    
-    # Is.Not.SameAs
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Is\.Not\.SameAs\((.+)\)\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        expected = match.group(3).strip()
-        return f"{indent}await Assert.That({actual}).IsNotSameReferenceAs({expected}).ConfigureAwait(false);\n"
-    
-    # Has.Count.EqualTo
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Has\.Count\.EqualTo\((.+)\)\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        expected = match.group(3).strip()
-        return f"{indent}await Assert.That({actual}).HasCount().EqualTo({expected}).ConfigureAwait(false);\n"
-    
-    # Contains.Item
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Contains\.Item\((.+)\)\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        expected = match.group(3).strip()
-        return f"{indent}await Assert.That({actual}).Contains({expected}).ConfigureAwait(false);\n"
-    
-    # Does.Contain
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Does\.Contain\((.+)\)\);\s*$',
-        line
-    )
-    if match:
-        actual = match.group(2).strip()
-        expected = match.group(3).strip()
-        return f"{indent}await Assert.That({actual}).Contains({expected}).ConfigureAwait(false);\n"
-    
-    # Does.Not.Contain
-    match = re.match(
-        r'^(\s*)Assert\.That\((.+),\s*Does\.Not\.Contain\((.+)\)\);\s*$',
-        line
+def make_async_if_awaiting(match: Match) -> Optional[str]:
+    """Turn `public void Name()` into `public async Task Name()` when its body awaits."""
+    if not AWAIT_PATTERN.search(match["body"]):
+        return None
+    return match.original().replace("void", "async Task", 1)
+
+
+# The converted assertions await, which a plain Assert.Multiple(() => { ... }) lambda
+# cannot; TUnit's scope form keeps the assertions grouped. Shared by the other converters.
+ASSERT_MULTIPLE_RULE = Rule(
+    "assert-multiple",
+    "Assert.Multiple(() => $body:block);",
+    "using (Assert.Multiple())\n$indent$body",
+)
+
+
+# Converts void test methods that (after conversion) contain await; shared by the
+# other converters in this folder.
+ASYNC_TEST_METHOD_RULE = Rule("async-test-method", "public void $name:ident() $body:block", make_async_if_awaiting)
+
+
+def convert_assert_throws(match: Match) -> str:
+    """Assert.Throws<T>(() => expr); -> await Assert.That(() => expr).ThrowsException().OfType<T>()..."""
+    # Keep a multiline lambda body on its own lines, as it was written.
+    separator = match.leading("expr") if "\n" in match.leading("expr") else " "
+    return (
+        f"await Assert.That(() =>{separator}{match['expr']})"
+        f".ThrowsException().OfType<{match['exception']}>().ConfigureAwait(false);"
     )
-    if match:
-        actual = match.group(2).strip()
-        expected = match.group(3).strip()
-        return f"{indent}await Assert.That({actual}).DoesNotContain({expected}).ConfigureAwait(false);\n"
-    
-    return None
 
 
-def make_method_async(content: str) -> str:
-    """
-    Make void test methods async Task if they contain await.
-    """
-    # Find methods that need to be async
-    # Pattern: public void MethodName()
-    def replace_method(match):
-        indent = match.group(1)
-        name = match.group(2)
-        return f"{indent}public async Task {name}()"
-    
-    # Only replace if method contains await
-    lines = content.split('\n')
-    result = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        # Check for method signature
-        method_match = re.match(r'^(\s*)public\s+void\s+(\w+)\s*\(\s*\)\s*$', line)
-        if method_match:
-            # Look ahead to see if method body contains 'await'
-            brace_count = 0
-            has_await = False
-            method_lines = [line]
-            j = i + 1
-            found_open = False
-            while j < len(lines):
-                method_lines.append(lines[j])
-                if '{' in lines[j]:
-                    brace_count += lines[j].count('{')
-                    found_open = True
-                if '}' in lines[j]:
-                    brace_count -= lines[j].count('}')
-                if 'await ' in lines[j]:
-                    has_await = True
-                if found_open and brace_count == 0:
-                    break
-                j += 1
-            
-            if has_await:
-                # Convert to async Task
-                result.append(re.sub(
-                    r'^(\s*)public\s+void\s+(\w+)\s*\(\s*\)',
-                    r'\1public async Task \2()',
-                    line
-                ))
-            else:
-                result.append(line)
-            i += 1
-        else:
-            result.append(line)
-            i += 1
-    
-    return '\n'.join(result)
+def convert_assert_throws_assignment(match: Match) -> str:
+    """T exception = Assert.Throws<T>(() => expr); keeps the declaration."""
+    return f"{match['type']} {match['variable']} = {convert_assert_throws(match)}"
 
 
-def remove_nunit_using(content: str) -> str:
-    """Remove the 'using NUnit.Framework;' line."""
-    lines = content.split('\n')
-    result = [line for line in lines if not re.match(r'^\s*using\s+NUnit\.Framework\s*;\s*$', line)]
-    return '\n'.join(result)
+RULES = [
+    Rule("remove-nunit-using", "using NUnit.Framework;", ""),
+    # _ = Assert.Throws<T>(() => expr);
+    Rule("assert-throws-discard", "_ = Assert.Throws<$exception>(() => $expr);", convert_assert_throws),
+    # T exception = Assert.Throws<T>(() => expr);
+    Rule(
+        "assert-throws-assignment",
+        "$type:ident $variable:ident = Assert.Throws<$exception>(() => $expr);",
+        convert_assert_throws_assignment,
+    ),
+    Rule("assert-throws", "Assert.Throws<$exception>(() => $expr);", convert_assert_throws),
+    *assert_that_rules(ASSERT_THAT_CONSTRAINTS),
+    ASSERT_MULTIPLE_RULE,
+    ASYNC_TEST_METHOD_RULE,
+]
 
 
 def add_system_threading_tasks_using(content: str) -> str:
@@ -341,129 +144,34 @@ def add_system_threading_tasks_using(content: str) -> str:
         lines = content.split('\n')
         last_using_idx = -1
         for i, line in enumerate(lines):
-            if re.match(r'^\s*using\s+', line):
+            # A using directive, not a using statement such as using (Assert.Multiple())
+            if USING_DIRECTIVE_PATTERN.match(line):
                 last_using_idx = i
-        
+
         if last_using_idx >= 0:
             lines.insert(last_using_idx + 1, '    using System.Threading.Tasks;')
-        
+
         return '\n'.join(lines)
     return content
 
 
+REWRITER = Rewriter(RULES, finalize=add_system_threading_tasks_using)
+
+
 def process_file(file_path: Path, dry_run: bool = False) -> tuple[bool, str]:
     """
     Process a single file and convert NUnit assertions to TUnit.
     Returns (changed, new_content).
     """
-    content = file_path.read_text(encoding='utf-8')
-    original = content
-    
-    # Process line by line for simple conversions
-    lines = content.split('\n')
-    new_lines = []
-    
-    in_multiline_throws = False
-    multiline_buffer = []
-    throws_var_type = None
-    throws_var_name = None
-    throws_exc_type = None
-    
-    for i, line in enumerate(lines):
-        indent_match = re.match(r'^(\s*)', line)
-        indent = indent_match.group(1) if indent_match else ""
-        
-        # Handle multiline Assert.Throws
-        if in_multiline_throws:
-            multiline_buffer.append(line)
-            if ').' in line or ');' in line:
-                # End of multiline throws - check if it ends with .ConfigureAwait or not
-                full_expr = '\n'.join(multiline_buffer)
-                
-                # Check if it's a closing with additional assertions like .With.Message
-                if '.ConfigureAwait(false);' not in full_expr:
-                    # Find the expression content
-                    expr_match = re.search(r'\(\)\s*=>\s*\n?\s*\{?([\s\S]*?)\}?\s*\)', full_expr, re.MULTILINE)
-                    if expr_match:
-                        expr = expr_match.group(1).strip()
-                        # Reconstruct as TUnit
-                        if throws_var_name:
-                            new_lines.append(f"{indent}{throws_var_type} {throws_var_name} = await Assert.That(() =>\n")
-                            for buf_line in multiline_buffer[:-1]:
-                                new_lines.append(buf_line)
-                            # Replace the closing
-                            closing = multiline_buffer[-1]
-                            closing = re.sub(
-                                r'\)\s*;',
-                                f').ThrowsException().OfType<{throws_exc_type}>().ConfigureAwait(false);',
-                                closing
-                            )
-                            new_lines.append(closing)
-                        else:
-                            new_lines.extend(multiline_buffer)
-                    else:
-                        new_lines.extend(multiline_buffer)
-                else:
-                    new_lines.extend(multiline_buffer)
-                
-                in_multiline_throws = False
-                multiline_buffer = []
-                throws_var_type = None
-                throws_var_name = None
-                throws_exc_type = None
-                continue
-            continue
-        
-        # Check for start of multiline Assert.Throws
-        match = re.match(
-            r'^(\s*)(\w+)\s+(\w+)\s*=\s*Assert\.Throws<(\w+)>\(\s*\(\)\s*=>\s*$',
-            line
-        )
-        if match:
-            in_multiline_throws = True
-            throws_var_type = match.group(2)
-            throws_var_name = match.group(3)
-            throws_exc_type = match.group(4)
-            # Start the TUnit pattern
-            new_lines.append(f"{indent}{throws_var_type} {throws_var_name} = await Assert.That(() =>\n")
-            continue
-        
-        # Try simple Assert.Throws conversion (single line)
-        throws_result = convert_assert_throws(line, indent)
-        if throws_result:
-            new_lines.append(throws_result.rstrip('\n'))
-            continue
-        
-        # Try simple Assert.That conversions
-        that_result = convert_assert_that_simple(line)
-        if that_result:
-            new_lines.append(that_result.rstrip('\n'))
-            continue
-        
-        new_lines.append(line)
-    
-    content = '\n'.join(new_lines)
-    
-    # Make methods async if they contain await
-    content = make_method_async(content)
-    
-    # Remove NUnit using
-    content = remove_nunit_using(content)
-    
-    # Add System.Threading.Tasks using if needed
-    content = add_system_threading_tasks_using(content)
-    
-    changed = content != original
-    
-    if changed and not dry_run:
-        file_path.write_text(content, encoding='utf-8')
-    
-    return changed, content
+    result = rewrite_file(file_path, REWRITER, write=not dry_run)
+    if result.error:
+        raise OSError(result.error)
+    return result.changed, result.text
 
 
 def find_test_files(base_path: Path) -> list[Path]:
     """Find all TUnit test files."""
-    return list(base_path.glob('**/*TUnitTests.cs'))
+    return sorted(base_path.glob('**/*TUnitTests.cs'))
 
 
 def main():
@@ -472,29 +180,37 @@ def main():
     parser.add_argument('--all', action='store_true', help='Process all TUnit test files')
     parser.add_argument('--dry-run', action='store_true', help='Show changes without writing')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
-    
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=default_jobs(),
+        help='Worker processes used with --all (default: CPU count)',
+    )
+
     args = parser.parse_args()
-    
+
     if args.all:
         base_path = Path(__file__).parent.parent.parent / 'src' / 'tests' / 'WallstopStudios.NovaSharp.Interpreter.Tests.TUnit'
         files = find_test_files(base_path)
         print(f"Found {len(files)} test files")
-        
+
+        results = rewrite_files(files, REWRITER, write=not args.dry_run, jobs=args.jobs)
         changed_count = 0
-        for f in files:
-            changed, _ = process_file(f, args.dry_run)
-            if changed:
+        for result in results:
+            if result.error:
+                print(f"  Error: {result.path.name}: {result.error}")
+            elif result.changed:
                 changed_count += 1
                 if args.verbose:
-                    print(f"  Changed: {f.name}")
-        
+                    print(f"  Changed: {result.path.name}")
+
         print(f"Modified {changed_count} files" + (" (dry run)" if args.dry_run else ""))
     elif args.file:
         file_path = Path(args.file)
         if not file_path.exists():
             print(f"File not found: {file_path}")
             sys.exit(1)
-        
+
         changed, content = process_file(file_path, args.dry_run)
         if args.dry_run:
             print(content)
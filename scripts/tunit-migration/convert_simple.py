@@ -7,157 +7,76 @@ This script handles the migration from NUnit patterns to TUnit patterns:
 - Assert.That(x, Is.Not.Null) -> await Assert.That(x).IsNotNull().ConfigureAwait(false)
 - Assert.Throws<T>(() => ...) -> await Assert.That(() => ...).Throws<T>().ConfigureAwait(false)
 - Preserves void for methods without await
+
+The conversions are rules for the token-stream engine in
+tools/csharp_rewrite.py and apply in one pass per file; several files are
+converted in parallel (--jobs).
 """
 
-import re
+import argparse
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools"))
+
+from convert_nunit_to_tunit import ASYNC_TEST_METHOD_RULE, assert_that_rules  # noqa: E402
+from csharp_rewrite import Rewriter, Rule, default_jobs, rewrite_file, rewrite_files  # noqa: E402
+
+RULES = [
+    Rule("nunit-using", "using NUnit.Framework;", "using System.Threading.Tasks;"),
+    *assert_that_rules([
+        ("equal-to", "Is.EqualTo($expected)", "IsEqualTo($expected)"),
+        ("true", "Is.True", "IsTrue()"),
+        ("false", "Is.False", "IsFalse()"),
+        ("not-null", "Is.Not.Null", "IsNotNull()"),
+        ("null", "Is.Null", "IsNull()"),
+        ("instance-of", "Is.InstanceOf<$type>()", "IsTypeOf<$type>()"),
+    ]),
+    Rule(
+        "assert-throws",
+        "Assert.Throws<$exception>(() => $expr);",
+        "await Assert.That(() => $expr).Throws<$exception>().ConfigureAwait(false);",
+    ),
+    # Assert.Fail(); -> Assert.Fail("reason");
+    Rule("assert-fail", "Assert.Fail();", 'Assert.Fail("Forced failure");'),
+    ASYNC_TEST_METHOD_RULE,
+]
+
+REWRITER = Rewriter(RULES)
+
 
 def convert_file(file_path: Path) -> str:
     """Convert a file from NUnit to TUnit assertions."""
-    content = file_path.read_text(encoding='utf-8')
-    
-    # Remove NUnit using and add System.Threading.Tasks
-    content = re.sub(r'using\s+NUnit\.Framework;\s*\n', 'using System.Threading.Tasks;\n', content)
-    
-    # Track which method bodies contain await (after conversion)
-    # We'll do the conversion first, then adjust method signatures
-    
-    # Convert Assert.That(x, Is.EqualTo(y)); - simple case
-    content = re.sub(
-        r'Assert\.That\(([^,]+),\s*Is\.EqualTo\(([^)]+)\)\);',
-        r'await Assert.That(\1).IsEqualTo(\2).ConfigureAwait(false);',
-        content
-    )
-    
-    # Convert Assert.That(x, Is.EqualTo(y), "message"); - with message
-    content = re.sub(
-        r'Assert\.That\(([^,]+),\s*Is\.EqualTo\(([^)]+)\),\s*"[^"]*"\);',
-        r'await Assert.That(\1).IsEqualTo(\2).ConfigureAwait(false);',
-        content
-    )
-    
-    # Convert Assert.That(x, Is.True);
-    content = re.sub(
-        r'Assert\.That\(([^,]+),\s*Is\.True\);',
-        r'await Assert.That(\1).IsTrue().ConfigureAwait(false);',
-        content
-    )
-    
-    # Convert Assert.That(x, Is.False); or with message
-    content = re.sub(
-        r'Assert\.That\(([^,]+),\s*Is\.False(?:,\s*[^)]+)?\);',
-        r'await Assert.That(\1).IsFalse().ConfigureAwait(false);',
-        content
-    )
-    
-    # Convert Assert.That(x, Is.Not.Null);
-    content = re.sub(
-        r'Assert\.That\(([^,]+),\s*Is\.Not\.Null\);',
-        r'await Assert.That(\1).IsNotNull().ConfigureAwait(false);',
-        content
-    )
-    
-    # Convert Assert.That(x, Is.Null);
-    content = re.sub(
-        r'Assert\.That\(([^,]+),\s*Is\.Null\);',
-        r'await Assert.That(\1).IsNull().ConfigureAwait(false);',
-        content
-    )
-    
-    # Convert Assert.That(x, Is.InstanceOf<T>());
-    content = re.sub(
-        r'Assert\.That\(([^,]+),\s*Is\.InstanceOf<([^>]+)>\(\)\);',
-        r'await Assert.That(\1).IsTypeOf<\2>().ConfigureAwait(false);',
-        content
-    )
-    
-    # Convert simple Assert.Throws<T>(() => expr); (single line)
-    content = re.sub(
-        r'Assert\.Throws<([^>]+)>\(\s*\(\)\s*=>\s*([^)]+\([^)]*\))\);',
-        r'await Assert.That(() => \2).Throws<\1>().ConfigureAwait(false);',
-        content
-    )
-    
-    # Convert Assert.Fail(); -> Assert.Fail("reason");
-    content = re.sub(
-        r'Assert\.Fail\(\);',
-        r'Assert.Fail("Forced failure");',
-        content
-    )
-    
-    # Now handle method signatures - find methods with await and make them async Task
-    # Parse method by method
-    lines = content.split('\n')
-    result_lines = []
-    i = 0
-    
-    while i < len(lines):
-        line = lines[i]
-        
-        # Check for test method signature: public void MethodName()
-        match = re.match(r'^(\s*)public\s+void\s+(\w+)\s*\(\s*\)\s*$', line)
-        if match:
-            indent = match.group(1)
-            method_name = match.group(2)
-            
-            # Collect entire method body
-            method_lines = [line]
-            brace_count = 0
-            j = i + 1
-            found_open = False
-            
-            while j < len(lines):
-                method_lines.append(lines[j])
-                if '{' in lines[j]:
-                    brace_count += lines[j].count('{')
-                    found_open = True
-                if '}' in lines[j]:
-                    brace_count -= lines[j].count('}')
-                if found_open and brace_count == 0:
-                    break
-                j += 1
-            
-            # Check if method body contains 'await '
-            method_body = '\n'.join(method_lines)
-            has_await = 'await ' in method_body
-            
-            if has_await:
-                # Convert to async Task
-                result_lines.append(f'{indent}public async Task {method_name}()')
-            else:
-                result_lines.append(line)
-            
-            # Add remaining method lines
-            for k in range(1, len(method_lines)):
-                result_lines.append(method_lines[k])
-            
-            i = j + 1
-        else:
-            result_lines.append(line)
-            i += 1
-    
-    return '\n'.join(result_lines)
+    result = rewrite_file(file_path, REWRITER)
+    if result.error:
+        raise OSError(result.error)
+    return result.text
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python convert_simple.py <file_path>")
-        sys.exit(1)
-    
-    file_path = Path(sys.argv[1])
-    if not file_path.exists():
-        print(f"File not found: {file_path}")
+    parser = argparse.ArgumentParser(description='Convert simple NUnit assertions to TUnit')
+    parser.add_argument('files', nargs='+', type=Path, help='Files to convert')
+    parser.add_argument('--dry-run', action='store_true', help='Print the converted files instead of writing them')
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=default_jobs(),
+        help='Worker processes (default: CPU count)',
+    )
+    args = parser.parse_args()
+
+    missing = [path for path in args.files if not path.exists()]
+    if missing:
+        print(f"File not found: {missing[0]}")
         sys.exit(1)
-    
-    result = convert_file(file_path)
-    
-    if len(sys.argv) > 2 and sys.argv[2] == '--dry-run':
-        print(result)
-    else:
-        file_path.write_text(result, encoding='utf-8')
-        print(f"Converted: {file_path}")
+
+    for result in rewrite_files(args.files, REWRITER, write=not args.dry_run, jobs=args.jobs):
+        if result.error:
+            print(f"{result.path}: {result.error}")
+        elif args.dry_run:
+            print(result.text)
+        else:
+            print(f"Converted: {result.path}")
 
 
 if __name__ == '__main__':
@@ -5,12 +5,20 @@ namespace WallstopStudios.NovaSharp.Benchmarks
     using System.Collections.Generic;
     using System.Diagnostics;
     using System.Diagnostics.CodeAnalysis;
+    using System.IO;
+    using System.Text.Json;
     using global::NovaSharp;
     using BenchmarkDotNet.Attributes;
 
     /// <summary>
     /// Retention-oriented probes for Phase A0.5 memory lifecycle work.
     /// </summary>
+    /// <remarks>
+    /// BenchmarkDotNet reports carry timing and allocation columns only, so the engine trim
+    /// diagnostics are written to <c>&lt;Method&gt;.json</c> files in the directory named by
+    /// <c>NOVASHARP_MEMORY_RETENTION_DIAGNOSTICS_DIR</c>. render-benchmark-deltas.py gates
+    /// those files against the Phase A0.5 baseline.
+    /// </remarks>
     [MemoryDiagnoser]
     [SuppressMessage(
         "Usage",
@@ -25,45 +33,95 @@ namespace WallstopStudios.NovaSharp.Benchmarks
         private const int CompileParseStackLength = 256;
         private const int VmValueStackLength = 128;
         private const int VmFrameStackLength = 64;
+        private const string DiagnosticsDirectoryVariable =
+            "NOVASHARP_MEMORY_RETENTION_DIAGNOSTICS_DIR";
+        private const string DiagnosticsSchema = "novasharp.memory-retention-diagnostics.v1";
         private static readonly object VmSentinel = new();
         private readonly ScratchBufferPool<byte> _compileTokenPool = new();
         private readonly ScratchBufferPool<int> _compileParseStackPool = new();
         private readonly ScratchBufferPool<object> _vmValueStackPool = new();
         private readonly ScratchBufferPool<int> _vmFrameStackPool = new();
+        private string _diagnosticsMethod;
+        private LuaMemoryStatistics _diagnosticsAfterCriticalTrim;
 
         /// <summary>
-        /// Compiles many unique chunks, clears reclaimable cache entries, and reports retained bytes.
+        /// Writes the last critical-trim diagnostics of this benchmark case, when requested.
         /// </summary>
-        [Benchmark]
-        [SuppressMessage(
-            "Performance",
-            "CA1822:Mark members as static",
-            Justification = "BenchmarkDotNet discovers instance benchmark methods."
-        )]
-        public long CompilationBurstAfterCriticalTrimRetainedBytes()
+        /// <remarks>
+        /// Private bytes and working set are read here rather than per operation so the measured
+        /// benchmark body stays unchanged; they are report-only diagnostics.
+        /// </remarks>
+        [GlobalCleanup]
+        public void WriteDiagnosticsAfterCriticalTrim()
         {
-            using LuaEngine engine = LuaEngine.Create(
-                new LuaEngineOptions { EnableScriptCaching = true, ScriptCacheMaxEntries = 8 }
+            string directory = Environment.GetEnvironmentVariable(DiagnosticsDirectoryVariable);
+            if (string.IsNullOrWhiteSpace(directory) || _diagnosticsMethod == null)
+            {
+                return;
+            }
+
+            LuaMemoryStatistics statistics = _diagnosticsAfterCriticalTrim;
+            using Process process = Process.GetCurrentProcess();
+            Directory.CreateDirectory(directory);
+            using FileStream stream = File.Create(
+                Path.Combine(directory, _diagnosticsMethod + ".json")
             );
+            using Utf8JsonWriter writer = new(stream, new JsonWriterOptions { Indented = true });
+            writer.WriteStartObject();
+            writer.WriteString("schema", DiagnosticsSchema);
+            writer.WriteString("method", _diagnosticsMethod);
+            writer.WriteStartObject("diagnosticsAfterCriticalTrim");
+            writer.WriteNumber("retainedPoolCount", statistics.RetainedPoolCount);
+            writer.WriteNumber("estimatedRetainedBytes", statistics.EstimatedRetainedBytes);
+            writer.WriteNumber("peakRetainedBytes", statistics.PeakRetainedBytes);
+            writer.WriteNumber("trimCount", statistics.TrimCount);
+            writer.WriteNumber("droppedCount", statistics.DroppedCount);
+            writer.WriteNumber("compilationCacheEntryCount", statistics.CompilationCacheEntryCount);
+            writer.WriteNumber("privateBytes", process.PrivateMemorySize64);
+            writer.WriteNumber("workingSetBytes", process.WorkingSet64);
+            writer.WriteEndObject();
+            writer.WriteEndObject();
+        }
 
-            for (int i = 0; i < BurstCount; i++)
+        /// <summary>
+        /// Replays a compile burst after the working-set benchmark and writes its diagnostics.
+        /// </summary>
+        /// <remarks>
+        /// The measured body trims and reads the working set but never reads the engine
+        /// statistics, so the statistics read happens on a replayed engine here, outside the
+        /// measurement.
+        /// </remarks>
+        [GlobalCleanup(Target = nameof(CompilationBurstWorkingSetBytes))]
+        public void WriteCompilationBurstWorkingSetDiagnostics()
+        {
+            string directory = Environment.GetEnvironmentVariable(DiagnosticsDirectoryVariable);
+            if (string.IsNullOrWhiteSpace(directory))
             {
-                engine.Run(CreateReturnChunk(i), CreateChunkName(i));
+                return;
             }
 
-            engine.TrimMemory(LuaMemoryTrimLevel.Critical);
-            return engine.GetMemoryStatistics().EstimatedRetainedBytes;
+            using LuaEngine engine = RunCompilationBurst();
+            RecordDiagnosticsAfterCriticalTrim(engine, nameof(CompilationBurstWorkingSetBytes));
+            WriteDiagnosticsAfterCriticalTrim();
+        }
+
+        /// <summary>
+        /// Compiles many unique chunks, clears reclaimable cache entries, and reports retained bytes.
+        /// </summary>
+        [Benchmark]
+        public long CompilationBurstAfterCriticalTrimRetainedBytes()
+        {
+            using LuaEngine engine = RunCompilationBurst();
+            return RecordDiagnosticsAfterCriticalTrim(
+                engine,
+                nameof(CompilationBurstAfterCriticalTrimRetainedBytes)
+            );
         }
 
         /// <summary>
         /// Exercises small argument array paths through the public callback facade.
         /// </summary>
         [Benchmark]
-        [SuppressMessage(
-            "Performance",
-            "CA1822:Mark members as static",
-            Justification = "BenchmarkDotNet discovers instance benchmark methods."
-        )]
         public long CallbackBurstAfterCriticalTrimRetainedBytes()
         {
             using LuaEngine engine = LuaEngine.Create();
@@ -87,8 +145,10 @@ namespace WallstopStudios.NovaSharp.Benchmarks
                 engine.Run("return sum(1, 2, 3, 4, 5, 6, 7, 8)", "callback_burst.lua");
             }
 
-            engine.TrimMemory(LuaMemoryTrimLevel.Critical);
-            return engine.GetMemoryStatistics().EstimatedRetainedBytes;
+            return RecordDiagnosticsAfterCriticalTrim(
+                engine,
+                nameof(CallbackBurstAfterCriticalTrimRetainedBytes)
+            );
         }
 
         /// <summary>
@@ -102,15 +162,7 @@ namespace WallstopStudios.NovaSharp.Benchmarks
         )]
         public long CompilationBurstWorkingSetBytes()
         {
-            using LuaEngine engine = LuaEngine.Create(
-                new LuaEngineOptions { EnableScriptCaching = true, ScriptCacheMaxEntries = 8 }
-            );
-
-            for (int i = 0; i < BurstCount; i++)
-            {
-                engine.Run(CreateReturnChunk(i), CreateChunkName(i));
-            }
-
+            using LuaEngine engine = RunCompilationBurst();
             engine.TrimMemory(LuaMemoryTrimLevel.Critical);
             using Process process = Process.GetCurrentProcess();
             return process.WorkingSet64;
@@ -276,6 +328,37 @@ namespace WallstopStudios.NovaSharp.Benchmarks
             return checksum;
         }
 
+        private long RecordDiagnosticsAfterCriticalTrim(LuaEngine engine, string method)
+        {
+            engine.TrimMemory(LuaMemoryTrimLevel.Critical);
+            LuaMemoryStatistics statistics = engine.GetMemoryStatistics();
+            _diagnosticsMethod = method;
+            _diagnosticsAfterCriticalTrim = statistics;
+            return statistics.EstimatedRetainedBytes;
+        }
+
+        private static LuaEngine RunCompilationBurst()
+        {
+            LuaEngine engine = LuaEngine.Create(
+                new LuaEngineOptions { EnableScriptCaching = true, ScriptCacheMaxEntries = 8 }
+            );
+
+            try
+            {
+                for (int i = 0; i < BurstCount; i++)
+                {
+                    engine.Run(CreateReturnChunk(i), CreateChunkName(i));
+                }
+            }
+            catch
+            {
+                engine.Dispose();
+                throw;
+            }
+
+            return engine;
+        }
+
         private static string CreateReturnChunk(int value)
         {
             return string.Concat(
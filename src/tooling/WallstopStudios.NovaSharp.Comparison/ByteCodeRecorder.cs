@@ -0,0 +1,79 @@
+namespace WallstopStudios.NovaSharp.Comparison
+{
+    using System;
+    using System.Collections.Generic;
+    using WallstopStudios.NovaSharp.Interpreter.Debugging;
+    using WallstopStudios.NovaSharp.Interpreter.Errors;
+    using WallstopStudios.NovaSharp.Interpreter.Execution;
+
+    /// <summary>
+    /// Debugger that only records the disassembled bytecode a script publishes after compiling.
+    /// </summary>
+    /// <remarks>
+    /// Scenario export uses it to list the opcodes each benchmark scenario compiles to, so
+    /// render-benchmark-deltas.py can tell which VM allocation sites a scenario can reach.
+    /// It never pauses or steps, and the recorded script is only compiled, never executed.
+    /// </remarks>
+    internal sealed class ByteCodeRecorder : IDebugger
+    {
+        private string[] _byteCode = Array.Empty<string>();
+
+        /// <summary>
+        /// Gets the upper-case names of the distinct opcodes in the last published bytecode.
+        /// </summary>
+        public SortedSet<string> GetOpCodeNames()
+        {
+            SortedSet<string> names = new(StringComparer.Ordinal);
+            foreach (string instruction in _byteCode)
+            {
+                string trimmed = instruction.TrimStart();
+                int end = trimmed.IndexOf(' ', StringComparison.Ordinal);
+                string name = end < 0 ? trimmed : trimmed.Substring(0, end);
+                if (name.Length > 0)
+                {
+                    names.Add(name);
+                }
+            }
+
+            return names;
+        }
+
+        /// <inheritdoc />
+        public DebuggerCaps GetDebuggerCaps() => DebuggerCaps.CanDebugByteCode;
+
+        /// <inheritdoc />
+        public void SetDebugService(DebugService debugService) { }
+
+        /// <inheritdoc />
+        public void SetSourceCode(SourceCode sourceCode) { }
+
+        /// <inheritdoc />
+        public void SetByteCode(string[] byteCode)
+        {
+            _byteCode = byteCode ?? Array.Empty<string>();
+        }
+
+        /// <inheritdoc />
+        public bool IsPauseRequested() => false;
+
+        /// <inheritdoc />
+        public bool SignalRuntimeException(ScriptRuntimeException ex) => false;
+
+        /// <inheritdoc />
+        public DebuggerAction GetAction(int ip, SourceRef sourceref) =>
+            new() { Action = DebuggerAction.ActionType.Run };
+
+        /// <inheritdoc />
+        public void SignalExecutionEnded() { }
+
+        /// <inheritdoc />
+        public void Update(WatchType watchType, IEnumerable<WatchItem> items) { }
+
+        /// <inheritdoc />
+        public IReadOnlyList<DynamicExpression> GetWatchItems() =>
+            Array.Empty<DynamicExpression>();
+
+        /// <inheritdoc />
+        public void RefreshBreakpoints(IEnumerable<SourceRef> refs) { }
+    }
+}
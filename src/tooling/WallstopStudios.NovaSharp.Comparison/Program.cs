@@ -5,14 +5,20 @@ namespace WallstopStudios.NovaSharp.Comparison
     using System.Globalization;
     using System.IO;
     using System.Linq;
+    using System.Text.Json;
     using BenchmarkDotNet.Reports;
     using BenchmarkDotNet.Running;
+    using WallstopStudios.NovaSharp.Interpreter;
+    using WallstopStudios.NovaSharp.Interpreter.Modules;
 
     /// <summary>
     /// Entry point for running NovaSharp external-runtime comparison benchmarks.
     /// </summary>
     internal static class Program
     {
+        private const string ScenarioOpCodesFileName = "scenario-opcodes.json";
+        private const string ScenarioOpCodesSchema = "novasharp.benchmark-scenario-opcodes.v1";
+
         /// <summary>
         /// Executes the requested BenchmarkDotNet suites and prints a completion summary.
         /// </summary>
@@ -87,16 +93,38 @@ namespace WallstopStudios.NovaSharp.Comparison
         {
             Directory.CreateDirectory(outputDirectory);
             int exported = 0;
+            using FileStream opCodesStream = File.Create(
+                Path.Combine(outputDirectory, ScenarioOpCodesFileName)
+            );
+            using Utf8JsonWriter opCodesWriter = new(
+                opCodesStream,
+                new JsonWriterOptions { Indented = true }
+            );
+            opCodesWriter.WriteStartObject();
+            opCodesWriter.WriteString("schema", ScenarioOpCodesSchema);
+            opCodesWriter.WriteStartObject("scenarios");
             foreach (ScriptScenario scenario in BenchmarkScripts.GetScenarios())
             {
+                string scenarioName = BenchmarkScripts.GetScenarioName(scenario);
+                string source = BenchmarkScripts.GetScript(scenario);
                 string outputPath = Path.Combine(
                     outputDirectory,
-                    string.Concat(BenchmarkScripts.GetScenarioName(scenario), ".lua")
+                    string.Concat(scenarioName, ".lua")
                 );
-                File.WriteAllText(outputPath, BenchmarkScripts.GetScript(scenario));
+                File.WriteAllText(outputPath, source);
+
+                opCodesWriter.WriteStartArray(scenarioName);
+                foreach (string opCode in CompileOpCodeNames(source, scenarioName))
+                {
+                    opCodesWriter.WriteStringValue(opCode);
+                }
+                opCodesWriter.WriteEndArray();
                 exported++;
             }
 
+            opCodesWriter.WriteEndObject();
+            opCodesWriter.WriteEndObject();
+
             Console.WriteLine(
                 string.Format(
                     CultureInfo.InvariantCulture,
@@ -106,5 +134,16 @@ namespace WallstopStudios.NovaSharp.Comparison
                 )
             );
         }
+
+        private static SortedSet<string> CompileOpCodeNames(string source, string scenarioName)
+        {
+            // The scenario is compiled, never run, so the recorder sees every opcode the
+            // benchmark's NovaSharp Execute rows can dispatch, not only the ones a run hits.
+            ByteCodeRecorder recorder = new();
+            Script script = new(CoreModulePresets.Complete);
+            script.AttachDebugger(recorder);
+            script.PrepareString(source, null, string.Concat("opcodes_", scenarioName));
+            return recorder.GetOpCodeNames();
+        }
     }
 }
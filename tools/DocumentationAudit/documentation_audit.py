@@ -6,6 +6,10 @@ Scans the C# source tree and reports public/internal type declarations that do
 not carry `///` XML documentation comments. The goal is to launch the PLAN's
 documentation quality pass by providing actionable guidance before we wire the
 check into CI.
+
+Per-file results are cached by content hash in
+`artifacts/documentation-audit-cache.json` (see tools/audit_cache.py), so a rerun
+only re-audits files that changed.
 """
 
 from __future__ import annotations
@@ -15,10 +19,17 @@ from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 import re
+import sys
 from typing import Iterable
 
 ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+from audit_cache import AuditCache, cache_key  # noqa: E402
+
 SRC_ROOT = ROOT / "src"
+DEFAULT_CACHE = ROOT / "artifacts" / "documentation-audit-cache.json"
+CACHE_SCHEMA = "novasharp.documentation-audit-cache.v1"
 DOC_PATTERN = re.compile(r"^\s*///")
 TYPE_PATTERN = re.compile(
     r"^\s*(?:public|internal)\s+"
@@ -199,6 +210,28 @@ def audit_file(path: Path) -> list[DocIssue]:
     return issues
 
 
+def audit_files(files: Iterable[Path], cache: AuditCache | None = None) -> list[DocIssue]:
+    issues: list[DocIssue] = []
+    for file_path in files:
+        rel_path = file_path.relative_to(ROOT)
+        cached = cache.lookup(rel_path.as_posix()) if cache else None
+        if cached is not None:
+            issues.extend(
+                DocIssue(rel_path, line, declaration, kind) for line, declaration, kind in cached
+            )
+            continue
+        file_issues = audit_file(file_path)
+        if cache:
+            cache.store(
+                rel_path.as_posix(),
+                [[issue.line, issue.declaration, issue.kind] for issue in file_issues],
+            )
+        issues.extend(file_issues)
+    if cache:
+        cache.save()
+    return issues
+
+
 def group_issues(issues: Iterable[DocIssue]) -> dict[Path, list[DocIssue]]:
     grouped: dict[Path, list[DocIssue]] = defaultdict(list)
     for issue in issues:
@@ -243,15 +276,29 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Return a non-zero exit code when undocumented members are found.",
     )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE,
+        help="Per-file results cache (default: artifacts/documentation-audit-cache.json).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Audit every file without reading or writing --cache.",
+    )
     return parser.parse_args()
 
 
 def main() -> int:
     args = parse_args()
-    files = discover_files()
-    issues: list[DocIssue] = []
-    for file_path in files:
-        issues.extend(audit_file(file_path))
+    cache = AuditCache(
+        None if args.no_cache else args.cache.resolve(),
+        CACHE_SCHEMA,
+        cache_key([Path(__file__)], {}),
+        root=ROOT,
+    )
+    issues = audit_files(discover_files(), cache)
 
     report = format_report(issues)
     print(report)
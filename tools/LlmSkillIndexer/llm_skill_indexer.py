@@ -5,12 +5,21 @@ LLM Skill Indexer
 Scans .llm/skills/*.md for YAML front-matter metadata and generates
 a skills-index.json with categorization, triggers, and validation.
 
+Each skill's parsed and validated metadata is cached by content hash in
+`artifacts/llm-skill-index-cache.json` (see tools/audit_cache.py), so a rerun only
+re-reads and re-validates skills that changed. Related-skill links are always
+re-resolved against the current set of skill names, which needs no file access.
+Changed skills are processed on --jobs worker processes once there are enough of
+them to pay for the pool.
+
 Usage:
     python3 tools/LlmSkillIndexer/llm_skill_indexer.py [--check] [--verbose]
 
 Options:
     --check     Validate metadata and the committed index without writing files
     --verbose   Show detailed output for each skill
+    --jobs N    Worker processes used for changed skills (default: CPU count)
+    --no-cache  Re-read and re-validate every skill without reading or writing the cache
 
 Exit codes:
     0  Generation completed, or check mode found no issues
@@ -18,14 +27,23 @@ Exit codes:
 """
 
 import argparse
+import copy
 import json
-import os
 import re
 import sys
 from dataclasses import dataclass, field, asdict
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+from audit_cache import AuditCache, cache_key  # noqa: E402
+from process_pool import default_jobs, map_files  # noqa: E402
+
+DEFAULT_CACHE = ROOT / "artifacts" / "llm-skill-index-cache.json"
+CACHE_SCHEMA = "novasharp.llm-skill-index-cache.v1"
 
 # Line count thresholds
 LINE_WARNING_THRESHOLD = 300
@@ -255,19 +273,50 @@ def process_skill_file(file_path: Path, repo_root: Path) -> SkillMetadata:
     return skill
 
 
-def generate_index(repo_root: Path) -> dict:
+def process_skill_files(
+    skill_files: list[Path],
+    repo_root: Path,
+    jobs: int = 1,
+    cache: Optional[AuditCache] = None,
+) -> list[SkillMetadata]:
+    """Process ``skill_files`` on up to ``jobs`` worker processes, keeping their order.
+
+    Skills whose content is unchanged since ``cache`` recorded them are neither
+    re-read nor re-validated.
+    """
+    skills: dict[Path, SkillMetadata] = {}
+    to_process = []
+    for skill_file in skill_files:
+        cached = cache.lookup(skill_file.relative_to(repo_root).as_posix()) if cache else None
+        if cached is not None:
+            # Copied: generate_index appends related-skill warnings to the lists.
+            skills[skill_file] = SkillMetadata(**copy.deepcopy(cached))
+        else:
+            to_process.append(skill_file)
+
+    processed = map_files(partial(process_skill_file, repo_root=repo_root), to_process, jobs)
+    for skill_file, skill in zip(to_process, processed):
+        skills[skill_file] = skill
+        if cache:
+            cache.store(skill_file.relative_to(repo_root).as_posix(), asdict(skill))
+    if cache:
+        cache.save()
+
+    return [skills[skill_file] for skill_file in skill_files]
+
+
+def generate_index(repo_root: Path, jobs: int = 1, cache: Optional[AuditCache] = None) -> dict:
     """Generate the complete skills index."""
     skills_dir = repo_root / '.llm' / 'skills'
 
     if not skills_dir.exists():
         raise FileNotFoundError(f"Skills directory not found: {skills_dir}")
 
-    skills = []
     skill_files = sorted(skills_dir.glob('*.md'))
+    skills = process_skill_files(skill_files, repo_root, jobs, cache)
 
-    for skill_file in skill_files:
-        skill = process_skill_file(skill_file, repo_root)
-        skills.append(skill)
+    # Checked on every run, cached or not: adding, renaming, or removing a skill
+    # changes whether its neighbours' related links resolve.
 
     skill_names = {skill.name for skill in skills}
     for skill in skills:
@@ -403,6 +452,23 @@ def main():
         default=None,
         help='Output file path (default: .llm/skills-index.json)'
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=default_jobs(),
+        help='Worker processes used for changed skills (default: CPU count)'
+    )
+    parser.add_argument(
+        '--cache',
+        type=Path,
+        default=DEFAULT_CACHE,
+        help='Per-skill results cache (default: artifacts/llm-skill-index-cache.json)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-read and re-validate every skill without reading or writing --cache'
+    )
     args = parser.parse_args()
 
     # Find repo root (directory containing .llm/)
@@ -414,9 +480,16 @@ def main():
         print(f"ERROR: Could not find .llm/ directory. Expected at {repo_root / '.llm'}", file=sys.stderr)
         sys.exit(1)
 
+    cache = AuditCache(
+        None if args.no_cache else args.cache.resolve(),
+        CACHE_SCHEMA,
+        cache_key([script_path], {}),
+        root=repo_root,
+    )
+
     # Generate index
     try:
-        index = generate_index(repo_root)
+        index = generate_index(repo_root, jobs=args.jobs, cache=cache)
     except Exception as e:
         print(f"ERROR: Failed to generate index: {e}", file=sys.stderr)
         sys.exit(1)
@@ -12,6 +12,7 @@ from llm_skill_indexer import (
     generate_index,
     validate_metadata,
 )
+from audit_cache import AuditCache
 
 
 def make_index(warnings: int = 0, errors: int = 0) -> dict:
@@ -247,5 +248,59 @@ class MetadataTests(unittest.TestCase):
             self.assertNotIn("\\", skill["file_path"])
 
 
+def write_skill(skills_directory: Path, name: str, related: str = "") -> None:
+    related_block = f"related:\n  - {related}\n" if related else ""
+    (skills_directory / f"{name}.md").write_text(
+        f"---\ntriggers:\n  - {name}\ncategory: core\n{related_block}priority: core\n"
+        f"---\n# {name.title()}\n",
+        encoding="utf-8",
+    )
+
+
+class IncrementalGenerationTests(unittest.TestCase):
+    def test_cached_generation_revalidates_changed_skills_and_related_links(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            repo_root = Path(temporary_directory)
+            skills_directory = repo_root / ".llm" / "skills"
+            skills_directory.mkdir(parents=True)
+            write_skill(skills_directory, "target")
+            write_skill(skills_directory, "source", related="target")
+            cache_path = repo_root / "artifacts" / "cache.json"
+
+            def generate() -> tuple[dict, int]:
+                cache = AuditCache(cache_path, "test.v1", "key", root=repo_root)
+                return generate_index(repo_root, cache=cache), cache.audited
+
+            first, audited = generate()
+            self.assertEqual(2, audited)
+            self.assertEqual((first, 0), generate())
+
+            # The cached source skill must notice that its related target is gone,
+            # and the warning must not leak into the cache.
+            (skills_directory / "target.md").unlink()
+            for _ in range(2):
+                index, audited = generate()
+                self.assertEqual(0, audited)
+                self.assertEqual(1, index["validation_summary"]["total_warnings"])
+
+            write_skill(skills_directory, "source")
+            index, audited = generate()
+            self.assertEqual(1, audited)
+            self.assertEqual(0, index["validation_summary"]["total_warnings"])
+
+    def test_parallel_generation_matches_serial(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            repo_root = Path(temporary_directory)
+            skills_directory = repo_root / ".llm" / "skills"
+            skills_directory.mkdir(parents=True)
+            for number in range(70):
+                write_skill(skills_directory, f"skill{number:02}", related=f"skill{number + 1:02}")
+
+            serial = generate_index(repo_root)
+
+            self.assertEqual(serial, generate_index(repo_root, jobs=2))
+            self.assertEqual(1, serial["validation_summary"]["total_warnings"])
+
+
 if __name__ == "__main__":
     unittest.main()
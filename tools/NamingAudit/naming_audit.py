@@ -20,7 +20,13 @@ from pathlib import Path
 from typing import Iterable
 
 ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+from audit_cache import AuditCache, cache_key  # noqa: E402
+
 SRC_ROOT = ROOT / "src"
+DEFAULT_CACHE = ROOT / "artifacts" / "naming-audit-cache.json"
+CACHE_SCHEMA = "novasharp.naming-audit-cache.v1"
 PROPS_PATH = ROOT / "Directory.Build.props"
 EXCLUDED_DIRS = {"bin", "obj", "packages", ".vs", "legacy"}
 FILE_ALLOWLIST = {
@@ -523,13 +529,35 @@ def audit_file(
 
 def audit(
     enforce_namespace_prefix: str | None = None,
+    cache: AuditCache | None = None,
 ) -> tuple[list[NamingIssue], list[str]]:
     all_issues: list[NamingIssue] = []
     namespaces: list[str] = []
     for cs_file in discover_cs_files():
-        file_issues, file_namespaces = audit_file(cs_file, enforce_namespace_prefix)
+        rel_path = cs_file.relative_to(ROOT)
+        cached = cache.lookup(rel_path.as_posix()) if cache else None
+        if cached is not None:
+            file_issues = [
+                NamingIssue(rel_path, kind, identifier, message)
+                for kind, identifier, message in cached["issues"]
+            ]
+            file_namespaces = cached["namespaces"]
+        else:
+            file_issues, file_namespaces = audit_file(cs_file, enforce_namespace_prefix)
+            if cache:
+                cache.store(
+                    rel_path.as_posix(),
+                    {
+                        "issues": [
+                            [issue.kind, issue.identifier, issue.message] for issue in file_issues
+                        ],
+                        "namespaces": file_namespaces,
+                    },
+                )
         all_issues.extend(file_issues)
         namespaces.extend(file_namespaces)
+    if cache:
+        cache.save()
     return all_issues, namespaces
 
 
@@ -689,6 +717,18 @@ def main(argv: list[str]) -> int:
             "Use together with --namespace-prefix for migration tracking."
         ),
     )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE,
+        metavar="PATH",
+        help="Per-file results cache (default: artifacts/naming-audit-cache.json).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Audit every file without reading or writing --cache.",
+    )
     args = parser.parse_args(argv)
 
     namespace_prefixes = (
@@ -697,7 +737,13 @@ def main(argv: list[str]) -> int:
         else load_namespace_prefixes_from_props()
     )
 
-    issues, namespaces = audit(args.enforce_namespace_prefix)
+    cache = AuditCache(
+        None if args.no_cache else resolve_repo_path(args.cache),
+        CACHE_SCHEMA,
+        cache_key([Path(__file__)], {"enforceNamespacePrefix": args.enforce_namespace_prefix}),
+        root=ROOT,
+    )
+    issues, namespaces = audit(args.enforce_namespace_prefix, cache)
     namespace_summary_lines = build_namespace_summary(namespaces, namespace_prefixes)
     report = render_report(issues, namespace_summary_lines if namespace_summary_lines else None)
 
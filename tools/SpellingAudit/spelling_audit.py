@@ -1,24 +1,43 @@
 #!/usr/bin/env python3
 """Spelling audit helper for NovaSharp.
 
-Wraps the `codespell` CLI so we can produce deterministic logs and wire the
-results into CI. The script mirrors the naming/namespace audit helpers: run it
-with `--write-log docs/audits/spelling_audit.log` to refresh the committed report, or use
+Wraps `codespell` so we can produce deterministic logs and wire the results
+into CI. The script mirrors the naming/namespace audit helpers: run it with
+`--write-log docs/audits/spelling_audit.log` to refresh the committed report, or use
 `--verify-log docs/audits/spelling_audit.log` to fail when the log is stale.
+
+By default codespell runs in-process: the dictionaries load once, files are
+scanned on worker processes, and per-file findings are cached by content hash
+under `artifacts/` (see tools/audit_cache.py). `--engine subprocess` runs the `codespell` CLI instead; both engines
+produce the same report. The in-process engine drives codespell internals, so it
+only runs against the codespell version pinned in requirements.tooling.txt and
+otherwise falls back to the CLI.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
 import difflib
+import io
+import os
+import re
 import subprocess
 import sys
 from pathlib import Path
 from typing import Iterable, Sequence
 
 ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+from audit_cache import AuditCache, cache_key  # noqa: E402
+from process_pool import default_jobs, map_files  # noqa: E402
+
 DEFAULT_LOG = ROOT / "docs" / "audits" / "spelling_audit.log"
 DEFAULT_ALLOWLIST = ROOT / "tools" / "SpellingAudit" / "allowlist.txt"
+DEFAULT_CACHE = ROOT / "artifacts" / "spelling-audit-cache.json"
+REQUIREMENTS = ROOT / "requirements.tooling.txt"
+CACHE_SCHEMA = "novasharp.spelling-audit-cache.v1"
 TOP_LEVEL_EXCLUDES = {".git", ".vs", "artifacts"}
 
 
@@ -120,6 +139,10 @@ class SpellingAuditError(RuntimeError):
     """Raised when the spelling audit cannot complete."""
 
 
+class InProcessEngineUnavailable(SpellingAuditError):
+    """Raised when the installed codespell is not the release the in-process engine targets."""
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="NovaSharp spelling audit helper")
     parser.add_argument(
@@ -160,6 +183,29 @@ def parse_args() -> argparse.Namespace:
         default=7,
         help="codespell quiet level (default: 7 to suppress binary/encoding noise).",
     )
+    parser.add_argument(
+        "--engine",
+        choices=("inprocess", "subprocess"),
+        default="inprocess",
+        help="Run codespell in-process (default) or through the codespell CLI.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="Worker processes for the in-process engine (default: CPU count).",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE,
+        help="Per-file findings cache for the in-process engine (default: artifacts/spelling-audit-cache.json).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Scan every file without reading or writing --cache.",
+    )
     return parser.parse_args()
 
 
@@ -192,19 +238,39 @@ def load_allowlist(path: Path) -> list[str]:
     return words
 
 
-def run_codespell(paths: Sequence[str], allowlist: list[str], skip_globs: Sequence[str], quiet: int) -> list[str]:
+def codespell_arguments(allowlist: Sequence[str], skip_globs: Sequence[str], quiet: int) -> list[str]:
+    arguments = ["-q", str(quiet)]
+    if skip_globs:
+        arguments.extend(["-S", ",".join(skip_globs)])
+    if allowlist:
+        arguments.extend(["-L", ",".join(allowlist)])
+    return arguments
+
+
+def import_codespell():
     try:
-        __import__("codespell_lib")
+        import codespell_lib._codespell as codespell
     except ModuleNotFoundError as exc:  # pragma: no cover - defensive guard
         raise SpellingAuditError(
             "codespell_lib is not installed. Run 'python -m pip install -r requirements.tooling.txt' first."
         ) from exc
+    return codespell
 
-    command = [sys.executable, "-m", "codespell_lib", "-q", str(quiet)]
-    if skip_globs:
-        command.extend(["-S", ",".join(skip_globs)])
-    if allowlist:
-        command.extend(["-L", ",".join(allowlist)])
+
+def pinned_codespell_version() -> str | None:
+    """Return the codespell version pinned in requirements.tooling.txt, if any."""
+    try:
+        requirements = REQUIREMENTS.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    match = re.search(r"^codespell==(\S+)", requirements, re.MULTILINE)
+    return match.group(1) if match else None
+
+
+def run_codespell(paths: Sequence[str], allowlist: list[str], skip_globs: Sequence[str], quiet: int) -> list[str]:
+    import_codespell()
+
+    command = [sys.executable, "-m", "codespell_lib", *codespell_arguments(allowlist, skip_globs, quiet)]
     command.extend(str(Path(p)) for p in paths)
 
     proc = subprocess.run(
@@ -223,6 +289,234 @@ def run_codespell(paths: Sequence[str], allowlist: list[str], skip_globs: Sequen
     return output
 
 
+class CodespellEngine:
+    """codespell's file walk and line checks, with the dictionaries loaded once.
+
+    Mirrors ``codespell_lib._codespell.main`` for the options this audit passes, so
+    findings (and their order) match the CLI. Paths stay relative to the repo root
+    exactly as the CLI prints them when run from there. Those are private codespell
+    internals, so any other codespell release than the pinned one is refused with
+    :class:`InProcessEngineUnavailable`.
+    """
+
+    def __init__(self, allowlist: Sequence[str], skip_globs: Sequence[str], quiet: int) -> None:
+        codespell = import_codespell()
+        pinned = pinned_codespell_version()
+        if pinned is not None and codespell.VERSION != pinned:
+            raise InProcessEngineUnavailable(
+                f"codespell {codespell.VERSION} is installed, but the in-process engine "
+                f"targets the pinned codespell {pinned}"
+            )
+        self.codespell = codespell
+        # Config files (setup.cfg, .codespellrc, pyproject.toml) are read from the
+        # working directory, which is the repo root for the CLI engine.
+        with contextlib.chdir(ROOT):
+            options, _, _ = codespell.parse_options(codespell_arguments(allowlist, skip_globs, quiet))
+        self.options = options
+        self.word_regex = re.compile(options.regex or codespell.word_regex_def)
+        self.ignore_word_regex = (
+            re.compile(options.ignore_regex) if options.ignore_regex else None
+        )
+        ignore_multiline_regex = (
+            re.compile(options.ignore_multiline_regex, re.DOTALL)
+            if options.ignore_multiline_regex
+            else None
+        )
+        ignore_words, self.ignore_words_cased = codespell.parse_ignore_words_option(
+            options.ignore_words_list
+        )
+        self.uri_regex = re.compile(options.uri_regex or codespell.uri_regex_def)
+        self.uri_ignore_words: set[str] = set()
+        for words in codespell.parse_ignore_words_option(options.uri_ignore_words_list):
+            self.uri_ignore_words.update(words)
+        self.misspellings: dict = {}
+        for dictionary in codespell._select_builtin_dictionary(options.builtin):
+            codespell.build_dict(dictionary, self.misspellings, ignore_words)
+        self.colors = codespell.TermColors()
+        if not options.colors:
+            self.colors.disable()
+        self.file_opener = codespell.FileOpener(
+            options.hard_encoding_detection, options.quiet_level, ignore_multiline_regex
+        )
+        self.glob_match = codespell.GlobMatch(
+            codespell.flatten_clean_comma_separated_arguments(options.skip) if options.skip else []
+        )
+        # Whole-file word lookup is exact only when every reported word is a plain
+        # word-regex token of its line, i.e. when no URI text is erased first.
+        self.prefilter = "*" not in self.uri_ignore_words and self.ignore_word_regex is None
+
+    def _hidden(self, name: str) -> bool:
+        return self.codespell.is_hidden(name, self.options.check_hidden)
+
+    def discover(self, paths: Sequence[str]) -> list[str]:
+        """Return the files codespell would check for ``paths``, in its order."""
+        names: list[str] = []
+        match = self.glob_match.match
+        for top in sorted(str(Path(p)) for p in paths):
+            if self._hidden(top):
+                continue
+            absolute_top = os.path.join(ROOT, top)
+            if not os.path.isdir(absolute_top):
+                if not match(top):
+                    names.append(top)
+                continue
+            for absolute_root, dirs, files in os.walk(absolute_top):
+                root = top + absolute_root[len(absolute_top) :]
+                if match(root):
+                    dirs.clear()
+                    continue
+                if self._hidden(root):
+                    continue
+                for file_ in sorted(files):
+                    if self._hidden(file_) or match(file_):
+                        continue
+                    name = os.path.join(root, file_)
+                    if not match(name):
+                        names.append(name)
+                dirs[:] = [dir_ for dir_ in dirs if not match(dir_) and not self._hidden(dir_)]
+        return names
+
+    def scan(self, name: str, data: bytes) -> list[str]:
+        """Return codespell's report lines for file ``name`` with contents ``data``."""
+        if b"\x00" in data[:1024]:
+            return []
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            text = data.decode("iso-8859-1")
+        fragments = self.file_opener.get_lines(io.StringIO(text, newline=""))
+        fragments = [fragment for fragment in fragments if not fragment[0]]
+        if self.prefilter and not any(
+            word.lower() in self.misspellings
+            for _, _, lines in fragments
+            for word in self.word_regex.findall("".join(lines))
+        ):
+            return []
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            for fragment in fragments:
+                self.codespell.parse_lines(
+                    fragment,
+                    name,
+                    self.colors,
+                    None,
+                    self.misspellings,
+                    self.ignore_words_cased,
+                    set(),
+                    self.word_regex,
+                    self.ignore_word_regex,
+                    self.uri_regex,
+                    self.uri_ignore_words,
+                    None,
+                    self.options,
+                )
+        return [line.strip() for line in output.getvalue().splitlines() if line.strip()]
+
+
+_WORKER_ENGINE: CodespellEngine | None = None
+
+
+def _init_worker(allowlist: Sequence[str], skip_globs: Sequence[str], quiet: int) -> None:
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = CodespellEngine(allowlist, skip_globs, quiet)
+
+
+def _scan_in_worker(entry: tuple[str, bytes]) -> list[str]:
+    assert _WORKER_ENGINE is not None
+    return _WORKER_ENGINE.scan(*entry)
+
+
+def spelling_cache_key(allowlist: Sequence[str], quiet: int) -> str:
+    """Identify the audit, codespell release, and options that produced cached findings."""
+    codespell = import_codespell()
+    return cache_key(
+        [Path(__file__)],
+        {"codespell": codespell.VERSION, "allowlist": list(allowlist), "quiet": quiet},
+    )
+
+
+def run_inprocess(
+    paths: Sequence[str],
+    allowlist: list[str],
+    skip_globs: Sequence[str],
+    quiet: int,
+    jobs: int = 1,
+    cache_path: Path | None = None,
+) -> list[str]:
+    """Return the same findings as :func:`run_codespell` without spawning codespell.
+
+    Per-file findings are reused through :class:`audit_cache.AuditCache`.
+    """
+    engine = CodespellEngine(allowlist, skip_globs, quiet)
+    cache = AuditCache(
+        cache_path,
+        CACHE_SCHEMA,
+        spelling_cache_key(allowlist, quiet),
+        root=ROOT,
+    )
+
+    names = engine.discover(paths)
+    findings: dict[str, list[str]] = {}
+    to_scan: list[tuple[str, bytes]] = []
+    for name in names:
+        cached = cache.lookup(Path(name).as_posix())
+        if cached is not None:
+            findings[name] = cached
+            continue
+        absolute = os.path.join(ROOT, name)
+        try:
+            if not os.path.isfile(absolute):
+                continue
+            with open(absolute, "rb") as handle:
+                to_scan.append((name, handle.read()))
+        except OSError:
+            continue
+
+    scanned = map_files(
+        _scan_in_worker,
+        to_scan,
+        jobs,
+        serial=lambda entry: engine.scan(*entry),
+        initializer=_init_worker,
+        initargs=(allowlist, skip_globs, quiet),
+    )
+    for (name, _), file_findings in zip(to_scan, scanned):
+        findings[name] = file_findings
+        cache.store(Path(name).as_posix(), file_findings)
+    cache.save()
+
+    return [line for name in names for line in findings.get(name, [])]
+
+
+def run_audit(
+    paths: Sequence[str],
+    allowlist: list[str],
+    skip_globs: Sequence[str],
+    quiet: int,
+    engine: str = "inprocess",
+    jobs: int = 1,
+    cache_path: Path | None = None,
+) -> list[str]:
+    """Run the requested engine, falling back to the codespell CLI when the
+    in-process engine does not match the installed codespell."""
+    if engine == "inprocess":
+        try:
+            return run_inprocess(
+                paths,
+                allowlist,
+                skip_globs,
+                quiet,
+                jobs=jobs,
+                cache_path=cache_path,
+            )
+        except (InProcessEngineUnavailable, ImportError, AttributeError, TypeError) as exc:
+            sys.stderr.write(
+                f"[spelling-audit] In-process engine unavailable ({exc}); using --engine subprocess.\n"
+            )
+    return run_codespell(paths, allowlist, skip_globs, quiet)
+
+
 def render_report(
     findings: Sequence[str],
     paths: Sequence[str],
@@ -287,7 +581,15 @@ def main() -> None:
 
     skip_globs = flatten_patterns(args.skip)
     allowlist = load_allowlist(args.allowlist)
-    findings = run_codespell(args.paths, allowlist, skip_globs, args.quiet_level)
+    findings = run_audit(
+        args.paths,
+        allowlist,
+        skip_globs,
+        args.quiet_level,
+        engine=args.engine,
+        jobs=args.jobs,
+        cache_path=None if args.no_cache else args.cache.resolve(),
+    )
     report = render_report(findings, args.paths, skip_globs, allowlist)
 
     if args.write_log:
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Plan/apply engine shared by the version annotation migrators.
+
+`migrate_version_annotations.py` (Lua fixtures) and
+`migrate_csharp_version_annotations.py` (TUnit tests) each supply a planner: a
+module-level function that reads one file and returns its migrator-specific
+result plus the line hunks it would rewrite. The engine runs the planner over
+the whole corpus in one parallel pass and collects the hunks into a
+`MigrationPlan`, which can be written to a reviewable JSON patch set.
+
+Applying a plan never re-parses annotations. Every file's SHA-256 is checked
+against the plan before anything is written, each new file is staged next to
+its target, and the staged files are only moved into place once all of them
+were written; a stale plan or a failed write leaves the tree untouched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from audit_cache import write_json_atomic
+from process_pool import default_jobs, map_files
+
+PLAN_SCHEMA = "novasharp.annotation-migration-plan.v1"
+
+STALE_PATHS_LISTED = 10
+
+
+@dataclass
+class Hunk:
+    """Replace ``before`` (lines starting at 0-indexed ``start``) with ``after``."""
+    start: int
+    before: list[str]
+    after: list[str]
+
+
+@dataclass
+class FileEdit:
+    """All hunks for one file, pinned to the SHA-256 of the file they were planned against."""
+    path: Path
+    sha256: str
+    hunks: list[Hunk] = field(default_factory=list)
+
+
+@dataclass
+class SourceFile:
+    """A file as the migrators parse it: universal newlines, split with line endings kept."""
+    sha256: str
+    lines: list[str]
+
+
+class StalePlanError(Exception):
+    """Raised when files changed after a plan was written; nothing was applied."""
+
+    def __init__(self, paths: list[Path]):
+        self.paths = paths
+        listed = ", ".join(str(path) for path in paths[:STALE_PATHS_LISTED])
+        if len(paths) > STALE_PATHS_LISTED:
+            listed += f", ... and {len(paths) - STALE_PATHS_LISTED} more"
+        super().__init__(f"{len(paths)} file(s) changed since the plan was written: {listed}")
+
+
+def _decode_lines(data: bytes) -> list[str]:
+    # Matches open(path, "r", encoding="utf-8").readlines() on every platform.
+    text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return text.splitlines(keepends=True)
+
+
+def read_source(path: Path) -> SourceFile:
+    """Read ``path`` once for planning; raises OSError/UnicodeDecodeError like open()."""
+    data = Path(path).read_bytes()
+    return SourceFile(sha256=hashlib.sha256(data).hexdigest(), lines=_decode_lines(data))
+
+
+def apply_hunks(lines: list[str], hunks: Iterable[Hunk]) -> list[str]:
+    """Return ``lines`` with ``hunks`` applied (bottom-up, so line numbers stay valid)."""
+    new_lines = list(lines)
+    for hunk in sorted(hunks, key=lambda h: h.start, reverse=True):
+        end = hunk.start + len(hunk.before)
+        if new_lines[hunk.start:end] != hunk.before:
+            raise ValueError(f"hunk at line {hunk.start + 1} does not match the file")
+        new_lines[hunk.start:end] = hunk.after
+    return new_lines
+
+
+@dataclass
+class MigrationPlan:
+    """The edits one migrator would make, keyed by paths relative to ``root``."""
+    migrator: str
+    root: Path
+    edits: list[FileEdit] = field(default_factory=list)
+
+    @property
+    def hunk_count(self) -> int:
+        return sum(len(edit.hunks) for edit in self.edits)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "schema": PLAN_SCHEMA,
+            "migrator": self.migrator,
+            "files": [
+                {
+                    "path": _relative(edit.path, self.root),
+                    "sha256": edit.sha256,
+                    "hunks": [
+                        {"line": hunk.start + 1, "before": hunk.before, "after": hunk.after}
+                        for hunk in edit.hunks
+                    ],
+                }
+                for edit in self.edits
+            ],
+        }
+
+    def write(self, path: Path) -> None:
+        """Write the plan as indented JSON (atomically) for review or a later apply."""
+        write_json_atomic(Path(path), self.to_json(), indent=2)
+
+    @classmethod
+    def load(cls, path: Path, migrator: str, root: Path) -> "MigrationPlan":
+        """Load a plan written by ``write``; raises ValueError for another schema or migrator."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.get("schema") != PLAN_SCHEMA:
+            raise ValueError(f"{path}: not an annotation migration plan")
+        if data.get("migrator") != migrator:
+            raise ValueError(f"{path}: plan was written by the {data.get('migrator')!r} migrator")
+        edits = [
+            FileEdit(
+                path=root / entry["path"],
+                sha256=entry["sha256"],
+                hunks=[
+                    Hunk(start=hunk["line"] - 1, before=hunk["before"], after=hunk["after"])
+                    for hunk in entry["hunks"]
+                ],
+            )
+            for entry in data.get("files", [])
+        ]
+        return cls(migrator=migrator, root=root, edits=edits)
+
+
+def _relative(path: Path, root: Path) -> str:
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+Planner = Callable[[Path], tuple[Any, Optional[FileEdit]]]
+
+
+def plan_migration(
+    migrator: str,
+    root: Path,
+    paths: list[Path],
+    planner: Planner,
+    jobs: int = 1,
+) -> tuple[list[Any], MigrationPlan]:
+    """Run ``planner`` over ``paths`` and return the per-file results (in input order)
+    together with the plan of every edit they produced."""
+    planned = map_files(planner, paths, jobs)
+
+    plan = MigrationPlan(migrator=migrator, root=root)
+    results = []
+    for result, edit in planned:
+        results.append(result)
+        if edit is not None and edit.hunks:
+            plan.edits.append(edit)
+    return results, plan
+
+
+def apply_plan(plan: MigrationPlan) -> int:
+    """Apply every edit in ``plan`` all-or-nothing and return the number of files written.
+
+    Raises StalePlanError when any file no longer matches its planned hash, and
+    re-raises write failures after discarding the staged files.
+    """
+    sources: list[tuple[FileEdit, SourceFile]] = []
+    stale = []
+    for edit in plan.edits:
+        try:
+            source = read_source(edit.path)
+        except (OSError, UnicodeDecodeError):
+            stale.append(edit.path)
+            continue
+        if source.sha256 != edit.sha256:
+            stale.append(edit.path)
+        else:
+            sources.append((edit, source))
+    if stale:
+        raise StalePlanError(stale)
+
+    staged: list[tuple[Path, Path]] = []
+    try:
+        for edit, source in sources:
+            new_lines = apply_hunks(source.lines, edit.hunks)
+            temporary = edit.path.with_name(f"{edit.path.name}.{os.getpid()}.tmp")
+            staged.append((temporary, edit.path))
+            with open(temporary, "w", encoding="utf-8") as f:
+                f.writelines(new_lines)
+            shutil.copymode(edit.path, temporary)
+    except BaseException:
+        for temporary, _ in staged:
+            temporary.unlink(missing_ok=True)
+        raise
+
+    for temporary, target in staged:
+        os.replace(temporary, target)
+    return len(staged)
+
+
+def add_plan_arguments(parser: argparse.ArgumentParser, default_plan: Path) -> None:
+    """Add the --jobs/--write-plan/--apply-plan options shared by both migrators."""
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="Worker processes used to plan the migration (default: CPU count)"
+    )
+    parser.add_argument(
+        "--write-plan",
+        type=Path,
+        nargs="?",
+        const=default_plan,
+        default=None,
+        metavar="PATH",
+        help=f"Write the planned edits as a reviewable JSON patch set (default: {default_plan})"
+    )
+    parser.add_argument(
+        "--apply-plan",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Apply a plan written by --write-plan without re-scanning any file"
+    )
+
+
+def apply_saved_plan(plan_path: Path, migrator: str, root: Path) -> int:
+    """Apply the plan at ``plan_path`` for the --apply-plan option; returns an exit code."""
+    try:
+        plan = MigrationPlan.load(plan_path, migrator, root)
+        written = apply_plan(plan)
+    except StalePlanError as e:
+        print(f"Error: {e}")
+        print("Nothing was applied. Re-run with --write-plan to refresh the plan.")
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        print("Nothing was applied.")
+        return 1
+    print(f"Applied {plan.hunk_count} edit(s) to {written} file(s) from {plan_path}")
+    return 0
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Per-file result cache shared by the audits and the CI checks that scan the tree.
+
+Each audit still renders its full report, but per-file results are reused when a
+file is unchanged: a matching size and modification time skips reading the file,
+and a matching SHA-256 skips re-auditing it. The cache lives under `artifacts/`
+and is discarded whenever its key (the audit script plus its options) changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def cache_key(scripts: Iterable[Path], options: dict[str, Any]) -> str:
+    """Identify the audit implementation and the options that produced cached results."""
+    digest = hashlib.sha256()
+    for script in scripts:
+        digest.update(Path(script).read_bytes())
+    digest.update(json.dumps(options, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def write_json_atomic(path: Path, payload: Any, **dump_options: Any) -> None:
+    """Write ``payload`` as JSON through a temporary file, so readers never see half a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temporary.write_text(json.dumps(payload, **dump_options) + "\n", encoding="utf-8")
+    os.replace(temporary, path)
+
+
+class AuditCache:
+    """JSON cache of per-file audit results, keyed by path and validated by content hash.
+
+    ``lookup`` returns the cached result for a file or None; after a miss, the caller
+    audits the file and hands the result to ``store``. ``save`` writes the cache
+    atomically. With ``path`` set to None nothing is cached.
+    """
+
+    def __init__(
+        self,
+        path: Path | None,
+        schema: str,
+        key: str,
+        root: Path = ROOT,
+    ) -> None:
+        self.path = path
+        self.schema = schema
+        self.key = key
+        self.root = root
+        self.loaded = self._load()
+        self.entries: dict[str, dict] = {}
+        self.pending: dict[str, dict] = {}
+        self.audited = 0
+
+    def _load(self) -> dict[str, dict]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if data.get("schema") != self.schema or data.get("key") != self.key:
+            return {}
+        return dict(data.get("files") or {})
+
+    def lookup(self, name: str) -> Any | None:
+        """Return the cached result for ``name`` (a POSIX path relative to the root)."""
+        if self.path is None:
+            return None
+        entry = self.loaded.get(name)
+        try:
+            stat = os.stat(self.root / name)
+            if entry is not None and (entry.get("mtimeNs"), entry.get("size")) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                self.entries[name] = entry
+                return entry["result"]
+            digest = hashlib.sha256((self.root / name).read_bytes()).hexdigest()
+        except OSError:
+            return None
+        if entry is not None and entry.get("sha256") == digest:
+            self.entries[name] = dict(entry, mtimeNs=stat.st_mtime_ns, size=stat.st_size)
+            return entry["result"]
+        self.pending[name] = {"mtimeNs": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}
+        return None
+
+    def store(self, name: str, result: Any) -> None:
+        """Record ``result`` for a file whose ``lookup`` missed."""
+        self.audited += 1
+        fingerprint = self.pending.pop(name, None)
+        if fingerprint is not None:
+            self.entries[name] = dict(fingerprint, result=result)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        if not self.audited and self.entries.keys() == self.loaded.keys() and all(
+            self.entries[name] is self.loaded[name] for name in self.entries
+        ):
+            return
+        # Entries for files outside this run stay cached until the file disappears.
+        merged = {
+            name: entry
+            for name, entry in self.loaded.items()
+            if name not in self.entries and (self.root / name).exists()
+        }
+        merged.update(self.entries)
+        payload = {"schema": self.schema, "key": self.key, "files": dict(sorted(merged.items()))}
+        write_json_atomic(self.path, payload, indent=1)
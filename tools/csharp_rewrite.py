@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Token-stream rewrite engine for bulk C# test refactors.
+
+The TUnit migration scripts in scripts/tunit-migration (and
+scripts/dev/add-version-coverage.py) describe their edits as rules: a token pattern written as a C# snippet with
+`$name` placeholders, plus a replacement template or function. A `Rewriter`
+tokenizes each file once (with tools/csharp_tokens.py) and applies every rule in a single left-to-right pass,
+so adding rules does not add passes over the file, and `rewrite_files` spreads
+files across worker processes.
+
+Pattern placeholders:
+    $name          a balanced expression (lazy; never crosses an unmatched
+                   bracket or a top-level `;`)
+    $name:ident    one identifier
+    $name:block    one `{ ... }` block
+    $name:attrs    zero or more `[ ... ]` attribute lists
+    $name:chain    zero or more trailing `.Member` or `.Member(...)` accesses
+    $name?         an expression that may be empty
+
+Literal pattern tokens match the file's tokens regardless of whitespace and
+comments between them. The text a placeholder captures is itself rewritten by
+the same rules before it is substituted, so nested matches (assertions inside a
+method body, for example) are still handled in the one pass. Templates refer to
+captures as `$name` and to the indentation of the matched line as `$indent`.
+Replacement functions receive the `Match` and return the replacement text, or
+None to leave the match as it was. A rule that replaces a statement sitting on
+its own line with "" removes the whole line.
+
+Usage:
+    rewriter = Rewriter([
+        Rule("is-true", "Assert.That($actual, Is.True);",
+             "await Assert.That($actual).IsTrue().ConfigureAwait(false);"),
+    ])
+    result = rewriter.rewrite(source)
+    results = rewrite_files(paths, rewriter, write=True, jobs=4)
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from csharp_tokens import CLOSERS, OPENERS, match_brackets, tokenize  # noqa: E402
+from process_pool import default_jobs, map_files  # noqa: E402,F401
+
+PLACEHOLDER_PATTERN = re.compile(r"\$(\w+)(?::(ident|block|attrs|chain))?(\?)?")
+TEMPLATE_PATTERN = re.compile(r"\$(\w+)")
+
+
+@dataclass(frozen=True)
+class Literal:
+    text: str
+
+
+@dataclass(frozen=True)
+class Capture:
+    name: str
+    kind: str  # "expr", "ident", "block", "attrs", or "chain"
+    optional: bool = False
+
+
+def compile_pattern(pattern: str) -> tuple[Union[Literal, Capture], ...]:
+    """Turn a C# snippet with $placeholders into a sequence of pattern elements."""
+    elements: list[Union[Literal, Capture]] = []
+    pos = 0
+    for placeholder in PLACEHOLDER_PATTERN.finditer(pattern):
+        texts, _, _, _ = tokenize(pattern[pos:placeholder.start()])
+        elements.extend(Literal(text) for text in texts)
+        name, kind, optional = placeholder.groups()
+        elements.append(Capture(name, kind or "expr", bool(optional)))
+        pos = placeholder.end()
+    texts, _, _, _ = tokenize(pattern[pos:])
+    elements.extend(Literal(text) for text in texts)
+    if not elements:
+        raise ValueError("empty rewrite pattern")
+    return tuple(elements)
+
+
+Replacement = Union[str, Callable[["Match"], Optional[str]]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """Rewrite every match of ``pattern`` with ``replacement`` (a template or a function)."""
+    name: str
+    pattern: str
+    replacement: Replacement
+
+
+@dataclass
+class RewriteResult:
+    text: str
+    counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+class Match:
+    """One rule match: captured text (already rewritten) and helpers for replacements."""
+
+    def __init__(self, state: "_RewriteState", start: int, end: int, spans: dict[str, tuple[int, int]]):
+        self._state = state
+        self.start = start
+        self.end = end
+        self.spans = spans
+        self._texts: dict[str, str] = {}
+
+    def __getitem__(self, name: str) -> str:
+        if name not in self._texts:
+            start, end = self.spans[name]
+            self._texts[name] = self._state.render(start, end)
+        return self._texts[name]
+
+    @property
+    def indent(self) -> str:
+        """Indentation of the line the match starts on."""
+        return self._state.indent(self.start)
+
+    def leading(self, name: str) -> str:
+        """The whitespace and comments right before a capture."""
+        start, end = self.spans[name]
+        return self._state.leads[start] if end > start else ""
+
+    def rewrite(self, name: str, rewriter: "Rewriter") -> str:
+        """Apply another rule set to the capture's original tokens (instead of this one's)."""
+        start, end = self.spans[name]
+        nested = _RewriteState(rewriter, self._state.texts, self._state.kinds, self._state.leads,
+                               self._state.partner, self._state.tail)
+        text = nested.render(start, end)
+        for rule_name, count in nested.counts.items():
+            self._state.counts[rule_name] = self._state.counts.get(rule_name, 0) + count
+        self._texts[name] = text
+        return text
+
+    def original(self) -> str:
+        """The matched source text, with each capture replaced by its rewritten text."""
+        state = self._state
+        starts = {start: (name, end) for name, (start, end) in self.spans.items() if end > start}
+        pieces = []
+        index = self.start
+        while index < self.end:
+            if index > self.start:
+                pieces.append(state.leads[index])
+            if index in starts:
+                name, end = starts[index]
+                pieces.append(self[name])
+                index = end
+            else:
+                pieces.append(state.texts[index])
+                index += 1
+        return "".join(pieces)
+
+
+class Rewriter:
+    """
+    A compiled rule set; rules earlier in the list win when several match at one token.
+
+    ``finalize`` (a module-level function, so workers can pickle it) post-processes the
+    rewritten file for fix-ups that depend on the whole file, such as adding a using.
+    """
+
+    def __init__(self, rules: list[Rule], finalize: Optional[Callable[[str], str]] = None):
+        self.rules = list(rules)
+        self.finalize = finalize
+        self.patterns = [compile_pattern(rule.pattern) for rule in self.rules]
+        self._by_text: dict[str, list[int]] = {}
+        self._by_kind: dict[str, list[int]] = {}
+        self._anywhere: list[int] = []
+        for index, elements in enumerate(self.patterns):
+            first = elements[0]
+            if isinstance(first, Literal):
+                self._by_text.setdefault(first.text, []).append(index)
+            elif first.kind == "ident" and not first.optional:
+                self._by_kind.setdefault("ident", []).append(index)
+            else:
+                self._anywhere.append(index)
+        self._candidates: dict[tuple[str, str], list[int]] = {}
+
+    def __getstate__(self) -> dict:
+        return {"rules": self.rules, "finalize": self.finalize}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["rules"], state["finalize"])
+
+    def candidates(self, text: str, kind: str) -> list[int]:
+        key = (text, kind)
+        found = self._candidates.get(key)
+        if found is None:
+            found = sorted(
+                self._by_text.get(text, []) + self._by_kind.get(kind, []) + self._anywhere
+            )
+            self._candidates[key] = found
+        return found
+
+    def rewrite(self, text: str) -> RewriteResult:
+        """Apply every rule to ``text`` in one pass."""
+        texts, kinds, leads, tail = tokenize(text)
+        state = _RewriteState(self, texts, kinds, leads, match_brackets(texts), tail)
+        body = state.render(0, len(texts), top_level=True)
+        prefix = leads[0] if texts else ""
+        if state.deleted_first_line:
+            prefix = prefix[: prefix.rfind("\n") + 1]
+        suffix = state.strip_line(tail) if state.strip_lead_of == len(texts) else tail
+        rewritten = prefix + body + suffix
+        if self.finalize is not None:
+            rewritten = self.finalize(rewritten)
+        return RewriteResult(text=rewritten, counts=state.counts)
+
+
+class _RewriteState:
+    def __init__(self, rewriter: Rewriter, texts, kinds, leads, partner, tail):
+        self.rewriter = rewriter
+        self.texts = texts
+        self.kinds = kinds
+        self.leads = leads
+        self.partner = partner
+        self.tail = tail
+        self.counts: dict[str, int] = {}
+        self.strip_lead_of = -1
+        self.deleted_first_line = False
+
+    def indent(self, index: int) -> str:
+        line = self.leads[index].rsplit("\n", 1)[-1]
+        if line.strip():
+            line = ""
+        if index > 0 and "\n" not in self.leads[index]:
+            # The match does not start its line; walk back to the line's first token.
+            while index > 0 and "\n" not in self.leads[index]:
+                index -= 1
+            line = self.leads[index].rsplit("\n", 1)[-1]
+        return line[: len(line) - len(line.lstrip(" \t"))]
+
+    @staticmethod
+    def strip_line(lead: str) -> str:
+        return lead.partition("\n")[2]
+
+    def render(self, start: int, end: int, top_level: bool = False) -> str:
+        """Rewrite tokens [start, end) and return their text (without the first token's lead)."""
+        texts = self.texts
+        leads = self.leads
+        pieces: list[str] = []
+        index = start
+        while index < end:
+            if index > start:
+                lead = leads[index]
+                if self.strip_lead_of == index:
+                    lead = self.strip_line(lead)
+                    self.strip_lead_of = -1
+                pieces.append(lead)
+            replaced = None
+            for rule_index in self.rewriter.candidates(texts[index], self.kinds[index]):
+                matched = self.match(self.rewriter.patterns[rule_index], 0, index, end, {})
+                if matched is None:
+                    continue
+                match_end, spans = matched
+                rule = self.rewriter.rules[rule_index]
+                match = Match(self, index, match_end, spans)
+                if isinstance(rule.replacement, str):
+                    replacement = TEMPLATE_PATTERN.sub(
+                        lambda m: match.indent if m.group(1) == "indent" else match[m.group(1)],
+                        rule.replacement,
+                    )
+                else:
+                    replacement = rule.replacement(match)
+                if replacement is None:
+                    replaced = (match_end, match.original())
+                    break
+                self.counts[rule.name] = self.counts.get(rule.name, 0) + 1
+                if replacement == "" and self._deletes_line(index, match_end, end, top_level):
+                    if pieces and index > start:
+                        pieces[-1] = pieces[-1][: pieces[-1].rfind("\n") + 1]
+                    elif index == 0:
+                        self.deleted_first_line = True
+                    self.strip_lead_of = match_end
+                replaced = (match_end, replacement)
+                break
+            if replaced is None:
+                pieces.append(texts[index])
+                index += 1
+            else:
+                pieces.append(replaced[1])
+                index = replaced[0]
+        return "".join(pieces)
+
+    def _deletes_line(self, start: int, end: int, limit: int, top_level: bool) -> bool:
+        before = self.leads[start]
+        if "\n" not in before and start > 0:
+            return False
+        if before.rsplit("\n", 1)[-1].strip():
+            return False
+        if end < limit:
+            after = self.leads[end]
+        elif top_level and end == len(self.texts):
+            after = self.tail
+        else:
+            return False
+        first_line, newline, _ = after.partition("\n")
+        return bool(newline) and not first_line.strip()
+
+    def match(self, elements, position: int, index: int, limit: int, spans: dict):
+        """Match ``elements[position:]`` at token ``index``; returns (end, spans) or None."""
+        if position == len(elements):
+            return index, spans
+        element = elements[position]
+        texts = self.texts
+        if isinstance(element, Literal):
+            if index < limit and texts[index] == element.text:
+                return self.match(elements, position + 1, index + 1, limit, spans)
+            return None
+
+        name = element.name
+        kind = element.kind
+        if kind == "ident":
+            if index < limit and self.kinds[index] == "ident":
+                return self.match(elements, position + 1, index + 1, limit, {**spans, name: (index, index + 1)})
+            return None
+        if kind == "block":
+            if index < limit and texts[index] == "{" and index < self.partner[index] < limit:
+                end = self.partner[index] + 1
+                return self.match(elements, position + 1, end, limit, {**spans, name: (index, end)})
+            return None
+        if kind == "attrs":
+            end = index
+            while end < limit and texts[end] == "[" and end < self.partner[end] < limit:
+                end = self.partner[end] + 1
+            return self.match(elements, position + 1, end, limit, {**spans, name: (index, end)})
+        if kind == "chain":
+            end = index
+            while end + 1 < limit and texts[end] == "." and self.kinds[end + 1] == "ident":
+                end += 2
+                if end < limit and texts[end] == "(" and end < self.partner[end] < limit:
+                    end = self.partner[end] + 1
+            return self.match(elements, position + 1, end, limit, {**spans, name: (index, end)})
+
+        # Balanced expression: try the shortest capture first, then extend it.
+        following = elements[position + 1] if position + 1 < len(elements) else None
+        next_text = following.text if isinstance(following, Literal) else None
+        end = index
+        if element.optional:
+            matched = self._try_expression(elements, position, index, end, limit, spans, next_text)
+            if matched is not None:
+                return matched
+        while end < limit:
+            text = texts[end]
+            if text in CLOSERS or text == ";":
+                return None
+            if text in OPENERS:
+                partner = self.partner[end]
+                if partner < end or partner >= limit:
+                    return None
+                end = partner + 1
+            else:
+                end += 1
+            matched = self._try_expression(elements, position, index, end, limit, spans, next_text)
+            if matched is not None:
+                return matched
+        return None
+
+    def _try_expression(self, elements, position, index, end, limit, spans, next_text):
+        if next_text is not None and (end >= limit or self.texts[end] != next_text):
+            return None
+        return self.match(elements, position + 1, end, limit, {**spans, elements[position].name: (index, end)})
+
+
+@dataclass
+class FileRewrite:
+    """The outcome of rewriting one file."""
+    path: Path
+    changed: bool
+    text: str
+    counts: dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+_worker_rewriter: Optional[Rewriter] = None
+_worker_write = False
+
+
+def rewrite_file(path: Path, rewriter: Rewriter, write: bool = False) -> FileRewrite:
+    """Rewrite one file, writing it back only when ``write`` is set and it changed."""
+    try:
+        original = Path(path).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        return FileRewrite(path=path, changed=False, text="", error=f"Failed to read file: {e}")
+    result = rewriter.rewrite(original)
+    changed = result.text != original
+    rewrite = FileRewrite(path=path, changed=changed, text=result.text, counts=result.counts)
+    if changed and write:
+        try:
+            Path(path).write_text(result.text, encoding="utf-8")
+        except OSError as e:
+            rewrite.error = f"Failed to write file: {e}"
+    return rewrite
+
+
+def _init_worker(rewriter: Rewriter, write: bool) -> None:
+    global _worker_rewriter, _worker_write
+    _worker_rewriter = rewriter
+    _worker_write = write
+
+
+def _rewrite_in_worker(path: Path) -> FileRewrite:
+    return rewrite_file(path, _worker_rewriter, _worker_write)
+
+
+def rewrite_files(
+    paths: list[Path],
+    rewriter: Rewriter,
+    write: bool = False,
+    jobs: int = 1,
+) -> list[FileRewrite]:
+    """Rewrite ``paths`` (in parallel with ``jobs`` > 1), returning results in input order."""
+    return map_files(
+        _rewrite_in_worker,
+        paths,
+        jobs,
+        serial=lambda path: rewrite_file(path, rewriter, write),
+        initializer=_init_worker,
+        initargs=(rewriter, write),
+    )
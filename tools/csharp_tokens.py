@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Lossless C# tokenizer shared by the C# source tooling.
+
+`tokenize` splits a file into significant tokens (identifiers, numbers,
+punctuation, and string/char literals, including verbatim, interpolated, and
+raw strings) and keeps the whitespace, comments, and preprocessor lines before
+each token as its "lead", so joining every lead and token reproduces the file.
+Tools that match code therefore never see comments or literal contents unless
+they ask for them. tools/csharp_rewrite.py (the rule engine behind the TUnit
+migration scripts) and scripts/lint/check-luanumber-usage.py build on it.
+"""
+
+from __future__ import annotations
+
+import re
+
+# Trivia is kept verbatim and skipped when matching patterns.
+TRIVIA_PATTERN = re.compile(
+    r"[ \t\r\n\f\v\ufeff]+"  # whitespace
+    r"|//[^\n]*"  # line comment
+    r"|/\*.*?(?:\*/|\Z)"  # block comment
+    r"|#[^\n]*",  # preprocessor directive
+    re.DOTALL,
+)
+
+TOKEN_PATTERN = re.compile(
+    r"(?P<raw>\$*\"\"\"+)"  # raw string opener; scanned by _scan_raw_string
+    r"|(?P<interp>\$@?\"|@\$\")"  # interpolated string opener; scanned by _scan_interpolated
+    r"|(?P<string>@\"(?:[^\"]|\"\")*\"|\"(?:[^\"\\\n]|\\.)*\")"
+    r"|(?P<char>'(?:[^'\\\n]|\\.)+')"
+    r"|(?P<ident>@?[^\W\d]\w*)"
+    r"|(?P<number>0[xXbB][0-9a-fA-F_]+[A-Za-z]*|\d[\d_]*(?:\.\d[\d_]*)?(?:[eE][+-]?\d+)?[A-Za-z]*)"
+    r"|(?P<punct>=>|::|==|!=|<=|>=|&&|\|\||\?\?|\?\.|\+\+|--|->|[+\-*/%&|^]=|.)",
+    re.DOTALL,
+)
+
+OPENERS = {"(": ")", "[": "]", "{": "}"}
+CLOSERS = {")", "]", "}"}
+
+
+def _scan_raw_string(text: str, pos: int, opener: str) -> int:
+    """Return the end of a C# 11 raw string literal whose opener starts at ``pos``."""
+    quotes = opener.lstrip("$")
+    close = text.find(quotes, pos + len(opener))
+    if close < 0:
+        return len(text)
+    end = close + len(quotes)
+    while end < len(text) and text[end] == '"':
+        end += 1
+    return end
+
+
+def _scan_interpolated(text: str, pos: int, opener: str) -> int:
+    """Return the end of an interpolated string, skipping strings nested in its holes."""
+    verbatim = "@" in opener
+    i = pos + len(opener)
+    depth = 0
+    while i < len(text):
+        ch = text[i]
+        if depth == 0:
+            if ch == '"':
+                if verbatim and text.startswith('""', i):
+                    i += 2
+                    continue
+                return i + 1
+            if ch == "\\" and not verbatim:
+                i += 2
+                continue
+            if ch == "\n" and not verbatim:
+                return i
+            if ch == "{":
+                if text.startswith("{{", i):
+                    i += 2
+                    continue
+                depth = 1
+            i += 1
+            continue
+        if ch in "\"'$@":
+            match = TOKEN_PATTERN.match(text, i)
+            if match.lastgroup in ("string", "char"):
+                i = match.end()
+                continue
+            if match.lastgroup == "interp":
+                i = _scan_interpolated(text, i, match.group())
+                continue
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+        i += 1
+    return len(text)
+
+
+def tokenize(text: str) -> tuple[list[str], list[str], list[str], str]:
+    """
+    Split C# source into significant tokens.
+
+    Returns (texts, kinds, leads, tail): the text and kind of every significant
+    token, the trivia preceding each one, and the trivia after the last one.
+    Joining lead + text for every token, then the tail, reproduces ``text``.
+    """
+    texts: list[str] = []
+    kinds: list[str] = []
+    leads: list[str] = []
+    pos = 0
+    length = len(text)
+    while True:
+        trivia_start = pos
+        while pos < length:
+            trivia = TRIVIA_PATTERN.match(text, pos)
+            if trivia is None:
+                break
+            pos = trivia.end()
+        if pos >= length:
+            return texts, kinds, leads, text[trivia_start:]
+        match = TOKEN_PATTERN.match(text, pos)
+        kind = match.lastgroup
+        end = match.end()
+        if kind == "raw":
+            end = _scan_raw_string(text, pos, match.group())
+            kind = "string"
+        elif kind == "interp":
+            end = _scan_interpolated(text, pos, match.group())
+            kind = "string"
+        leads.append(text[trivia_start:pos])
+        texts.append(text[pos:end])
+        kinds.append(kind)
+        pos = end
+
+
+def match_brackets(texts: list[str]) -> list[int]:
+    """Map every bracket to its partner's index (-1 when unbalanced)."""
+    partner = [-1] * len(texts)
+    stack: list[int] = []
+    for index, text in enumerate(texts):
+        if text in OPENERS:
+            stack.append(index)
+        elif text in CLOSERS:
+            if stack and OPENERS[texts[stack[-1]]] == text:
+                opener = stack.pop()
+                partner[opener] = index
+                partner[index] = opener
+            else:
+                # Recover from stray closers by discarding unmatched openers.
+                while stack and OPENERS[texts[stack[-1]]] != text:
+                    stack.pop()
+                if stack:
+                    opener = stack.pop()
+                    partner[opener] = index
+                    partner[index] = opener
+    return partner
@@ -12,7 +12,8 @@ Conversions:
     [Arguments(Lua51)][Arguments(Lua52)][Arguments(Lua53)]    -> [LuaVersionRange(Lua51, Lua53)]
 
 Non-contiguous patterns (e.g., Lua51, Lua53, Lua55) and patterns with extra
-parameters are recorded in manual-review.txt for human review.
+parameters are recorded in a manual review file for human review: next to the
+--write-plan file when one is written, otherwise under artifacts/.
 
 Usage:
     python tools/migrate_csharp_version_annotations.py                 # Dry run (default)
@@ -21,6 +22,13 @@ Usage:
     python tools/migrate_csharp_version_annotations.py --verbose       # Show all changes in detail
     python tools/migrate_csharp_version_annotations.py --test          # Run unit tests
     python tools/migrate_csharp_version_annotations.py --apply --verbose  # Apply with details
+    python tools/migrate_csharp_version_annotations.py --write-plan    # Dry run + write the plan
+    python tools/migrate_csharp_version_annotations.py --apply-plan artifacts/csharp-annotation-migration-plan.json
+
+Every test file is read and planned once, in parallel (--jobs), through the shared
+engine in tools/annotation_migration.py. --write-plan stores the planned edits as
+a reviewable JSON patch set; --apply-plan later writes exactly those edits
+without re-scanning, refusing (and changing nothing) if any file changed since.
 
 Requirements:
     - Must be run from the repository root
@@ -29,7 +37,7 @@ Requirements:
 Limitations:
     - Only handles [Arguments(LuaCompatibilityVersion.LuaXX)] attributes
     - Attributes with extra parameters (e.g., [Arguments(Lua53, "extra")]) are skipped
-    - Non-contiguous version patterns are written to manual-review.txt
+    - Non-contiguous version patterns are written to the manual review file
 """
 
 from __future__ import annotations
@@ -43,6 +51,24 @@ from typing import Optional
 
 # Script directory for relative imports
 SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from annotation_migration import (
+    FileEdit,
+    Hunk,
+    MigrationPlan,
+    StalePlanError,
+    add_plan_arguments,
+    apply_plan,
+    apply_saved_plan,
+    plan_migration,
+    read_source,
+)
+
+# Plan files record which migrator wrote them; --apply-plan refuses the others.
+MIGRATOR = "csharp-tests"
+DEFAULT_PLAN_PATH = Path("artifacts") / "csharp-annotation-migration-plan.json"
+DEFAULT_MANUAL_REVIEW_PATH = Path("artifacts") / "csharp-annotation-manual-review.txt"
 
 # All known Lua versions as C# enum values (in order)
 ALL_LUA_ENUM_VALUES = [
@@ -103,6 +129,7 @@ class MigrationReport:
     files_with_errors: int = 0
     conversions: list[ConversionResult] = field(default_factory=list)
     manual_review_entries: list[tuple[Path, AttributeGroup]] = field(default_factory=list)
+    plan: Optional[MigrationPlan] = None
 
 
 # Regex to match [Arguments(LuaCompatibilityVersion.LuaXX)] or [Arguments(LuaXX)]
@@ -315,36 +342,34 @@ def find_attribute_groups(lines: list[str]) -> list[AttributeGroup]:
     return groups
 
 
-def process_file(file_path: Path, apply: bool = False) -> ConversionResult:
+def plan_file(file_path: Path) -> tuple[ConversionResult, Optional[FileEdit]]:
     """
-    Process a single C# test file.
+    Analyze a single C# test file without modifying it.
 
     Args:
         file_path: Path to the .cs file
-        apply: Whether to actually write changes
 
     Returns:
-        ConversionResult describing what happened
+        The ConversionResult plus the edit that would apply it (None if nothing changes)
     """
     result = ConversionResult(file_path=file_path)
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.splitlines(keepends=True)
+        source = read_source(file_path)
     except Exception as e:
         result.error = f"Failed to read file: {e}"
-        return result
+        return result, None
 
+    lines = source.lines
     if not lines:
-        return result
+        return result, None
 
     # Find attribute groups
     groups = find_attribute_groups(lines)
     result.attribute_groups = groups
 
     if not groups:
-        return result
+        return result, None
 
     # Count conversions
     for group in groups:
@@ -355,20 +380,38 @@ def process_file(file_path: Path, apply: bool = False) -> ConversionResult:
         else:
             result.skipped_count += 1
 
-    # Apply changes if requested
-    if apply and result.converted_count > 0:
-        # Build new content by replacing groups (in reverse order to preserve line numbers)
-        new_lines = list(lines)
+    if result.converted_count == 0:
+        return result, None
+
+    # Each convertible group collapses into a single attribute line
+    hunks = [
+        Hunk(
+            start=group.start_line,
+            before=lines[group.start_line:group.end_line + 1],
+            after=[f"{group.indentation}{group.new_attribute}\n"],
+        )
+        for group in groups
+        if group.can_convert and group.new_attribute
+    ]
+    return result, FileEdit(path=file_path, sha256=source.sha256, hunks=hunks)
 
-        for group in reversed(groups):
-            if group.can_convert and group.new_attribute:
-                # Replace the group with the new attribute
-                new_attr_line = f"{group.indentation}{group.new_attribute}\n"
-                new_lines[group.start_line:group.end_line + 1] = [new_attr_line]
 
+def process_file(file_path: Path, apply: bool = False) -> ConversionResult:
+    """
+    Process a single C# test file.
+
+    Args:
+        file_path: Path to the .cs file
+        apply: Whether to actually write changes
+
+    Returns:
+        ConversionResult describing what happened
+    """
+    result, edit = plan_file(file_path)
+
+    if apply and edit is not None:
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.writelines(new_lines)
+            apply_plan(MigrationPlan(migrator=MIGRATOR, root=file_path.parent, edits=[edit]))
         except Exception as e:
             result.error = f"Failed to write file: {e}"
 
@@ -414,18 +457,29 @@ def find_csharp_test_files(base_path: Path) -> list[Path]:
 def run_migration(
     base_path: Path,
     apply: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    jobs: int = 1,
+    plan_path: Optional[Path] = None,
 ) -> MigrationReport:
     """
     Run the migration process on all C# test files.
 
+    Every file is planned once (in parallel with ``jobs`` > 1); ``apply`` then
+    writes the planned edits all-or-nothing instead of processing files one by one.
+
     Args:
         base_path: Repository root path
         apply: Whether to actually write changes
         verbose: Whether to show detailed output
+        jobs: Worker processes used for planning
+        plan_path: Where to write the reviewable plan file (None to skip)
 
     Returns:
         MigrationReport with summary and details
+
+    Raises:
+        StalePlanError: A test file changed between planning and applying
+        OSError: Writing the planned edits failed (no test file was modified)
     """
     report = MigrationReport()
 
@@ -433,9 +487,14 @@ def run_migration(
     cs_files = find_csharp_test_files(base_path)
     report.total_files_scanned = len(cs_files)
 
-    # Process each file
-    for cs_file in cs_files:
-        result = process_file(cs_file, apply=apply)
+    results, plan = plan_migration(MIGRATOR, base_path, cs_files, plan_file, jobs=jobs)
+    report.plan = plan
+    if plan_path is not None:
+        plan.write(plan_path)
+    if apply:
+        apply_plan(plan)
+
+    for result in results:
         report.conversions.append(result)
 
         if result.error:
@@ -453,22 +512,39 @@ def run_migration(
             # Collect manual review entries
             for group in result.attribute_groups:
                 if not group.can_convert and (group.has_extra_params or not group.is_contiguous):
-                    report.manual_review_entries.append((cs_file, group))
+                    report.manual_review_entries.append((result.file_path, group))
 
     return report
 
 
-def write_manual_review_file(report: MigrationReport, base_path: Path):
+def manual_review_path(base_path: Path, plan_path: Optional[Path] = None) -> Path:
+    """
+    Return where the manual review file goes, so a run never writes to the repo root.
+
+    Args:
+        base_path: Repository root path
+        plan_path: The --write-plan file, if one is written
+
+    Returns:
+        A path beside the plan file, or under base_path/artifacts without one
+    """
+    if plan_path is not None:
+        return plan_path.with_name(f"{plan_path.stem}-manual-review.txt")
+    return base_path / DEFAULT_MANUAL_REVIEW_PATH
+
+
+def write_manual_review_file(report: MigrationReport, base_path: Path, path: Path):
     """
-    Write the manual-review.txt file with patterns that need human review.
+    Write the manual review file with patterns that need human review.
 
     Args:
         report: The migration report
         base_path: Repository root path
+        path: Where to write the file (see manual_review_path)
     """
-    manual_review_path = base_path / "manual-review.txt"
+    path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(manual_review_path, 'w', encoding='utf-8') as f:
+    with open(path, 'w', encoding='utf-8') as f:
         f.write("=" * 70 + "\n")
         f.write("C# Version Annotation Manual Review\n")
         f.write("=" * 70 + "\n\n")
@@ -513,7 +589,12 @@ def write_manual_review_file(report: MigrationReport, base_path: Path):
         f.write("=" * 70 + "\n")
 
 
-def print_report(report: MigrationReport, verbose: bool = False, apply: bool = False):
+def print_report(
+    report: MigrationReport,
+    verbose: bool = False,
+    apply: bool = False,
+    review_path: Optional[Path] = None,
+):
     """
     Print the migration report.
 
@@ -521,6 +602,7 @@ def print_report(report: MigrationReport, verbose: bool = False, apply: bool = F
         report: The migration report to print
         verbose: Whether to show detailed output
         apply: Whether changes were applied
+        review_path: Where the manual review file was written, if it was
     """
     mode = "APPLIED" if apply else "DRY RUN"
 
@@ -593,8 +675,8 @@ def print_report(report: MigrationReport, verbose: bool = False, apply: bool = F
     print(f"\n{'='*70}")
     if not apply:
         print("This was a dry run. Use --apply to make actual changes.")
-    if report.total_manual_review > 0:
-        print(f"Manual review file written to: manual-review.txt")
+    if review_path is not None:
+        print(f"Manual review file written to: {review_path}")
     print(f"{'='*70}\n")
 
 
@@ -630,6 +712,7 @@ def main():
         default=None,
         help="Repository root path (default: current directory)"
     )
+    add_plan_arguments(parser, DEFAULT_PLAN_PATH)
 
     args = parser.parse_args()
 
@@ -640,6 +723,10 @@ def main():
     # Determine base path
     base_path = args.path or Path.cwd()
 
+    # A saved plan is applied as-is: no test file is scanned or parsed again
+    if args.apply_plan:
+        return apply_saved_plan(args.apply_plan, MIGRATOR, base_path)
+
     # Verify we're in the right place
     if not (base_path / "src" / "tests").exists():
         print(f"Error: Cannot find src/tests directory in {base_path}")
@@ -647,14 +734,30 @@ def main():
         sys.exit(1)
 
     # Run migration
-    report = run_migration(base_path, apply=args.apply, verbose=args.verbose)
+    try:
+        report = run_migration(
+            base_path,
+            apply=args.apply,
+            verbose=args.verbose,
+            jobs=args.jobs,
+            plan_path=args.write_plan,
+        )
+    except (StalePlanError, OSError) as e:
+        print(f"Error: {e}")
+        print("No files were modified.")
+        return 1
 
     # Write manual review file if needed
+    review_path = None
     if report.total_manual_review > 0:
-        write_manual_review_file(report, base_path)
+        review_path = manual_review_path(base_path, args.write_plan)
+        write_manual_review_file(report, base_path, review_path)
 
     # Print report
-    print_report(report, verbose=args.verbose, apply=args.apply)
+    print_report(report, verbose=args.verbose, apply=args.apply, review_path=review_path)
+    if args.write_plan:
+        print(f"Plan ({report.plan.hunk_count} edits in {len(report.plan.edits)} files) "
+              f"written to: {args.write_plan}")
 
     return 0
 
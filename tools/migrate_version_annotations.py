@@ -20,6 +20,13 @@ Usage:
     python tools/migrate_version_annotations.py --apply         # Apply changes
     python tools/migrate_version_annotations.py --verbose       # Show all changes in detail
     python tools/migrate_version_annotations.py --apply --verbose  # Apply with details
+    python tools/migrate_version_annotations.py --write-plan    # Dry run + write the plan
+    python tools/migrate_version_annotations.py --apply-plan artifacts/lua-annotation-migration-plan.json
+
+Every fixture is read and planned once, in parallel (--jobs), through the shared
+engine in tools/annotation_migration.py. --write-plan stores the planned edits as
+a reviewable JSON patch set; --apply-plan later writes exactly those edits
+without re-scanning, refusing (and changing nothing) if any fixture changed since.
 
 Requirements:
     - Must be run from the repository root
@@ -45,12 +52,27 @@ from typing import Optional
 SCRIPT_DIR = Path(__file__).parent
 sys.path.insert(0, str(SCRIPT_DIR))
 
+from annotation_migration import (
+    FileEdit,
+    Hunk,
+    MigrationPlan,
+    StalePlanError,
+    add_plan_arguments,
+    apply_plan,
+    apply_saved_plan,
+    plan_migration,
+    read_source,
+)
 from lua_version_utils import (
     ALL_LUA_VERSIONS,
     parse_lua_versions,
     simplify_version_list,
 )
 
+# Plan files record which migrator wrote them; --apply-plan refuses the others.
+MIGRATOR = "lua-fixtures"
+DEFAULT_PLAN_PATH = Path("artifacts") / "lua-annotation-migration-plan.json"
+
 
 @dataclass
 class ConversionResult:
@@ -80,6 +102,7 @@ class MigrationReport:
     special_patterns: int = 0  # 'none', 'novasharp-only', etc.
     annotations_not_on_line1: int = 0
     conversions: list[ConversionResult] = field(default_factory=list)
+    plan: Optional[MigrationPlan] = None
 
 
 # Maximum number of lines to check for annotation if not found on line 1
@@ -240,29 +263,28 @@ def convert_annotation(version_str: str) -> tuple[str, bool]:
     return original, False
 
 
-def process_file(file_path: Path, apply: bool = False) -> ConversionResult:
+def plan_file(file_path: Path) -> tuple[ConversionResult, Optional[FileEdit]]:
     """
-    Process a single Lua fixture file.
+    Analyze a single Lua fixture file without modifying it.
 
     Args:
         file_path: Path to the .lua file
-        apply: Whether to actually write changes
 
     Returns:
-        ConversionResult describing what happened
+        The ConversionResult plus the edit that would apply it (None if nothing changes)
     """
     result = ConversionResult(file_path=file_path)
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        source = read_source(file_path)
     except Exception as e:
         result.error = f"Failed to read file: {e}"
-        return result
+        return result, None
 
+    lines = source.lines
     if not lines:
         result.no_annotation = True
-        return result
+        return result, None
 
     # Check line 1 for @lua-versions annotation
     first_line = lines[0]
@@ -279,7 +301,7 @@ def process_file(file_path: Path, apply: bool = False) -> ConversionResult:
 
         if not match:
             result.no_annotation = True
-            return result
+            return result, None
 
     prefix = match.group(1)  # e.g., "-- @lua-versions: "
     version_str = match.group(2)  # e.g., "5.1, 5.2, 5.3, 5.4, 5.5"
@@ -291,33 +313,50 @@ def process_file(file_path: Path, apply: bool = False) -> ConversionResult:
         result.is_special_pattern = True
         result.already_optimal = True
         result.new_annotation = version_str
-        return result
+        return result, None
 
     # Check if already optimal
     if is_already_range_syntax(version_str):
         result.already_optimal = True
         result.new_annotation = version_str
-        return result
+        return result, None
 
     # Try to convert
     new_version_str, was_converted = convert_annotation(version_str)
     result.new_annotation = new_version_str
 
-    if was_converted:
-        result.converted = True
+    if not was_converted:
+        return result, None
 
-        if apply:
-            # Update the line
-            line_idx = result.line_number - 1
-            new_line = f"{prefix}{new_version_str}\n"
-            lines[line_idx] = new_line
+    result.converted = True
+    line_idx = result.line_number - 1
+    edit = FileEdit(
+        path=file_path,
+        sha256=source.sha256,
+        hunks=[Hunk(start=line_idx, before=[lines[line_idx]], after=[f"{prefix}{new_version_str}\n"])],
+    )
+    return result, edit
 
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.writelines(lines)
-            except Exception as e:
-                result.error = f"Failed to write file: {e}"
-                result.converted = False
+
+def process_file(file_path: Path, apply: bool = False) -> ConversionResult:
+    """
+    Process a single Lua fixture file.
+
+    Args:
+        file_path: Path to the .lua file
+        apply: Whether to actually write changes
+
+    Returns:
+        ConversionResult describing what happened
+    """
+    result, edit = plan_file(file_path)
+
+    if apply and edit is not None:
+        try:
+            apply_plan(MigrationPlan(migrator=MIGRATOR, root=file_path.parent, edits=[edit]))
+        except Exception as e:
+            result.error = f"Failed to write file: {e}"
+            result.converted = False
 
     return result
 
@@ -325,18 +364,29 @@ def process_file(file_path: Path, apply: bool = False) -> ConversionResult:
 def run_migration(
     base_path: Path,
     apply: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    jobs: int = 1,
+    plan_path: Optional[Path] = None,
 ) -> MigrationReport:
     """
     Run the migration process on all Lua fixtures.
 
+    Every fixture is planned once (in parallel with ``jobs`` > 1); ``apply`` then
+    writes the planned edits all-or-nothing instead of processing files one by one.
+
     Args:
         base_path: Repository root path
         apply: Whether to actually write changes
         verbose: Whether to show detailed output
+        jobs: Worker processes used for planning
+        plan_path: Where to write the reviewable plan file (None to skip)
 
     Returns:
         MigrationReport with summary and details
+
+    Raises:
+        StalePlanError: A fixture changed between planning and applying
+        OSError: Writing the planned edits failed (no fixture was modified)
     """
     report = MigrationReport()
 
@@ -344,9 +394,14 @@ def run_migration(
     lua_files = find_lua_fixtures(base_path)
     report.total_files_scanned = len(lua_files)
 
-    # Process each file
-    for lua_file in lua_files:
-        result = process_file(lua_file, apply=apply)
+    results, plan = plan_migration(MIGRATOR, base_path, lua_files, plan_file, jobs=jobs)
+    report.plan = plan
+    if plan_path is not None:
+        plan.write(plan_path)
+    if apply:
+        apply_plan(plan)
+
+    for result in results:
         report.conversions.append(result)
 
         if result.error:
@@ -516,12 +571,17 @@ def main():
         default=None,
         help="Repository root path (default: current directory)"
     )
+    add_plan_arguments(parser, DEFAULT_PLAN_PATH)
 
     args = parser.parse_args()
 
     # Determine base path
     base_path = args.path or Path.cwd()
 
+    # A saved plan is applied as-is: no fixture is scanned or parsed again
+    if args.apply_plan:
+        return apply_saved_plan(args.apply_plan, MIGRATOR, base_path)
+
     # Verify we're in the right place
     if not (base_path / "src" / "tests").exists():
         print(f"Error: Cannot find src/tests directory in {base_path}")
@@ -529,10 +589,24 @@ def main():
         sys.exit(1)
 
     # Run migration
-    report = run_migration(base_path, apply=args.apply, verbose=args.verbose)
+    try:
+        report = run_migration(
+            base_path,
+            apply=args.apply,
+            verbose=args.verbose,
+            jobs=args.jobs,
+            plan_path=args.write_plan,
+        )
+    except (StalePlanError, OSError) as e:
+        print(f"Error: {e}")
+        print("No files were modified.")
+        return 1
 
     # Print report
     print_report(report, verbose=args.verbose, apply=args.apply)
+    if args.write_plan:
+        print(f"Plan ({report.plan.hunk_count} edits in {len(report.plan.edits)} files) "
+              f"written to: {args.write_plan}")
 
     return 0
 
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Tests for tools/annotation_migration.py and the migrators built on it."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import annotation_migration  # noqa: E402
+import migrate_csharp_version_annotations as csharp_migrator  # noqa: E402
+import migrate_version_annotations as lua_migrator  # noqa: E402
+from annotation_migration import MigrationPlan, StalePlanError, apply_plan  # noqa: E402
+from process_pool import MIN_PARALLEL_FILES  # noqa: E402
+
+
+CSHARP_SOURCE = """namespace Sample;
+
+public sealed class SampleTUnitTests
+{
+    [Test]
+    [Arguments(LuaCompatibilityVersion.Lua53)]
+    [Arguments(LuaCompatibilityVersion.Lua54)]
+    [Arguments(LuaCompatibilityVersion.Lua55)]
+    public async Task Runs(LuaCompatibilityVersion version)
+    {
+    }
+
+    [Test]
+    [Arguments(LuaCompatibilityVersion.Lua51)]
+    [Arguments(LuaCompatibilityVersion.Lua53)]
+    public async Task Skips(LuaCompatibilityVersion version)
+    {
+    }
+}
+"""
+
+
+class AnnotationMigrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.temporary_directory.name)
+        fixtures = self.root / "src" / "tests" / "Sample.Tests.TUnit" / "LuaFixtures"
+        fixtures.mkdir(parents=True)
+        self.fixture = fixtures / "upper.lua"
+        self.fixture.write_text("-- @lua-versions: 5.3, 5.4, 5.5\nreturn 1\n", encoding="utf-8")
+        self.optimal = fixtures / "optimal.lua"
+        self.optimal.write_text("-- @lua-versions: all\nreturn 2\n", encoding="utf-8")
+        self.test_file = fixtures.parent / "SampleTUnitTests.cs"
+        self.test_file.write_text(CSHARP_SOURCE, encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_plan_round_trips_and_applies_without_rescanning(self) -> None:
+        plan_path = self.root / "plans" / "lua.json"
+        report = lua_migrator.run_migration(self.root, plan_path=plan_path)
+        self.assertEqual(1, report.files_converted)
+        self.assertIn("5.3, 5.4, 5.5", self.fixture.read_text(encoding="utf-8"))
+
+        loaded = MigrationPlan.load(plan_path, lua_migrator.MIGRATOR, self.root)
+        self.assertEqual([self.fixture], [edit.path for edit in loaded.edits])
+        with mock.patch.object(lua_migrator, "plan_file", side_effect=AssertionError):
+            self.assertEqual(1, apply_plan(loaded))
+        self.assertEqual(
+            "-- @lua-versions: 5.3+\nreturn 1\n", self.fixture.read_text(encoding="utf-8")
+        )
+
+        with self.assertRaises(ValueError):
+            MigrationPlan.load(plan_path, csharp_migrator.MIGRATOR, self.root)
+
+    def test_stale_plan_and_failed_write_leave_every_file_untouched(self) -> None:
+        _, lua_plan = annotation_migration.plan_migration(
+            "lua-fixtures", self.root, [self.fixture, self.optimal], lua_migrator.plan_file
+        )
+        results, csharp_plan = annotation_migration.plan_migration(
+            "csharp-tests", self.root, [self.test_file], csharp_migrator.plan_file
+        )
+        self.assertEqual((1, 1), (results[0].converted_count, results[0].manual_review_count))
+        combined = MigrationPlan("combined", self.root, lua_plan.edits + csharp_plan.edits)
+        originals = {edit.path: edit.path.read_bytes() for edit in combined.edits}
+
+        self.test_file.write_text(CSHARP_SOURCE + "// edited\n", encoding="utf-8")
+        with self.assertRaises(StalePlanError) as raised:
+            apply_plan(combined)
+        self.assertEqual([self.test_file], raised.exception.paths)
+        self.assertEqual(originals[self.fixture], self.fixture.read_bytes())
+
+        self.test_file.write_bytes(originals[self.test_file])
+        failing_copymode = mock.patch.object(
+            annotation_migration.shutil, "copymode", side_effect=[None, OSError]
+        )
+        with failing_copymode, self.assertRaises(OSError):
+            apply_plan(combined)
+        self.assertEqual(originals, {path: path.read_bytes() for path in originals})
+        self.assertEqual([], [path.name for path in self.root.rglob("*.tmp")])
+
+        self.assertEqual(2, apply_plan(combined))
+        migrated = self.test_file.read_text(encoding="utf-8")
+        self.assertIn(
+            "    [LuaVersionsFrom(LuaCompatibilityVersion.Lua53)]\n    public async Task Runs",
+            migrated,
+        )
+        self.assertIn("[Arguments(LuaCompatibilityVersion.Lua51)]", migrated)
+
+    def test_parallel_planning_matches_serial_planning(self) -> None:
+        paths = [self.fixture, self.optimal] * (MIN_PARALLEL_FILES // 2)
+        serial_results, serial_plan = annotation_migration.plan_migration(
+            "lua-fixtures", self.root, paths, lua_migrator.plan_file
+        )
+        parallel_results, parallel_plan = annotation_migration.plan_migration(
+            "lua-fixtures", self.root, paths, lua_migrator.plan_file, jobs=2
+        )
+        self.assertEqual(serial_results, parallel_results)
+        self.assertEqual(serial_plan.to_json(), parallel_plan.to_json())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Tests for tools/audit_cache.py."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from audit_cache import AuditCache, cache_key  # noqa: E402
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class AuditCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.work_dir = ROOT / "artifacts" / "test-audit-cache"
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+        self.work_dir.mkdir(parents=True)
+        self.cache_path = self.work_dir / "cache.json"
+        (self.work_dir / "a.cs").write_text("class a {}\n", encoding="utf-8")
+        (self.work_dir / "b.cs").write_text("class B {}\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+
+    def cache(self, key: str = "k") -> AuditCache:
+        return AuditCache(self.cache_path, "test.v1", key, root=self.work_dir)
+
+    def audit(self, cache: AuditCache, names: list[str]) -> dict[str, object]:
+        results = {}
+        for name in names:
+            result = cache.lookup(name)
+            if result is None:
+                result = [(self.work_dir / name).read_text(encoding="utf-8").strip()]
+                cache.store(name, result)
+            results[name] = result
+        cache.save()
+        return results
+
+    def test_reuses_results_until_contents_or_key_change(self) -> None:
+        cold = self.cache()
+        first = self.audit(cold, ["a.cs", "b.cs"])
+        self.assertEqual(2, cold.audited)
+
+        warm = self.cache()
+        self.assertEqual(first, self.audit(warm, ["a.cs", "b.cs"]))
+        self.assertEqual(0, warm.audited)
+
+        # Same bytes with a new modification time are matched by hash.
+        stat = (self.work_dir / "a.cs").stat()
+        os.utime(self.work_dir / "a.cs", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        touched = self.cache()
+        self.audit(touched, ["a.cs", "b.cs"])
+        self.assertEqual(0, touched.audited)
+
+        (self.work_dir / "b.cs").write_text("class Bb {}\n", encoding="utf-8")
+        edited = self.cache()
+        self.assertEqual(["class Bb {}"], self.audit(edited, ["a.cs", "b.cs"])["b.cs"])
+        self.assertEqual(1, edited.audited)
+
+        rekeyed = self.cache(key=cache_key([Path(__file__)], {"option": 1}))
+        self.audit(rekeyed, ["a.cs", "b.cs"])
+        self.assertEqual(2, rekeyed.audited)
+
+    def test_reaudits_files_edited_since_the_cache_and_drops_deleted_ones(self) -> None:
+        self.audit(self.cache(), ["a.cs", "b.cs"])
+        # a.cs changed on disk (a checkout, say) after the cache was written.
+        (self.work_dir / "a.cs").write_text("class Edited {}\n", encoding="utf-8")
+
+        checkout = self.cache()
+        results = self.audit(checkout, ["a.cs", "b.cs"])
+        self.assertEqual(["class Edited {}"], results["a.cs"])
+        self.assertEqual(["class B {}"], results["b.cs"])
+        self.assertEqual(1, checkout.audited)
+
+        (self.work_dir / "b.cs").unlink()
+        self.audit(self.cache(), ["a.cs"])
+        self.assertEqual(["a.cs"], list(self.cache().loaded))
+
+
+if __name__ == "__main__":
+    unittest.main()
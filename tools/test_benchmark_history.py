@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Tests for scripts/benchmarks/benchmark-history.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "scripts" / "benchmarks" / "benchmark-history.py"
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("benchmark_history", SCRIPT)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {SCRIPT}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class BenchmarkHistoryTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_module()
+
+    def setUp(self) -> None:
+        self.work_dir = ROOT / "artifacts" / "test-benchmark-history"
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+        self.reports = self.work_dir / "reports"
+        self.history = self.work_dir / "history.jsonl"
+
+    def tearDown(self) -> None:
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+
+    def write_report(self, mean: float, allocated: float = 64) -> None:
+        results = self.reports / "results"
+        if results.exists():
+            shutil.rmtree(results)
+        results.mkdir(parents=True)
+        report = {
+            "HostEnvironmentInfo": {
+                "OsVersion": "Linux",
+                "ProcessorName": "Test CPU",
+                "LogicalCoreCount": 4,
+                "Architecture": "X64",
+                "RuntimeVersion": ".NET 8.0.0",
+            },
+            "Benchmarks": [
+                {
+                    "Namespace": "WallstopStudios.NovaSharp.Comparison",
+                    "Type": "LuaPerformanceBenchmarks",
+                    "Method": "NovaSharpExecute",
+                    "MethodTitle": "'NovaSharp Execute'",
+                    "Parameters": "ScenarioName=NumericLoops",
+                    "Statistics": {"Mean": mean, "Percentiles": {"P95": mean * 1.1}},
+                    "Memory": {"BytesAllocatedPerOperation": allocated},
+                }
+            ],
+        }
+        (results / "LuaPerformanceBenchmarks-report-full-compressed.json").write_text(
+            json.dumps(report),
+            encoding="utf-8",
+        )
+
+    def run_script(self, *args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [
+                "python3",
+                str(SCRIPT.relative_to(ROOT)),
+                "--history",
+                str(self.history.relative_to(ROOT)),
+                *args,
+            ],
+            cwd=ROOT,
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+
+    def ingest(self, commit: str, day: int) -> subprocess.CompletedProcess[str]:
+        result = self.run_script(
+            "ingest",
+            str(self.reports.relative_to(ROOT)),
+            "--commit",
+            commit,
+            "--commit-time",
+            f"2025-01-{day:02d}T00:00:00+00:00",
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+        return result
+
+    def test_ingest_is_append_only_and_skips_reports_already_recorded(self) -> None:
+        self.write_report(100)
+        first = self.ingest("aaaa", 1)
+        second = self.ingest("aaaa", 1)
+
+        self.assertIn("ingested_records=1", first.stdout)
+        self.assertIn("ingested_records=0", second.stdout)
+        self.assertIn("skipped_reports=1", second.stdout)
+        records = [json.loads(line) for line in self.history.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(1, len(records))
+        self.assertEqual("NovaSharp", records[0]["runtime"])
+        self.assertEqual("Execute", records[0]["method"])
+        self.assertEqual("aaaa", records[0]["commit"])
+        self.assertEqual(12, len(records[0]["machine"]))
+
+    def test_machine_fingerprint_matches_the_renderer_and_includes_the_sidecar(self) -> None:
+        self.write_report(100)
+        self.reports.joinpath("environment-fingerprint.json").write_text(
+            json.dumps({"kernel": "6.1.0", "governor": "performance"}), encoding="utf-8"
+        )
+        self.ingest("aaaa", 1)
+        self.reports.joinpath("environment-fingerprint.json").write_text(
+            json.dumps({"kernel": "6.8.0", "governor": "performance"}), encoding="utf-8"
+        )
+        self.ingest("bbbb", 2)
+
+        records = [json.loads(line) for line in self.history.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(
+            {
+                "architecture": "X64",
+                "governor": "performance",
+                "kernel": "6.1.0",
+                "logicalCores": "4",
+                "os": "Linux",
+                "processor": "Test CPU",
+                "runtime": ".NET 8.0.0",
+            },
+            records[0]["machineInfo"],
+        )
+        renderer = self.module.load_delta_renderer()
+        expected = renderer.EnvironmentFingerprint(records[0]["machineInfo"]).digest
+        self.assertEqual(expected, records[0]["machine"])
+        self.assertNotEqual(records[0]["machine"], records[1]["machine"])
+
+    def test_changepoints_report_first_regressing_commit_range(self) -> None:
+        means = [100, 101, 99, 100, 130, 131, 129, 130]
+        for index, mean in enumerate(means):
+            self.write_report(mean)
+            self.ingest(f"commit{index}", index + 1)
+
+        result = self.run_script("changepoints", "--scenario", "numericloops", "--regressions-only")
+
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertIn("regression_changepoints=1", result.stderr)
+        self.assertIn("| regression | 100.0 ns | 130.0 ns | +30.00% |", result.stdout)
+        self.assertIn("| `commit3` | `commit4` |", result.stdout)
+
+        trend = self.run_script("trend", "--metric", "allocatedBytes")
+        self.assertIn("series=1", trend.stderr)
+        self.assertIn("| `commit7` | 2025-01-08T00:00:00+00:00 | 1 | 64 B | +0.00% | +0.00% |", trend.stdout)
+
+    def test_dirty_records_are_excluded_unless_requested(self) -> None:
+        for index, mean in enumerate((100, 100, 100, 100)):
+            self.write_report(mean)
+            self.ingest(f"commit{index}", index + 1)
+        records = [json.loads(line) for line in self.history.read_text(encoding="utf-8").splitlines()]
+        dirty = {**records[-1], "commit": "dirty", "commitTime": "2025-01-09T00:00:00+00:00"}
+        with self.history.open("a", encoding="utf-8") as handle:
+            for mean in (150, 151):
+                handle.write(json.dumps({**dirty, "dirty": True, "meanNs": mean}) + "\n")
+
+        clean = self.run_script("trend")
+        self.assertIn("dirty_records_excluded=2", clean.stderr)
+        self.assertNotIn("`dirty`", clean.stdout)
+
+        included = self.run_script("trend", "--include-dirty")
+        self.assertNotIn("dirty_records_excluded", included.stderr)
+        self.assertIn("| `dirty` | 2025-01-09T00:00:00+00:00 | 2 |", included.stdout)
+
+    def test_series_order_commits_by_utc_time_across_offsets(self) -> None:
+        self.write_report(100)
+        self.ingest("tokyo", 1)
+        template = json.loads(self.history.read_text(encoding="utf-8"))
+        commit_times = (
+            ("tokyo", "2025-01-01T10:00:00+09:00"),
+            ("newyork", "2025-01-01T05:00:00-05:00"),
+            ("london", "2025-01-01T12:00:00+00:00"),
+        )
+        records = [
+            {**template, "commit": commit, "commitTime": commit_time}
+            for commit, commit_time in commit_times
+        ]
+
+        series = self.module.build_series(records, "meanNs", "", "", "")
+
+        (points,) = series.values()
+        self.assertEqual(["tokyo", "newyork", "london"], [point.commit for point in points])
+        self.assertEqual("2025-01-01T01:00:00+00:00", points[0].commit_time)
+
+        result = self.run_script(
+            "ingest",
+            str(self.reports.relative_to(ROOT)),
+            "--commit",
+            "offset",
+            "--commit-time",
+            "2025-01-02T09:00:00+09:00",
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+        stored = json.loads(self.history.read_text(encoding="utf-8").splitlines()[-1])
+        self.assertEqual("2025-01-02T00:00:00+00:00", stored["commitTime"])
+
+    def test_noisy_flat_series_has_no_changepoints(self) -> None:
+        key = self.module.SeriesKey("machine", "NovaSharp", "Summary", "Execute", "")
+        points = [
+            self.module.CommitPoint(f"c{index}", f"t{index}", value, 1)
+            for index, value in enumerate([100, 104, 97, 103, 98, 102, 99, 105])
+        ]
+
+        changepoints = self.module.find_changepoints(key, "meanNs", points, 0.05, 4.0, 2)
+
+        self.assertEqual([], changepoints)
+
+
+if __name__ == "__main__":
+    unittest.main()
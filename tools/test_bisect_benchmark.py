@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Tests for scripts/benchmarks/bisect-benchmark.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "scripts" / "benchmarks" / "bisect-benchmark.py"
+
+# Stands in for the dotnet build and BenchmarkDotNet run: each commit of the test
+# repository stores its NovaSharp mean in mean.txt.
+MEASURE_SCRIPT = """
+import json, os
+from pathlib import Path
+
+mean = float(Path("mean.txt").read_text())
+samples = [mean + offset for offset in (-1.5, -1, -0.5, 0, 0, 0.5, 1, 1.5, -0.25, 0.25)]
+results = Path(os.environ["BISECT_ARTIFACTS"]) / "results"
+results.mkdir(parents=True, exist_ok=True)
+report = {
+    "Benchmarks": [
+        {
+            "Namespace": "WallstopStudios.NovaSharp.Comparison",
+            "Type": "LuaPerformanceBenchmarks",
+            "Method": "NovaSharpExecute",
+            "MethodTitle": "'NovaSharp Execute'",
+            "Parameters": "ScenarioName=NumericLoops",
+            "Statistics": {"Mean": mean, "Percentiles": {"P95": mean + 1.5}, "OriginalValues": samples},
+            "Memory": {"BytesAllocatedPerOperation": 64},
+        }
+    ]
+}
+(results / "LuaPerformanceBenchmarks-report-full-compressed.json").write_text(json.dumps(report))
+"""
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("bisect_benchmark", SCRIPT)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {SCRIPT}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class BisectBenchmarkTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_module()
+
+    def setUp(self) -> None:
+        self.work_dir = ROOT / "artifacts" / "test-bisect-benchmark"
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+        self.repo = self.work_dir / "repo"
+        self.repo.mkdir(parents=True)
+        self.measure = self.work_dir / "measure.py"
+        self.measure.write_text(MEASURE_SCRIPT, encoding="utf-8")
+        self.git("init", "-q")
+        self.git("config", "user.email", "bench@example.com")
+        self.git("config", "user.name", "Bench")
+        self.commits = []
+        for index, mean in enumerate((100, 100, 101, 130, 131, 130)):
+            (self.repo / "mean.txt").write_text(f"{mean}\n", encoding="utf-8")
+            self.git("add", "mean.txt")
+            self.git("commit", "-q", "--allow-empty", "-m", f"commit {index}")
+            self.commits.append(self.git("rev-parse", "HEAD"))
+
+    def tearDown(self) -> None:
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+
+    def git(self, *args: str) -> str:
+        return subprocess.run(
+            ["git", *args],
+            cwd=self.repo,
+            text=True,
+            capture_output=True,
+            check=True,
+        ).stdout.strip()
+
+    def run_script(self, good: str, bad: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [
+                "python3",
+                str(SCRIPT.relative_to(ROOT)),
+                "run",
+                "--repo",
+                str(self.repo),
+                "--good",
+                good,
+                "--bad",
+                bad,
+                "--scenario",
+                "NumericLoops",
+                "--no-lua-cli",
+                "--measure-command",
+                f"{sys.executable} {self.measure}",
+                "--cache",
+                str(self.work_dir / "cache"),
+                "--output",
+                str(self.work_dir / "bisect.md"),
+            ],
+            cwd=ROOT,
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+
+    def test_finds_first_regressing_commit_and_reuses_cached_results(self) -> None:
+        first = self.run_script(self.commits[0], self.commits[-1])
+
+        self.assertEqual(0, first.returncode, first.stderr + first.stdout)
+        self.assertIn(f"first_bad_commit={self.commits[3]}", first.stdout)
+        self.assertIn("cached_probes=0", first.stdout)
+        report = (self.work_dir / "bisect.md").read_text(encoding="utf-8")
+        self.assertIn(f"- First bad commit: `{self.commits[3][:12]}` (commit 3)", report)
+        self.assertIn(f"| `{self.commits[3][:12]}` | bad | 130 ns | 132 ns | 64 B |", report)
+        self.assertNotIn("bisect-worktree", self.git("worktree", "list", "--porcelain"))
+
+        second = self.run_script(self.commits[1], self.commits[-2])
+        self.assertEqual(0, second.returncode, second.stderr + second.stdout)
+        self.assertIn(f"first_bad_commit={self.commits[3]}", second.stdout)
+        probed = int(second.stdout.split("probed_commits=")[1].split()[0])
+        self.assertIn(f"cached_probes={probed}", second.stdout)
+
+    def test_refuses_to_bisect_when_bad_commit_does_not_regress(self) -> None:
+        result = self.run_script(self.commits[0], self.commits[2])
+
+        self.assertEqual(1, result.returncode)
+        self.assertIn(f"error=bad commit {self.commits[2][:12]} does not regress", result.stderr)
+
+    def test_failed_measurements_are_retried_instead_of_cached(self) -> None:
+        flag = self.work_dir / "fail-measurement"
+        flag.write_text("", encoding="utf-8")
+        state = {
+            "repo": str(self.repo),
+            "cache": str(self.work_dir / "cache"),
+            "key": self.module.parse_key(None, "NumericLoops"),
+            "runtime": "NovaSharp",
+            "filter": "*NumericLoops*",
+            "configuration": "Release",
+            "luaCmd": None,
+            "measureCommand": f"test ! -e {flag} && {sys.executable} {self.measure}",
+        }
+
+        failed = self.module.measure_commit(state, self.commits[0])
+        self.assertEqual("measure-failed", failed.status)
+        self.assertIsNone(self.module.load_result(state, self.commits[0]))
+
+        flag.unlink()
+        measured = self.module.measure_commit(state, self.commits[0])
+        self.assertTrue(measured.measured)
+        self.assertEqual(100, measured.mean_ns)
+        cached = self.module.load_result(state, self.commits[0])
+        self.assertIsNotNone(cached)
+        self.assertEqual(measured.samples_ns, cached.samples_ns)
+
+    def test_key_json_and_default_filter(self) -> None:
+        key = self.module.parse_key(
+            json.dumps({"operation": "Execute", "parameters": "Scenario:BinaryTrees"}), None
+        )
+
+        self.assertEqual("*BinaryTrees*", self.module.default_filter(key))
+        with self.assertRaises(ValueError):
+            self.module.default_filter(
+                self.module.parse_key(json.dumps({"operation": "LuaToClrInterop"}), None)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
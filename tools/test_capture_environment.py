@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Tests for scripts/benchmarks/capture-environment.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "scripts" / "benchmarks" / "capture-environment.py"
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("capture_environment", SCRIPT)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {SCRIPT}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class CaptureEnvironmentTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_module()
+
+    def setUp(self) -> None:
+        self.work_dir = ROOT / "artifacts" / "test-capture-environment"
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+
+    def tearDown(self) -> None:
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+
+    def test_writes_environment_next_to_benchmark_artifacts(self) -> None:
+        result = subprocess.run(
+            [
+                "python3",
+                str(SCRIPT.relative_to(ROOT)),
+                "--output-root",
+                str(self.work_dir.relative_to(ROOT)),
+            ],
+            cwd=ROOT,
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertIn(
+            "output=artifacts/test-capture-environment/environment-fingerprint.json",
+            result.stdout,
+        )
+        payload = json.loads((self.work_dir / "environment-fingerprint.json").read_text())
+        self.assertEqual("novasharp.benchmark-environment.v1", payload["schema"])
+        self.assertGreater(payload["logicalCores"], 0)
+        self.assertTrue(payload["kernel"])
+
+    def test_reads_distinct_governors_across_cpus(self) -> None:
+        for cpu, governor in (("cpu0", "performance"), ("cpu1", "powersave"), ("cpu2", "powersave")):
+            path = self.work_dir / cpu / "cpufreq" / "scaling_governor"
+            path.parent.mkdir(parents=True)
+            path.write_text(f"{governor}\n", encoding="utf-8")
+        (self.work_dir / "cpufreq").mkdir()
+
+        self.assertEqual("performance,powersave", self.module.read_governors(self.work_dir))
+        self.assertEqual("", self.module.read_governors(self.work_dir / "missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Tests for scripts/lint/check-luanumber-usage.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import shutil
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "scripts" / "lint" / "check-luanumber-usage.py"
+
+sys.path.insert(0, str(ROOT / "tools"))
+
+from audit_cache import AuditCache  # noqa: E402
+from process_pool import MIN_PARALLEL_FILES  # noqa: E402
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("check_luanumber_usage", SCRIPT)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {SCRIPT}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class AnalyzeContentTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_module()
+
+    def lines(self, source: str) -> list[int]:
+        return [issue.line_number for issue in self.module.analyze_content(source, "src/X.cs")]
+
+    def test_strings_and_comments_never_raise_findings(self) -> None:
+        source = (
+            "// n = (int)arg.Number;\n"
+            "/* n = (int)arg.Number;\n"
+            "   x.Number * 2 */\n"
+            'string s = "(int)arg.Number";\n'
+            'string v = @"x.Number - 1";\n'
+            'string r = """\n    (long)arg.Number\n    """;\n'
+            "#if LEGACY // (int)arg.Number\n"
+        )
+
+        self.assertEqual([], self.lines(source))
+
+    def test_strings_and_comments_never_suppress_findings(self) -> None:
+        source = (
+            "n = (int)arg.Number; // exitCode\n"
+            'n = (int)arg.Number + Log("IsNumber");\n'
+            "n = (int)arg.Number; /* DynValue.NewNumber */\n"
+            "n = (int)count.Number; // safe: argCount\n"
+        )
+
+        self.assertEqual([1, 2, 3, 4], self.lines(source))
+
+    def test_code_safe_patterns_and_audited_files_still_apply(self) -> None:
+        self.assertEqual([], self.lines("int argCount = (int)args[0].Number;\n"))
+        self.assertEqual(
+            [], self.module.analyze_content("n = (int)arg.Number;\n", "src/CoreLib/Utf8Module.cs")
+        )
+        self.assertEqual([2], self.lines("int n = (int)\n    arg.Number - 1;\n"))
+
+
+class AnalyzeFilesTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_module()
+
+    def setUp(self) -> None:
+        self.work_dir = ROOT / "artifacts" / "test-check-luanumber-usage"
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+        self.work_dir.mkdir(parents=True)
+        self.cache_path = self.work_dir / "cache.json"
+        self.paths = []
+        for number in range(MIN_PARALLEL_FILES + 2):
+            path = self.work_dir / f"File{number:03}.cs"
+            body = "n = (int)arg.Number;\n" if number % 4 == 0 else "n = arg.ToInteger();\n"
+            path.write_text(f"class File{number} {{\n{body}}}\n", encoding="utf-8")
+            self.paths.append(path)
+
+    def tearDown(self) -> None:
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+
+    def cache(self) -> AuditCache:
+        return AuditCache(self.cache_path, "test.v1", "key", root=self.work_dir)
+
+    def test_parallel_and_cached_runs_match_a_serial_run(self) -> None:
+        serial = self.module.analyze_files(self.paths, self.work_dir)
+        # One issue per fourth file.
+        self.assertEqual(len(self.paths[::4]), len(serial))
+
+        cold = self.cache()
+        self.assertEqual(serial, self.module.analyze_files(self.paths, self.work_dir, 2, cold))
+        self.assertEqual(len(self.paths), cold.audited)
+
+        warm = self.cache()
+        self.assertEqual(serial, self.module.analyze_files(self.paths, self.work_dir, 1, warm))
+        self.assertEqual(0, warm.audited)
+
+        self.paths[1].write_text("n = (long)arg.Number;\n", encoding="utf-8")
+        edited = self.cache()
+        issues = self.module.analyze_files(self.paths, self.work_dir, 1, edited)
+        self.assertEqual(1, edited.audited)
+        self.assertEqual(("File001.cs", 1), (issues[1].file_path, issues[1].line_number))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Tests for scripts/lint/check-tunit-version-coverage.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "scripts" / "lint" / "check-tunit-version-coverage.py"
+sys.path.insert(0, str(ROOT / "tools"))
+
+from process_pool import MIN_PARALLEL_FILES  # noqa: E402
+
+# The scanner reads up to PRECEDING_CONTEXT_LINES above each [Test], so the methods
+# are spaced further apart than that to keep each window to its own attributes.
+METHODS = [
+    """        [global::TUnit.Core.Test]
+        [global::TUnit.Core.Arguments(
+            LuaCompatibilityVersion.Lua53,
+            "first")]
+        [global::TUnit.Core.Arguments(
+            Compatibility.LuaCompatibilityVersion.Lua54,
+            "second"
+        )]
+        public async Task MultiLineArguments(LuaCompatibilityVersion version, string name)
+        {
+            Script script = new Script(version);
+        }
+""",
+    """        [AllLuaVersions]
+        [global::TUnit.Core.Test]
+        public async Task HelperAttributeAbove(LuaCompatibilityVersion version)
+        {
+            script.DoString("return 1");
+        }
+""",
+    """        [global::TUnit.Core.Test]
+        [global::TUnit.Core.MethodDataSource(nameof(Cases))]
+        public async Task DataSource(int value)
+        {
+        }
+""",
+    """        [global::TUnit.Core.Test]
+        public async Task RunsLuaWithoutVersions()
+        {
+            Script script = CreateScript();
+            if (script != null)
+            {
+                await script.Call(script.Globals["f"]);
+            }
+        }
+""",
+    """        [global::TUnit.Core.Test]
+        public async Task InfrastructureOnly()
+        {
+            await Assert.That(1).IsEqualTo(1);
+        }
+""",
+    """        // [global::TUnit.Core.Test] is not first on this line, so it is ignored.
+        public async Task NotATest()
+        {
+            script.DoString("return 2");
+        }
+""",
+]
+
+FIXTURE = (
+    "namespace Sample\n{\n    public sealed class SampleTUnitTests\n    {\n"
+    + "\n" * 20
+    + ("\n" * 20).join(METHODS)
+    + "    }\n}\n"
+)
+
+
+def declaration_line(name: str) -> int:
+    lines = FIXTURE.splitlines()
+    return next(number for number, line in enumerate(lines, start=1) if f"Task {name}(" in line)
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("check_tunit_version_coverage", SCRIPT)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {SCRIPT}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class AnalyzeContentTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_module()
+
+    def test_classifies_each_test_from_its_context_window(self) -> None:
+        test_file = self.module.analyze_content(FIXTURE, "SampleTUnitTests.cs", "SampleTUnitTests")
+
+        self.assertEqual("SampleTUnitTests", test_file.class_name)
+        self.assertEqual(
+            [
+                ("MultiLineArguments", declaration_line("MultiLineArguments"), ["Lua53", "Lua54"], False, False, True),
+                ("HelperAttributeAbove", declaration_line("HelperAttributeAbove"), [], False, True, True),
+                ("DataSource", declaration_line("DataSource"), [], True, False, False),
+                ("RunsLuaWithoutVersions", declaration_line("RunsLuaWithoutVersions"), [], False, False, True),
+                ("InfrastructureOnly", declaration_line("InfrastructureOnly"), [], False, False, False),
+            ],
+            [
+                (
+                    method.name,
+                    method.line_number,
+                    method.version_arguments,
+                    method.has_methoddatasource,
+                    method.has_lua_version_helper,
+                    method.executes_lua,
+                )
+                for method in test_file.methods
+            ],
+        )
+        self.assertEqual(
+            ["RunsLuaWithoutVersions"],
+            [method.name for method in test_file.lua_execution_tests_needing_version],
+        )
+        self.assertEqual(
+            ["InfrastructureOnly"], [method.name for method in test_file.infrastructure_tests]
+        )
+        body = test_file.methods[3].method_body
+        self.assertTrue(body.lstrip().startswith("{"))
+        self.assertTrue(body.rstrip().endswith("}"))
+        self.assertEqual(body.count("{"), body.count("}"))
+
+
+class AnalyzeTestFilesTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_module()
+
+    def setUp(self) -> None:
+        # Not under artifacts/: find_test_files skips that directory.
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.work_dir = Path(self.temporary_directory.name)
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_parallel_report_matches_serial_report(self) -> None:
+        for number in range(MIN_PARALLEL_FILES + 2):
+            content = FIXTURE.replace("SampleTUnitTests", f"Sample{number:03}TUnitTests")
+            if number % 5 == 0:
+                content = content.replace("[AllLuaVersions]", "")
+            path = self.work_dir / f"Sample{number:03}TUnitTests.cs"
+            path.write_text(content, encoding="utf-8")
+        paths = self.module.find_test_files(self.work_dir)
+
+        serial = self.module.generate_report(self.module.analyze_test_files(paths, jobs=1), detailed=True)
+        parallel = self.module.generate_report(self.module.analyze_test_files(paths, jobs=2), detailed=True)
+
+        self.assertEqual(json.dumps(serial, indent=2), json.dumps(parallel, indent=2))
+        self.assertEqual(MIN_PARALLEL_FILES + 2, len(paths))
+        self.assertEqual(5 * len(paths), serial["summary"]["total_tests"])
+        self.assertEqual(len(paths) + len(paths[::5]), serial["summary"]["lua_execution_needing_version"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Tests for the token-stream C# rewrite engine and the converters built on it."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(ROOT / "scripts" / "tunit-migration"))
+
+import convert_event_member  # noqa: E402
+import convert_nunit_to_tunit  # noqa: E402
+from csharp_rewrite import Rewriter, Rule, rewrite_files  # noqa: E402
+
+
+def load_add_version_coverage():
+    path = ROOT / "scripts" / "dev" / "add-version-coverage.py"
+    spec = importlib.util.spec_from_file_location("add_version_coverage", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class RewriterTests(unittest.TestCase):
+    def test_applies_nested_rules_in_one_pass(self) -> None:
+        rewriter = Rewriter([
+            Rule("drop-using", "using Old.Framework;", ""),
+            Rule("is-true", "Check($actual, Is.True);", "await Verify($actual).IsTrue();"),
+            Rule("typed", "Check($actual, Is.TypeOf<$type>());", "await Verify($actual).IsTypeOf<$type>();"),
+            convert_nunit_to_tunit.ASYNC_TEST_METHOD_RULE,
+        ])
+        source = (
+            "using System;\n"
+            "using Old.Framework;\n"
+            "\n"
+            "class C\n"
+            "{\n"
+            "    public void Converts()\n"
+            "    {\n"
+            "        Check(Make(1, (2, 3)), Is.True);\n"
+            "        Check(map, Is.TypeOf<Dictionary<int, string>>());\n"
+            "    }\n"
+            "\n"
+            "    public void Unchanged()\n"
+            "    {\n"
+            "        Check(x, Is.False);\n"
+            "    }\n"
+            "}\n"
+        )
+
+        result = rewriter.rewrite(source)
+
+        self.assertEqual(
+            "using System;\n"
+            "\n"
+            "class C\n"
+            "{\n"
+            "    public async Task Converts()\n"
+            "    {\n"
+            "        await Verify(Make(1, (2, 3))).IsTrue();\n"
+            "        await Verify(map).IsTypeOf<Dictionary<int, string>>();\n"
+            "    }\n"
+            "\n"
+            "    public void Unchanged()\n"
+            "    {\n"
+            "        Check(x, Is.False);\n"
+            "    }\n"
+            "}\n",
+            result.text,
+        )
+        self.assertEqual(
+            {"drop-using": 1, "is-true": 1, "typed": 1, "async-test-method": 1}, result.counts
+        )
+
+    def test_converters_handle_multiline_statements(self) -> None:
+        source = (
+            "    using System;\n"
+            "    using NUnit.Framework;\n"
+            "\n"
+            "    public sealed class SampleTUnitTests\n"
+            "    {\n"
+            "        [Test]\n"
+            "        public void Throws()\n"
+            "        {\n"
+            "            InvalidOperationException ex = Assert.Throws<InvalidOperationException>(() =>\n"
+            "            {\n"
+            "                Run(\"a, b\");\n"
+            "            });\n"
+            "            Assert.That(value, Is.EqualTo(\"a, b\"), \"message\");\n"
+            "        }\n"
+            "    }\n"
+        )
+
+        result = convert_nunit_to_tunit.REWRITER.rewrite(source)
+
+        self.assertEqual(
+            "    using System;\n"
+            "    using System.Threading.Tasks;\n"
+            "\n"
+            "    public sealed class SampleTUnitTests\n"
+            "    {\n"
+            "        [Test]\n"
+            "        public async Task Throws()\n"
+            "        {\n"
+            "            InvalidOperationException ex = await Assert.That(() =>\n"
+            "            {\n"
+            "                Run(\"a, b\");\n"
+            "            }).ThrowsException().OfType<InvalidOperationException>().ConfigureAwait(false);\n"
+            "            await Assert.That(value).IsEqualTo(\"a, b\").Because(\"message\").ConfigureAwait(false);\n"
+            "        }\n"
+            "    }\n",
+            result.text,
+        )
+
+    def test_assert_that_keeps_trailing_constraint_modifiers(self) -> None:
+        source = (
+            "            Assert.That(d, Is.EqualTo(1.0).Within(0.001));\n"
+            "            Assert.That(ratio, Is.EqualTo(Expected(2)).Within(tolerance), \"ratio\");\n"
+            "            Assert.That(flag, Is.True);\n"
+        )
+
+        result = convert_nunit_to_tunit.REWRITER.rewrite(source)
+
+        self.assertEqual(
+            "            await Assert.That(d).IsEqualTo(1.0).Within(0.001).ConfigureAwait(false);\n"
+            "            await Assert.That(ratio).IsEqualTo(Expected(2)).Within(tolerance)"
+            ".Because(\"ratio\").ConfigureAwait(false);\n"
+            "            await Assert.That(flag).IsTrue().ConfigureAwait(false);\n",
+            result.text,
+        )
+        self.assertEqual(
+            {"assert-that-equal-to": 1, "assert-that-equal-to-message": 1, "assert-that-true": 1},
+            result.counts,
+        )
+
+    def test_assert_multiple_becomes_a_scope_and_keeps_messages(self) -> None:
+        source = (
+            "        [Test]\n"
+            "        public void Grouped()\n"
+            "        {\n"
+            "            Assert.Multiple(() =>\n"
+            "            {\n"
+            "                Assert.That(\n"
+            "                    count,\n"
+            "                    Is.EqualTo(1),\n"
+            "                    \"First add should register delegate once\"\n"
+            "                );\n"
+            "                Assert.That(handler, Is.Not.Null);\n"
+            "            });\n"
+            "        }\n"
+        )
+        expected = (
+            "        [Test]\n"
+            "        public async Task Grouped()\n"
+            "        {\n"
+            "            using (Assert.Multiple())\n"
+            "            {\n"
+            "                await Assert.That(count).IsEqualTo(1)"
+            ".Because(\"First add should register delegate once\").ConfigureAwait(false);\n"
+            "                await Assert.That(handler).IsNotNull().ConfigureAwait(false);\n"
+            "            }\n"
+            "        }\n"
+        )
+
+        for rewriter in (convert_nunit_to_tunit.REWRITER, convert_event_member.REWRITER):
+            with self.subTest(rewriter=rewriter):
+                result = rewriter.rewrite(source)
+
+                self.assertEqual(expected, result.text)
+                self.assertEqual(1, result.counts["assert-multiple"])
+
+    def test_version_coverage_only_touches_unversioned_test_methods(self) -> None:
+        add_version_coverage = load_add_version_coverage()
+        source = (
+            "        [global::TUnit.Core.Test]\n"
+            "        public async Task Plain()\n"
+            "        {\n"
+            "            Script script = CreateScript();\n"
+            "        }\n"
+            "\n"
+            "        [global::TUnit.Core.Test]\n"
+            "        [global::TUnit.Core.Arguments(LuaCompatibilityVersion.Lua54)]\n"
+            "        public async Task Versioned(LuaCompatibilityVersion version)\n"
+            "        {\n"
+            "            Script script = CreateScript();\n"
+            "        }\n"
+        )
+
+        result = add_version_coverage.REWRITER.rewrite(source)
+
+        self.assertEqual({"version-coverage": 1, "create-script": 1}, result.counts)
+        self.assertTrue(
+            result.text.startswith(
+                "        [global::TUnit.Core.Test]\n"
+                "        [global::TUnit.Core.Arguments(LuaCompatibilityVersion.Lua51)]\n"
+            )
+        )
+        self.assertIn("public async Task Plain(LuaCompatibilityVersion version)", result.text)
+        self.assertIn("Script script = CreateScriptWithVersion(version);", result.text)
+        self.assertTrue(result.text.endswith(source[source.index("\n\n"):]))
+
+    def test_parallel_rewrite_matches_serial_and_writes_only_changed_files(self) -> None:
+        rewriter = Rewriter([Rule("fail", "Assert.Fail();", 'Assert.Fail("Forced failure");')])
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for index in range(20):
+                path = Path(directory) / f"Test{index}.cs"
+                path.write_text("Assert.Fail();\n" if index % 2 else "Run();\n", encoding="utf-8")
+                paths.append(path)
+
+            serial = rewrite_files(paths, rewriter)
+            parallel = rewrite_files(paths, rewriter, write=True, jobs=2)
+
+            self.assertEqual(serial, parallel)
+            self.assertEqual(10, sum(result.changed for result in parallel))
+            self.assertEqual('Assert.Fail("Forced failure");\n', paths[1].read_text(encoding="utf-8"))
+            self.assertEqual("Run();\n", paths[0].read_text(encoding="utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Tests for tools/csharp_tokens.py."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from csharp_tokens import match_brackets, tokenize  # noqa: E402
+
+
+class TokenizeTests(unittest.TestCase):
+    def test_round_trips_and_keeps_brackets_in_literals_out_of_the_structure(self) -> None:
+        source = (
+            "// { comment\n"
+            "#region Braces\n"
+            "var a = $\"{Call(\"}\")} {{x}}\"; /* ) */\n"
+            "var b = @\"C:\\{\"\"quoted\"\"}\" + '{' + \"\"\"\n  raw } \"\n  \"\"\";\n"
+            "var c = $@\"{d[\"]\"]}\";\n"
+            "Run(a, b, c);\n"
+        )
+        texts, kinds, leads, tail = tokenize(source)
+
+        self.assertEqual(source, "".join(lead + text for lead, text in zip(leads, texts)) + tail)
+        self.assertEqual(["Run", "(", "a", ",", "b", ",", "c", ")", ";"], texts[-9:])
+        self.assertEqual(4, kinds.count("string"))
+        partner = match_brackets(texts)
+        self.assertEqual(texts.index(")", len(texts) - 9), partner[texts.index("(", len(texts) - 9)])
+
+    def test_comments_directives_and_literals_stay_out_of_code_tokens(self) -> None:
+        source = (
+            "#if DEBUG // x.Number\n"
+            "/* (int)x.Number */ var s = \"(int)x.Number\"; // y.Number\n"
+            "var r = \"\"\"\n  y.Number\n  \"\"\";\n"
+        )
+
+        texts, kinds, leads, tail = tokenize(source)
+
+        self.assertNotIn("Number", texts)
+        self.assertEqual(["string", "string"], [kind for kind in kinds if kind == "string"])
+        self.assertIn("// y.Number", leads[texts.index("var", 1)])
+        self.assertEqual("\n", tail)
+
+
+if __name__ == "__main__":
+    unittest.main()
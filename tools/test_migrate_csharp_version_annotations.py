@@ -22,6 +22,7 @@ from migrate_csharp_version_annotations import (
     determine_replacement,
     find_attribute_groups,
     find_csharp_test_files,
+    manual_review_path,
 )
 
 
@@ -335,5 +336,23 @@ class TestDuplicateVersions(unittest.TestCase):
         )
 
 
+class TestManualReviewPath(unittest.TestCase):
+    """Tests for where the manual review file is written."""
+
+    def test_defaults_under_artifacts(self):
+        """Without a plan file the review file goes under artifacts/, not the repo root."""
+        self.assertEqual(
+            manual_review_path(Path("/repo")),
+            Path("/repo/artifacts/csharp-annotation-manual-review.txt")
+        )
+
+    def test_sits_next_to_the_plan_file(self):
+        """With --write-plan the review file is written beside the plan."""
+        self.assertEqual(
+            manual_review_path(Path("/repo"), Path("out/plan.json")),
+            Path("out/plan-manual-review.txt")
+        )
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Tests for tools/process_pool.py."""
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from process_pool import MIN_PARALLEL_FILES, map_files  # noqa: E402
+
+
+def square_with_pid(value: int) -> tuple[int, int]:
+    return value * value, os.getpid()
+
+
+class MapFilesTests(unittest.TestCase):
+    def test_small_batches_run_in_process_with_the_serial_function(self) -> None:
+        items = list(range(MIN_PARALLEL_FILES - 1))
+
+        results = map_files(square_with_pid, items, jobs=4)
+        self.assertEqual([(value * value, os.getpid()) for value in items], results)
+
+        serial = map_files(square_with_pid, items, jobs=4, serial=lambda value: (value, 0))
+        self.assertEqual([(value, 0) for value in items], serial)
+
+    def test_large_batches_use_workers_and_keep_input_order(self) -> None:
+        items = list(range(MIN_PARALLEL_FILES * 2))
+
+        results = map_files(square_with_pid, items, jobs=2)
+
+        self.assertEqual([value * value for value in items], [square for square, _ in results])
+        self.assertNotIn(os.getpid(), {pid for _, pid in results})
+        self.assertEqual(
+            [(value * value, os.getpid()) for value in items],
+            map_files(square_with_pid, items, jobs=1),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""Tests for scripts/benchmarks/profile-benchmarks.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "scripts" / "benchmarks" / "profile-benchmarks.py"
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("profile_benchmarks", SCRIPT)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {SCRIPT}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def evented_profile(frames: list[str], events: list[tuple[str, int, float]]) -> dict:
+    return {
+        "shared": {"frames": [{"name": name} for name in frames]},
+        "profiles": [
+            {
+                "type": "evented",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": events[-1][2],
+                "events": [
+                    {"type": kind, "frame": frame, "at": at} for kind, frame, at in events
+                ],
+            }
+        ],
+    }
+
+
+class ProfileBenchmarksTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_module()
+
+    def setUp(self) -> None:
+        self.work_dir = ROOT / "artifacts" / "test-profile-benchmarks"
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+        self.work_dir.mkdir(parents=True)
+
+    def tearDown(self) -> None:
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+
+    def test_collapses_evented_and_sampled_profiles_to_focused_stacks(self) -> None:
+        frames = [
+            "BenchmarkDotNet!Runner.Run",
+            "WallstopStudios.NovaSharp.Interpreter!Processor.Processing_Loop",
+            "WallstopStudios.NovaSharp.Interpreter!Table.Get",
+            "System.Private.CoreLib!Dictionary.FindValue",
+        ]
+        document = evented_profile(
+            frames,
+            [
+                ("O", 0, 0),
+                ("O", 1, 1),
+                ("O", 2, 3),
+                ("O", 3, 4),
+                ("C", 3, 6),
+                ("C", 2, 7),
+                ("C", 1, 9),
+                ("C", 0, 10),
+            ],
+        )
+        document["profiles"].append(
+            {
+                "type": "sampled",
+                "unit": "microseconds",
+                "samples": [[0, 1], [0]],
+                "weights": [500, 250],
+            }
+        )
+
+        stacks = self.module.collapse_speedscope(document)
+        focused = self.module.focus_stacks(stacks, self.module.DEFAULT_FOCUS)
+
+        self.assertEqual(4000 + 500, stacks[(frames[0], frames[1])])
+        self.assertEqual(2000 + 250, stacks[(frames[0],)])
+        self.assertEqual(
+            {
+                (frames[1],): 4500,
+                (frames[1], frames[2]): 2000,
+                (frames[1], frames[2], frames[3]): 2000,
+            },
+            focused,
+        )
+        hot = self.module.hot_method_rows(focused)
+        self.assertEqual(frames[1], hot[0].name)
+        self.assertEqual(8500, hot[0].total_weight)
+        table = self.module.render_hot_methods("NumericLoops", focused, 2)
+        self.assertIn("| 1 | `Processor.Processing_Loop` | 4.5 ms | 52.94% | 100.00% |", table)
+        self.assertNotIn("Runner.Run", table)
+
+    def test_diff_compares_self_shares_and_writes_difffolded(self) -> None:
+        before = {("Loop",): 600.0, ("Loop", "Table.Get"): 400.0}
+        after = {("Loop",): 1000.0, ("Loop", "Table.Get"): 1000.0, ("Loop", "Box"): 2000.0}
+        before_path = self.work_dir / "before.folded"
+        after_path = self.work_dir / "after.folded"
+        self.module.write_folded(before_path, before)
+        self.module.write_folded(after_path, after)
+
+        result = subprocess.run(
+            [
+                "python3",
+                str(SCRIPT.relative_to(ROOT)),
+                "diff",
+                str(before_path.relative_to(ROOT)),
+                str(after_path.relative_to(ROOT)),
+                "--output",
+                str((self.work_dir / "diff.md").relative_to(ROOT)),
+                "--folded-output",
+                str((self.work_dir / "diff.folded").relative_to(ROOT)),
+            ],
+            cwd=ROOT,
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertEqual(before, self.module.read_folded(before_path))
+        markdown = (self.work_dir / "diff.md").read_text(encoding="utf-8")
+        rows = [line for line in markdown.splitlines() if line.startswith("| `")]
+        self.assertEqual("| `Box` | 0.00% | 50.00% | +50.00 pp |", rows[0])
+        self.assertEqual("| `Loop` | 60.00% | 25.00% | -35.00 pp |", rows[1])
+        self.assertEqual(
+            ["Loop 600 1000", "Loop;Box 0 2000", "Loop;Table.Get 400 1000"],
+            (self.work_dir / "diff.folded").read_text(encoding="utf-8").splitlines(),
+        )
+
+    def test_capture_profiles_phase_gate_scenarios_and_writes_empty_index(self) -> None:
+        deltas = {
+            "phaseGateFailures": [
+                {"parameters": "Scenario:NumericLoops", "metric": "time"},
+                {"parameters": "Scenario:NumericLoops", "metric": "allocated"},
+                {"parameters": "Scenario:TableAccess", "metric": "allocated"},
+                {"parameters": "", "metric": "shape"},
+            ]
+        }
+        self.assertEqual(
+            ["NumericLoops", "TableAccess"], self.module.regressed_scenarios(deltas)
+        )
+        self.assertEqual(
+            "LuaPerformanceBenchmarks.NovaSharpExecute(Scenario_NumericLoops)",
+            self.module.profile_name(
+                Path(
+                    "LuaPerformanceBenchmarks.NovaSharpExecute(Scenario_NumericLoops)"
+                    "-20250101-120000.speedscope.json"
+                )
+            ),
+        )
+
+        deltas_path = self.work_dir / "benchmark-deltas.json"
+        deltas_path.write_text(json.dumps({"phaseGateFailures": []}), encoding="utf-8")
+        result = subprocess.run(
+            [
+                "python3",
+                str(SCRIPT.relative_to(ROOT)),
+                "capture",
+                "--from-deltas",
+                str(deltas_path.relative_to(ROOT)),
+                "--output-root",
+                str((self.work_dir / "current").relative_to(ROOT)),
+            ],
+            cwd=ROOT,
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertIn("profiled_scenarios=0", result.stdout)
+        index = json.loads(
+            (self.work_dir / "current" / "profile-index.json").read_text(encoding="utf-8")
+        )
+        self.assertEqual("novasharp.benchmark-profiles.v1", index["schema"])
+        self.assertEqual([], index["profiles"])
+
+    def test_processes_speedscope_with_baseline_diff(self) -> None:
+        frames = [
+            "WallstopStudios.NovaSharp.Interpreter!Processor.Processing_Loop",
+            "WallstopStudios.NovaSharp.Interpreter!Table.Get",
+        ]
+        baseline_root = self.work_dir / "baseline"
+        current_root = self.work_dir / "current"
+        for root, get_time in ((baseline_root, 1), (current_root, 5)):
+            raw = root / "raw" / "NumericLoops"
+            raw.mkdir(parents=True)
+            speedscope = raw / "Bench.NovaSharpExecute-20250101-120000.speedscope.json"
+            speedscope.write_text(
+                json.dumps(
+                    evented_profile(
+                        frames,
+                        [("O", 0, 0), ("O", 1, 1), ("C", 1, 1 + get_time), ("C", 0, 2 + get_time)],
+                    )
+                ),
+                encoding="utf-8",
+            )
+            baseline = self.module.load_index(baseline_root)
+            entry = self.module.process_speedscope(
+                speedscope, "NumericLoops", root, baseline, self.module.DEFAULT_FOCUS, 10
+            )
+            self.module.write_index(root, "ep", [entry])
+
+        self.assertEqual("Bench.NovaSharpExecute", entry["name"])
+        self.assertEqual(["Table.Get", "Processor.Processing_Loop"], entry["topMethods"])
+        self.assertEqual("Bench.NovaSharpExecute.diff.md", entry["diff"]["markdown"])
+        self.assertEqual(frames[1], entry["diff"]["largestIncrease"])
+        for name in ("speedscope", "folded", "hotMethods"):
+            self.assertTrue((current_root / entry[name]).exists(), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
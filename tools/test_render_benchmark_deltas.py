@@ -29,10 +29,14 @@ class RenderBenchmarkDeltasTests(unittest.TestCase):
         if self.work_dir.exists():
             shutil.rmtree(self.work_dir)
 
-    def write_report(self, root: Path, name: str, benchmarks: list[dict]) -> None:
+    def write_report(
+        self, root: Path, name: str, benchmarks: list[dict], host: dict | None = None
+    ) -> None:
         results = root / "results"
         results.mkdir(parents=True, exist_ok=True)
         report = {"Benchmarks": benchmarks}
+        if host is not None:
+            report["HostEnvironmentInfo"] = host
         (results / f"{name}-report-full-compressed.json").write_text(
             json.dumps(report),
             encoding="utf-8",
@@ -106,12 +110,13 @@ class RenderBenchmarkDeltasTests(unittest.TestCase):
         p95: float,
         allocated: float,
         gen0: float = 0,
+        scenario: str = "NumericLoops",
     ) -> dict:
         return self.benchmark(
             "WallstopStudios.NovaSharp.Comparison",
             "LuaPerformanceBenchmarks",
             method_title,
-            "ScenarioName=NumericLoops",
+            f"ScenarioName={scenario}",
             mean,
             p95,
             allocated,
@@ -181,6 +186,62 @@ class RenderBenchmarkDeltasTests(unittest.TestCase):
             allocated,
         )
 
+    def retention_benchmark(self, method: str, allocated: float) -> dict:
+        return self.benchmark(
+            "WallstopStudios.NovaSharp.Benchmarks",
+            "MemoryRetentionBenchmarks",
+            method,
+            "",
+            1000,
+            1100,
+            allocated,
+        )
+
+    def write_retention_diagnostics(
+        self, root: Path, method: str, diagnostics: dict[str, float]
+    ) -> None:
+        directory = root / "memory-retention-diagnostics"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"{method}.json").write_text(
+            json.dumps(
+                {
+                    "schema": "novasharp.memory-retention-diagnostics.v1",
+                    "method": method,
+                    "diagnosticsAfterCriticalTrim": diagnostics,
+                }
+            ),
+            encoding="utf-8",
+        )
+
+    def write_retention_baseline(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(
+                {
+                    "schema": "novasharp.phase-a0.5-memory-retention-baseline.v1",
+                    "notes": ["Private bytes and working set are not hard gates."],
+                    "benchmarks": [
+                        {
+                            "method": "CompilationBurstAfterCriticalTrimRetainedBytes",
+                            "allocatedBytesPerOperation": 567844,
+                            "diagnosticsAfterCriticalTrim": {
+                                "retainedPoolCount": 0,
+                                "estimatedRetainedBytes": 159044,
+                                "peakRetainedBytes": 159044,
+                                "compilationCacheEntryCount": 0,
+                                "privateBytes": 66002944,
+                            },
+                        },
+                        {
+                            "method": "VmScratchScopePrototype",
+                            "allocatedBytesPerOperation": 7936,
+                        },
+                    ],
+                }
+            ),
+            encoding="utf-8",
+        )
+
     def run_script(
         self,
         self_baseline_root: Path | None = None,
@@ -188,6 +249,8 @@ class RenderBenchmarkDeltasTests(unittest.TestCase):
         phase_baseline: Path | None = None,
         write_phase_baseline: Path | None = None,
         enforce_phase_gates: bool = False,
+        allocation_sites: Path | None = None,
+        extra_args: tuple[str, ...] = (),
     ) -> subprocess.CompletedProcess[str]:
         args = [
             "python3",
@@ -202,6 +265,8 @@ class RenderBenchmarkDeltasTests(unittest.TestCase):
             "0.02",
             "--regression-threshold",
             "0.10",
+            "--report-cache",
+            str((self.work_dir / "report-cache").relative_to(ROOT)),
         ]
         if self_baseline_root is not None:
             args.extend(
@@ -230,6 +295,14 @@ class RenderBenchmarkDeltasTests(unittest.TestCase):
             )
         if enforce_phase_gates:
             args.append("--enforce-phase-gates")
+        if allocation_sites is not None:
+            args.extend(
+                [
+                    "--allocation-sites",
+                    str(allocation_sites.relative_to(ROOT)),
+                ]
+            )
+        args.extend(extra_args)
 
         return subprocess.run(
             args,
@@ -364,6 +437,70 @@ class RenderBenchmarkDeltasTests(unittest.TestCase):
             output,
         )
 
+    def test_in_process_reference_lua_rows_show_percent_without_changed_signal(self) -> None:
+        lua_row = self.lua_cli_benchmark(mean=50, p95=70)
+        lua_row["RuntimeDisplayName"] = "Lua in-process os.clock"
+        lua_row["RuntimeKind"] = "LuaInProcessCpuTime"
+        lua_row["ShowDeltaPercent"] = True
+        self.write_report(
+            self.comparison_root,
+            "LuaPerformanceBenchmarks",
+            [
+                self.comparison_benchmark("NovaSharp Execute", 90, 110, 80, gen0=1),
+                lua_row,
+            ],
+        )
+
+        result = self.run_script()
+
+        self.assertEqual(0, result.returncode, result.stdout + result.stderr)
+        self.assertIn("changed=false", result.stdout)
+        output = self.output.read_text(encoding="utf-8")
+        self.assertIn("Lua in-process os.clock: lua5.4: Lua 5.4.6", output)
+        self.assertIn(
+            "| NumericLoops | Execute | 90 ns / 110 ns | 50 ns / 70 ns | +40 ns (+80.00%) / +40 ns (+57.14%) |",
+            output,
+        )
+        self.assertIn(
+            "| NumericLoops | Execute | 80 B / 1 / 0 / 0 | - / - / - / - | - / - / - / - |",
+            output,
+        )
+
+    def test_renders_reference_lua_process_resource_metrics_in_memory_matrix(self) -> None:
+        lua_row = self.lua_cli_benchmark(mean=50, p95=70)
+        lua_row["Metrics"] = [
+            {"Value": value, "Descriptor": {"Id": metric_id}}
+            for metric_id, value in (
+                ("PeakRss", 2 * 1024 * 1024),
+                ("UserCpuTime", 120),
+                ("SystemCpuTime", 4.5),
+                ("MinorPageFaults", 300),
+                ("MajorPageFaults", 2),
+                ("VoluntaryContextSwitches", 3),
+                ("InvoluntaryContextSwitches", 11),
+            )
+        ]
+        self.write_report(
+            self.comparison_root,
+            "LuaPerformanceBenchmarks",
+            [
+                self.comparison_benchmark("NovaSharp Execute", 90, 110, 80, gen0=1),
+                lua_row,
+            ],
+        )
+
+        result = self.run_script()
+
+        self.assertEqual(0, result.returncode, result.stdout + result.stderr)
+        output = self.output.read_text(encoding="utf-8")
+        self.assertIn(
+            "| NumericLoops | Execute | 80 B / 1 / 0 / 0 | RSS 2 MB / CPU 120+4.5 ms / 302 faults / 3+11 csw | - |",
+            output,
+        )
+        self.assertIn("RSS 2 MB / CPU 120+4.5 ms / 302 faults / 3+11 csw |", output.split("#### Scoreboard Memory and GC")[1])
+        self.assertIn("Their memory cells hold per-process OS resource usage", output)
+        self.assertNotIn("does not report managed allocations", output)
+
     def test_reports_missing_reference_lua_cli_context_when_expected(self) -> None:
         self.write_report(
             self.comparison_root,
@@ -456,6 +593,95 @@ class RenderBenchmarkDeltasTests(unittest.TestCase):
         self.assertIn("Self Baseline Comparisons", output)
         self.assertIn("+30 ns (+30.00%)", output)
 
+    def with_samples(self, benchmark: dict, samples: list[float]) -> dict:
+        benchmark["Statistics"]["OriginalValues"] = samples
+        benchmark["Statistics"]["Mean"] = sum(samples) / len(samples)
+        return benchmark
+
+    def test_noisy_self_baseline_slowdown_is_not_significant(self) -> None:
+        self.write_report(
+            self.current_root,
+            "RuntimeBenchmarks",
+            [
+                self.with_samples(
+                    self.current_benchmark(mean=0, p95=200, allocated=100),
+                    [60, 190, 80, 175, 95, 170, 70, 185, 110, 165],
+                )
+            ],
+        )
+        self.write_report(
+            self.self_baseline_root,
+            "RuntimeBenchmarks",
+            [
+                self.with_samples(
+                    self.current_benchmark(mean=0, p95=180, allocated=100),
+                    [65, 180, 75, 160, 90, 150, 85, 140, 100, 155],
+                )
+            ],
+        )
+
+        result = self.run_script(self.self_baseline_root)
+
+        self.assertEqual(0, result.returncode, result.stdout + result.stderr)
+        self.assertIn("statistical_self_rows=1", result.stdout)
+        self.assertIn("regressed=false", result.stdout)
+        output = self.output.read_text(encoding="utf-8")
+        self.assertIn("#### Self Baseline Significance", output)
+        self.assertIn("| 10/10 |", output)
+        self.assertIn("| no significant change | ok |", output)
+
+    def test_small_consistent_self_baseline_slowdown_is_significant(self) -> None:
+        baseline_samples = [100 + index * 0.2 for index in range(20)]
+        self.write_report(
+            self.current_root,
+            "RuntimeBenchmarks",
+            [
+                self.with_samples(
+                    self.current_benchmark(mean=0, p95=110, allocated=100),
+                    [sample * 1.05 for sample in baseline_samples],
+                )
+            ],
+        )
+        self.write_report(
+            self.self_baseline_root,
+            "RuntimeBenchmarks",
+            [
+                self.with_samples(
+                    self.current_benchmark(mean=0, p95=105, allocated=100),
+                    baseline_samples,
+                )
+            ],
+        )
+
+        result = self.run_script(self.self_baseline_root)
+
+        self.assertEqual(0, result.returncode, result.stdout + result.stderr)
+        self.assertIn("regressed=true", result.stdout)
+        output = self.output.read_text(encoding="utf-8")
+        self.assertIn("| 20/20 | 1.04", output)
+        self.assertIn("| <0.0001 | +1.00 | slower | ok |", output)
+
+    def test_self_baseline_allocation_increase_is_significant_without_slowdown(self) -> None:
+        samples = [100 + index for index in range(10)]
+        self.write_report(
+            self.current_root,
+            "RuntimeBenchmarks",
+            [self.with_samples(self.current_benchmark(mean=0, p95=110, allocated=96), samples)],
+        )
+        self.write_report(
+            self.self_baseline_root,
+            "RuntimeBenchmarks",
+            [self.with_samples(self.current_benchmark(mean=0, p95=110, allocated=88), samples)],
+        )
+
+        result = self.run_script(self.self_baseline_root)
+
+        self.assertIn("regressed=true", result.stdout)
+        self.assertIn(
+            "| no significant change | regressed |",
+            self.output.read_text(encoding="utf-8"),
+        )
+
     def test_reports_comparison_groups_without_novasharp_row(self) -> None:
         self.write_report(
             self.comparison_root,
@@ -513,6 +739,298 @@ class RenderBenchmarkDeltasTests(unittest.TestCase):
         self.assertIn("phase_baseline_rows=1", enforce_result.stdout)
         self.assertIn("phase_gate_failures=0", enforce_result.stdout)
 
+    def test_json_output_carries_rows_failures_and_missing_cells(self) -> None:
+        json_output = self.work_dir / "benchmark-deltas.json"
+        self.write_report(
+            self.current_root,
+            "RuntimeBenchmarks",
+            [self.current_benchmark(mean=120, p95=130, allocated=80)],
+        )
+        self.write_report(
+            self.self_baseline_root,
+            "RuntimeBenchmarks",
+            [self.current_benchmark(mean=100, p95=110, allocated=80)],
+        )
+        self.write_report(
+            self.comparison_root,
+            "LuaPerformanceBenchmarks",
+            [
+                self.comparison_benchmark("NovaSharp Execute", 100, 120, 80),
+                self.comparison_benchmark("NLua Execute", 50, 60, 24),
+            ],
+        )
+        self.phase_baseline.write_text(
+            json.dumps({"schema": "novasharp.phase-benchmark-baseline.v1", "rows": []}),
+            encoding="utf-8",
+        )
+
+        result = self.run_script(
+            self_baseline_root=self.self_baseline_root,
+            expect_lua_cli=True,
+            extra_args=("--json-output", str(json_output.relative_to(ROOT))),
+        )
+
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertIn(
+            "json_output=artifacts/test-render-benchmark-deltas/benchmark-deltas.json",
+            result.stdout,
+        )
+        payload = json.loads(json_output.read_text(encoding="utf-8"))
+        self.assertEqual("novasharp.benchmark-deltas.v1", payload["schema"])
+        self.assertTrue(payload["summary"]["regressed"])
+        self_row = payload["selfRows"][0]
+        self.assertEqual("Scenario Execution", self_row["method"])
+        self.assertTrue(self_row["regressed"])
+        self.assertAlmostEqual(0.2, self_row["deltas"]["meanNs"])
+        self.assertIsNone(self_row["timing"])
+        matrix_row = payload["runtimeMatrixRows"][0]
+        self.assertEqual("Execute", matrix_row["operation"])
+        self.assertEqual(100, matrix_row["novaSharp"]["meanNs"])
+        self.assertEqual("NLua", matrix_row["runtimes"][0]["runtime"])
+        self.assertAlmostEqual(1.0, matrix_row["runtimes"][0]["deltas"]["meanNs"])
+        self.assertEqual(
+            ["Lua", "LuaCSharp", "MoonSharp"],
+            sorted(cell["runtime"] for cell in payload["missingRuntimeCells"]),
+        )
+        self.assertEqual(
+            "Current comparison row has no checked-in phase baseline.",
+            payload["phaseGateFailures"][0]["message"],
+        )
+
+    def test_links_profiles_relative_to_the_markdown_output(self) -> None:
+        profile_root = self.work_dir / "profiles"
+        profile_root.mkdir(parents=True)
+        (profile_root / "profile-index.json").write_text(
+            json.dumps(
+                {
+                    "schema": "novasharp.benchmark-profiles.v1",
+                    "profiler": "ep",
+                    "profiles": [
+                        {
+                            "scenario": "NumericLoops",
+                            "name": "LuaPerformanceBenchmarks.NovaSharpExecute",
+                            "speedscope": "Execute.speedscope.json",
+                            "folded": "Execute.folded",
+                            "hotMethods": "Execute.hot.md",
+                            "topMethods": ["Processor.Processing_Loop"],
+                            "diff": {"markdown": "Execute.diff.md", "folded": "Execute.diff.folded"},
+                        }
+                    ],
+                }
+            ),
+            encoding="utf-8",
+        )
+        self.write_report(
+            self.comparison_root,
+            "LuaPerformanceBenchmarks",
+            [self.comparison_benchmark("NovaSharp Execute", 100, 120, 80)],
+        )
+
+        result = self.run_script(
+            extra_args=("--profile-root", str(profile_root.relative_to(ROOT))),
+        )
+
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertIn("profiles=1", result.stdout)
+        markdown = self.output.read_text(encoding="utf-8")
+        self.assertIn("### Hot-Path Profiles", markdown)
+        self.assertIn("`Processor.Processing_Loop`", markdown)
+        self.assertIn("[table](profiles/Execute.hot.md)", markdown)
+        self.assertIn(
+            "[folded](profiles/Execute.folded), [speedscope](profiles/Execute.speedscope.json)",
+            markdown,
+        )
+        self.assertIn("[diff](profiles/Execute.diff.md)", markdown)
+
+    def test_noise_calibration_writes_bands_that_replace_global_phase_thresholds(self) -> None:
+        calibration_roots = []
+        for index, (nova_mean, nlua_mean) in enumerate([(100, 50), (102, 51), (98, 49)]):
+            root = self.work_dir / f"calibration-{index}"
+            self.write_report(
+                root,
+                "LuaPerformanceBenchmarks",
+                [
+                    self.comparison_benchmark("NovaSharp Execute", nova_mean, nova_mean, 80),
+                    self.comparison_benchmark("NLua Execute", nlua_mean, nlua_mean, 24),
+                ],
+            )
+            calibration_roots.extend(["--noise-calibration-root", str(root.relative_to(ROOT))])
+        shutil.copytree(self.work_dir / "calibration-0", self.comparison_root)
+
+        written = self.run_script(
+            write_phase_baseline=self.phase_baseline,
+            extra_args=tuple(calibration_roots),
+        )
+
+        self.assertEqual(0, written.returncode, written.stderr)
+        self.assertIn("noise_calibration_runs=3", written.stdout)
+        self.assertIn("noise_banded_rows=1", written.stdout)
+        baseline_payload = json.loads(self.phase_baseline.read_text(encoding="utf-8"))
+        runtimes = baseline_payload["rows"][0]["runtimes"]
+        self.assertEqual(
+            {"allocatedBytes": 0.0, "meanFraction": 0.02, "p95Fraction": 0.02, "runs": 3},
+            runtimes["NovaSharp"]["noise"],
+        )
+
+        shutil.rmtree(self.comparison_root)
+        self.write_report(
+            self.comparison_root,
+            "LuaPerformanceBenchmarks",
+            [
+                self.comparison_benchmark("NovaSharp Execute", 115, 115, 81),
+                self.comparison_benchmark("NLua Execute", 50, 50, 24),
+            ],
+        )
+
+        result = self.run_script(enforce_phase_gates=True)
+
+        self.assertEqual(1, result.returncode, result.stdout)
+        self.assertIn("phase_gate_failures=3", result.stdout)
+        report = self.output.read_text(encoding="utf-8")
+        self.assertIn("- Baseline rows with calibrated noise bands: 1 of 1", report)
+        self.assertIn(
+            "NovaSharp allocation increased from 80 B to 81 B (+1 B; allowed 0 B).", report
+        )
+        self.assertIn(
+            "NovaSharp/NLua mean ratio regressed from 2.000x to 2.300x (+15.00%).", report
+        )
+
+    def test_noise_bands_need_three_runs_and_never_tighten_the_allocation_gate(self) -> None:
+        calibration_roots = []
+        for index in range(3):
+            root = self.work_dir / f"calibration-{index}"
+            self.write_report(
+                root,
+                "LuaPerformanceBenchmarks",
+                [
+                    self.comparison_benchmark("NovaSharp Execute", 100, 100, 4096),
+                    self.comparison_benchmark("NLua Execute", 50, 50, 24),
+                ],
+            )
+            calibration_roots.extend(["--noise-calibration-root", str(root.relative_to(ROOT))])
+        shutil.copytree(self.work_dir / "calibration-0", self.comparison_root)
+
+        two_runs = self.run_script(
+            write_phase_baseline=self.phase_baseline,
+            extra_args=tuple(calibration_roots[:4]),
+        )
+        self.assertEqual(0, two_runs.returncode, two_runs.stderr)
+        self.assertIn("noise_banded_rows=0", two_runs.stdout)
+
+        written = self.run_script(
+            write_phase_baseline=self.phase_baseline,
+            extra_args=tuple(calibration_roots),
+        )
+        self.assertEqual(0, written.returncode, written.stderr)
+        self.assertIn("noise_banded_rows=1", written.stdout)
+
+        for current_bytes, expected_failures in ((4096 + 300, 0), (4096 + 600, 1)):
+            with self.subTest(current_bytes=current_bytes):
+                shutil.rmtree(self.comparison_root)
+                self.write_report(
+                    self.comparison_root,
+                    "LuaPerformanceBenchmarks",
+                    [
+                        self.comparison_benchmark("NovaSharp Execute", 100, 100, current_bytes),
+                        self.comparison_benchmark("NLua Execute", 50, 50, 24),
+                    ],
+                )
+
+                result = self.run_script(enforce_phase_gates=True)
+
+                self.assertIn(f"phase_gate_failures={expected_failures}", result.stdout)
+        self.assertIn(
+            "NovaSharp allocation increased from 4 KB to 4.59 KB (+600 B; allowed 512 B).",
+            self.output.read_text(encoding="utf-8"),
+        )
+
+    def host(self, processor: str, runtime: str = ".NET 8.0.11 (8.0.11, 8.0.1124.51707)") -> dict:
+        return {
+            "ProcessorName": processor,
+            "LogicalCoreCount": 8,
+            "Architecture": "X64",
+            "RuntimeVersion": runtime,
+            "OsVersion": "Linux Ubuntu 24.04",
+        }
+
+    def test_phase_gate_normalizes_or_refuses_cross_environment_baselines(self) -> None:
+        self.write_report(
+            self.comparison_root,
+            "LuaPerformanceBenchmarks",
+            [
+                self.comparison_benchmark("NovaSharp Execute", 100, 100, 80),
+                self.comparison_benchmark("NLua Execute", 50, 50, 24),
+            ],
+            host=self.host("Slow CPU"),
+        )
+        written = self.run_script(write_phase_baseline=self.phase_baseline)
+        self.assertEqual(0, written.returncode, written.stderr)
+        baseline_payload = json.loads(self.phase_baseline.read_text(encoding="utf-8"))
+        self.assertEqual(
+            "Slow CPU",
+            baseline_payload["rows"][0]["runtimes"]["NovaSharp"]["environment"]["processor"],
+        )
+
+        # Twice as fast a machine hides a 15% ratio regression behind a faster NovaSharp mean.
+        self.write_report(
+            self.comparison_root,
+            "LuaPerformanceBenchmarks",
+            [
+                self.comparison_benchmark("NovaSharp Execute", 57.5, 57.5, 80),
+                self.comparison_benchmark("NLua Execute", 25, 25, 24),
+            ],
+            host=self.host("Fast CPU", ".NET 8.0.14 (8.0.14, 8.0.1425.11118)"),
+        )
+        (self.comparison_root / "environment-fingerprint.json").write_text(
+            json.dumps({"kernel": "6.8.0", "governor": "performance"}),
+            encoding="utf-8",
+        )
+
+        gate_args = ("--nlua-ratio-threshold", "0.10")
+        warned = self.run_script(
+            enforce_phase_gates=True, extra_args=(*gate_args, "--environment-mismatch", "warn")
+        )
+        self.assertEqual(0, warned.returncode, warned.stdout)
+        self.assertIn("environment_mismatched_rows=1", warned.stdout)
+        self.assertIn("environment_normalized_rows=0", warned.stdout)
+
+        normalized = self.run_script(enforce_phase_gates=True, extra_args=gate_args)
+        self.assertEqual(1, normalized.returncode, normalized.stdout)
+        self.assertIn("environment_fingerprints=1", normalized.stdout)
+        self.assertIn("environment_normalized_rows=1", normalized.stdout)
+        report = self.output.read_text(encoding="utf-8")
+        self.assertIn("### Benchmark Environments", report)
+        self.assertIn("| Fast CPU | 8 | X64 |", report)
+        self.assertIn("| 6.8.0 | performance |", report)
+        self.assertIn("| 0.500x |", report)
+        self.assertIn(
+            "NovaSharp/NLua mean ratio regressed from 2.000x to 2.300x (+15.00%).", report
+        )
+
+        failed = self.run_script(
+            enforce_phase_gates=True, extra_args=(*gate_args, "--environment-mismatch", "fail")
+        )
+        self.assertEqual(1, failed.returncode, failed.stdout)
+        self.assertIn(
+            "| NumericLoops | Execute | environment | Current environment differs from the "
+            "phase baseline (processor `Fast CPU` vs baseline `Slow CPU`). |",
+            self.output.read_text(encoding="utf-8"),
+        )
+
+        self.write_report(
+            self.comparison_root,
+            "LuaPerformanceBenchmarks",
+            [
+                self.comparison_benchmark("NovaSharp Execute", 100, 100, 80),
+                self.comparison_benchmark("NLua Execute", 50, 50, 24),
+            ],
+            host=self.host("Slow CPU", ".NET 9.0.3 (9.0.3, 9.0.325.11113)"),
+        )
+        runtime_changed = self.run_script(enforce_phase_gates=True, extra_args=gate_args)
+        self.assertEqual(1, runtime_changed.returncode, runtime_changed.stdout)
+        self.assertIn("phase_gate_failures=1", runtime_changed.stdout)
+        self.assertIn("runtime `.NET 9.0.3", self.output.read_text(encoding="utf-8"))
+
     def test_phase_gate_fails_on_small_novasharp_allocation_increase(self) -> None:
         phase_baseline = self.work_dir / "phase-a0-baseline.json"
         self.write_report(
@@ -547,6 +1065,291 @@ class RenderBenchmarkDeltasTests(unittest.TestCase):
             self.output.read_text(encoding="utf-8"),
         )
 
+    def test_ranks_allocation_sites_by_the_regressions_their_opcodes_reach(self) -> None:
+        phase_baseline = self.work_dir / "phase-a0-baseline.json"
+        allocation_sites = self.work_dir / "allocation-sites.json"
+        scenario_opcodes = self.work_dir / "scenario-opcodes.json"
+        self.write_report(
+            self.comparison_root,
+            "LuaPerformanceBenchmarks",
+            [
+                self.comparison_benchmark("NovaSharp Execute", 100, 120, 80),
+                self.comparison_benchmark(
+                    "NovaSharp Execute", 100, 120, 80, scenario="StringConcatChains"
+                ),
+                self.comparison_benchmark("NovaSharp Compile", 100, 120, 4000),
+            ],
+        )
+        self.assertEqual(0, self.run_script(write_phase_baseline=phase_baseline).returncode)
+        self.write_report(
+            self.comparison_root,
+            "LuaPerformanceBenchmarks",
+            [
+                self.comparison_benchmark("NovaSharp Execute", 100, 120, 380),
+                self.comparison_benchmark(
+                    "NovaSharp Execute", 100, 120, 1060, scenario="StringConcatChains"
+                ),
+                self.comparison_benchmark("NovaSharp Compile", 100, 120, 4000),
+            ],
+        )
+        allocation_sites.write_text(
+            json.dumps(
+                {
+                    "schema": "novasharp.vm-hotpath-allocation-sites.v1",
+                    "scope": "reachable",
+                    "sites": [
+                        {
+                            "allowlisted": True,
+                            "callPath": ["Processor.ExecConcat"],
+                            "code": "new StringBuilder()",
+                            "line": 40,
+                            "opcodes": ["Concat"],
+                            "path": "src/runtime/Execution/VM/Processor/Processor_InstructionLoop.cs",
+                            "reason": "Concat buffer.",
+                            "ruleId": "new-temporary-collection",
+                            "symbol": "ExecConcat",
+                        },
+                        {
+                            "allowlisted": False,
+                            "callPath": ["Processor.ExecAdd"],
+                            "code": "new DynValue[2]",
+                            "line": 20,
+                            "opcodes": ["Add"],
+                            "path": "src/runtime/Execution/VM/Processor/Processor_InstructionLoop.cs",
+                            "reason": "",
+                            "ruleId": "new-dynvalue-array",
+                            "symbol": "ExecAdd",
+                        },
+                        {
+                            "allowlisted": True,
+                            "callPath": ["Processor.ProcessingLoop", "Processor.ListenDebugger"],
+                            "code": "new List<WatchItem>()",
+                            "line": 90,
+                            "opcodes": None,
+                            "path": "src/runtime/Execution/VM/Processor/ProcessorDebugger.cs",
+                            "reason": "Debugger refresh.",
+                            "ruleId": "new-temporary-collection",
+                            "symbol": "ListenDebugger",
+                        },
+                        {
+                            "allowlisted": False,
+                            "callPath": ["CallbackFunction.Invoke"],
+                            "code": "new ScriptExecutionContext(this)",
+                            "line": 10,
+                            "path": "src/runtime/Interop/CallbackFunction.cs",
+                            "reason": "",
+                            "ruleId": "new-script-execution-context",
+                            "symbol": "Invoke",
+                        },
+                    ],
+                }
+            ),
+            encoding="utf-8",
+        )
+        scenario_opcodes.write_text(
+            json.dumps(
+                {
+                    "schema": "novasharp.benchmark-scenario-opcodes.v1",
+                    "scenarios": {
+                        "NumericLoops": ["ADD", "JFOR", "RET"],
+                        "StringConcatChains": ["CALL", "CONCAT", "RET"],
+                    },
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        result = self.run_script(
+            phase_baseline=phase_baseline,
+            allocation_sites=allocation_sites,
+            extra_args=("--scenario-opcodes", str(scenario_opcodes.relative_to(ROOT))),
+        )
+
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertIn("allocation_sites=4", result.stdout)
+        self.assertIn("allocation_regressed_scenarios=2", result.stdout)
+        self.assertIn("scenario_opcode_sets=2", result.stdout)
+        markdown = self.output.read_text(encoding="utf-8")
+        self.assertIn("### Allocation Hotspots", markdown)
+        self.assertIn("| NumericLoops | Execute | 80 B | 380 B | +300 B |", markdown)
+        self.assertIn("#### Candidate Allocation Sites", markdown)
+        self.assertIn(
+            "| `ProcessorDebugger.cs:90` ListenDebugger | new-temporary-collection | allowlisted "
+            "| +1.25 KB | NumericLoops, StringConcatChains |",
+            markdown,
+        )
+        self.assertIn(
+            "| `Processor_InstructionLoop.cs:40` ExecConcat | new-temporary-collection | "
+            "allowlisted | +980 B | StringConcatChains |",
+            markdown,
+        )
+        self.assertIn(
+            "| `Processor_InstructionLoop.cs:20` ExecAdd | new-dynvalue-array | new | +300 B "
+            "| NumericLoops |",
+            markdown,
+        )
+        self.assertIn(
+            "| `CallbackFunction.cs:10` Invoke | new-script-execution-context | new | - | - |",
+            markdown,
+        )
+        order = [
+            markdown.index(symbol)
+            for symbol in ("` ListenDebugger", "` ExecConcat", "` ExecAdd", "` Invoke")
+        ]
+        self.assertEqual(sorted(order), order)
+
+        unnarrowed = self.run_script(phase_baseline=phase_baseline, allocation_sites=allocation_sites)
+        self.assertEqual(0, unnarrowed.returncode, unnarrowed.stderr)
+        self.assertIn(
+            "| `Processor_InstructionLoop.cs:20` ExecAdd | new-dynvalue-array | new | +1.25 KB "
+            "| NumericLoops, StringConcatChains |",
+            self.output.read_text(encoding="utf-8"),
+        )
+
+        allocation_sites.unlink()
+        missing = self.run_script(phase_baseline=phase_baseline, allocation_sites=allocation_sites)
+        self.assertNotEqual(0, missing.returncode)
+        self.assertIn("Allocation sites file does not exist", missing.stderr)
+
+    def test_reports_are_parsed_once_and_cached_by_digest(self) -> None:
+        self.write_report(
+            self.current_root,
+            "RuntimeBenchmarks",
+            [self.current_benchmark(mean=90, p95=110, allocated=80)],
+        )
+        self.write_report(
+            self.comparison_root,
+            "LuaPerformanceBenchmarks",
+            [
+                self.comparison_benchmark("NovaSharp Execute", 90, 110, 80, gen0=1),
+                self.comparison_benchmark("NLua Execute", 100, 120, 64),
+            ],
+        )
+
+        first = self.run_script(self_baseline_root=self.current_root)
+        first_report = self.output.read_text(encoding="utf-8")
+        second = self.run_script(self_baseline_root=self.current_root)
+
+        self.assertEqual(0, first.returncode, first.stderr)
+        self.assertIn("reports_parsed=2", first.stdout)
+        self.assertIn("reports_cached=0", first.stdout)
+        self.assertIn("reports_parsed=0", second.stdout)
+        self.assertIn("reports_cached=2", second.stdout)
+        self.assertEqual(first_report, self.output.read_text(encoding="utf-8"))
+
+    def test_memory_retention_gate_fails_when_retained_bytes_or_pools_grow(self) -> None:
+        retention_root = self.work_dir / "retention"
+        retention_baseline = self.work_dir / "retention-baseline.json"
+        self.write_retention_baseline(retention_baseline)
+        self.write_report(
+            retention_root,
+            "MemoryRetentionBenchmarks",
+            [
+                self.retention_benchmark("CompilationBurstAfterCriticalTrimRetainedBytes", 567844),
+                self.retention_benchmark("VmScratchScopePrototype", 7936),
+            ],
+        )
+        self.write_retention_diagnostics(
+            retention_root,
+            "CompilationBurstAfterCriticalTrimRetainedBytes",
+            {
+                "retainedPoolCount": 2,
+                "estimatedRetainedBytes": 200000,
+                "peakRetainedBytes": 159500,
+                "compilationCacheEntryCount": 0,
+                "privateBytes": 99000000,
+            },
+        )
+
+        result = self.run_script(
+            extra_args=(
+                "--memory-retention-root",
+                str(retention_root.relative_to(ROOT)),
+                "--memory-retention-baseline",
+                str(retention_baseline.relative_to(ROOT)),
+                "--enforce-memory-retention-gates",
+            )
+        )
+
+        self.assertEqual(1, result.returncode, result.stdout)
+        self.assertIn("memory_retention_rows=2", result.stdout)
+        self.assertIn("memory_retention_gate_failures=2", result.stdout)
+        self.assertIn("error=memory retention gate failures: 2", result.stderr)
+        report = self.output.read_text(encoding="utf-8")
+        self.assertIn("### Phase A0.5 Memory Retention", report)
+        self.assertIn("Retained grew from 155 KB to 195 KB (+40 KB; allowed 7.77 KB).", report)
+        self.assertIn(
+            "| CompilationBurstAfterCriticalTrimRetainedBytes | Pools | "
+            "Pools grew from 0 to 2 (+2; allowed 0). |",
+            report,
+        )
+        self.assertNotIn("Private Bytes grew", report)
+        self.assertNotIn("Peak Retained grew", report)
+        self.assertIn("| VmScratchScopePrototype | 7.75 KB (0 B) | - | - | - | - | - | - |", report)
+
+    def test_memory_retention_baseline_round_trips_and_requires_diagnostics(self) -> None:
+        retention_root = self.work_dir / "retention"
+        previous_baseline = self.work_dir / "retention-baseline.json"
+        written_baseline = self.work_dir / "written-retention-baseline.json"
+        self.write_retention_baseline(previous_baseline)
+        diagnostics = {
+            "retainedPoolCount": 0,
+            "estimatedRetainedBytes": 159044,
+            "peakRetainedBytes": 159044,
+            "compilationCacheEntryCount": 0,
+        }
+        self.write_report(
+            retention_root,
+            "MemoryRetentionBenchmarks",
+            [self.retention_benchmark("CompilationBurstAfterCriticalTrimRetainedBytes", 567844)],
+        )
+        self.write_retention_diagnostics(
+            retention_root, "CompilationBurstAfterCriticalTrimRetainedBytes", diagnostics
+        )
+        retention_args = (
+            "--memory-retention-root",
+            str(retention_root.relative_to(ROOT)),
+            "--enforce-memory-retention-gates",
+        )
+
+        written = self.run_script(
+            extra_args=(
+                *retention_args,
+                "--memory-retention-baseline",
+                str(previous_baseline.relative_to(ROOT)),
+                "--write-memory-retention-baseline",
+                str(written_baseline.relative_to(ROOT)),
+            )
+        )
+        payload = json.loads(written_baseline.read_text(encoding="utf-8"))
+        self.assertEqual(["Private bytes and working set are not hard gates."], payload["notes"])
+        self.assertEqual(diagnostics, payload["benchmarks"][0]["diagnosticsAfterCriticalTrim"])
+        self.assertIn("memory_retention_gate_failures=1", written.stdout)
+
+        matching = self.run_script(
+            extra_args=(
+                *retention_args,
+                "--memory-retention-baseline",
+                str(written_baseline.relative_to(ROOT)),
+            )
+        )
+        self.assertEqual(0, matching.returncode, matching.stderr)
+        self.assertIn("memory_retention_gate_failures=0", matching.stdout)
+
+        shutil.rmtree(retention_root / "memory-retention-diagnostics")
+        missing = self.run_script(
+            extra_args=(
+                *retention_args,
+                "--memory-retention-baseline",
+                str(written_baseline.relative_to(ROOT)),
+            )
+        )
+        self.assertEqual(1, missing.returncode)
+        self.assertIn(
+            "Current artifacts do not report `estimatedRetainedBytes`.",
+            self.output.read_text(encoding="utf-8"),
+        )
+
     def test_phase_gate_allows_large_row_allocation_noise(self) -> None:
         phase_baseline = self.work_dir / "phase-a0-baseline.json"
         self.write_report(
@@ -3,9 +3,13 @@
 
 from __future__ import annotations
 
+import contextlib
 import importlib.util
+import io
+import json
 import os
 import shutil
+import subprocess
 import sys
 import tempfile
 import unittest
@@ -22,6 +26,7 @@ def load_module():
         raise RuntimeError(f"Unable to load {SCRIPT}")
 
     module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
     spec.loader.exec_module(module)
     return module
 
@@ -98,6 +103,141 @@ class RunLuaCliContextTests(unittest.TestCase):
         self.assertEqual("LuaCliWallTime", result["RuntimeKind"])
         self.assertFalse(result["ShowDeltaPercent"])
 
+    def test_benchmark_record_reports_in_process_timing_with_startup_excluded(self) -> None:
+        result = self.module.benchmark_record(
+            "TwoArgAdd",
+            [10.0, 20.0, 30.0],
+            "/usr/bin/lua5.4",
+            "Lua 5.4.6",
+            "in-process",
+            1_500_000,
+        )
+
+        self.assertEqual("Lua in-process os.clock", result["RuntimeDisplayName"])
+        self.assertEqual("LuaInProcessCpuTime", result["RuntimeKind"])
+        self.assertTrue(result["ShowDeltaPercent"])
+        self.assertEqual(20.0, result["Statistics"]["Mean"])
+        self.assertEqual([10.0, 20.0, 30.0], result["Statistics"]["OriginalValues"])
+        self.assertEqual(1_500_000, result["StartupNanoseconds"])
+        self.assertEqual(
+            "/usr/bin/lua5.4: Lua 5.4.6; process startup 1.50 ms excluded",
+            result["RuntimeContext"],
+        )
+
+    def test_parse_driver_output_subtracts_loop_overhead_per_call(self) -> None:
+        operations, result = self.module.parse_driver_output(
+            "operations 1000\n"
+            "overhead 0.0001\n"
+            "overhead 0.0003\n"
+            "overhead 0.0002\n"
+            "iteration 0.0022\n"
+            "iteration 0.0032\n"
+        )
+
+        self.assertEqual(1000, operations)
+        self.assertEqual(2, len(result))
+        self.assertAlmostEqual(2000.0, result[0])
+        self.assertAlmostEqual(3000.0, result[1])
+
+    def test_parse_driver_output_rejects_missing_timings(self) -> None:
+        with self.assertRaises(RuntimeError):
+            self.module.parse_driver_output("operations 8\n")
+
+    @unittest.skipUnless(
+        hasattr(os, "wait4") and hasattr(os, "waitid"), "needs os.wait4 and os.waitid"
+    )
+    def test_run_with_resource_usage_times_out_only_live_children(self) -> None:
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self.module.run_with_resource_usage(
+                [sys.executable, "-c", "import time; time.sleep(30)"], 0.2
+            )
+
+        completed, usage = self.module.run_with_resource_usage(
+            [sys.executable, "-c", "print('done')"], 30.0
+        )
+
+        self.assertEqual(0, completed.returncode)
+        self.assertEqual("done", completed.stdout.strip())
+        self.assertGreater(usage.peak_rss_bytes, 0)
+
+    def test_run_converged_stops_on_tight_interval_or_iteration_cap(self) -> None:
+        tight = self.module.ScenarioRun(Path("tight.lua"), [100.0, 100.5, 99.5, 100.0])
+        noisy = self.module.ScenarioRun(Path("noisy.lua"), [50.0, 150.0, 80.0, 120.0])
+
+        self.assertTrue(self.module.run_converged(tight, 4, 40, 0.02))
+        self.assertFalse(self.module.run_converged(tight, 5, 40, 0.02))
+        self.assertFalse(self.module.run_converged(noisy, 4, 40, 0.02))
+        self.assertTrue(self.module.run_converged(noisy, 4, 4, 0.02))
+
+    def test_main_measures_scenarios_in_parallel_interleaved_batches(self) -> None:
+        artifacts_root = ROOT / "artifacts"
+        artifacts_root.mkdir(exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=artifacts_root) as temp_dir_text:
+            temp_dir = Path(temp_dir_text)
+            scenario_dir = temp_dir / "scenarios"
+            scenario_dir.mkdir()
+            for name in ("Alpha", "Beta", "Gamma"):
+                (scenario_dir / f"{name}.lua").write_text("return 1\n", encoding="utf-8")
+            calls = temp_dir / "calls.log"
+            fake_lua = temp_dir / "fake-lua"
+            fake_lua.write_text(
+                "#!/bin/sh\n"
+                'if [ "$1" = "-v" ]; then echo "Lua 5.4.6"; exit 0; fi\n'
+                'if [ "$1" = "-e" ]; then exit 0; fi\n'
+                f'echo "$2 $6" >> "{calls}"\n'
+                "echo operations 8\n"
+                'i=0; while [ "$i" -lt "$4" ]; do echo iteration 0.000008; i=$((i + 1)); done\n',
+                encoding="utf-8",
+            )
+            fake_lua.chmod(0o755)
+            output_root = temp_dir / "comparison"
+
+            with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                result = self.module.main(
+                    [
+                        "--scenario-dir",
+                        str(scenario_dir),
+                        "--output-root",
+                        str(output_root),
+                        "--lua-cmd",
+                        str(fake_lua),
+                        "--warmup-count",
+                        "0",
+                        "--iteration-count",
+                        "4",
+                        "--batch-size",
+                        "2",
+                        "--jobs",
+                        "2",
+                    ]
+                )
+
+            self.assertEqual(0, result)
+            self.assertIn("lua_cli_rows=3", stdout.getvalue())
+            self.assertIn("lua_cli_jobs=2", stdout.getvalue())
+            self.assertIn("lua_cli_samples=12", stdout.getvalue())
+            report = json.loads(
+                (output_root / "results" / self.module.REPORT_NAME).read_text(encoding="utf-8")
+            )
+            self.assertEqual(
+                ["Alpha", "Beta", "Gamma"],
+                [row["Parameters"].split("=")[1] for row in report["Benchmarks"]],
+            )
+            for row in report["Benchmarks"]:
+                self.assertEqual(4, row["Statistics"]["N"])
+                self.assertAlmostEqual(1000.0, row["Statistics"]["Mean"])
+                if hasattr(os, "wait4") and hasattr(os, "waitid"):
+                    self.assertEqual(2, row["ProcessCount"])
+                    metric_ids = [metric["Descriptor"]["Id"] for metric in row["Metrics"]]
+                    self.assertIn("PeakRss", metric_ids)
+                    self.assertIn("InvoluntaryContextSwitches", metric_ids)
+                    self.assertGreater(row["Metrics"][0]["Value"], 0)
+            lines = calls.read_text(encoding="utf-8").splitlines()
+            self.assertEqual(6, len(lines))
+            alpha_calls = [line for line in lines if "Alpha" in line]
+            self.assertTrue(alpha_calls[0].endswith("Alpha.lua "))
+            self.assertTrue(alpha_calls[1].endswith("Alpha.lua 8"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Tests for tools/SpellingAudit/spelling_audit.py."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import io
+import shutil
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "tools" / "SpellingAudit" / "spelling_audit.py"
+WORK_DIR = "artifacts/test-spelling-audit"
+sys.path.insert(0, str(ROOT / "tools"))
+
+from process_pool import MIN_PARALLEL_FILES  # noqa: E402
+
+# Fixture misspellings are assembled at runtime so this file itself stays clean
+# under the repository spelling audit.
+MISSPELLED_THE = "t" + "eh"
+MISSPELLED_SEPARATE = "seper" + "ate"
+MISSPELLED_RECEIVE = "rec" + "ieve"
+MISSPELLED_A_LOT = "a" + "lot"
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("spelling_audit", SCRIPT)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {SCRIPT}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class SpellingAuditTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_module()
+
+    def setUp(self) -> None:
+        self.work_dir = ROOT / WORK_DIR
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+        (self.work_dir / "docs" / ".hidden").mkdir(parents=True)
+        (self.work_dir / "docs" / "guide.md").write_text(
+            f"{MISSPELLED_THE} intro\nsee http://{MISSPELLED_THE}.example.com and {MISSPELLED_THE}@example.com\n"
+            f"\\n{MISSPELLED_THE} escape # codespell:ignore {MISSPELLED_THE}\n{MISSPELLED_SEPARATE}\r\n{MISSPELLED_A_LOT}\n",
+            encoding="utf-8",
+        )
+        (self.work_dir / "docs" / ".hidden" / "note.md").write_text(f"{MISSPELLED_THE}\n", encoding="utf-8")
+        (self.work_dir / "latin.txt").write_bytes(b"\x63af\xe9 " + MISSPELLED_RECEIVE.encode() + b"\n")
+        (self.work_dir / "binary.dat").write_bytes(MISSPELLED_THE.encode() + b"\x00")
+        (self.work_dir / "clean.cs").write_text("return value;\n", encoding="utf-8")
+        self.cache_path = self.work_dir / "cache.json"
+        self.skip_globs = ["*.json"]
+
+    def tearDown(self) -> None:
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+
+    def audit(self, **kwargs) -> list[str]:
+        return self.module.run_inprocess(
+            [WORK_DIR], [], self.skip_globs, 7, cache_path=self.cache_path, **kwargs
+        )
+
+    def test_inprocess_engine_matches_the_codespell_cli(self) -> None:
+        expected = self.module.run_codespell([WORK_DIR], [MISSPELLED_A_LOT], self.skip_globs, 7)
+        findings = self.module.run_inprocess(
+            [WORK_DIR], [MISSPELLED_A_LOT], self.skip_globs, 7, jobs=2
+        )
+
+        self.assertEqual(expected, findings)
+        self.assertEqual(
+            [
+                f"{WORK_DIR}/latin.txt:1: {MISSPELLED_RECEIVE} ==> receive",
+                f"{WORK_DIR}/docs/guide.md:1: {MISSPELLED_THE} ==> the",
+                f"{WORK_DIR}/docs/guide.md:2: {MISSPELLED_THE} ==> the",
+                f"{WORK_DIR}/docs/guide.md:2: {MISSPELLED_THE} ==> the",
+                f"{WORK_DIR}/docs/guide.md:4: {MISSPELLED_SEPARATE} ==> separate",
+            ],
+            [line.replace("\\", "/") for line in findings],
+        )
+
+    def test_cache_reuses_findings_by_content_hash(self) -> None:
+        first = self.audit()
+        guide = self.work_dir / "docs" / "guide.md"
+
+        # Same bytes, new modification time: served from the content hash.
+        guide.write_bytes(guide.read_bytes())
+        self.assertEqual(first, self.audit())
+
+        guide.write_text(f"{MISSPELLED_THE}\n", encoding="utf-8")
+        # Its contents differ from the cache: rescanned.
+        rescanned = self.audit()
+        self.assertEqual(2, len(rescanned))
+        self.assertEqual(
+            f"{WORK_DIR}/docs/guide.md:1: {MISSPELLED_THE} ==> the", rescanned[1].replace("\\", "/")
+        )
+        self.assertEqual(rescanned, self.audit())
+
+    def test_parallel_scan_matches_serial_scan(self) -> None:
+        bulk = self.work_dir / "bulk"
+        bulk.mkdir()
+        count = MIN_PARALLEL_FILES + 6
+        for number in range(count):
+            words = f"{MISSPELLED_THE} {number}\n" if number % 3 else f"clean {number}\n"
+            (bulk / f"file{number:03}.md").write_text(words, encoding="utf-8")
+
+        serial = self.module.run_inprocess([WORK_DIR], [], self.skip_globs, 7, jobs=1)
+        parallel = self.module.run_inprocess([WORK_DIR], [], self.skip_globs, 7, jobs=2)
+
+        self.assertEqual(serial, parallel)
+        self.assertEqual(
+            count - len(range(0, count, 3)),
+            sum("/bulk/" in line.replace("\\", "/") for line in parallel),
+        )
+
+    def test_unpinned_codespell_falls_back_to_the_cli(self) -> None:
+        expected = self.module.run_codespell([WORK_DIR], [], self.skip_globs, 7)
+        original = self.module.pinned_codespell_version
+        self.module.pinned_codespell_version = lambda: "0.0.0"
+        try:
+            with self.assertRaises(self.module.InProcessEngineUnavailable):
+                self.module.CodespellEngine([], self.skip_globs, 7)
+            with contextlib.redirect_stderr(io.StringIO()) as stderr:
+                findings = self.module.run_audit([WORK_DIR], [], self.skip_globs, 7)
+        finally:
+            self.module.pinned_codespell_version = original
+
+        self.assertEqual(expected, findings)
+        self.assertIn("--engine subprocess", stderr.getvalue())
+        self.assertEqual(self.module.pinned_codespell_version(), self.module.import_codespell().VERSION)
+
+
+if __name__ == "__main__":
+    unittest.main()